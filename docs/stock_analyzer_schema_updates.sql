@@ -119,6 +119,8 @@ CREATE INDEX IF NOT EXISTS idx_stock_cg_detail_quarter ON stock_capital_gains_de
 CREATE INDEX IF NOT EXISTS idx_stock_cg_detail_symbol ON stock_capital_gains_detail(symbol);
 CREATE INDEX IF NOT EXISTS idx_stock_cg_detail_type ON stock_capital_gains_detail(gain_type);
 CREATE INDEX IF NOT EXISTS idx_stock_cg_detail_sell_date ON stock_capital_gains_detail(sell_date);
+-- Duplicate rule for StockDBIngester (INSERT OR IGNORE); also covers tables created without the UNIQUE clause
+CREATE UNIQUE INDEX IF NOT EXISTS idx_stock_cg_detail_dedup ON stock_capital_gains_detail(user_id, symbol, buy_date, sell_date, quantity);
 
 -- ============================================================================
 -- NEW TABLE: stock_xirr_performance - XIRR calculations per stock
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Migration 004: Per-user field encryption envelopes.
+
+This migration:
+1. Creates user_encryption_keys (one key salt per user)
+2. Re-encrypts every *_encrypted / *_salt column pair from the legacy
+   per-field-salt format into the v1 envelope keyed by the owning user
+
+After migration, decrypting all sensitive fields of a user costs one
+PBKDF2 derivation instead of one per field.
+
+Tables affected (discovered automatically):
+- users (pan)
+- bank_accounts (account_number)
+
+Usage:
+    python migrations/004_field_encryption_envelope.py --db-path Data/Users/Sanjay/db/finance.db --password xxx --master-key yyy
+    python migrations/004_field_encryption_envelope.py --db-path Data/Users/Sanjay/db/finance.db --password xxx --master-key yyy --dry-run
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+from datetime import datetime
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from pfas.core.encryption import reencrypt_to_envelope
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+MIGRATION_VERSION = "004"
+MIGRATION_NAME = "field_encryption_envelope"
+
+
+def get_connection(db_path: str, password: str = None):
+    """Get database connection with optional encryption."""
+    try:
+        import sqlcipher3
+        conn = sqlcipher3.connect(db_path)
+        if password:
+            conn.execute(f"PRAGMA key = '{password}'")
+            conn.execute("PRAGMA cipher_compatibility = 4")
+        # Verify connection works
+        conn.execute("SELECT 1").fetchone()
+        logger.info(f"Connected to database: {db_path}")
+        return conn
+    except ImportError:
+        import sqlite3
+        conn = sqlite3.connect(db_path)
+        logger.info(f"Connected to database (sqlite3): {db_path}")
+        return conn
+
+
+def check_migration_status(conn) -> bool:
+    """Check if migration has already been applied."""
+    try:
+        cursor = conn.execute(
+            "SELECT 1 FROM schema_migrations WHERE version = ?",
+            (MIGRATION_VERSION,)
+        )
+        return cursor.fetchone() is not None
+    except Exception:
+        # Table doesn't exist yet
+        return False
+
+
+def ensure_schema_migrations_table(conn):
+    """Ensure schema_migrations table exists."""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS schema_migrations (
+            version TEXT PRIMARY KEY,
+            name TEXT NOT NULL,
+            applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            description TEXT
+        )
+    """)
+    conn.commit()
+
+
+def run_migration(conn, master_key: bytes, dry_run: bool = False) -> dict:
+    """Run the migration."""
+    logger.info(f"Running migration {MIGRATION_VERSION}: {MIGRATION_NAME}")
+
+    counts = reencrypt_to_envelope(conn, master_key, dry_run=dry_run)
+
+    for field_name, count in counts.items():
+        action = "Would re-encrypt" if dry_run else "Re-encrypted"
+        logger.info(f"  {action} {count} values in {field_name}")
+
+    return counts
+
+
+def record_migration(conn):
+    """Record migration in schema_migrations table."""
+    conn.execute("""
+        INSERT OR REPLACE INTO schema_migrations (version, name, applied_at, description)
+        VALUES (?, ?, ?, ?)
+    """, (
+        MIGRATION_VERSION,
+        MIGRATION_NAME,
+        datetime.now().isoformat(),
+        "Re-encrypt sensitive fields into per-user v1 envelopes"
+    ))
+    conn.commit()
+    logger.info(f"Recorded migration {MIGRATION_VERSION} in schema_migrations")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Migration 004: Per-user field encryption envelopes"
+    )
+    parser.add_argument(
+        "--db-path",
+        required=True,
+        help="Path to database file"
+    )
+    parser.add_argument(
+        "--password",
+        help="Database encryption password"
+    )
+    parser.add_argument(
+        "--master-key",
+        required=True,
+        help="Master key used for field encryption"
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Show what would be done without executing"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Run even if already applied"
+    )
+    parser.add_argument(
+        "-v", "--verbose",
+        action="store_true",
+        help="Verbose output"
+    )
+
+    args = parser.parse_args()
+
+    if args.verbose:
+        logging.getLogger().setLevel(logging.DEBUG)
+
+    # Connect to database
+    conn = get_connection(args.db_path, args.password)
+
+    # Ensure schema_migrations table exists
+    ensure_schema_migrations_table(conn)
+
+    # Check if already applied
+    if check_migration_status(conn) and not args.force:
+        logger.info(f"Migration {MIGRATION_VERSION} already applied. Use --force to rerun.")
+        return 0
+
+    # Run migration
+    run_migration(conn, args.master_key.encode("utf-8"), dry_run=args.dry_run)
+
+    # Record migration
+    if not args.dry_run:
+        record_migration(conn)
+
+    logger.info(f"Migration {MIGRATION_VERSION} completed successfully")
+    conn.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
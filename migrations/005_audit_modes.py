@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Migration 005: Audit modes (full / summary / deferred).
+
+This migration:
+1. Creates audit_control (row-level audit switch) and audit_batches
+   (compact batch audit records for the deferred mode)
+2. Recreates the audit_*_insert triggers with a WHEN guard on
+   audit_control, so summary/deferred ingests can skip row-level audit
+   rows inside their write transaction
+
+UPDATE/DELETE triggers are unchanged and always fire.
+
+Usage:
+    python migrations/005_audit_modes.py --db-path Data/Users/Sanjay/db/finance.db --password xxx
+    python migrations/005_audit_modes.py --db-path Data/Users/Sanjay/db/finance.db --password xxx --dry-run
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+from datetime import datetime
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from pfas.core.database import SCHEMA_SQL
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+MIGRATION_VERSION = "005"
+MIGRATION_NAME = "audit_modes"
+
+# Insert triggers recreated with the audit_control guard
+GUARDED_TRIGGERS = [
+    "audit_journals_insert",
+    "audit_journal_entries_insert",
+    "audit_accounts_insert",
+    "audit_exchange_rates_insert",
+    "audit_bank_accounts_insert",
+    "audit_bank_transactions_insert",
+]
+
+
+def get_connection(db_path: str, password: str = None):
+    """Get database connection with optional encryption."""
+    try:
+        import sqlcipher3
+        conn = sqlcipher3.connect(db_path)
+        if password:
+            conn.execute(f"PRAGMA key = '{password}'")
+            conn.execute("PRAGMA cipher_compatibility = 4")
+        # Verify connection works
+        conn.execute("SELECT 1").fetchone()
+        logger.info(f"Connected to database: {db_path}")
+        return conn
+    except ImportError:
+        import sqlite3
+        conn = sqlite3.connect(db_path)
+        logger.info(f"Connected to database (sqlite3): {db_path}")
+        return conn
+
+
+def check_migration_status(conn) -> bool:
+    """Check if migration has already been applied."""
+    try:
+        cursor = conn.execute(
+            "SELECT 1 FROM schema_migrations WHERE version = ?",
+            (MIGRATION_VERSION,)
+        )
+        return cursor.fetchone() is not None
+    except Exception:
+        # Table doesn't exist yet
+        return False
+
+
+def ensure_schema_migrations_table(conn):
+    """Ensure schema_migrations table exists."""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS schema_migrations (
+            version TEXT PRIMARY KEY,
+            name TEXT NOT NULL,
+            applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            description TEXT
+        )
+    """)
+    conn.commit()
+
+
+def run_migration(conn, dry_run: bool = False) -> list:
+    """Run the migration."""
+    logger.info(f"Running migration {MIGRATION_VERSION}: {MIGRATION_NAME}")
+
+    rows = conn.execute(
+        "SELECT name, sql FROM sqlite_master WHERE type = 'trigger'"
+    ).fetchall()
+    existing = {name: sql or "" for name, sql in rows}
+    to_replace = [
+        name for name in GUARDED_TRIGGERS
+        if name in existing and "audit_control" not in existing[name]
+    ]
+
+    for name in to_replace:
+        action = "Would recreate" if dry_run else "Recreating"
+        logger.info(f"  {action} trigger {name}")
+
+    if dry_run:
+        return to_replace
+
+    # Drop and recreate in one transaction; SCHEMA_SQL recreates the
+    # dropped triggers (guarded) and adds the new tables
+    drops = "".join(f"DROP TRIGGER IF EXISTS {name};\n" for name in to_replace)
+    conn.executescript(f"BEGIN;\n{drops}{SCHEMA_SQL}\nCOMMIT;")
+
+    return to_replace
+
+
+def record_migration(conn):
+    """Record migration in schema_migrations table."""
+    conn.execute("""
+        INSERT OR REPLACE INTO schema_migrations (version, name, applied_at, description)
+        VALUES (?, ?, ?, ?)
+    """, (
+        MIGRATION_VERSION,
+        MIGRATION_NAME,
+        datetime.now().isoformat(),
+        "Guard audit insert triggers for summary/deferred audit modes"
+    ))
+    conn.commit()
+    logger.info(f"Recorded migration {MIGRATION_VERSION} in schema_migrations")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Migration 005: Audit modes (full / summary / deferred)"
+    )
+    parser.add_argument(
+        "--db-path",
+        required=True,
+        help="Path to database file"
+    )
+    parser.add_argument(
+        "--password",
+        help="Database encryption password"
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Show what would be done without executing"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Run even if already applied"
+    )
+    parser.add_argument(
+        "-v", "--verbose",
+        action="store_true",
+        help="Verbose output"
+    )
+
+    args = parser.parse_args()
+
+    if args.verbose:
+        logging.getLogger().setLevel(logging.DEBUG)
+
+    # Connect to database
+    conn = get_connection(args.db_path, args.password)
+
+    # Ensure schema_migrations table exists
+    ensure_schema_migrations_table(conn)
+
+    # Check if already applied
+    if check_migration_status(conn) and not args.force:
+        logger.info(f"Migration {MIGRATION_VERSION} already applied. Use --force to rerun.")
+        return 0
+
+    # Run migration
+    run_migration(conn, dry_run=args.dry_run)
+
+    # Record migration
+    if not args.dry_run:
+        record_migration(conn)
+
+    logger.info(f"Migration {MIGRATION_VERSION} completed successfully")
+    conn.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,58 @@
+"""
+Lazy package re-exports.
+
+Package __init__ modules describe their public names in a table instead of
+importing every submodule, so `import pfas.services.nav_service` or a CLI's
+--help no longer pulls in pandas, openpyxl, pdfplumber and reportlab through
+sibling modules. A name is imported from its submodule on first access and
+then cached in the package namespace.
+
+Usage (in a package __init__):
+    __getattr__, __dir__ = lazy_exports(__name__, {
+        ".nav_service": ["NAVService", "get_navs"],
+        ".mf_analyzer": [("AnalysisResult", "MFAnalysisResult")],
+    })
+"""
+
+import importlib
+import sys
+from typing import Callable, Dict, List, Tuple, Union
+
+# Exported name, or (attribute in submodule, exported alias)
+ExportSpec = Union[str, Tuple[str, str]]
+
+
+def lazy_exports(
+    package: str,
+    exports: Dict[str, List[ExportSpec]],
+) -> Tuple[Callable[[str], object], Callable[[], List[str]]]:
+    """
+    Build the module-level __getattr__ and __dir__ for a package.
+
+    Args:
+        package: The package's __name__
+        exports: Relative submodule -> names it provides
+
+    Returns:
+        (__getattr__, __dir__) to assign in the package namespace
+    """
+    namespace = sys.modules[package].__dict__
+    targets: Dict[str, Tuple[str, str]] = {}
+    for module_name, names in exports.items():
+        for spec in names:
+            attribute, alias = spec if isinstance(spec, tuple) else (spec, spec)
+            targets[alias] = (module_name, attribute)
+
+    def __getattr__(name: str) -> object:
+        target = targets.get(name)
+        if target is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        module_name, attribute = target
+        value = getattr(importlib.import_module(module_name, package), attribute)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(targets))
+
+    return __getattr__, __dir__
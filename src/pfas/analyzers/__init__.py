@@ -1,31 +1,25 @@
-"""PFAS Analyzers - Financial data analysis modules."""
+"""PFAS Analyzers - Financial data analysis modules.
 
-from .mf_analyzer import (
-    MFStatementScanner,
-    MFFieldNormalizer,
-    MFDBIngester,
-    MFReportGenerator,
-    MFAnalyzer,
-    NormalizedHolding as MFNormalizedHolding,
-    AnalysisResult as MFAnalysisResult,
-)
+Exports are imported from their submodules on first access (pfas._lazy).
+"""
 
-from .stock_analyzer import (
-    StockAnalyzer,
-    StockStatementScanner,
-    StockFieldNormalizer,
-    StockDBIngester,
-    StockReportGenerator,
-    BrokerDetector,
-    XIRRCalculator,
-    AnalysisResult as StockAnalysisResult,
-    NormalizedHolding as StockNormalizedHolding,
-    NormalizedTransaction,
-    ScannedFile,
-    BrokerType,
-    StatementType,
-    GainType,
-)
+from pfas._lazy import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    ".mf_analyzer": [
+        "MFStatementScanner", "MFFieldNormalizer", "MFDBIngester", "MFReportGenerator",
+        "MFAnalyzer",
+        ("NormalizedHolding", "MFNormalizedHolding"),
+        ("AnalysisResult", "MFAnalysisResult"),
+    ],
+    ".stock_analyzer": [
+        "StockAnalyzer", "StockStatementScanner", "StockFieldNormalizer", "StockDBIngester",
+        "StockReportGenerator", "BrokerDetector", "XIRRCalculator",
+        ("AnalysisResult", "StockAnalysisResult"),
+        ("NormalizedHolding", "StockNormalizedHolding"),
+        "NormalizedTransaction", "ScannedFile", "BrokerType", "StatementType", "GainType",
+    ],
+})
 
 __all__ = [
     # MF Analyzer
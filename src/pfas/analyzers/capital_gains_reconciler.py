@@ -10,14 +10,18 @@ Features:
 - Debt fund tax rule changes (post-April 2023)
 - Reconciliation between calculated and RTA values
 - Detailed audit trail
+- FY-boundary lot checkpoints so a single FY replays only its own
+  transactions
 """
 
 from dataclasses import dataclass, field
 from datetime import date
 from decimal import Decimal, ROUND_HALF_UP
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 from collections import defaultdict
 from enum import Enum
+import hashlib
+import json
 import logging
 import sqlite3
 
@@ -36,6 +40,9 @@ EQUITY_LTCG_DAYS = 365   # >12 months
 DEBT_LTCG_DAYS_OLD = 1095  # >36 months (before April 2023)
 DEBT_LTCG_DAYS_NEW = 1095  # Still 36 months but taxed at slab rate
 
+# Bump when the stored lot state format changes; older checkpoints are ignored
+LOT_CHECKPOINT_VERSION = 1
+
 
 class ReconciliationStatus(Enum):
     """Status of capital gains reconciliation."""
@@ -151,6 +158,11 @@ def parse_fy_dates(fy: str) -> Tuple[date, date]:
     return date(start_year, 4, 1), date(start_year + 1, 3, 31)
 
 
+def next_fy_start(txn_date: date) -> date:
+    """Get the first day of the FY after the one containing a date."""
+    return date(txn_date.year + 1 if txn_date.month >= 4 else txn_date.year, 4, 1)
+
+
 def classify_transaction_type(description: str) -> TransactionType:
     """Classify transaction type from description."""
     desc_upper = description.upper()
@@ -219,15 +231,25 @@ class CapitalGainsReconciler:
         self,
         cas_data,
         user_id: int,
-        target_fy: Optional[str] = None
+        target_fy: Optional[str] = None,
+        use_checkpoints: bool = True
     ) -> Dict[str, FYCapitalGains]:
         """
         Calculate capital gains from CAS data using FIFO.
 
+        The open lots of every folio/scheme are checkpointed at each FY
+        boundary. When a single FY is requested, each folio/scheme resumes
+        from its latest checkpoint at or before the FY start and replays
+        only the transactions after it. A checkpoint is used only if the
+        folio/scheme's transactions before its boundary are unchanged, so
+        back-dated transactions in a newer CAS fall back to an earlier
+        checkpoint (or a full replay) and rewrite the later ones.
+
         Args:
             cas_data: Parsed CAS data from CASPDFParser
             user_id: User ID
             target_fy: Optional specific FY to calculate (e.g., "2024-25")
+            use_checkpoints: Read and write lot checkpoints
 
         Returns:
             Dictionary of FY -> FYCapitalGains
@@ -237,115 +259,310 @@ class CapitalGainsReconciler:
             lambda: FYCapitalGains(financial_year="", user_id=user_id)
         )
 
-        # Collect all transactions
-        all_transactions = []
+        # Collect transactions per folio/scheme; seq keeps statement order
+        # for transactions on the same date
+        scheme_items: Dict[Tuple[str, str], List[Dict]] = {}
+        asset_classes: Dict[Tuple[str, str], AssetClass] = {}
+        seq = 0
 
         for folio in cas_data.folios:
             for scheme in folio.schemes:
                 # Classify scheme
                 asset_class = classify_scheme(scheme.scheme)
+                key = (folio.folio, scheme.scheme)
+                asset_classes[key] = asset_class
+                items = scheme_items.setdefault(key, [])
 
                 for txn in scheme.transactions:
-                    all_transactions.append({
+                    items.append({
                         "folio": folio.folio,
                         "scheme": scheme.scheme,
                         "isin": getattr(scheme, 'isin', None),
                         "asset_class": asset_class,
-                        "txn": txn
+                        "txn": txn,
+                        "seq": seq
                     })
+                    seq += 1
+
+        all_dates = [item["txn"].date for items in scheme_items.values() for item in items]
+        if not all_dates:
+            self._fy_gains = {}
+            return self._fy_gains
+
+        if target_fy:
+            fy_start, fy_end = parse_fy_dates(target_fy)
+        else:
+            fy_start, fy_end = None, max(all_dates)
+        last_boundary = next_fy_start(fy_end)
 
-        # Sort by date
-        all_transactions.sort(key=lambda x: x["txn"].date)
+        stored = (
+            self._load_lot_checkpoints(user_id, fy_start)
+            if use_checkpoints and fy_start else {}
+        )
 
-        # Process transactions
-        for item in all_transactions:
-            txn = item["txn"]
-            txn_type = classify_transaction_type(txn.description)
+        # Pick each folio/scheme's resume point and the boundaries to save
+        to_replay = []
+        to_save: Dict[date, List[Tuple[str, str]]] = defaultdict(list)
+        fingerprints: Dict[Tuple[Tuple[str, str], date], str] = {}
+        stale = []
 
-            # Skip non-transactional items
-            if txn_type in (
-                TransactionType.STAMP_DUTY_TAX,
-                TransactionType.DIVIDEND_PAYOUT,
-                TransactionType.DIVIDEND
-            ):
+        for key, items in scheme_items.items():
+            if not items:
                 continue
+            items.sort(key=lambda x: x["txn"].date)
+
+            boundaries = []
+            boundary = next_fy_start(items[0]["txn"].date)
+            while boundary <= last_boundary:
+                boundaries.append(boundary)
+                boundary = date(boundary.year + 1, 4, 1)
+            prints = self._lot_fingerprints(items, boundaries)
+
+            resume = None
+            for boundary, state, fingerprint in stored.get(key, []):
+                if prints.get(boundary) == fingerprint:
+                    self._portfolio_tracker.restore_tracker(
+                        key[0], key[1], asset_classes[key], state
+                    )
+                    resume = boundary
+                    break
+                stale.append((key, boundary))
+
+            for item in items:
+                txn_date = item["txn"].date
+                if txn_date > fy_end:
+                    break
+                if resume is None or txn_date >= resume:
+                    to_replay.append(item)
+
+            for boundary in boundaries:
+                if resume is None or boundary > resume:
+                    to_save[boundary].append(key)
+                    fingerprints[(key, boundary)] = prints[boundary]
+
+        if stale:
+            logger.info(f"Discarding {len(stale)} outdated lot checkpoints")
+            self.conn.executemany("""
+                DELETE FROM mf_fifo_lot_checkpoints
+                WHERE user_id = ? AND folio = ? AND scheme_name = ? AND boundary_date = ?
+            """, [(user_id, key[0], key[1], boundary.isoformat()) for key, boundary in stale])
+
+        # Replay in date order, snapshotting open lots at each FY boundary
+        to_replay.sort(key=lambda x: (x["txn"].date, x["seq"]))
+        pending = sorted(to_save)
+        checkpoints = []
+
+        for item in to_replay:
+            while pending and item["txn"].date >= pending[0]:
+                boundary = pending.pop(0)
+                checkpoints.extend(
+                    self._snapshot_lots(user_id, boundary, to_save[boundary], fingerprints)
+                )
+            self._process_cas_item(item, fy_gains, user_id, target_fy)
 
-            # Get values
-            nav = txn.nav if txn.nav else Decimal("0")
-            units = txn.units if txn.units else Decimal("0")
-            amount = txn.amount if txn.amount else Decimal("0")
+        for boundary in pending:
+            checkpoints.extend(
+                self._snapshot_lots(user_id, boundary, to_save[boundary], fingerprints)
+            )
 
-            if nav == Decimal("0") and units and units != Decimal("0"):
-                nav = abs(amount / units)
+        if use_checkpoints:
+            self._save_lot_checkpoints(checkpoints)
 
-            if units == Decimal("0") or amount == Decimal("0"):
-                continue
+        self._fy_gains = dict(fy_gains)
+        return self._fy_gains
 
-            try:
-                gains = self._portfolio_tracker.process_transaction(
-                    folio=item["folio"],
-                    scheme_name=item["scheme"],
-                    asset_class=item["asset_class"],
-                    txn_type=txn_type,
-                    txn_date=txn.date,
-                    units=units,
-                    nav=nav,
-                    amount=amount
-                )
+    def _process_cas_item(
+        self,
+        item: Dict,
+        fy_gains: Dict[str, FYCapitalGains],
+        user_id: int,
+        target_fy: Optional[str]
+    ):
+        """Apply one CAS transaction to the FIFO trackers and aggregate its gains."""
+        txn = item["txn"]
+        txn_type = classify_transaction_type(txn.description)
+
+        # Skip non-transactional items
+        if txn_type in (
+            TransactionType.STAMP_DUTY_TAX,
+            TransactionType.DIVIDEND_PAYOUT,
+            TransactionType.DIVIDEND
+        ):
+            return
 
-                # Aggregate gains by FY
-                if gains:
-                    for gain in gains:
-                        fy = get_financial_year(gain.sale_date)
+        # Get values
+        nav = txn.nav if txn.nav else Decimal("0")
+        units = txn.units if txn.units else Decimal("0")
+        amount = txn.amount if txn.amount else Decimal("0")
 
-                        # Skip if not target FY (when specified)
-                        if target_fy and fy != target_fy:
-                            continue
+        if nav == Decimal("0") and units and units != Decimal("0"):
+            nav = abs(amount / units)
 
-                        if fy_gains[fy].financial_year == "":
-                            fy_gains[fy].financial_year = fy
-                            fy_gains[fy].user_id = user_id
+        if units == Decimal("0") or amount == Decimal("0"):
+            return
 
-                        # Aggregate by asset class
-                        asset_class = item["asset_class"]
+        try:
+            gains = self._portfolio_tracker.process_transaction(
+                folio=item["folio"],
+                scheme_name=item["scheme"],
+                asset_class=item["asset_class"],
+                txn_type=txn_type,
+                txn_date=txn.date,
+                units=units,
+                nav=nav,
+                amount=amount
+            )
 
-                        if asset_class == AssetClass.EQUITY:
+            # Aggregate gains by FY
+            if gains:
+                for gain in gains:
+                    fy = get_financial_year(gain.sale_date)
+
+                    # Skip if not target FY (when specified)
+                    if target_fy and fy != target_fy:
+                        continue
+
+                    if fy_gains[fy].financial_year == "":
+                        fy_gains[fy].financial_year = fy
+                        fy_gains[fy].user_id = user_id
+
+                    # Aggregate by asset class
+                    asset_class = item["asset_class"]
+
+                    if asset_class == AssetClass.EQUITY:
+                        if gain.is_long_term:
+                            fy_gains[fy].fifo_equity_ltcg += gain.taxable_gain
+                        else:
+                            fy_gains[fy].fifo_equity_stcg += gain.taxable_gain
+                    elif asset_class == AssetClass.HYBRID:
+                        if gain.is_long_term:
+                            fy_gains[fy].fifo_hybrid_ltcg += gain.taxable_gain
+                        else:
+                            fy_gains[fy].fifo_hybrid_stcg += gain.taxable_gain
+                    else:  # DEBT and OTHER
+                        # Apply post-April 2023 debt fund rules
+                        if gain.sale_date >= DEBT_TAX_CHANGE_DATE:
+                            # All debt gains are STCG (taxed at slab)
+                            fy_gains[fy].fifo_debt_stcg += gain.taxable_gain
+                        else:
                             if gain.is_long_term:
-                                fy_gains[fy].fifo_equity_ltcg += gain.taxable_gain
+                                fy_gains[fy].fifo_debt_ltcg += gain.taxable_gain
                             else:
-                                fy_gains[fy].fifo_equity_stcg += gain.taxable_gain
-                        elif asset_class == AssetClass.HYBRID:
-                            if gain.is_long_term:
-                                fy_gains[fy].fifo_hybrid_ltcg += gain.taxable_gain
-                            else:
-                                fy_gains[fy].fifo_hybrid_stcg += gain.taxable_gain
-                        else:  # DEBT and OTHER
-                            # Apply post-April 2023 debt fund rules
-                            if gain.sale_date >= DEBT_TAX_CHANGE_DATE:
-                                # All debt gains are STCG (taxed at slab)
                                 fy_gains[fy].fifo_debt_stcg += gain.taxable_gain
-                            else:
-                                if gain.is_long_term:
-                                    fy_gains[fy].fifo_debt_ltcg += gain.taxable_gain
-                                else:
-                                    fy_gains[fy].fifo_debt_stcg += gain.taxable_gain
-
-                        # Track scheme-level gains
-                        self._add_scheme_gain(
-                            fy_gains[fy],
-                            item["scheme"],
-                            item["folio"],
-                            item.get("isin"),
-                            asset_class,
-                            gain
-                        )
-
-            except Exception as e:
-                logger.warning(f"Error processing {item['scheme']}: {e}")
+
+                    # Track scheme-level gains
+                    self._add_scheme_gain(
+                        fy_gains[fy],
+                        item["scheme"],
+                        item["folio"],
+                        item.get("isin"),
+                        asset_class,
+                        gain
+                    )
+
+        except Exception as e:
+            logger.warning(f"Error processing {item['scheme']}: {e}")
+
+    @staticmethod
+    def _lot_fingerprints(items: List[Dict], boundaries: List[date]) -> Dict[date, str]:
+        """
+        Hash a folio/scheme's transactions dated before each boundary.
+
+        Args:
+            items: Transactions of one folio/scheme, sorted by date
+            boundaries: Ascending FY start dates
+
+        Returns:
+            Dict of boundary -> hex digest
+        """
+        digest = hashlib.sha256()
+        prints = {}
+        i = 0
+        for boundary in boundaries:
+            while i < len(items) and items[i]["txn"].date < boundary:
+                txn = items[i]["txn"]
+                digest.update(
+                    f"{txn.date.isoformat()}|{txn.description}|{txn.units}|{txn.nav}|{txn.amount}\n"
+                    .encode()
+                )
+                i += 1
+            prints[boundary] = digest.hexdigest()
+        return prints
+
+    def _snapshot_lots(
+        self,
+        user_id: int,
+        boundary: date,
+        keys: List[Tuple[str, str]],
+        fingerprints: Dict[Tuple[Tuple[str, str], date], str]
+    ) -> List[Tuple]:
+        """Build checkpoint rows for the current open lots of some folio/schemes."""
+        rows = []
+        for key in keys:
+            state = self._portfolio_tracker.get_tracker_state(*key)
+            if state is None:
+                # Nothing before this boundary reached the tracker
                 continue
+            rows.append((
+                user_id, key[0], key[1], boundary.isoformat(),
+                json.dumps(state), fingerprints[(key, boundary)], LOT_CHECKPOINT_VERSION
+            ))
+        return rows
 
-        self._fy_gains = dict(fy_gains)
-        return self._fy_gains
+    def _load_lot_checkpoints(
+        self,
+        user_id: int,
+        on_or_before: date
+    ) -> Dict[Tuple[str, str], List[Tuple[date, Dict[str, Any], str]]]:
+        """
+        Get stored lot checkpoints up to a boundary.
+
+        Returns:
+            Dict of (folio, scheme) -> [(boundary, lot state, fingerprint)],
+            newest boundary first
+        """
+        cursor = self.conn.execute("""
+            SELECT folio, scheme_name, boundary_date, lots, txn_fingerprint
+            FROM mf_fifo_lot_checkpoints
+            WHERE user_id = ? AND boundary_date <= ? AND version = ?
+            ORDER BY boundary_date DESC
+        """, (user_id, on_or_before.isoformat(), LOT_CHECKPOINT_VERSION))
+
+        checkpoints: Dict[Tuple[str, str], List[Tuple[date, Dict[str, Any], str]]] = defaultdict(list)
+        for folio, scheme_name, boundary, lots, fingerprint in cursor.fetchall():
+            checkpoints[(folio, scheme_name)].append(
+                (date.fromisoformat(boundary), json.loads(lots), fingerprint)
+            )
+        return checkpoints
+
+    def _save_lot_checkpoints(self, rows: List[Tuple]):
+        """Store checkpoint rows built by _snapshot_lots()."""
+        self.conn.executemany("""
+            INSERT OR REPLACE INTO mf_fifo_lot_checkpoints (
+                user_id, folio, scheme_name, boundary_date, lots, txn_fingerprint, version
+            ) VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, rows)
+        self.conn.commit()
+
+    def clear_lot_checkpoints(self, user_id: int, from_date: Optional[date] = None) -> int:
+        """
+        Delete stored lot checkpoints.
+
+        Args:
+            user_id: User ID
+            from_date: Only delete checkpoints at or after this FY boundary
+
+        Returns:
+            Number of checkpoints deleted
+        """
+        query = "DELETE FROM mf_fifo_lot_checkpoints WHERE user_id = ?"
+        params: list = [user_id]
+        if from_date:
+            query += " AND boundary_date >= ?"
+            params.append(from_date.isoformat())
+        cursor = self.conn.execute(query, params)
+        self.conn.commit()
+        return cursor.rowcount
 
     def _add_scheme_gain(
         self,
@@ -1288,12 +1288,18 @@ class MFAnalyzer:
 
         return self.result
 
-    def generate_reports(self, output_dir: Optional[Path] = None) -> Optional[Path]:
+    def generate_reports(
+        self,
+        output_dir: Optional[Path] = None,
+        conn=None
+    ) -> Optional[Path]:
         """
         Generate Excel reports.
 
         Args:
             output_dir: Output directory (uses config if not provided)
+            conn: Connection to read from (default: the analyzer's); pass a
+                DatabaseManager.reader() connection to keep the writer free
 
         Returns:
             Path to generated report
@@ -1311,7 +1317,7 @@ class MFAnalyzer:
             reports_path = reports_template.replace("{user}", self.user_name)
             output_dir = Path(reports_path)
 
-        generator = MFReportGenerator(self.conn, output_dir)
+        generator = MFReportGenerator(conn or self.conn, output_dir)
         return generator.generate(self.user_id, self.user_name)
 
     def _get_or_create_user(self, user_name: str) -> int:
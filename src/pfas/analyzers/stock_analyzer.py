@@ -18,7 +18,6 @@ Usage:
 import json
 import logging
 import re
-import hashlib
 from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
 from decimal import Decimal, InvalidOperation
@@ -31,6 +30,9 @@ from openpyxl import Workbook
 from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
 from openpyxl.utils.dataframe import dataframe_to_rows
 
+from pfas.core.fingerprint import file_fingerprint, get_fingerprint_cache
+from pfas.core.xirr import CashflowBatch, xirr
+
 logger = logging.getLogger(__name__)
 
 
@@ -215,11 +217,7 @@ class ScannedFile:
 
     def _compute_hash(self) -> str:
         """Compute MD5 hash of file for deduplication."""
-        md5 = hashlib.md5()
-        with open(self.path, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                md5.update(chunk)
-        return md5.hexdigest()
+        return file_fingerprint(self.path, "md5")
 
 
 @dataclass
@@ -230,6 +228,8 @@ class AnalysisResult:
     holdings_processed: int = 0
     transactions_processed: int = 0
     duplicates_skipped: int = 0
+    # Capital gains rows skipped as already ingested
+    duplicate_transactions: List[NormalizedTransaction] = field(default_factory=list)
 
     total_market_value: Decimal = Decimal("0")
     total_cost_basis: Decimal = Decimal("0")
@@ -448,18 +448,16 @@ class StockStatementScanner:
                 continue
 
             pattern = "**/*" if recursive else "*"
-            for file_path in scan_path.glob(pattern):
-                if not file_path.is_file():
-                    continue
-
-                # Check extension
-                if file_path.suffix.lower() not in extensions:
-                    continue
-
-                # Check exclude patterns
-                if any(excl in file_path.name for excl in exclude_patterns):
-                    continue
-
+            candidates = [
+                file_path for file_path in scan_path.glob(pattern)
+                if file_path.is_file()
+                and file_path.suffix.lower() in extensions
+                and not any(excl in file_path.name for excl in exclude_patterns)
+            ]
+            # Hash new files in parallel; ScannedFile reads the warmed cache
+            get_fingerprint_cache().hash_many(candidates, "md5")
+
+            for file_path in candidates:
                 # Detect broker and statement type
                 broker, detection_method = self.broker_detector.detect(file_path)
                 stmt_type = self.broker_detector.detect_statement_type(file_path, broker)
@@ -872,10 +870,26 @@ class StockDBIngester:
     Uses unique constraints to avoid duplicates and upsert logic for updates.
     """
 
+    INSERT_TRANSACTION_SQL = """INSERT INTO stock_capital_gains_detail (
+                user_id, broker_id, financial_year, quarter,
+                symbol, isin, company_name, quantity,
+                buy_date, sell_date, holding_period_days,
+                buy_price, sell_price, buy_value, sell_value,
+                buy_expenses, sell_expenses,
+                fmv_31jan2018, grandfathered_price, is_grandfathered,
+                gross_profit_loss, cost_of_acquisition, taxable_profit,
+                is_long_term, gain_type, stt_paid, turnover, source_file
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+    INSERT_OR_IGNORE_TRANSACTION_SQL = INSERT_TRANSACTION_SQL.replace(
+        "INSERT INTO", "INSERT OR IGNORE INTO", 1
+    )
+
     def __init__(self, conn, config: Dict[str, Any]):
         self.conn = conn
         self.config = config
         self.processing = config.get("processing", {})
+        # Transactions skipped as duplicates by the last ingest_transactions call
+        self.skipped_transactions: List[NormalizedTransaction] = []
 
     def get_or_create_broker(self, broker: BrokerType) -> int:
         """Get or create broker ID."""
@@ -994,16 +1008,33 @@ class StockDBIngester:
     def ingest_transactions(
         self,
         transactions: List[NormalizedTransaction],
-        user_id: int
+        user_id: int,
+        bulk: Optional[bool] = None
     ) -> Tuple[int, int]:
         """
         Ingest transactions into database.
 
+        A transaction is a duplicate if (user, symbol, buy_date, sell_date,
+        quantity) is already stored or appeared earlier in the batch. The
+        skipped transactions are kept in ``skipped_transactions``.
+
+        Args:
+            transactions: Normalized transactions
+            user_id: User ID
+            bulk: Load existing keys once and insert with executemany
+                  (default: processing.bulk_insert, on unless disabled)
+
         Returns:
             Tuple of (inserted_count, skipped_count)
         """
+        if bulk is None:
+            bulk = self.processing.get("bulk_insert", True)
+        if bulk:
+            return self._ingest_transactions_bulk(transactions, user_id)
+
         inserted = 0
         skipped = 0
+        self.skipped_transactions = []
 
         duplicate_key = self.processing.get(
             "duplicate_key",
@@ -1016,6 +1047,7 @@ class StockDBIngester:
             # Check for duplicate
             if self._is_duplicate_transaction(txn, user_id, duplicate_key):
                 skipped += 1
+                self.skipped_transactions.append(txn)
                 continue
 
             self._insert_transaction(txn, user_id, broker_id)
@@ -1024,6 +1056,77 @@ class StockDBIngester:
         self.conn.commit()
         return inserted, skipped
 
+    def _ingest_transactions_bulk(
+        self,
+        transactions: List[NormalizedTransaction],
+        user_id: int
+    ) -> Tuple[int, int]:
+        """
+        Set-based duplicate check, then one executemany INSERT OR IGNORE.
+
+        The DB-side form of the duplicate rule is idx_stock_cg_detail_dedup
+        (schema migration 5).
+        """
+        self.skipped_transactions = []
+
+        existing = self._existing_transaction_keys(transactions, user_id)
+        broker_ids: Dict[BrokerType, int] = {}
+        rows = []
+
+        for txn in transactions:
+            key = self._transaction_key(txn)
+            # Rows without both dates never compare equal in SQL
+            if key[1] is not None and key[2] is not None:
+                if key in existing:
+                    self.skipped_transactions.append(txn)
+                    continue
+                existing.add(key)
+
+            if txn.broker not in broker_ids:
+                broker_ids[txn.broker] = self.get_or_create_broker(txn.broker)
+            rows.append(self._transaction_row(txn, user_id, broker_ids[txn.broker]))
+
+        if rows:
+            self.conn.executemany(self.INSERT_OR_IGNORE_TRANSACTION_SQL, rows)
+        self.conn.commit()
+        return len(rows), len(self.skipped_transactions)
+
+    @staticmethod
+    def _transaction_key(txn: NormalizedTransaction) -> Tuple[str, Optional[str], Optional[str], int]:
+        """Duplicate key of a transaction (user_id aside), as stored."""
+        return (
+            txn.symbol,
+            txn.buy_date.isoformat() if txn.buy_date else None,
+            txn.sell_date.isoformat() if txn.sell_date else None,
+            txn.quantity,
+        )
+
+    def _existing_transaction_keys(
+        self,
+        transactions: List[NormalizedTransaction],
+        user_id: int
+    ) -> set:
+        """Load stored duplicate keys for the batch's symbols and sell-date range."""
+        sell_dates = [txn.sell_date for txn in transactions if txn.sell_date]
+        if not sell_dates:
+            return set()
+
+        symbols = sorted({txn.symbol for txn in transactions})
+        first, last = min(sell_dates).isoformat(), max(sell_dates).isoformat()
+
+        existing = set()
+        # Stay well below SQLite's host-parameter limit
+        for start in range(0, len(symbols), 900):
+            batch = symbols[start:start + 900]
+            placeholders = ",".join("?" for _ in batch)
+            cursor = self.conn.execute(
+                f"""SELECT symbol, buy_date, sell_date, quantity FROM stock_capital_gains_detail
+                   WHERE user_id = ? AND sell_date BETWEEN ? AND ? AND symbol IN ({placeholders})""",
+                [user_id, first, last, *batch]
+            )
+            existing.update(tuple(row) for row in cursor.fetchall())
+        return existing
+
     def _is_duplicate_transaction(
         self,
         txn: NormalizedTransaction,
@@ -1052,33 +1155,33 @@ class StockDBIngester:
     ):
         """Insert a new transaction record."""
         self.conn.execute(
-            """INSERT INTO stock_capital_gains_detail (
-                user_id, broker_id, financial_year, quarter,
-                symbol, isin, company_name, quantity,
-                buy_date, sell_date, holding_period_days,
-                buy_price, sell_price, buy_value, sell_value,
-                buy_expenses, sell_expenses,
-                fmv_31jan2018, grandfathered_price, is_grandfathered,
-                gross_profit_loss, cost_of_acquisition, taxable_profit,
-                is_long_term, gain_type, stt_paid, turnover, source_file
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-            (
-                user_id, broker_id, txn.financial_year, txn.quarter,
-                txn.symbol, txn.isin, txn.company_name, txn.quantity,
-                txn.buy_date.isoformat() if txn.buy_date else None,
-                txn.sell_date.isoformat() if txn.sell_date else None,
-                txn.holding_period_days,
-                float(txn.buy_price), float(txn.sell_price),
-                float(txn.buy_value), float(txn.sell_value),
-                float(txn.buy_expenses), float(txn.sell_expenses),
-                float(txn.fmv_31jan2018) if txn.fmv_31jan2018 else None,
-                float(txn.grandfathered_price) if txn.grandfathered_price else None,
-                txn.is_grandfathered,
-                float(txn.profit_loss), float(txn.buy_value + txn.buy_expenses),
-                float(txn.taxable_profit),
-                txn.is_long_term, txn.gain_type.value,
-                float(txn.stt_paid), float(txn.turnover), txn.source_file
-            )
+            self.INSERT_TRANSACTION_SQL,
+            self._transaction_row(txn, user_id, broker_id)
+        )
+
+    @staticmethod
+    def _transaction_row(
+        txn: NormalizedTransaction,
+        user_id: int,
+        broker_id: int
+    ) -> tuple:
+        """Parameters for INSERT_TRANSACTION_SQL."""
+        return (
+            user_id, broker_id, txn.financial_year, txn.quarter,
+            txn.symbol, txn.isin, txn.company_name, txn.quantity,
+            txn.buy_date.isoformat() if txn.buy_date else None,
+            txn.sell_date.isoformat() if txn.sell_date else None,
+            txn.holding_period_days,
+            float(txn.buy_price), float(txn.sell_price),
+            float(txn.buy_value), float(txn.sell_value),
+            float(txn.buy_expenses), float(txn.sell_expenses),
+            float(txn.fmv_31jan2018) if txn.fmv_31jan2018 else None,
+            float(txn.grandfathered_price) if txn.grandfathered_price else None,
+            txn.is_grandfathered,
+            float(txn.profit_loss), float(txn.buy_value + txn.buy_expenses),
+            float(txn.taxable_profit),
+            txn.is_long_term, txn.gain_type.value,
+            float(txn.stt_paid), float(txn.turnover), txn.source_file
         )
 
 
@@ -1090,7 +1193,8 @@ class XIRRCalculator:
     """
     Calculate XIRR (Extended Internal Rate of Return) for stock investments.
 
-    Uses Newton-Raphson method for iterative solving.
+    Thin wrapper over the shared batch engine in pfas.core.xirr; use
+    CashflowBatch directly to solve many series in one call.
     """
 
     @staticmethod
@@ -1112,67 +1216,22 @@ class XIRRCalculator:
         Returns:
             Annual rate as decimal (0.15 = 15%), or None if no convergence
         """
-        if len(cashflows) < 2:
-            return None
-
-        # Sort by date
-        sorted_cf = sorted(cashflows, key=lambda x: x[0])
-        dates = [cf[0] for cf in sorted_cf]
-        amounts = [float(cf[1]) for cf in sorted_cf]
-
-        # Need at least one positive and one negative cashflow
-        if not (any(a < 0 for a in amounts) and any(a > 0 for a in amounts)):
-            return None
-
-        base_date = dates[0]
-        days = [(d - base_date).days for d in dates]
-
-        rate = guess
-
-        for _ in range(max_iterations):
-            # Calculate NPV and derivative
-            npv = 0.0
-            dnpv = 0.0
-
-            for i, amount in enumerate(amounts):
-                t = days[i] / 365.0
-                factor = (1 + rate) ** (-t)
-                npv += amount * factor
-                if t != 0:
-                    dnpv -= t * amount * factor / (1 + rate)
-
-            if abs(dnpv) < 1e-10:
-                break
-
-            new_rate = rate - npv / dnpv
-
-            if abs(new_rate - rate) < tolerance:
-                return new_rate
-
-            rate = new_rate
-
-            # Bound the rate to prevent divergence
-            if rate < -0.99:
-                rate = -0.99
-            if rate > 10:
-                rate = 10
-
-        return rate if abs(npv) < 0.01 else None
+        return xirr(cashflows, guess=guess, max_iterations=max_iterations, tolerance=tolerance)
 
     @staticmethod
-    def calculate_for_stock(
+    def stock_cashflows(
         transactions: List[NormalizedTransaction],
         current_holdings: Optional[NormalizedHolding] = None
-    ) -> Optional[float]:
+    ) -> List[Tuple[date, Decimal]]:
         """
-        Calculate XIRR for a specific stock.
+        Build the cashflows of a stock: buys out, sells and current value in.
 
         Args:
             transactions: List of transactions for the stock
             current_holdings: Current holding (for unrealized gains)
 
         Returns:
-            XIRR as decimal, or None
+            List of (date, amount) tuples
         """
         cashflows: List[Tuple[date, Decimal]] = []
 
@@ -1190,7 +1249,24 @@ class XIRRCalculator:
             as_of = current_holdings.as_of_date or date.today()
             cashflows.append((as_of, current_holdings.market_value))
 
-        return XIRRCalculator.calculate(cashflows)
+        return cashflows
+
+    @staticmethod
+    def calculate_for_stock(
+        transactions: List[NormalizedTransaction],
+        current_holdings: Optional[NormalizedHolding] = None
+    ) -> Optional[float]:
+        """
+        Calculate XIRR for a specific stock.
+
+        Args:
+            transactions: List of transactions for the stock
+            current_holdings: Current holding (for unrealized gains)
+
+        Returns:
+            XIRR as decimal, or None
+        """
+        return XIRRCalculator.calculate(XIRRCalculator.stock_cashflows(transactions, current_holdings))
 
 
 # =============================================================================
@@ -1856,6 +1932,7 @@ class StockAnalyzer:
                 )
                 self.result.transactions_processed += inserted
                 self.result.duplicates_skipped += skipped
+                self.result.duplicate_transactions.extend(self.ingester.skipped_transactions)
 
         else:
             self.result.warnings.append(
@@ -1930,7 +2007,7 @@ class StockAnalyzer:
             }
 
     def _calculate_xirr(self):
-        """Calculate XIRR for portfolio and individual stocks."""
+        """Calculate XIRR for portfolio and individual stocks in one batch."""
         # Get all transactions and current holdings
         cursor = self.conn.execute(
             """SELECT symbol, buy_date, sell_date, buy_value, sell_value
@@ -1942,7 +2019,8 @@ class StockAnalyzer:
 
         # Group transactions by symbol
         by_symbol: Dict[str, List[NormalizedTransaction]] = {}
-        all_cashflows: List[Tuple[date, Decimal]] = []
+        batch = CashflowBatch()
+        overall = ("portfolio",)
 
         for row in cursor.fetchall():
             symbol, buy_date_str, sell_date_str, buy_val, sell_val = row
@@ -1965,38 +2043,30 @@ class StockAnalyzer:
 
             # Add to overall cashflows
             if buy_date and buy_val:
-                all_cashflows.append((buy_date, -Decimal(str(buy_val))))
+                batch.add(buy_date, -Decimal(str(buy_val)), overall)
             if sell_date and sell_val:
-                all_cashflows.append((sell_date, Decimal(str(sell_val))))
+                batch.add(sell_date, Decimal(str(sell_val)), overall)
 
-        # Get current holdings for unrealized portion
+        # Get current holdings for unrealized portion (first row per symbol)
         cursor = self.conn.execute(
             """SELECT symbol, market_value, as_of_date
             FROM stock_holdings WHERE user_id = ?""",
             (self.user_id,)
         )
 
+        holding_rows: Dict[str, Tuple[Any, Any]] = {}
         for row in cursor.fetchall():
             symbol, market_val, as_of_str = row
+            holding_rows.setdefault(symbol, (market_val, as_of_str))
             as_of = datetime.strptime(as_of_str, "%Y-%m-%d").date() if as_of_str else date.today()
 
             if market_val and market_val > 0:
-                all_cashflows.append((as_of, Decimal(str(market_val))))
+                batch.add(as_of, Decimal(str(market_val)), overall)
 
-        # Calculate overall XIRR
-        self.result.xirr_overall = XIRRCalculator.calculate(all_cashflows)
-
-        # Calculate per-stock XIRR
+        # Per-stock series
         for symbol, txns in by_symbol.items():
-            # Get current holding for this stock
-            cursor = self.conn.execute(
-                """SELECT market_value, as_of_date
-                FROM stock_holdings WHERE user_id = ? AND symbol = ?""",
-                (self.user_id, symbol)
-            )
-            holding_row = cursor.fetchone()
-
             holding = None
+            holding_row = holding_rows.get(symbol)
             if holding_row and holding_row[0]:
                 holding = NormalizedHolding(
                     symbol=symbol,
@@ -2008,8 +2078,16 @@ class StockAnalyzer:
                     as_of_date=datetime.strptime(holding_row[1], "%Y-%m-%d").date() if holding_row[1] else date.today()
                 )
 
-            xirr = XIRRCalculator.calculate_for_stock(txns, holding)
-            self.result.xirr_by_stock[symbol] = xirr
+            for when, amount in XIRRCalculator.stock_cashflows(txns, holding):
+                batch.add(when, amount, symbol)
+
+        solutions = batch.solve()
+
+        overall_solution = solutions.get(overall)
+        self.result.xirr_overall = overall_solution.rate if overall_solution else None
+        for symbol in by_symbol:
+            solution = solutions.get(symbol)
+            self.result.xirr_by_stock[symbol] = solution.rate if solution else None
 
     def generate_reports(
         self,
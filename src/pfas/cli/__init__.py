@@ -6,7 +6,11 @@ Available CLI tools:
 - mf_analyzer_cli: Mutual Fund statement analysis and reporting
 """
 
-from .reports_cli import main as reports_main
-from .mf_analyzer_cli import main as mf_analyzer_main
+from pfas._lazy import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    ".reports_cli": [("main", "reports_main")],
+    ".mf_analyzer_cli": [("main", "mf_analyzer_main")],
+})
 
 __all__ = ["reports_main", "mf_analyzer_main"]
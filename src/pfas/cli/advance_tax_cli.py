@@ -317,6 +317,7 @@ def generate_reports(
     output_format: str = "xlsx"
 ):
     """Generate advance tax reports."""
+    from pfas.core.database import DatabaseManager
     from pfas.reports.advance_tax_report_v2 import AdvanceTaxReportGeneratorV2
 
     user_id = get_or_create_user(conn, resolver.user_name)
@@ -325,17 +326,23 @@ def generate_reports(
     output_dir = resolver.reports() / "tax_computation"
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    generator = AdvanceTaxReportGeneratorV2(conn, output_dir)
-
-    reports = []
+    # Import data from files if needed
     for fy in financial_years:
-        # Import data from files if needed
         import_income_from_files(conn, user_id, resolver, fy)
 
-        # Generate report
-        report_path = generator.generate_report(user_id, resolver.user_name, fy, tax_regime)
-        reports.append(report_path)
-        print(f"Generated: {report_path}")
+    reports = []
+    # Reports only read: use a pooled reader so ingestion is not held up;
+    # the computation history is still stored through the writer
+    with DatabaseManager().reader() as report_conn:
+        generator = AdvanceTaxReportGeneratorV2(
+            report_conn, output_dir, history_connection=conn
+        )
+        for fy in financial_years:
+            report_path = generator.generate_report(
+                user_id, resolver.user_name, fy, tax_regime
+            )
+            reports.append(report_path)
+            print(f"Generated: {report_path}")
 
     return reports
 
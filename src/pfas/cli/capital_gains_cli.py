@@ -21,6 +21,7 @@ sys.path.insert(0, str(PROJECT_ROOT / "src"))
 
 from pfas.core.database import DatabaseManager
 from pfas.parsers.mf.cas_pdf_parser import CASPDFParser
+from pfas.parsers.mf.text_cache import CASTextCache
 from pfas.analyzers.capital_gains_reconciler import CapitalGainsReconciler
 
 # Default paths
@@ -72,6 +73,14 @@ def get_pdf_password(pdf_path: Path, passwords: dict) -> str:
     return ""
 
 
+def make_cas_parser(user: str, db_password: str) -> CASPDFParser:
+    """Create a CAS parser backed by the user's encrypted text cache."""
+    cache_dir = DATA_ROOT / "Users" / user / "cache" / "cas_text"
+    return CASPDFParser(
+        text_cache=CASTextCache(cache_dir, db_password.encode("utf-8"))
+    )
+
+
 def get_user_id(conn, user_name: str) -> int:
     """Get user ID from database."""
     cursor = conn.execute("SELECT id FROM users WHERE name = ?", (user_name,))
@@ -121,7 +130,7 @@ def cmd_calculate(args):
     print(f"\nProcessing: {cas_file.name}")
 
     # Parse CAS
-    parser = CASPDFParser()
+    parser = make_cas_parser(args.user, db_password)
     try:
         cas_data = parser.parse(str(cas_file), pdf_password)
     except Exception as e:
@@ -196,7 +205,7 @@ def cmd_report(args):
     cas_file = cas_files[0]
     pdf_password = get_pdf_password(cas_file, passwords)
 
-    parser = CASPDFParser()
+    parser = make_cas_parser(args.user, db_password)
     cas_data = parser.parse(str(cas_file), pdf_password)
 
     # Calculate
@@ -243,7 +252,7 @@ def cmd_compare(args):
 
     print(f"Processing: {cas_file.name}")
 
-    parser = CASPDFParser()
+    parser = make_cas_parser(args.user, db_password)
     cas_data = parser.parse(str(cas_file), pdf_password)
 
     # PFAS calculation
@@ -10,6 +10,7 @@ Usage:
     pfas audit --user Sanjay --asset Mutual-Fund --file holdings.xlsx
     pfas report --user Sanjay --asset Mutual-Fund --type transactions
     pfas archive --user Sanjay --asset Mutual-Fund
+    pfas balances --user Sanjay --rebuild
 """
 
 import argparse
@@ -326,9 +327,11 @@ def cmd_report(args, resolver: PathResolver, conn, user_id: int):
 
         report_type = getattr(args, 'type', None)
         report_types = [report_type] if report_type else None
-        reports = generate_mf_reports(
-            conn, user_id, args.user, output_dir, report_types
-        )
+        # Reports only read: use a pooled reader so ingestion is not held up
+        with DatabaseManager().reader() as report_conn:
+            reports = generate_mf_reports(
+                report_conn, user_id, args.user, output_dir, report_types
+            )
 
         print(f"\nReports generated:")
         for rt, path in reports.items():
@@ -435,6 +438,29 @@ def cmd_status(args, resolver: PathResolver, conn, user_id: int):
     return 0
 
 
+def cmd_balances(args, resolver: PathResolver, conn, user_id: int):
+    """Handle balances command - check or rebuild materialized account balances."""
+    from pfas.core.journal import JournalEngine
+
+    engine = JournalEngine(conn)
+
+    if args.rebuild:
+        rows = engine.rebuild_daily_balances()
+        print(f"\nRebuilt account_daily_balances: {rows} account-day rows")
+
+    mismatches = engine.check_daily_balances()
+    if not mismatches:
+        print("\nAccount balances are consistent with journal entries")
+        return 0
+
+    print(f"\nFound {len(mismatches)} inconsistent account-day rows:")
+    for m in mismatches[:20]:
+        print(f"  account={m['account_id']} date={m['date']} "
+              f"expected={m['expected']} actual={m['actual']}")
+    print("\nRun with --rebuild to recompute from journal entries")
+    return 1
+
+
 # ============================================================================
 # Main Entry Point
 # ============================================================================
@@ -453,6 +479,7 @@ Examples:
   pfas report --user Sanjay --asset Mutual-Fund --type transactions
   pfas archive --user Sanjay --asset Mutual-Fund
   pfas status --user Sanjay
+  pfas balances --user Sanjay --rebuild
         """
     )
 
@@ -512,6 +539,13 @@ Examples:
     # status command
     status_parser = subparsers.add_parser('status', help='Show current status')
 
+    # balances command
+    balances_parser = subparsers.add_parser(
+        'balances', help='Check or rebuild materialized account balances'
+    )
+    balances_parser.add_argument('--rebuild', action='store_true',
+                                help='Rebuild balances from journal entries before checking')
+
     args = parser.parse_args()
 
     if not args.command:
@@ -527,6 +561,10 @@ Examples:
     # Initialize path resolver
     resolver = PathResolver(data_root, args.user)
 
+    # Scan, ingest and archive share file hashes within and across runs
+    from pfas.core.fingerprint import configure_fingerprint_cache
+    hash_cache = configure_fingerprint_cache(resolver.cache_dir() / "file_hashes.db")
+
     print(f"PFAS - {args.command.upper()}")
     print(f"User: {args.user}")
     print(f"Data: {resolver.user_dir}")
@@ -556,6 +594,8 @@ Examples:
             return cmd_archive(args, resolver, conn, user_id)
         elif args.command == 'status':
             return cmd_status(args, resolver, conn, user_id)
+        elif args.command == 'balances':
+            return cmd_balances(args, resolver, conn, user_id)
         else:
             parser.print_help()
             return 1
@@ -571,6 +611,8 @@ Examples:
         return 1
     finally:
         db.close()
+        if hash_cache.stats.lookups:
+            print(f"File hash cache: {hash_cache.stats}")
 
 
 if __name__ == "__main__":
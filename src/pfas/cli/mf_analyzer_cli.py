@@ -16,21 +16,22 @@ import sys
 from datetime import date
 from decimal import Decimal
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 # Handle imports for both installed package and direct execution
 try:
-    from pfas.analyzers import MFAnalyzer, AnalysisResult
     from pfas.core.database import DatabaseManager
     from pfas.core.paths import PathResolver
 except ImportError:
     src_path = Path(__file__).parent.parent.parent.parent / "src"
     if src_path.exists() and str(src_path) not in sys.path:
         sys.path.insert(0, str(src_path))
-    from pfas.analyzers import MFAnalyzer, AnalysisResult
     from pfas.core.database import DatabaseManager
     from pfas.core.paths import PathResolver
 
+if TYPE_CHECKING:
+    from pfas.analyzers.mf_analyzer import AnalysisResult
+
 
 def get_project_root() -> Path:
     """Get project root directory."""
@@ -50,7 +51,7 @@ def format_currency(amount: Decimal) -> str:
     return f"Rs. {amount:,.2f}"
 
 
-def print_result(result: AnalysisResult, user_name: str):
+def print_result(result: "AnalysisResult", user_name: str):
     """Print analysis result to console."""
     print("\n" + "=" * 60)
     print(f"MF ANALYSIS RESULT - {user_name}")
@@ -226,7 +227,9 @@ Data Structure:
         print("Run with --init-db to initialize first.")
         return 1
 
-    # Create analyzer
+    # Create analyzer (pulls in pandas/pdfplumber, so only once there is work)
+    from pfas.analyzers.mf_analyzer import MFAnalyzer
+
     analyzer = MFAnalyzer(config=config, conn=conn)
 
     if args.report_only:
@@ -242,7 +245,9 @@ Data Structure:
             analyzer.user_id = row[0]
             analyzer.user_name = args.user
 
-            report_path = analyzer.generate_reports(output_dir)
+            # Reports only read: use a pooled reader so ingestion is not held up
+            with db.reader() as report_conn:
+                report_path = analyzer.generate_reports(output_dir, conn=report_conn)
             print(f"\nReport generated: {report_path}")
         except Exception as e:
             print(f"Error generating report: {e}")
@@ -281,14 +286,16 @@ Data Structure:
             # Generate reports unless --no-report
             if not args.no_report:
                 try:
-                    report_path = analyzer.generate_reports(output_dir)
+                    with db.reader() as report_conn:
+                        report_path = analyzer.generate_reports(output_dir, conn=report_conn)
                     print(f"\nReport generated: {report_path}")
                 except Exception as e:
                     print(f"Warning: Could not generate report: {e}")
 
             # Run diagnostics if requested
             if args.diagnose:
-                run_diagnostics(conn, analyzer.user_id, args.user)
+                with db.reader() as report_conn:
+                    run_diagnostics(report_conn, analyzer.user_id, args.user)
 
         except Exception as e:
             print(f"Error during analysis: {e}")
@@ -304,7 +311,8 @@ Data Structure:
             row = cursor.fetchone()
             if row:
                 user_id = row[0] if isinstance(row, tuple) else row["id"]
-                run_diagnostics(conn, user_id, args.user)
+                with db.reader() as report_conn:
+                    run_diagnostics(report_conn, user_id, args.user)
             else:
                 print(f"User '{args.user}' not found in database")
         except Exception as e:
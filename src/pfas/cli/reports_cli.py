@@ -21,8 +21,6 @@ from typing import Optional, List
 # Handle imports for both installed package and direct execution
 try:
     from pfas.core.database import DatabaseManager
-    from pfas.services import BalanceSheetService, CashFlowStatementService, PortfolioValuationService
-    from pfas.parsers.mf import CapitalGainsCalculator
     from pfas.core.models import get_fy_dates
     from pfas.core.accounts import setup_chart_of_accounts
 except ImportError:
@@ -32,8 +30,6 @@ except ImportError:
     if src_path.exists() and str(src_path) not in sys.path:
         sys.path.insert(0, str(src_path))
     from pfas.core.database import DatabaseManager
-    from pfas.services import BalanceSheetService, CashFlowStatementService, PortfolioValuationService
-    from pfas.parsers.mf import CapitalGainsCalculator
     from pfas.core.models import get_fy_dates
     from pfas.core.accounts import setup_chart_of_accounts
 
@@ -180,6 +176,8 @@ def format_currency(amount) -> str:
 
 def generate_balance_sheet(conn, user_id: int, as_of: date, output_format: str = "text"):
     """Generate Balance Sheet report."""
+    from pfas.services.balance_sheet_service import BalanceSheetService
+
     service = BalanceSheetService(conn)
     snapshot = service.get_balance_sheet(user_id=user_id, as_of=as_of)
 
@@ -256,6 +254,8 @@ def generate_balance_sheet(conn, user_id: int, as_of: date, output_format: str =
 
 def generate_cash_flow_statement(conn, user_id: int, fy: str, output_format: str = "text"):
     """Generate Cash Flow Statement report."""
+    from pfas.services.cash_flow_service import CashFlowStatementService
+
     service = CashFlowStatementService(conn)
     statement = service.get_cash_flow_statement(user_id=user_id, financial_year=fy)
 
@@ -333,6 +333,8 @@ def generate_cash_flow_statement(conn, user_id: int, fy: str, output_format: str
 
 def generate_income_statement(conn, user_id: int, fy: str, output_format: str = "text"):
     """Generate Income Statement (Capital Gains Summary)."""
+    from pfas.parsers.mf.capital_gains import CapitalGainsCalculator
+
     calculator = CapitalGainsCalculator(conn)
     summaries = calculator.calculate_summary(user_id=user_id, fy=fy)
 
@@ -393,6 +395,8 @@ def generate_income_statement(conn, user_id: int, fy: str, output_format: str =
 
 def generate_portfolio_summary(conn, user_id: int, output_format: str = "text"):
     """Generate Portfolio Valuation Summary."""
+    from pfas.services.portfolio_valuation_service import PortfolioValuationService
+
     service = PortfolioValuationService(conn)
     summary = service.get_portfolio_summary(user_id=user_id)
     xirr_result = service.calculate_xirr(user_id=user_id)
@@ -608,76 +612,78 @@ Data Structure:
     # Generate reports
     all_reports = {}
 
-    for fy in fys:
-        print(f"{'=' * 60}")
-        print(f"FINANCIAL YEAR: {fy}")
-        print(f"{'=' * 60}")
-
-        fy_reports = {}
-        fy_suffix = fy.replace("-", "")
-
-        # Balance Sheet (as of FY end date)
-        if args.report in ["all", "balance-sheet"]:
-            try:
-                _, end_date = get_fy_dates(fy)
-                report = generate_balance_sheet(conn, user_id, end_date,
-                                               "json" if args.format in ["json", "xlsx"] else "text")
-
-                if args.format == "text":
-                    print(report)
-                    if not args.no_save:
-                        save_text_report(report, reports_dir / f"balance_sheet_FY{fy_suffix}.txt")
-                else:
-                    fy_reports["balance_sheet"] = report
-            except Exception as e:
-                print(f"Error generating Balance Sheet: {e}")
-
-        # Cash Flow Statement
-        if args.report in ["all", "cash-flow"]:
-            try:
-                report = generate_cash_flow_statement(conn, user_id, fy,
-                                                     "json" if args.format in ["json", "xlsx"] else "text")
-
-                if args.format == "text":
-                    print(report)
-                    if not args.no_save:
-                        save_text_report(report, reports_dir / f"cash_flow_FY{fy_suffix}.txt")
-                else:
-                    fy_reports["cash_flow"] = report
-            except Exception as e:
-                print(f"Error generating Cash Flow Statement: {e}")
+    # Reports only read: use a pooled reader so ingestion is not held up
+    with DatabaseManager().reader() as report_conn:
+        for fy in fys:
+            print(f"{'=' * 60}")
+            print(f"FINANCIAL YEAR: {fy}")
+            print(f"{'=' * 60}")
+
+            fy_reports = {}
+            fy_suffix = fy.replace("-", "")
+
+            # Balance Sheet (as of FY end date)
+            if args.report in ["all", "balance-sheet"]:
+                try:
+                    _, end_date = get_fy_dates(fy)
+                    report = generate_balance_sheet(report_conn, user_id, end_date,
+                                                    "json" if args.format in ["json", "xlsx"] else "text")
+
+                    if args.format == "text":
+                        print(report)
+                        if not args.no_save:
+                            save_text_report(report, reports_dir / f"balance_sheet_FY{fy_suffix}.txt")
+                    else:
+                        fy_reports["balance_sheet"] = report
+                except Exception as e:
+                    print(f"Error generating Balance Sheet: {e}")
+
+            # Cash Flow Statement
+            if args.report in ["all", "cash-flow"]:
+                try:
+                    report = generate_cash_flow_statement(report_conn, user_id, fy,
+                                                          "json" if args.format in ["json", "xlsx"] else "text")
+
+                    if args.format == "text":
+                        print(report)
+                        if not args.no_save:
+                            save_text_report(report, reports_dir / f"cash_flow_FY{fy_suffix}.txt")
+                    else:
+                        fy_reports["cash_flow"] = report
+                except Exception as e:
+                    print(f"Error generating Cash Flow Statement: {e}")
+
+            # Income Statement
+            if args.report in ["all", "income"]:
+                try:
+                    report = generate_income_statement(report_conn, user_id, fy,
+                                                       "json" if args.format in ["json", "xlsx"] else "text")
+
+                    if args.format == "text":
+                        print(report)
+                        if not args.no_save:
+                            save_text_report(report, reports_dir / f"income_statement_FY{fy_suffix}.txt")
+                    else:
+                        fy_reports["income"] = report
+                except Exception as e:
+                    print(f"Error generating Income Statement: {e}")
+
+            # Portfolio Summary
+            if args.report in ["all", "portfolio"]:
+                try:
+                    report = generate_portfolio_summary(report_conn, user_id,
+                                                        "json" if args.format in ["json", "xlsx"] else "text")
+
+                    if args.format == "text":
+                        print(report)
+                        if not args.no_save:
+                            save_text_report(report, reports_dir / f"portfolio_summary_FY{fy_suffix}.txt")
+                    else:
+                        fy_reports["portfolio"] = report
+                except Exception as e:
+                    print(f"Error generating Portfolio Summary: {e}")
 
-        # Income Statement
-        if args.report in ["all", "income"]:
-            try:
-                report = generate_income_statement(conn, user_id, fy,
-                                                  "json" if args.format in ["json", "xlsx"] else "text")
-
-                if args.format == "text":
-                    print(report)
-                    if not args.no_save:
-                        save_text_report(report, reports_dir / f"income_statement_FY{fy_suffix}.txt")
-                else:
-                    fy_reports["income"] = report
-            except Exception as e:
-                print(f"Error generating Income Statement: {e}")
-
-        # Portfolio Summary
-        if args.report in ["all", "portfolio"]:
-            try:
-                report = generate_portfolio_summary(conn, user_id,
-                                                   "json" if args.format in ["json", "xlsx"] else "text")
-
-                if args.format == "text":
-                    print(report)
-                    if not args.no_save:
-                        save_text_report(report, reports_dir / f"portfolio_summary_FY{fy_suffix}.txt")
-                else:
-                    fy_reports["portfolio"] = report
-            except Exception as e:
-                print(f"Error generating Portfolio Summary: {e}")
-
-        all_reports[fy] = fy_reports
+            all_reports[fy] = fy_reports
 
     # JSON output
     if args.format == "json":
@@ -205,6 +205,9 @@ def print_analysis_result(result: AnalysisResult, financial_year: str):
     print(f"  Holdings processed:     {result.holdings_processed}")
     print(f"  Transactions processed: {result.transactions_processed}")
     print(f"  Duplicates skipped:     {result.duplicates_skipped}")
+    for txn in result.duplicate_transactions:
+        print(f"    - {txn.symbol} x{txn.quantity}: {txn.buy_date} -> {txn.sell_date}"
+              f" ({Path(txn.source_file).name})")
 
     # Portfolio summary
     print("\n💰 PORTFOLIO SUMMARY")
@@ -375,6 +378,10 @@ Examples:
     resolver = PathResolver(project_root, args.user)
     resolver.ensure_user_structure()
 
+    # Scanner and ingester share file hashes within and across runs
+    from pfas.core.fingerprint import configure_fingerprint_cache
+    hash_cache = configure_fingerprint_cache(resolver.cache_dir() / "file_hashes.db")
+
     # Normalize financial year
     financial_year = get_financial_year(args.fy)
     logger.info(f"Financial year: {financial_year}")
@@ -418,6 +425,7 @@ Examples:
             ]
 
         print_scan_results(scanned_files, config)
+        print(f"File hash cache: {hash_cache.stats}")
         sys.exit(0)
 
     # Full analysis mode
@@ -450,6 +458,7 @@ Examples:
 
         # Print results
         print_analysis_result(result, financial_year)
+        print(f"File hash cache: {hash_cache.stats}")
 
         # Generate report
         if not args.no_report and result.success:
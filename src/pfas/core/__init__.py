@@ -3,92 +3,111 @@ Core module - Foundation components for PFAS.
 
 Provides:
 - DatabaseManager: SQLCipher encrypted database management
+- ConnectionPool: One writer plus pooled read-only connections
 - JournalEngine: Double-entry accounting journal
 - TransactionService: Unified transaction recording with idempotency
 - LedgerMapper: Automatic journal entry generation from normalized records
 - CurrencyConverter: Multi-currency support with exchange rates
-- AuditLogger: Compliance audit logging
+- AuditLogger: Compliance audit logging (full/summary/deferred audit modes)
+- XIRR: Batch XIRR engine (many cashflow series per call)
+- KeywordMatcher: Compiled first-match keyword rules for categorization
+- FileFingerprintCache: Shared MD5/SHA-256 file hashes keyed by path and stat
 - SessionManager: User session management with timeout
 - Security: User context management and validation
 - Field encryption utilities
 - Core models: NormalizedTransaction, CashFlow, BalanceSheetSnapshot, etc.
+
+Exports are imported from their submodules on first access (pfas._lazy).
 """
 
-from pfas.core.database import DatabaseManager
-from pfas.core.encryption import encrypt_field, decrypt_field, derive_key
-from pfas.core.accounts import setup_chart_of_accounts, get_account_by_code, CHART_OF_ACCOUNTS
-from pfas.core.journal import JournalEngine, JournalEntry
-from pfas.core.currency import CurrencyConverter
-from pfas.core.audit import AuditLogger
-from pfas.core.session import SessionManager
-from pfas.core.security import (
-    UserContext,
-    UserContextError,
-    require_user_context,
-    validate_user_owns_record,
-)
-from pfas.core.transaction_service import (
-    TransactionService,
-    TransactionResult,
-    TransactionSource,
-    TransactionRecord,
-    AssetRecord,
-    IdempotencyKeyGenerator,
-)
-from pfas.core.ledger_mapper import (
-    map_to_journal,
-    get_supported_transaction_types,
-    register_mapper,
-    AccountCode as LedgerAccountCode,
-    TransactionType as LedgerTransactionType,
-    AssetCategory as LedgerAssetCategory,
-)
-from pfas.core.exceptions import (
-    PFASError,
-    DatabaseError,
-    EncryptionError,
-    UnbalancedJournalError,
-    SessionExpiredError,
-    AccountNotFoundError,
-    ExchangeRateNotFoundError,
-    UserContextError,
-    IdempotencyError,
-    BatchIngestionError,
-    AccountingBalanceError,
-    InsufficientSharesError,
-    ForexRateNotFoundError,
-)
-from pfas.core.models import (
-    ActivityType,
-    FlowDirection,
-    AssetCategory,
-    LiabilityType,
-    CashFlowCategory,
-    NormalizedTransaction,
-    CashFlow,
-    AssetHolding,
-    Liability,
-    LiabilityTransaction,
-    BalanceSheetSnapshot,
-    CashFlowStatement,
-    get_financial_year,
-    get_fy_dates,
-)
+from pfas._lazy import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "pfas.core.database": ["DatabaseManager", "ConnectionPool", "PoolStats"],
+    "pfas.core.encryption": [
+        "encrypt_field", "decrypt_field", "decrypt_fields", "derive_key", "FieldCipher",
+        "KeyCache", "get_user_cipher", "clear_key_cache",
+    ],
+    "pfas.core.accounts": [
+        "setup_chart_of_accounts", "get_account_by_code", "CHART_OF_ACCOUNTS",
+        "AccountDirectory", "get_account_directory",
+    ],
+    "pfas.core.journal": ["JournalEngine", "JournalEntry"],
+    "pfas.core.currency": ["CurrencyConverter"],
+    "pfas.core.audit": ["AuditLogger", "AuditMode", "AuditBatch", "audit_session"],
+    "pfas.core.xirr": ["xirr", "xirr_batch", "CashflowBatch", "XIRRSolution", "XIRRStatus"],
+    "pfas.core.keyword_matcher": ["KeywordMatcher"],
+    "pfas.core.fingerprint": [
+        "FileFingerprintCache", "FingerprintStats", "file_fingerprint",
+        "get_fingerprint_cache", "configure_fingerprint_cache",
+    ],
+    "pfas.core.session": ["SessionManager"],
+    # UserContextError is exported from pfas.core.exceptions below
+    "pfas.core.security": ["UserContext", "require_user_context", "validate_user_owns_record"],
+    "pfas.core.transaction_service": [
+        "TransactionService", "TransactionResult", "TransactionSource", "TransactionRecord",
+        "TransactionRequest", "BulkTransactionSession", "AssetRecord", "IdempotencyKeyGenerator",
+    ],
+    "pfas.core.ledger_mapper": [
+        "map_to_journal", "get_supported_transaction_types", "register_mapper",
+        ("AccountCode", "LedgerAccountCode"),
+        ("TransactionType", "LedgerTransactionType"),
+        ("AssetCategory", "LedgerAssetCategory"),
+    ],
+    "pfas.core.exceptions": [
+        "PFASError", "DatabaseError", "EncryptionError", "UnbalancedJournalError",
+        "SessionExpiredError", "AccountNotFoundError", "ExchangeRateNotFoundError",
+        "UserContextError", "IdempotencyError", "BatchIngestionError", "AccountingBalanceError",
+        "InsufficientSharesError", "ForexRateNotFoundError",
+    ],
+    "pfas.core.models": [
+        "ActivityType", "FlowDirection", "AssetCategory", "LiabilityType", "CashFlowCategory",
+        "NormalizedTransaction", "CashFlow", "AssetHolding", "Liability",
+        "LiabilityTransaction", "BalanceSheetSnapshot", "CashFlowStatement",
+        "get_financial_year", "get_fy_dates",
+    ],
+})
 
 __all__ = [
     # Database & Infrastructure
     "DatabaseManager",
+    "ConnectionPool",
+    "PoolStats",
     "encrypt_field",
     "decrypt_field",
+    "decrypt_fields",
     "derive_key",
+    "FieldCipher",
+    "KeyCache",
+    "get_user_cipher",
+    "clear_key_cache",
     "setup_chart_of_accounts",
     "get_account_by_code",
     "CHART_OF_ACCOUNTS",
+    "AccountDirectory",
+    "get_account_directory",
     "JournalEngine",
     "JournalEntry",
     "CurrencyConverter",
     "AuditLogger",
+    "AuditMode",
+    "AuditBatch",
+    "audit_session",
     "SessionManager",
+    # XIRR
+    "xirr",
+    "xirr_batch",
+    "CashflowBatch",
+    "XIRRSolution",
+    "XIRRStatus",
+    # Keyword matching
+    "KeywordMatcher",
+    # File fingerprints
+    "FileFingerprintCache",
+    "FingerprintStats",
+    "file_fingerprint",
+    "get_fingerprint_cache",
+    "configure_fingerprint_cache",
     # Security & User Context
     "UserContext",
     "UserContextError",
@@ -99,6 +118,8 @@ __all__ = [
     "TransactionResult",
     "TransactionSource",
     "TransactionRecord",
+    "TransactionRequest",
+    "BulkTransactionSession",
     "AssetRecord",
     "IdempotencyKeyGenerator",
     # Ledger Mapper
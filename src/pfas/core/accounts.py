@@ -7,10 +7,15 @@ Supports Indian tax reporting requirements.
 
 from dataclasses import dataclass
 from typing import Optional, List, Dict, Any
+import logging
 import sqlite3
+import threading
 
+from pfas.core.connection_cache import ConnectionCache, DataGeneration, is_connection
 from pfas.core.exceptions import AccountNotFoundError
 
+logger = logging.getLogger(__name__)
+
 
 # Chart of Accounts - 18 Asset Classes
 CHART_OF_ACCOUNTS: Dict[str, Dict[str, Any]] = {
@@ -340,3 +345,220 @@ def get_account_hierarchy(
         }
 
     return {"roots": build_tree(None)}
+
+
+class AccountDirectory:
+    """
+    In-memory index of the accounts table for one connection.
+
+    Loads accounts once and serves lookups by code, id and parent from
+    memory. The cache invalidates itself when accounts change:
+    - Writes on the same connection are caught by TEMP triggers on
+      accounts that call back into the directory.
+    - Writes committed by other connections (and loads taken inside a
+      transaction that has since ended) are caught by the shared
+      DataGeneration check of pfas.core.connection_cache.
+
+    A code that is not in memory falls back to one DB query, so accounts
+    created before the triggers were installed are still found.
+
+    Usage:
+        directory = get_account_directory(conn)
+        bank_id = directory.get_id("1101")
+        print(directory.lookups_avoided)
+    """
+
+    _DIRTY_FUNCTION = "pfas_accounts_changed"
+
+    def __init__(self, conn: sqlite3.Connection):
+        """
+        Initialize the directory (accounts are loaded lazily).
+
+        Args:
+            conn: Database connection
+        """
+        self.conn = conn
+        self._lock = threading.RLock()
+        self._by_code: Dict[str, Account] = {}
+        self._by_id: Dict[int, Account] = {}
+        self._by_parent: Dict[Optional[int], List[Account]] = {}
+        self._loaded = False
+        self._dirty = True
+        self._generation = DataGeneration()
+        self._triggers_installed = False
+        self.loads = 0
+        self.hits = 0
+        self.db_lookups = 0
+
+    @property
+    def lookups_avoided(self) -> int:
+        """Number of account lookups answered without querying the DB."""
+        return self.hits
+
+    def stats(self) -> Dict[str, int]:
+        """Return load/hit/DB-lookup counters."""
+        return {
+            "accounts": len(self._by_id),
+            "loads": self.loads,
+            "lookups_avoided": self.hits,
+            "db_lookups": self.db_lookups,
+        }
+
+    def reset_stats(self) -> None:
+        """Reset counters (e.g., at the start of an ingest run)."""
+        self.loads = 0
+        self.hits = 0
+        self.db_lookups = 0
+
+    def invalidate(self) -> None:
+        """Force a reload on the next lookup."""
+        self._dirty = True
+
+    def _mark_dirty(self) -> None:
+        """SQL callback fired by the TEMP triggers on accounts."""
+        self._dirty = True
+
+    def _install_triggers(self) -> None:
+        """Install TEMP triggers that flag same-connection writes to accounts."""
+        if self._triggers_installed:
+            return
+        try:
+            self.conn.create_function(self._DIRTY_FUNCTION, 0, self._mark_dirty)
+            for event in ("INSERT", "UPDATE", "DELETE"):
+                self.conn.execute(f"""
+                    CREATE TEMP TRIGGER IF NOT EXISTS pfas_accounts_dirty_{event.lower()}
+                    AFTER {event} ON main.accounts
+                    BEGIN
+                        SELECT {self._DIRTY_FUNCTION}();
+                    END
+                """)
+            self._triggers_installed = True
+        except sqlite3.Error as e:
+            logger.debug(f"AccountDirectory triggers not installed: {e}")
+
+    def _ensure_fresh(self) -> None:
+        # Same-connection writes are flagged by the triggers, not total_changes
+        if self._dirty or not self._loaded or self._generation.is_stale(self.conn, own_writes=False):
+            self._load()
+
+    def _load(self) -> None:
+        with self._lock:
+            self._install_triggers()
+            self._generation.mark(self.conn)
+            self._dirty = False
+
+            by_code: Dict[str, Account] = {}
+            by_id: Dict[int, Account] = {}
+            by_parent: Dict[Optional[int], List[Account]] = {}
+            try:
+                rows = self.conn.execute(
+                    "SELECT id, code, name, account_type, parent_id, currency, "
+                    "description, is_active FROM accounts"
+                ).fetchall()
+            except sqlite3.Error:
+                # accounts table not created yet
+                rows = []
+                self._triggers_installed = False
+
+            for row in rows:
+                account = Account(
+                    id=row[0],
+                    code=row[1],
+                    name=row[2],
+                    account_type=row[3],
+                    parent_id=row[4],
+                    currency=row[5],
+                    description=row[6],
+                    is_active=bool(row[7]),
+                )
+                by_code[account.code] = account
+                by_id[account.id] = account
+                by_parent.setdefault(account.parent_id, []).append(account)
+
+            self._by_code, self._by_id, self._by_parent = by_code, by_id, by_parent
+            self._loaded = True
+            self.loads += 1
+
+    def get_by_code(self, code: str) -> Optional[Account]:
+        """Get an account by code, or None if not found."""
+        self._ensure_fresh()
+        account = self._by_code.get(code)
+        if account is not None:
+            self.hits += 1
+            return account
+
+        self.db_lookups += 1
+        account = get_account_by_code(self.conn, code)
+        if account is not None:
+            # Created outside the triggers' view; refresh the whole index
+            self.invalidate()
+        return account
+
+    def get_by_id(self, account_id: int) -> Optional[Account]:
+        """Get an account by ID, or None if not found."""
+        self._ensure_fresh()
+        account = self._by_id.get(account_id)
+        if account is not None:
+            self.hits += 1
+            return account
+
+        self.db_lookups += 1
+        account = get_account_by_id(self.conn, account_id)
+        if account is not None:
+            self.invalidate()
+        return account
+
+    def get_id(self, code: str) -> Optional[int]:
+        """Get an account ID by code, or None if not found."""
+        account = self.get_by_code(code)
+        return account.id if account else None
+
+    def get_children(self, parent_id: Optional[int]) -> List[Account]:
+        """Get active child accounts of a parent (None for root accounts)."""
+        self._ensure_fresh()
+        self.hits += 1
+        return [a for a in self._by_parent.get(parent_id, []) if a.is_active]
+
+
+_directories: "ConnectionCache[AccountDirectory]" = ConnectionCache(AccountDirectory)
+
+
+def get_account_directory(conn: sqlite3.Connection) -> Optional[AccountDirectory]:
+    """
+    Get the shared AccountDirectory for a connection.
+
+    Returns None for objects that are not real DB connections (e.g. test
+    doubles), so callers can fall back to get_account_by_code().
+
+    Args:
+        conn: Database connection
+
+    Returns:
+        AccountDirectory or None
+    """
+    if not is_connection(conn):
+        return None
+    return _directories.get(conn)
+
+
+def discard_account_directory(conn: sqlite3.Connection) -> None:
+    """Drop the cached AccountDirectory for a connection."""
+    _directories.discard(conn)
+
+
+def resolve_account_id(conn: sqlite3.Connection, code: str) -> Optional[int]:
+    """
+    Resolve an account code to its ID through the connection's directory.
+
+    Args:
+        conn: Database connection
+        code: Account code (e.g., "1101")
+
+    Returns:
+        Account ID or None if not found
+    """
+    directory = get_account_directory(conn)
+    if directory is not None:
+        return directory.get_id(code)
+    account = get_account_by_code(conn, code)
+    return account.id if account else None
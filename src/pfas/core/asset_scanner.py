@@ -24,7 +24,6 @@ Usage:
     holdings_files = result.holdings_files
 """
 
-import hashlib
 import logging
 from dataclasses import dataclass, field
 from datetime import date
@@ -39,6 +38,7 @@ from pfas.core.statement_detector import (
     StatementRulesConfig
 )
 from pfas.core.file_processor import MultiFileProcessor
+from pfas.core.fingerprint import file_fingerprint, get_fingerprint_cache
 
 logger = logging.getLogger(__name__)
 
@@ -113,11 +113,7 @@ class ScannedAssetFile:
 
     def _calculate_hash(self) -> str:
         """Calculate SHA256 hash of file."""
-        sha256 = hashlib.sha256()
-        with open(self.path, 'rb') as f:
-            for chunk in iter(lambda: f.read(8192), b''):
-                sha256.update(chunk)
-        return sha256.hexdigest()
+        return file_fingerprint(self.path)
 
     @property
     def is_transaction(self) -> bool:
@@ -361,6 +357,9 @@ class AssetScanner:
                         continue
                     files_to_scan.append(file_path)
 
+        # Hash new files in parallel; ScannedAssetFile reads the warmed cache
+        get_fingerprint_cache().hash_many(files_to_scan)
+
         # Process each file
         for file_path in files_to_scan:
             result.total_scanned += 1
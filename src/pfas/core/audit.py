@@ -3,14 +3,50 @@ Audit logging for compliance and data tracking.
 
 Captures all data changes with table, record ID, action, old/new values, and timestamp.
 Essential for tax compliance and audit trails.
+
+Audit modes (see AuditMode) control how TransactionService audits the
+records it writes. Bulk ingests can switch a connection to SUMMARY or
+DEFERRED with audit_session() to avoid one or more audit rows per
+ingested row.
 """
 
 import json
-from dataclasses import dataclass
+import logging
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from enum import Enum
+from typing import Optional, List, Dict, Any, Iterator, Set, Tuple, Union
 import sqlite3
 
+from pfas.core.connection_cache import ConnectionCache, is_connection
+
+logger = logging.getLogger(__name__)
+
+# IDs per existence check (below SQLite's 999 host parameters)
+_MAX_ID_PARAMS = 900
+
+
+class AuditMode(Enum):
+    """
+    How TransactionService audits the records it writes.
+
+    FULL: Row-level insert triggers fire; the service adds one row per
+        record only for tables without an insert trigger, so no record
+        is audited twice.
+    SUMMARY: Row-level insert triggers are suppressed; the service writes
+        one audit row per recorded transaction.
+    DEFERRED: Row-level insert triggers are suppressed; audit facts are
+        collected in memory and written as one audit_batches record when
+        the audit_session() block exits (typically once per file).
+        Row-level detail is available on demand via
+        AuditLogger.get_batch_detail().
+    """
+
+    FULL = "full"
+    SUMMARY = "summary"
+    DEFERRED = "deferred"
+
 
 @dataclass
 class AuditLogEntry:
@@ -132,6 +168,7 @@ class AuditLogger:
         if action not in self.VALID_ACTIONS:
             raise ValueError(f"Invalid action: {action}. Must be one of {self.VALID_ACTIONS}")
 
+        in_transaction = self.conn.in_transaction
         cursor = self.conn.cursor()
 
         # Check if source column exists (backward compatibility)
@@ -175,7 +212,9 @@ class AuditLogger:
                 ),
             )
 
-        self.conn.commit()
+        # Don't commit a caller's open transaction (e.g., a batch ingest)
+        if not in_transaction:
+            self.conn.commit()
         return cursor.lastrowid
 
     def log_insert(
@@ -353,6 +392,83 @@ class AuditLogger:
         cursor = self.conn.execute(query, params)
         return [AuditLogEntry.from_row(row) for row in cursor.fetchall()]
 
+    def get_batch(self, batch_id: int) -> Optional["AuditBatch"]:
+        """
+        Get a DEFERRED-mode batch audit record.
+
+        Args:
+            batch_id: audit_batches ID
+
+        Returns:
+            AuditBatch or None if not found
+        """
+        if not _table_exists(self.conn, "audit_batches"):
+            return None
+
+        row = self.conn.execute(
+            """
+            SELECT id, label, source, user_id, row_ids
+            FROM audit_batches WHERE id = ?
+            """,
+            (batch_id,),
+        ).fetchone()
+        if not row:
+            return None
+
+        batch = AuditBatch(label=row[1], user_id=row[3], source=row[2], id=row[0])
+        for table_name, ranges in json.loads(row[4]).items():
+            batch.row_ids[table_name] = [
+                record_id for first, last in ranges for record_id in range(first, last + 1)
+            ]
+        return batch
+
+    def get_batch_detail(
+        self,
+        batch_id: int,
+        table_name: str = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Expand a batch audit record into row-level detail.
+
+        Values are read from the audited tables when requested, so they
+        reflect the current row; rows deleted since have values None.
+
+        Args:
+            batch_id: audit_batches ID
+            table_name: Only expand rows of this table (optional)
+
+        Returns:
+            List of dicts with table_name, record_id and values
+        """
+        batch = self.get_batch(batch_id)
+        if batch is None:
+            return []
+
+        detail = []
+        for name, record_ids in batch.row_ids.items():
+            if table_name and name != table_name:
+                continue
+
+            rows: Dict[int, Dict[str, Any]] = {}
+            # Table names come from our own batches, but only query real tables
+            if _table_exists(self.conn, name):
+                for start in range(0, len(record_ids), 900):
+                    chunk = record_ids[start:start + 900]
+                    placeholders = ",".join("?" for _ in chunk)
+                    cursor = self.conn.execute(
+                        f"SELECT * FROM {name} WHERE id IN ({placeholders})", chunk
+                    )
+                    columns = [desc[0] for desc in cursor.description]
+                    for values in cursor.fetchall():
+                        row = dict(zip(columns, values))
+                        rows[row["id"]] = row
+
+            detail.extend(
+                {"table_name": name, "record_id": rid, "values": rows.get(rid)}
+                for rid in record_ids
+            )
+        return detail
+
     def mask_sensitive_values(self, values: Dict[str, Any]) -> Dict[str, Any]:
         """
         Mask sensitive values before logging.
@@ -378,3 +494,266 @@ class AuditLogger:
                 masked[key] = value
 
         return masked
+
+
+def _table_exists(conn: sqlite3.Connection, table_name: str) -> bool:
+    """Check whether a table exists in the main schema."""
+    return conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+        (table_name,),
+    ).fetchone() is not None
+
+
+@dataclass
+class AuditBatch:
+    """
+    Audit facts collected by a DEFERRED audit session.
+
+    Written as one audit_batches row (IDs stored as [first, last] ranges
+    per table) plus one audit_log row pointing at it.
+    """
+
+    label: Optional[str] = None
+    user_id: Optional[int] = None
+    source: Optional[str] = None
+    row_ids: Dict[str, List[int]] = field(default_factory=dict)
+    id: Optional[int] = None
+
+    def add(self, table_name: str, record_id: int) -> None:
+        """Record that a row was inserted."""
+        self.row_ids.setdefault(table_name, []).append(record_id)
+
+    @property
+    def row_count(self) -> int:
+        """Number of rows recorded."""
+        return sum(len(ids) for ids in self.row_ids.values())
+
+    def retain_existing(self, conn: sqlite3.Connection) -> None:
+        """
+        Drop IDs of rows that no longer exist.
+
+        A write joined to a caller's transaction hands its facts over when
+        its savepoint is released; if the caller then rolls back, the rows
+        are gone and must not be audited.
+        """
+        for table_name, record_ids in list(self.row_ids.items()):
+            unique = sorted(set(record_ids))
+            present: Set[int] = set()
+            for start in range(0, len(unique), _MAX_ID_PARAMS):
+                chunk = unique[start:start + _MAX_ID_PARAMS]
+                placeholders = ",".join("?" * len(chunk))
+                present.update(row[0] for row in conn.execute(
+                    f'SELECT rowid FROM "{table_name}" WHERE rowid IN ({placeholders})', chunk
+                ))
+            kept = list(dict.fromkeys(i for i in record_ids if i in present))
+            if kept:
+                self.row_ids[table_name] = kept
+            else:
+                del self.row_ids[table_name]
+
+    def id_ranges(self) -> Dict[str, List[List[int]]]:
+        """Compress recorded IDs into sorted [first, last] ranges per table."""
+        compact = {}
+        for table_name, record_ids in self.row_ids.items():
+            ranges: List[List[int]] = []
+            for record_id in sorted(set(record_ids)):
+                if ranges and record_id == ranges[-1][1] + 1:
+                    ranges[-1][1] = record_id
+                else:
+                    ranges.append([record_id, record_id])
+            compact[table_name] = ranges
+        return compact
+
+
+class AuditContext:
+    """
+    Per-connection audit state: the active AuditMode, which tables have
+    row-level insert triggers, and the open DEFERRED batch (if any).
+
+    Use get_audit_context() rather than constructing this directly.
+    """
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+        self.mode = AuditMode.FULL
+        self.batch: Optional[AuditBatch] = None
+        self._staged: List[Tuple[str, int]] = []
+        self.trigger_tables: Set[str] = set()
+        self.guarded_tables: Set[str] = set()
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Re-read which tables have (suppressible) audit insert triggers."""
+        rows = self.conn.execute(
+            """
+            SELECT tbl_name, sql FROM sqlite_master
+            WHERE type = 'trigger' AND name LIKE 'audit_%_insert'
+            """
+        ).fetchall()
+        self.trigger_tables = {row[0] for row in rows}
+        self.guarded_tables = {row[0] for row in rows if "audit_control" in (row[1] or "")}
+
+        # The suppression flag is only ever set inside a write transaction;
+        # a committed 1 means a writer bypassed end_write(), so repair it
+        if self.guarded_tables and not self.conn.in_transaction:
+            row = self.conn.execute(
+                "SELECT suppress_row_audit FROM audit_control WHERE id = 1"
+            ).fetchone()
+            if row and row[0]:
+                logger.warning("Resetting stale audit_control.suppress_row_audit flag")
+                self.conn.execute("UPDATE audit_control SET suppress_row_audit = 0 WHERE id = 1")
+                self.conn.commit()
+
+        unguarded = self.trigger_tables - self.guarded_tables
+        if unguarded:
+            logger.debug(
+                f"Audit insert triggers without audit_control guard: {sorted(unguarded)}; "
+                f"run migration 005 to enable summary/deferred audit modes"
+            )
+
+    @property
+    def suppresses_row_triggers(self) -> bool:
+        """True when the active mode replaces row-level insert triggers."""
+        return self.mode is not AuditMode.FULL and bool(self.guarded_tables)
+
+    def begin_write(self, cursor: sqlite3.Cursor) -> None:
+        """
+        Suppress row-level insert triggers for the current write transaction.
+
+        Must be called after BEGIN and paired with end_write() before
+        commit, so the flag is never visible to other connections.
+        """
+        if self.suppresses_row_triggers:
+            cursor.execute("UPDATE audit_control SET suppress_row_audit = 1 WHERE id = 1")
+
+    def end_write(self, cursor: sqlite3.Cursor) -> None:
+        """Re-enable row-level insert triggers before the transaction commits."""
+        if self.suppresses_row_triggers:
+            cursor.execute("UPDATE audit_control SET suppress_row_audit = 0 WHERE id = 1")
+
+    def stage(self, table_name: str, record_id: int) -> None:
+        """Stage a DEFERRED audit fact until the write transaction commits."""
+        self._staged.append((table_name, record_id))
+
+    def commit_staged(self) -> None:
+        """Move staged facts into the open batch after a successful commit."""
+        if self.batch is not None:
+            for table_name, record_id in self._staged:
+                self.batch.add(table_name, record_id)
+        self._staged = []
+
+    def discard_staged(self) -> None:
+        """Drop staged facts after a rollback."""
+        self._staged = []
+
+
+_contexts: "ConnectionCache[AuditContext]" = ConnectionCache(AuditContext)
+
+
+def get_audit_context(conn: sqlite3.Connection) -> Optional[AuditContext]:
+    """
+    Get the shared AuditContext for a connection.
+
+    Returns None for objects that are not real DB connections (e.g. test
+    doubles); callers then audit as in FULL mode.
+
+    Args:
+        conn: Database connection
+
+    Returns:
+        AuditContext or None
+    """
+    if not is_connection(conn):
+        return None
+    return _contexts.get(conn)
+
+
+@contextmanager
+def audit_session(
+    conn: sqlite3.Connection,
+    mode: Union[AuditMode, str],
+    label: str = None,
+    user_id: int = None,
+    source: str = None,
+) -> Iterator[Optional[AuditBatch]]:
+    """
+    Audit writes made on a connection inside the block with the given mode.
+
+    In DEFERRED mode the collected facts are written as one batch audit
+    record when the block exits normally, in the caller's transaction if
+    one is open, and only for rows that still exist; if it raises,
+    nothing is written (the data writes are expected to roll back too).
+
+    Usage:
+        with audit_session(conn, "deferred", label=file_path.name, user_id=1) as batch:
+            parser.parse(file_path)
+        print(batch.id, batch.row_count)
+
+    Args:
+        conn: Database connection
+        mode: AuditMode or its value ('full', 'summary', 'deferred')
+        label: Batch label, e.g. the ingested file name (DEFERRED only)
+        user_id: User recorded on the batch audit row
+        source: Source recorded on the batch audit row
+
+    Yields:
+        The AuditBatch being collected in DEFERRED mode, otherwise None
+    """
+    mode = AuditMode(mode)
+    context = get_audit_context(conn)
+    if context is None:
+        yield None
+        return
+
+    previous = (context.mode, context.batch)
+    context.mode = mode
+    context.batch = AuditBatch(label, user_id, source) if mode is AuditMode.DEFERRED else None
+    batch = context.batch
+    try:
+        yield batch
+        if batch is not None and batch.row_ids:
+            batch.retain_existing(conn)
+        if batch is not None and batch.row_ids:
+            batch.id = write_audit_batch(conn, batch)
+    finally:
+        context.discard_staged()
+        context.mode, context.batch = previous
+
+
+def write_audit_batch(conn: sqlite3.Connection, batch: AuditBatch) -> int:
+    """
+    Write a batch audit record.
+
+    Commits only if the connection was not already in a transaction.
+
+    Args:
+        conn: Database connection
+        batch: Collected audit facts
+
+    Returns:
+        audit_batches ID
+    """
+    in_transaction = conn.in_transaction
+    cursor = conn.execute(
+        """
+        INSERT INTO audit_batches (label, source, user_id, row_count, row_ids)
+        VALUES (?, ?, ?, ?, ?)
+        """,
+        (batch.label, batch.source, batch.user_id, batch.row_count,
+         json.dumps(batch.id_ranges(), separators=(",", ":"))),
+    )
+    batch_id = cursor.lastrowid
+
+    AuditLogger(conn, user_id=batch.user_id, source=batch.source).log_insert(
+        table_name="audit_batches",
+        record_id=batch_id,
+        new_values={
+            "label": batch.label,
+            "row_count": batch.row_count,
+            "tables": {name: len(ids) for name, ids in batch.row_ids.items()},
+        },
+    )
+
+    if not in_transaction:
+        conn.commit()
+    return batch_id
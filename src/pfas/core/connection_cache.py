@@ -0,0 +1,180 @@
+"""
+Per-connection caches and the rule for when their contents are stale.
+
+Account directories, audit contexts, rate calendars and tax-rule
+snapshots are all kept per connection. ConnectionCache holds one value
+per connection for each of them:
+- At most max_connections values; least recently used are dropped.
+- Values of closed connections are pruned whenever a new one is added.
+- discard_connection_caches(conn) drops a connection's value from every
+  cache; DatabaseManager and ConnectionPool call it before closing a
+  connection, so caches do not keep closed connections alive.
+
+sqlite3 connections cannot be weakly referenced, which is why values
+are released through these hooks rather than by garbage collection.
+
+DataGeneration records the database generation a cached value was read
+at. The value is stale once the connection itself wrote (total_changes),
+or, outside a transaction, once another connection committed (PRAGMA
+data_version) or when it was read inside a transaction that has since
+ended and may have been rolled back.
+
+Usage:
+    _snapshots = ConnectionCache(_Snapshot)
+
+    entry = _snapshots.get(conn)
+    if entry.generation.is_stale(conn):
+        entry.generation.mark(conn)
+        entry.reload(conn)
+"""
+
+import sqlite3
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Callable, Generic, Optional, Tuple, TypeVar
+
+try:
+    import sqlcipher3
+    _CONNECTION_TYPES = (sqlite3.Connection, sqlcipher3.Connection)
+except ImportError:
+    _CONNECTION_TYPES = (sqlite3.Connection,)
+
+# Connections whose values each cache keeps
+MAX_CACHED_CONNECTIONS = 8
+
+T = TypeVar("T")
+
+_caches: "weakref.WeakSet[ConnectionCache]" = weakref.WeakSet()
+_caches_lock = threading.Lock()
+
+
+def is_connection(conn) -> bool:
+    """True for real DB connections (not test doubles)."""
+    return isinstance(conn, _CONNECTION_TYPES)
+
+
+def _is_closed(conn) -> bool:
+    try:
+        conn.total_changes
+    except Exception:
+        return True
+    return False
+
+
+def data_version(conn) -> Optional[int]:
+    """PRAGMA data_version of a connection, or None if it cannot be read."""
+    try:
+        return conn.execute("PRAGMA data_version").fetchone()[0]
+    except Exception:
+        return None
+
+
+class DataGeneration:
+    """Database generation a cached value was read at."""
+
+    __slots__ = ("changes", "data_version", "tentative")
+
+    def __init__(self):
+        self.changes: Optional[int] = None
+        self.data_version: Optional[int] = None
+        self.tentative = False
+
+    def is_stale(self, conn, own_writes: bool = True) -> bool:
+        """
+        Whether the database may have changed since mark().
+
+        Args:
+            conn: Connection the value was read through
+            own_writes: Count writes on conn itself; callers that track
+                those another way (e.g. triggers) pass False
+
+        Returns:
+            True if never marked or the generation moved
+        """
+        if self.changes is None:
+            return True
+        if own_writes and conn.total_changes != self.changes:
+            return True
+        if conn.in_transaction:
+            # Other connections cannot commit while this one holds a transaction
+            return False
+        return self.tentative or data_version(conn) != self.data_version
+
+    def mark(self, conn) -> None:
+        """Record the current generation (call before re-reading)."""
+        self.changes = conn.total_changes
+        self.data_version = data_version(conn)
+        self.tentative = conn.in_transaction
+
+    def advance(self, conn) -> None:
+        """Accept the connection's own writes since mark() as already applied."""
+        self.changes = conn.total_changes
+        self.tentative = self.tentative or conn.in_transaction
+
+
+class ConnectionCache(Generic[T]):
+    """
+    One value per connection, built on first use by factory(conn).
+
+    Values may keep a reference to their connection; entries are dropped
+    on eviction, on discard() and once the connection is found closed.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[..., T],
+        max_connections: int = MAX_CACHED_CONNECTIONS,
+    ):
+        self.factory = factory
+        self.max_connections = max_connections
+        self._entries: "OrderedDict[int, Tuple[object, T]]" = OrderedDict()
+        self._lock = threading.RLock()
+        with _caches_lock:
+            _caches.add(self)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def peek(self, conn) -> Optional[T]:
+        """Cached value of a connection, without creating one."""
+        with self._lock:
+            entry = self._entries.get(id(conn))
+            if entry is not None and entry[0] is conn:
+                return entry[1]
+            return None
+
+    def get(self, conn) -> T:
+        """Cached value of a connection, creating it on first use."""
+        with self._lock:
+            key = id(conn)
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] is conn:
+                self._entries.move_to_end(key)
+                return entry[1]
+
+            for other in [k for k, (c, _) in self._entries.items() if _is_closed(c)]:
+                del self._entries[other]
+            value = self.factory(conn)
+            self._entries[key] = (conn, value)
+            while len(self._entries) > self.max_connections:
+                self._entries.popitem(last=False)
+            return value
+
+    def discard(self, conn=None) -> None:
+        """Drop the value of one connection, or of all."""
+        with self._lock:
+            if conn is None:
+                self._entries.clear()
+                return
+            entry = self._entries.get(id(conn))
+            if entry is not None and entry[0] is conn:
+                del self._entries[id(conn)]
+
+
+def discard_connection_caches(conn) -> None:
+    """Drop a connection's values from every ConnectionCache (e.g., on close)."""
+    with _caches_lock:
+        caches = list(_caches)
+    for cache in caches:
+        cache.discard(conn)
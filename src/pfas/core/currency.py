@@ -7,11 +7,12 @@ For Phase 2: SBI TT Buying Rate automatic lookup.
 
 from dataclasses import dataclass
 from decimal import Decimal, ROUND_HALF_UP
-from datetime import date, timedelta
+from datetime import date
 from typing import Optional, List
 import sqlite3
 
 from pfas.core.exceptions import ExchangeRateNotFoundError
+from pfas.core.rate_calendar import RateCalendar, RateObservation, rate_calendar, rate_writes
 
 
 @dataclass
@@ -37,6 +38,20 @@ class ExchangeRate:
             source=row["source"],
         )
 
+    @classmethod
+    def from_observation(
+        cls, observation: RateObservation, from_currency: str, to_currency: str
+    ) -> "ExchangeRate":
+        """Create ExchangeRate from a rate calendar entry."""
+        return cls(
+            id=observation.id,
+            date=observation.rate_date,
+            from_currency=from_currency,
+            to_currency=to_currency,
+            rate=observation.rate,
+            source=observation.source,
+        )
+
 
 class CurrencyConverter:
     """
@@ -51,6 +66,9 @@ class CurrencyConverter:
         # Convert
         inr = converter.convert(Decimal("100"), "USD", date(2024, 6, 15))
         # Returns Decimal("8350.00")
+
+    Lookups go through the connection's shared RateCalendar
+    (pfas.core.rate_calendar), the same one SBITTRateProvider uses.
     """
 
     # Rounding precision for currency amounts
@@ -91,25 +109,30 @@ class CurrencyConverter:
 
         cursor = self.conn.cursor()
 
-        # Use INSERT OR REPLACE for upsert behavior
-        cursor.execute(
-            """
-            INSERT OR REPLACE INTO exchange_rates
-            (date, from_currency, to_currency, rate, source)
-            VALUES (?, ?, ?, ?, ?)
-            """,
-            (
-                rate_date.isoformat(),
-                from_currency.upper(),
-                to_currency.upper(),
-                str(rate),
-                source,
-            ),
-        )
-
-        self.conn.commit()
+        with rate_writes(self.conn) as written:
+            # Use INSERT OR REPLACE for upsert behavior
+            cursor.execute(
+                """
+                INSERT OR REPLACE INTO exchange_rates
+                (date, from_currency, to_currency, rate, source)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (
+                    rate_date.isoformat(),
+                    from_currency.upper(),
+                    to_currency.upper(),
+                    str(rate),
+                    source,
+                ),
+            )
+            written.append(cursor.lastrowid)
+            self.conn.commit()
         return cursor.lastrowid
 
+    def calendar(self, from_currency: str, to_currency: str = "INR") -> RateCalendar:
+        """Shared daily rate calendar of a currency pair."""
+        return rate_calendar(self.conn, from_currency.upper(), to_currency.upper())
+
     def get_rate(
         self,
         from_currency: str,
@@ -127,16 +150,13 @@ class CurrencyConverter:
         Returns:
             ExchangeRate object or None if not found
         """
-        cursor = self.conn.execute(
-            """
-            SELECT * FROM exchange_rates
-            WHERE from_currency = ? AND to_currency = ? AND date = ?
-            """,
-            (from_currency.upper(), to_currency.upper(), as_of_date.isoformat()),
+        observation = self.calendar(from_currency, to_currency).observation_on(
+            as_of_date, max_days_back=0
         )
-        row = cursor.fetchone()
-        if row:
-            return ExchangeRate.from_row(row)
+        if observation:
+            return ExchangeRate.from_observation(
+                observation, from_currency.upper(), to_currency.upper()
+            )
         return None
 
     def get_rate_or_nearest(
@@ -158,31 +178,13 @@ class CurrencyConverter:
         Returns:
             ExchangeRate object or None if not found within range
         """
-        # Try exact date first
-        rate = self.get_rate(from_currency, as_of_date, to_currency)
-        if rate:
-            return rate
-
-        # Look for nearest previous rate
-        earliest_date = as_of_date - timedelta(days=max_days_back)
-        cursor = self.conn.execute(
-            """
-            SELECT * FROM exchange_rates
-            WHERE from_currency = ? AND to_currency = ?
-            AND date <= ? AND date >= ?
-            ORDER BY date DESC
-            LIMIT 1
-            """,
-            (
-                from_currency.upper(),
-                to_currency.upper(),
-                as_of_date.isoformat(),
-                earliest_date.isoformat(),
-            ),
+        observation = self.calendar(from_currency, to_currency).observation_on(
+            as_of_date, max_days_back
         )
-        row = cursor.fetchone()
-        if row:
-            return ExchangeRate.from_row(row)
+        if observation:
+            return ExchangeRate.from_observation(
+                observation, from_currency.upper(), to_currency.upper()
+            )
         return None
 
     def convert(
@@ -248,21 +250,12 @@ class CurrencyConverter:
         Returns:
             List of ExchangeRate objects
         """
-        cursor = self.conn.execute(
-            """
-            SELECT * FROM exchange_rates
-            WHERE from_currency = ? AND to_currency = ?
-            AND date >= ? AND date <= ?
-            ORDER BY date
-            """,
-            (
-                from_currency.upper(),
-                to_currency.upper(),
-                start_date.isoformat(),
-                end_date.isoformat(),
-            ),
-        )
-        return [ExchangeRate.from_row(row) for row in cursor.fetchall()]
+        return [
+            ExchangeRate.from_observation(o, from_currency.upper(), to_currency.upper())
+            for o in self.calendar(from_currency, to_currency).observations_between(
+                start_date, end_date
+            )
+        ]
 
     def bulk_add_rates(
         self,
@@ -282,29 +275,31 @@ class CurrencyConverter:
         cursor = self.conn.cursor()
         count = 0
 
-        for rate_date, from_currency, rate in rates:
-            # Ensure rate is stored as string to preserve precision
-            if isinstance(rate, Decimal):
-                rate_str = str(rate)
-            else:
-                rate_str = str(Decimal(str(rate)))
-
-            cursor.execute(
-                """
-                INSERT OR REPLACE INTO exchange_rates
-                (date, from_currency, to_currency, rate, source)
-                VALUES (?, ?, 'INR', ?, ?)
-                """,
-                (
-                    rate_date.isoformat() if isinstance(rate_date, date) else rate_date,
-                    from_currency.upper(),
-                    rate_str,
-                    source,
-                ),
-            )
-            count += 1
-
-        self.conn.commit()
+        with rate_writes(self.conn) as written:
+            for rate_date, from_currency, rate in rates:
+                # Ensure rate is stored as string to preserve precision
+                if isinstance(rate, Decimal):
+                    rate_str = str(rate)
+                else:
+                    rate_str = str(Decimal(str(rate)))
+
+                cursor.execute(
+                    """
+                    INSERT OR REPLACE INTO exchange_rates
+                    (date, from_currency, to_currency, rate, source)
+                    VALUES (?, ?, 'INR', ?, ?)
+                    """,
+                    (
+                        rate_date.isoformat() if isinstance(rate_date, date) else rate_date,
+                        from_currency.upper(),
+                        rate_str,
+                        source,
+                    ),
+                )
+                written.append(cursor.lastrowid)
+                count += 1
+
+            self.conn.commit()
         return count
 
 
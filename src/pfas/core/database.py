@@ -9,12 +9,17 @@ Thread Safety Notes:
 - WAL mode is enabled for better concurrent read performance
 - Use the transaction() context manager for atomic operations
 - SQLite handles locking internally in WAL mode
+- reader() hands out pooled read-only connections (one per thread) so
+  long reads do not serialize on the writer connection
 """
 
+from dataclasses import dataclass, replace
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 from contextlib import contextmanager
+import logging
 import threading
+import time
 
 try:
     import sqlcipher3 as sqlite3
@@ -23,8 +28,11 @@ except ImportError:
     import sqlite3
     HAS_SQLCIPHER = False
 
+from pfas.core.connection_cache import discard_connection_caches
 from pfas.core.exceptions import DatabaseError
 
+logger = logging.getLogger(__name__)
+
 
 # Schema SQL for all core tables
 SCHEMA_SQL = """
@@ -40,6 +48,14 @@ CREATE TABLE IF NOT EXISTS users (
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
+-- Per-user key salt for envelope field encryption (see core/encryption.py)
+CREATE TABLE IF NOT EXISTS user_encryption_keys (
+    user_id INTEGER PRIMARY KEY,
+    key_salt BLOB NOT NULL,
+    version INTEGER NOT NULL DEFAULT 1,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
 CREATE TABLE IF NOT EXISTS accounts (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     code TEXT UNIQUE NOT NULL,
@@ -82,6 +98,17 @@ CREATE TABLE IF NOT EXISTS journal_entries (
     FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE RESTRICT
 );
 
+-- Per-account, per-day journal totals with the running balance
+-- (debit minus credit, INR), maintained by JournalEngine
+CREATE TABLE IF NOT EXISTS account_daily_balances (
+    account_id INTEGER NOT NULL,
+    date DATE NOT NULL,
+    debit DECIMAL(15,2) NOT NULL DEFAULT 0,
+    credit DECIMAL(15,2) NOT NULL DEFAULT 0,
+    running_balance DECIMAL(15,2) NOT NULL DEFAULT 0,
+    PRIMARY KEY (account_id, date)
+) WITHOUT ROWID;
+
 CREATE TABLE IF NOT EXISTS exchange_rates (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     date DATE NOT NULL,
@@ -108,6 +135,27 @@ CREATE TABLE IF NOT EXISTS audit_log (
     FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE SET NULL
 );
 
+-- Row-level audit switch. suppress_row_audit is set to 1 only inside a
+-- write transaction (summary/deferred audit modes, see pfas.core.audit)
+-- and reset before commit, so other connections never observe it.
+CREATE TABLE IF NOT EXISTS audit_control (
+    id INTEGER PRIMARY KEY CHECK(id = 1),
+    suppress_row_audit INTEGER NOT NULL DEFAULT 0
+);
+
+INSERT OR IGNORE INTO audit_control (id, suppress_row_audit) VALUES (1, 0);
+
+-- Compact batch audit records written by the deferred audit mode
+CREATE TABLE IF NOT EXISTS audit_batches (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    label TEXT,
+    source TEXT,
+    user_id INTEGER,
+    row_count INTEGER NOT NULL DEFAULT 0,
+    row_ids TEXT NOT NULL,  -- JSON {table_name: [[first_id, last_id], ...]}
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
 CREATE TABLE IF NOT EXISTS sessions (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     user_id INTEGER NOT NULL,
@@ -198,11 +246,13 @@ CREATE INDEX IF NOT EXISTS idx_bank_txn_interest ON bank_transactions(is_interes
 CREATE INDEX IF NOT EXISTS idx_bank_interest_user ON bank_interest_summary(user_id);
 
 -- Automatic Audit Logging Triggers
--- These triggers automatically populate the audit_log table for all data changes
+-- These triggers automatically populate the audit_log table for all data changes.
+-- INSERT triggers are skipped while audit_control.suppress_row_audit is set.
 
 -- Journals table triggers
 CREATE TRIGGER IF NOT EXISTS audit_journals_insert
 AFTER INSERT ON journals
+WHEN NOT EXISTS (SELECT 1 FROM audit_control WHERE suppress_row_audit = 1)
 BEGIN
     INSERT INTO audit_log (table_name, record_id, action, new_values, user_id, timestamp)
     VALUES (
@@ -274,6 +324,7 @@ END;
 -- Journal entries table triggers
 CREATE TRIGGER IF NOT EXISTS audit_journal_entries_insert
 AFTER INSERT ON journal_entries
+WHEN NOT EXISTS (SELECT 1 FROM audit_control WHERE suppress_row_audit = 1)
 BEGIN
     INSERT INTO audit_log (table_name, record_id, action, new_values, user_id, timestamp)
     VALUES (
@@ -349,6 +400,7 @@ END;
 -- Accounts table triggers
 CREATE TRIGGER IF NOT EXISTS audit_accounts_insert
 AFTER INSERT ON accounts
+WHEN NOT EXISTS (SELECT 1 FROM audit_control WHERE suppress_row_audit = 1)
 BEGIN
     INSERT INTO audit_log (table_name, record_id, action, new_values, user_id, timestamp)
     VALUES (
@@ -422,6 +474,7 @@ END;
 -- Exchange rates table triggers
 CREATE TRIGGER IF NOT EXISTS audit_exchange_rates_insert
 AFTER INSERT ON exchange_rates
+WHEN NOT EXISTS (SELECT 1 FROM audit_control WHERE suppress_row_audit = 1)
 BEGIN
     INSERT INTO audit_log (table_name, record_id, action, new_values, user_id, timestamp)
     VALUES (
@@ -491,6 +544,7 @@ END;
 -- Bank accounts table triggers
 CREATE TRIGGER IF NOT EXISTS audit_bank_accounts_insert
 AFTER INSERT ON bank_accounts
+WHEN NOT EXISTS (SELECT 1 FROM audit_control WHERE suppress_row_audit = 1)
 BEGIN
     INSERT INTO audit_log (table_name, record_id, action, new_values, user_id, timestamp)
     VALUES (
@@ -564,6 +618,7 @@ END;
 -- Bank transactions table triggers (limited fields to avoid sensitive data)
 CREATE TRIGGER IF NOT EXISTS audit_bank_transactions_insert
 AFTER INSERT ON bank_transactions
+WHEN NOT EXISTS (SELECT 1 FROM audit_control WHERE suppress_row_audit = 1)
 BEGIN
     INSERT INTO audit_log (table_name, record_id, action, new_values, user_id, timestamp)
     VALUES (
@@ -899,6 +954,20 @@ CREATE TABLE IF NOT EXISTS mf_capital_gains_reconciliation (
 
 CREATE INDEX IF NOT EXISTS idx_mf_capital_gains_recon_user_fy ON mf_capital_gains_reconciliation(user_id, financial_year);
 
+-- MF FIFO Lot Checkpoints (open lots per folio/scheme at each FY start)
+CREATE TABLE IF NOT EXISTS mf_fifo_lot_checkpoints (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER NOT NULL,
+    folio TEXT NOT NULL,
+    scheme_name TEXT NOT NULL,
+    boundary_date DATE NOT NULL,           -- FY start; lots open before this date
+    lots TEXT NOT NULL,                    -- JSON FIFOUnitTracker state
+    txn_fingerprint TEXT NOT NULL,         -- SHA-256 of the folio/scheme's transactions before boundary_date
+    version INTEGER NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(user_id, folio, scheme_name, boundary_date)
+);
+
 -- Stock Tables
 CREATE TABLE IF NOT EXISTS stock_brokers (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -1474,6 +1543,17 @@ CREATE TABLE IF NOT EXISTS foreign_holdings (
     FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE RESTRICT
 );
 
+-- Foreign Stock Prices (daily closes for Schedule FA peak values)
+CREATE TABLE IF NOT EXISTS foreign_stock_prices (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    symbol TEXT NOT NULL,
+    price_date DATE NOT NULL,
+    close_usd DECIMAL(15,4) NOT NULL,
+    source TEXT DEFAULT 'unknown',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(symbol, price_date)
+);
+
 -- DTAA Credits
 CREATE TABLE IF NOT EXISTS dtaa_credits (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -1562,6 +1642,7 @@ CREATE INDEX IF NOT EXISTS idx_foreign_dividends_date ON foreign_dividends(divid
 CREATE INDEX IF NOT EXISTS idx_foreign_dividends_symbol ON foreign_dividends(symbol);
 CREATE INDEX IF NOT EXISTS idx_foreign_holdings_user ON foreign_holdings(user_id);
 CREATE INDEX IF NOT EXISTS idx_foreign_holdings_date ON foreign_holdings(valuation_date);
+CREATE INDEX IF NOT EXISTS idx_foreign_stock_prices_symbol_date ON foreign_stock_prices(symbol, price_date);
 CREATE INDEX IF NOT EXISTS idx_dtaa_credits_user ON dtaa_credits(user_id);
 CREATE INDEX IF NOT EXISTS idx_dtaa_credits_date ON dtaa_credits(income_date);
 CREATE INDEX IF NOT EXISTS idx_schedule_fa_user ON schedule_fa(user_id);
@@ -1749,6 +1830,18 @@ CREATE TABLE IF NOT EXISTS balance_sheet_snapshots (
 CREATE INDEX IF NOT EXISTS idx_balance_sheet_user ON balance_sheet_snapshots(user_id);
 CREATE INDEX IF NOT EXISTS idx_balance_sheet_date ON balance_sheet_snapshots(snapshot_date);
 
+-- Balance Sheet Checkpoints (running totals to resume incremental snapshot series)
+CREATE TABLE IF NOT EXISTS balance_sheet_checkpoints (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER NOT NULL,
+    checkpoint_date DATE NOT NULL,
+    state TEXT NOT NULL,                   -- JSON BalanceSheetState
+    source_marks TEXT NOT NULL,            -- JSON {table: [count, max_id]} of rows dated <= checkpoint_date
+    version INTEGER NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(user_id, checkpoint_date)
+);
+
 -- Cash Flow Statement Snapshots (stored statement for historical reference)
 CREATE TABLE IF NOT EXISTS cash_flow_statements (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -1818,9 +1911,459 @@ CREATE INDEX IF NOT EXISTS idx_ingestion_log_user ON ingestion_log(user_id);
 CREATE INDEX IF NOT EXISTS idx_ingestion_log_file ON ingestion_log(source_file);
 CREATE INDEX IF NOT EXISTS idx_ingestion_log_hash ON ingestion_log(file_hash);
 CREATE INDEX IF NOT EXISTS idx_ingestion_log_status ON ingestion_log(status);
+
+-- Service bookkeeping tables. TransactionService, BatchIngester and
+-- NAVService still create these themselves on databases that were not
+-- bootstrapped at SCHEMA_VERSION.
+CREATE TABLE IF NOT EXISTS processed_transactions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    idempotency_key TEXT UNIQUE NOT NULL,
+    user_id INTEGER NOT NULL,
+    journal_id INTEGER,
+    source TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    metadata JSON,
+    FOREIGN KEY (journal_id) REFERENCES journals(id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_processed_txn_key ON processed_transactions(idempotency_key);
+
+CREATE TABLE IF NOT EXISTS processed_files (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    file_hash TEXT UNIQUE NOT NULL,
+    file_name TEXT NOT NULL,
+    file_path TEXT,
+    file_size INTEGER,
+    user_id INTEGER NOT NULL,
+    batch_id TEXT,
+    parser_type TEXT,
+    records_count INTEGER DEFAULT 0,
+    status TEXT DEFAULT 'success',
+    error_message TEXT,
+    processed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_processed_files_hash ON processed_files(file_hash);
+
+CREATE TABLE IF NOT EXISTS batch_runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    batch_id TEXT UNIQUE NOT NULL,
+    user_id INTEGER NOT NULL,
+    files_count INTEGER,
+    records_count INTEGER,
+    status TEXT DEFAULT 'pending',
+    started_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    completed_at TIMESTAMP,
+    error_message TEXT
+);
+
+CREATE TABLE IF NOT EXISTS mf_nav_history (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    scheme_id INTEGER NOT NULL,
+    nav_date DATE NOT NULL,
+    nav DECIMAL(12, 4) NOT NULL,
+    source TEXT DEFAULT 'unknown',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(scheme_id, nav_date),
+    FOREIGN KEY (scheme_id) REFERENCES mf_schemes(id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_nav_history_scheme_date ON mf_nav_history(scheme_id, nav_date);
 """
 
 
+# Schema version stored in PRAGMA user_version. Bump it and append to
+# SCHEMA_MIGRATIONS whenever SCHEMA_SQL changes in a way existing
+# databases need to pick up.
+SCHEMA_VERSION = 5
+
+# Insert triggers that gained the audit_control guard (migrations/005)
+_GUARDED_AUDIT_TRIGGERS = (
+    "audit_journals_insert",
+    "audit_journal_entries_insert",
+    "audit_accounts_insert",
+    "audit_exchange_rates_insert",
+    "audit_bank_accounts_insert",
+    "audit_bank_transactions_insert",
+)
+
+
+@dataclass(frozen=True)
+class SchemaMigration:
+    """One step of the schema history; script(conn) returns the SQL to run."""
+
+    version: int
+    name: str
+    script: Callable[[sqlite3.Connection], str]
+
+
+def _base_schema_script(conn) -> str:
+    """Version 1: everything init() used to run on every open."""
+    return SCHEMA_SQL
+
+
+def _audit_guard_script(conn) -> str:
+    """Version 2: recreate unguarded audit insert triggers (migrations/005)."""
+    rows = conn.execute(
+        "SELECT name, sql FROM sqlite_master WHERE type = 'trigger'"
+    ).fetchall()
+    existing = {row[0]: row[1] or "" for row in rows}
+    drops = "".join(
+        f"DROP TRIGGER IF EXISTS {name};\n"
+        for name in _GUARDED_AUDIT_TRIGGERS
+        if name in existing and "audit_control" not in existing[name]
+    )
+    return drops + SCHEMA_SQL
+
+
+def _foreign_stock_prices_script(conn) -> str:
+    """Version 3: foreign_stock_prices for Schedule FA daily valuation."""
+    return SCHEMA_SQL
+
+
+def _account_daily_balances_script(conn) -> str:
+    """Version 4: account_daily_balances, backfilled from journal_entries."""
+    from pfas.core.journal import JournalEngine
+
+    return (
+        f"{SCHEMA_SQL}\n"
+        f"DELETE FROM account_daily_balances;\n"
+        f"{JournalEngine.DAILY_BALANCES_SQL};\n"
+    )
+
+
+# Duplicate rule of StockDBIngester: rows repeating an earlier row's key.
+# Rows without both dates never compare equal in a UNIQUE index, so they
+# are left alone.
+_STOCK_CG_DUPLICATES = """
+FROM stock_capital_gains_detail
+WHERE buy_date IS NOT NULL AND sell_date IS NOT NULL
+  AND id NOT IN (
+    SELECT MIN(id) FROM stock_capital_gains_detail
+    WHERE buy_date IS NOT NULL AND sell_date IS NOT NULL
+    GROUP BY user_id, symbol, buy_date, sell_date, quantity
+  )"""
+
+
+def _stock_cg_dedup_script(conn) -> str:
+    """Version 5: drop legacy duplicates, then index stock_capital_gains_detail's duplicate rule."""
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'stock_capital_gains_detail'"
+    ).fetchone()
+    if not exists:
+        return SCHEMA_SQL  # The stock analyzer schema creates it with the index
+
+    duplicates = conn.execute(f"SELECT COUNT(*) {_STOCK_CG_DUPLICATES}").fetchone()[0]
+    if duplicates:
+        logger.warning(f"Removing {duplicates} duplicate stock_capital_gains_detail rows (oldest kept)")
+    return (
+        f"{SCHEMA_SQL}\n"
+        f"DELETE {_STOCK_CG_DUPLICATES};\n"
+        "CREATE UNIQUE INDEX IF NOT EXISTS idx_stock_cg_detail_dedup\n"
+        "ON stock_capital_gains_detail(user_id, symbol, buy_date, sell_date, quantity);\n"
+    )
+
+
+# Ordered by version; a database at user_version N gets every step above N
+SCHEMA_MIGRATIONS = (
+    SchemaMigration(1, "base_schema", _base_schema_script),
+    SchemaMigration(2, "audit_insert_guards", _audit_guard_script),
+    SchemaMigration(3, "foreign_stock_prices", _foreign_stock_prices_script),
+    SchemaMigration(4, "account_daily_balances", _account_daily_balances_script),
+    SchemaMigration(5, "stock_cg_detail_dedup", _stock_cg_dedup_script),
+)
+
+
+def get_schema_version(conn) -> int:
+    """Return the schema version recorded in PRAGMA user_version."""
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def schema_is_current(conn) -> bool:
+    """True if the database was bootstrapped at (or beyond) SCHEMA_VERSION."""
+    return get_schema_version(conn) >= SCHEMA_VERSION
+
+
+def bootstrap_schema(conn) -> list[int]:
+    """
+    Bring a database up to SCHEMA_VERSION.
+
+    Current databases cost a single PRAGMA read. A brand-new database gets
+    SCHEMA_SQL once and is stamped at SCHEMA_VERSION; an older one runs each
+    pending migration in its own transaction together with its version bump.
+
+    Args:
+        conn: Writer connection
+
+    Returns:
+        Versions applied (empty when the schema was already current)
+    """
+    version = get_schema_version(conn)
+    if version >= SCHEMA_VERSION:
+        if version > SCHEMA_VERSION:
+            logger.warning(
+                f"Database schema version {version} is newer than this "
+                f"build ({SCHEMA_VERSION}); skipping schema bootstrap"
+            )
+        return []
+
+    is_empty = conn.execute(
+        "SELECT COUNT(*) FROM sqlite_master WHERE type = 'table'"
+    ).fetchone()[0] == 0
+    if is_empty:
+        steps = [(SCHEMA_VERSION, SCHEMA_SQL)]
+    else:
+        steps = [
+            (m.version, m.script(conn))
+            for m in SCHEMA_MIGRATIONS if m.version > version
+        ]
+
+    for step_version, script in steps:
+        conn.executescript(
+            f"BEGIN;\n{script}\nPRAGMA user_version = {step_version};\nCOMMIT;"
+        )
+        logger.info(f"Database schema migrated to version {step_version}")
+    return [step_version for step_version, _ in steps]
+
+
+
+# Read-only connections kept per file database
+DEFAULT_READER_POOL_SIZE = 4
+
+# Seconds reader() waits for a free connection before raising DatabaseError
+DEFAULT_CHECKOUT_TIMEOUT = 30.0
+
+
+def _configure_connection(conn, password: str) -> None:
+    """Apply the per-connection settings every PFAS connection shares."""
+    conn.row_factory = sqlite3.Row
+
+    # Configure SQLCipher encryption
+    if HAS_SQLCIPHER:
+        conn.execute(f"PRAGMA key = '{password}'")
+        conn.execute("PRAGMA cipher_compatibility = 4")
+
+    # Enable foreign keys
+    conn.execute("PRAGMA foreign_keys = ON")
+
+
+@dataclass
+class PoolStats:
+    """Usage counters of a ConnectionPool."""
+    max_readers: int
+    readers_open: int = 0
+    readers_in_use: int = 0
+    reader_checkouts: int = 0
+    writer_checkouts: int = 0
+    reader_waits: int = 0          # Checkouts that found every reader busy
+    reader_wait_seconds: float = 0.0
+    readers_replaced: int = 0      # Readers that failed the health check
+    shared: bool = False           # In-memory database: readers use the writer
+
+
+class ConnectionPool:
+    """
+    One writer connection plus up to ``size`` read-only connections.
+
+    WAL lets readers run while the writer commits, but only on separate
+    connections. Readers are opened lazily with the same key and PRAGMAs
+    as the writer and ``PRAGMA query_only``; each thread holds at most
+    one, so nested reader() calls reuse it.
+
+    Readers see committed data only: inside writer(), read your own
+    uncommitted rows through the writer connection.
+
+    An in-memory database cannot be shared between connections, so
+    there reader() hands out the writer connection.
+    """
+
+    def __init__(
+        self,
+        writer,
+        db_path: str,
+        password: str,
+        size: int = DEFAULT_READER_POOL_SIZE,
+        timeout: float = DEFAULT_CHECKOUT_TIMEOUT,
+    ):
+        self._writer = writer
+        self._db_path = db_path
+        self._password = password
+        self.size = 0 if db_path == ":memory:" else size
+        self.timeout = timeout
+
+        self._cond = threading.Condition()
+        self._writer_lock = threading.RLock()
+        self._local = threading.local()
+        self._idle: list = []
+        self._open = 0
+        self._closed = False
+        self._stats = PoolStats(max_readers=self.size, shared=self.size == 0)
+
+    @contextmanager
+    def reader(self):
+        """
+        Check out a read-only connection for the current thread.
+
+        Raises:
+            DatabaseError: If no reader frees up within the timeout
+        """
+        held = getattr(self._local, "reader", None)
+        if held is not None:
+            yield held
+            return
+
+        if self.size == 0:
+            with self._cond:
+                self._stats.reader_checkouts += 1
+            yield self._writer
+            return
+
+        conn = self._checkout()
+        self._local.reader = conn
+        try:
+            yield conn
+        finally:
+            self._local.reader = None
+            self._checkin(conn)
+
+    @contextmanager
+    def writer(self):
+        """
+        Hold the writer connection; other writer() callers wait.
+
+        Commits stay with the caller, as on DatabaseManager.connection.
+        """
+        with self._writer_lock:
+            with self._cond:
+                self._stats.writer_checkouts += 1
+            yield self._writer
+
+    def stats(self) -> PoolStats:
+        """Snapshot of the usage counters."""
+        with self._cond:
+            return replace(self._stats, readers_open=self._open)
+
+    def check_health(self) -> bool:
+        """
+        Ping the writer and every idle reader; broken readers are dropped.
+
+        Returns:
+            True if the writer connection answers
+        """
+        with self._cond:
+            idle, self._idle = self._idle, []
+
+        healthy = []
+        for conn in idle:
+            if self._is_healthy(conn):
+                healthy.append(conn)
+            else:
+                self._discard(conn)
+
+        with self._cond:
+            self._idle.extend(healthy)
+            self._stats.readers_replaced += len(idle) - len(healthy)
+            self._cond.notify_all()
+
+        with self._writer_lock:
+            return self._is_healthy(self._writer)
+
+    def close(self) -> None:
+        """Close idle readers; busy ones close when checked back in."""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._cond.notify_all()
+        for conn in idle:
+            self._discard(conn)
+
+    def _checkout(self):
+        deadline = time.monotonic() + self.timeout
+        waited_from = None
+        conn = None
+
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise DatabaseError("Connection pool is closed")
+                if self._idle:
+                    conn = self._idle.pop()
+                    break
+                if self._open < self.size:
+                    self._open += 1
+                    break
+                if waited_from is None:
+                    waited_from = time.monotonic()
+                    self._stats.reader_waits += 1
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise DatabaseError(
+                        f"No read connection free after {self.timeout}s "
+                        f"({self.size} in use)"
+                    )
+                self._cond.wait(remaining)
+
+            if waited_from is not None:
+                self._stats.reader_wait_seconds += time.monotonic() - waited_from
+            self._stats.reader_checkouts += 1
+            self._stats.readers_in_use += 1
+
+        try:
+            if conn is not None and not self._is_healthy(conn):
+                self._discard(conn)
+                conn = None
+                with self._cond:
+                    self._stats.readers_replaced += 1
+            if conn is None:
+                conn = self._open_reader()
+        except Exception:
+            with self._cond:
+                self._open -= 1
+                self._stats.readers_in_use -= 1
+                self._cond.notify()
+            raise
+        return conn
+
+    def _checkin(self, conn) -> None:
+        if conn.in_transaction:
+            conn.rollback()
+        with self._cond:
+            self._stats.readers_in_use -= 1
+            closed = self._closed
+            if closed:
+                self._open -= 1
+            else:
+                self._idle.append(conn)
+            self._cond.notify()
+        if closed:
+            self._discard(conn)
+
+    def _open_reader(self):
+        try:
+            conn = sqlite3.connect(self._db_path, check_same_thread=False)
+            _configure_connection(conn, self._password)
+            conn.execute("PRAGMA query_only = ON")
+            return conn
+        except Exception as e:
+            raise DatabaseError(f"Failed to open read connection: {e}")
+
+    @staticmethod
+    def _is_healthy(conn) -> bool:
+        try:
+            conn.execute("SELECT 1").fetchone()
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _discard(conn) -> None:
+        discard_connection_caches(conn)
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+
 class DatabaseManager:
     """
     Singleton manager for SQLCipher encrypted database connections.
@@ -1830,6 +2373,12 @@ class DatabaseManager:
         conn = db.init("/path/to/db.sqlite", "password123")
         # Use connection...
         db.close()
+
+    Long read-only work (reports) should use a pooled reader so it does
+    not hold up ingestion on the writer connection:
+
+        with db.reader() as conn:
+            BalanceSheetService(conn).get_balance_sheet(user_id, as_of)
     """
 
     _instance: Optional["DatabaseManager"] = None
@@ -1842,6 +2391,7 @@ class DatabaseManager:
                     cls._instance = super().__new__(cls)
                     cls._instance._connection = None
                     cls._instance._db_path = None
+                    cls._instance._pool = None
         return cls._instance
 
     @property
@@ -1851,13 +2401,26 @@ class DatabaseManager:
             raise DatabaseError("Database not initialized. Call init() first.")
         return self._connection
 
-    def init(self, db_path: str, password: str) -> sqlite3.Connection:
+    @property
+    def pool(self) -> ConnectionPool:
+        """Get the connection pool (writer + read-only connections)."""
+        if self._pool is None:
+            raise DatabaseError("Database not initialized. Call init() first.")
+        return self._pool
+
+    def init(
+        self,
+        db_path: str,
+        password: str,
+        pool_size: int = DEFAULT_READER_POOL_SIZE
+    ) -> sqlite3.Connection:
         """
         Initialize encrypted database.
 
         Args:
             db_path: Path to database file or ":memory:" for in-memory database
             password: Encryption password for SQLCipher
+            pool_size: Read-only connections for reader() (file databases only)
 
         Returns:
             Database connection
@@ -1872,16 +2435,12 @@ class DatabaseManager:
             if db_path != ":memory:":
                 Path(db_path).parent.mkdir(parents=True, exist_ok=True)
 
-            self._connection = sqlite3.connect(db_path, check_same_thread=False)
-            self._connection.row_factory = sqlite3.Row
-
-            # Configure SQLCipher encryption
-            if HAS_SQLCIPHER:
-                self._connection.execute(f"PRAGMA key = '{password}'")
-                self._connection.execute("PRAGMA cipher_compatibility = 4")
+            if self._pool is not None:
+                self._pool.close()
+                self._pool = None
 
-            # Enable foreign keys
-            self._connection.execute("PRAGMA foreign_keys = ON")
+            self._connection = sqlite3.connect(db_path, check_same_thread=False)
+            _configure_connection(self._connection, password)
 
             # Enable WAL mode for better concurrent access
             # WAL mode allows multiple readers and one writer simultaneously
@@ -1892,16 +2451,16 @@ class DatabaseManager:
             # Execute schema
             self._execute_schema()
 
+            self._pool = ConnectionPool(self._connection, db_path, password, size=pool_size)
             return self._connection
 
         except Exception as e:
             raise DatabaseError(f"Failed to initialize database: {e}")
 
     def _execute_schema(self) -> None:
-        """Create all tables if not exist."""
+        """Create or migrate tables unless the schema version is current."""
         try:
-            self._connection.executescript(SCHEMA_SQL)
-            self._connection.commit()
+            bootstrap_schema(self._connection)
         except Exception as e:
             raise DatabaseError(f"Failed to execute schema: {e}")
 
@@ -1944,9 +2503,35 @@ class DatabaseManager:
             self.connection.rollback()
             raise DatabaseError(f"Transaction failed: {e}") from e
 
+    @contextmanager
+    def reader(self):
+        """
+        Context manager for a read-only pooled connection.
+
+        Usage:
+            with db.reader() as conn:
+                rows = conn.execute("SELECT ...").fetchall()
+        """
+        with self.pool.reader() as conn:
+            yield conn
+
+    @contextmanager
+    def writer(self):
+        """Context manager holding the writer connection for this thread."""
+        with self.pool.writer() as conn:
+            yield conn
+
+    def pool_stats(self) -> PoolStats:
+        """Usage counters of the connection pool."""
+        return self.pool.stats()
+
     def close(self) -> None:
         """Close the database connection."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
         if self._connection:
+            discard_connection_caches(self._connection)
             self._connection.close()
             self._connection = None
             self._db_path = None
@@ -1962,7 +2547,10 @@ class DatabaseManager:
     def reset_instance(cls) -> None:
         """Reset singleton instance (useful for testing)."""
         with cls._lock:
+            if cls._instance and cls._instance._pool:
+                cls._instance._pool.close()
             if cls._instance and cls._instance._connection:
+                discard_connection_caches(cls._instance._connection)
                 cls._instance._connection.close()
             cls._instance = None
 
@@ -2,11 +2,26 @@
 AES-256-GCM field-level encryption for sensitive data.
 
 Provides encryption for PAN, Aadhaar, Bank Account numbers, etc.
-Each field is encrypted with a unique salt for added security.
+
+Two storage formats share the same (ciphertext, salt) column pair:
+- Legacy: unique salt per field, ciphertext = nonce + ciphertext.
+- Envelope v1: one salt (and therefore one derived data key) per user,
+  ciphertext = magic + version + nonce + ciphertext, with the header
+  authenticated as associated data.
+
+Derived keys are kept in a bounded LRU cache so repeated decryption of
+fields sharing a salt costs one PBKDF2 run, not one per field. Only keys
+that are looked up again are cached: those used for decryption and the
+per-user envelope keys. Legacy encrypt_field() derives its one-off key
+directly.
 """
 
+import hashlib
+import logging
 import os
-from typing import Tuple
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
@@ -15,6 +30,8 @@ from cryptography.hazmat.backends import default_backend
 
 from pfas.core.exceptions import EncryptionError
 
+logger = logging.getLogger(__name__)
+
 
 # Constants
 SALT_LENGTH = 16
@@ -22,6 +39,98 @@ NONCE_LENGTH = 12
 KEY_LENGTH = 32  # 256 bits
 PBKDF2_ITERATIONS = 100000
 
+# Envelope format
+ENVELOPE_MAGIC = b"PFE"
+ENVELOPE_VERSION = 1
+ENVELOPE_HEADER = ENVELOPE_MAGIC + bytes([ENVELOPE_VERSION])
+
+# Maximum number of derived keys held in memory
+DEFAULT_KEY_CACHE_SIZE = 256
+
+
+class KeyCache:
+    """
+    Thread-safe bounded LRU cache of PBKDF2-derived keys.
+
+    Entries are keyed by (SHA-256 of master key, salt) so the master key
+    itself is never used as a dictionary key.
+
+    Usage:
+        cache = KeyCache(maxsize=128)
+        key = cache.get_or_derive(master_key, salt)
+        cache.clear()  # Wipe all derived keys (e.g., on logout)
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_KEY_CACHE_SIZE):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of derived keys to keep
+        """
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be positive, got {maxsize}")
+        self.maxsize = maxsize
+        self._keys: "OrderedDict[Tuple[bytes, bytes], bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_derive(self, master_key: bytes, salt: bytes) -> bytes:
+        """Return the derived key for (master_key, salt), deriving on a miss."""
+        cache_key = (hashlib.sha256(master_key).digest(), bytes(salt))
+
+        with self._lock:
+            key = self._keys.get(cache_key)
+            if key is not None:
+                self._keys.move_to_end(cache_key)
+                self.hits += 1
+                return key
+
+        # Derive outside the lock so other threads are not blocked by PBKDF2
+        key = derive_key(master_key, salt)
+
+        with self._lock:
+            self.misses += 1
+            self._keys[cache_key] = key
+            self._keys.move_to_end(cache_key)
+            while len(self._keys) > self.maxsize:
+                self._keys.popitem(last=False)
+        return key
+
+    def clear(self) -> None:
+        """Drop all derived keys and reset statistics."""
+        with self._lock:
+            self._keys.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def stats(self) -> Dict[str, int]:
+        """Return cache size and hit/miss counters."""
+        with self._lock:
+            return {
+                "size": len(self._keys),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+_key_cache = KeyCache()
+
+
+def get_key_cache() -> KeyCache:
+    """Get the process-wide derived-key cache."""
+    return _key_cache
+
+
+def clear_key_cache() -> None:
+    """Wipe all cached derived keys from the process-wide cache."""
+    _key_cache.clear()
+
 
 def derive_key(master_key: bytes, salt: bytes) -> bytes:
     """
@@ -65,7 +174,8 @@ def encrypt_field(plaintext: str, master_key: bytes) -> Tuple[bytes, bytes]:
         # Generate random nonce
         nonce = os.urandom(NONCE_LENGTH)
 
-        # Derive key from master key and salt
+        # Derive key from master key and salt. The salt is fresh, so the
+        # key is never looked up again and stays out of the key cache.
         key = derive_key(master_key, salt)
 
         # Encrypt using AES-256-GCM
@@ -83,8 +193,10 @@ def decrypt_field(ciphertext: bytes, salt: bytes, master_key: bytes) -> str:
     """
     Decrypt a sensitive field.
 
+    Accepts both legacy ciphertext and the v1 envelope format.
+
     Args:
-        ciphertext: The encrypted data (nonce + ciphertext)
+        ciphertext: The encrypted data (nonce + ciphertext, or envelope)
         salt: The salt used during encryption
         master_key: The master encryption key
 
@@ -96,7 +208,15 @@ def decrypt_field(ciphertext: bytes, salt: bytes, master_key: bytes) -> str:
     """
     try:
         # Derive key from master key and salt
-        key = derive_key(master_key, salt)
+        key = _key_cache.get_or_derive(master_key, salt)
+
+        if is_envelope(ciphertext):
+            try:
+                return _decrypt_envelope(ciphertext, key)
+            except Exception:
+                # A legacy nonce can start with the magic bytes by chance;
+                # GCM authentication tells the two apart.
+                pass
 
         # Extract nonce and ciphertext
         nonce = ciphertext[:NONCE_LENGTH]
@@ -112,6 +232,243 @@ def decrypt_field(ciphertext: bytes, salt: bytes, master_key: bytes) -> str:
         raise EncryptionError(f"Decryption failed: {e}")
 
 
+def is_envelope(ciphertext: bytes) -> bool:
+    """Check whether ciphertext carries the versioned envelope header."""
+    return bytes(ciphertext[:len(ENVELOPE_HEADER)]) == ENVELOPE_HEADER
+
+
+def _encrypt_envelope(plaintext: str, key: bytes) -> bytes:
+    """Encrypt plaintext into the v1 envelope with a fresh nonce."""
+    nonce = os.urandom(NONCE_LENGTH)
+    ciphertext = AESGCM(key).encrypt(nonce, plaintext.encode("utf-8"), ENVELOPE_HEADER)
+    return ENVELOPE_HEADER + nonce + ciphertext
+
+
+def _decrypt_envelope(ciphertext: bytes, key: bytes) -> str:
+    """Decrypt a v1 envelope."""
+    body = ciphertext[len(ENVELOPE_HEADER):]
+    nonce, ct = body[:NONCE_LENGTH], body[NONCE_LENGTH:]
+    return AESGCM(key).decrypt(nonce, ct, ENVELOPE_HEADER).decode("utf-8")
+
+
+def decrypt_fields(
+    items: Iterable[Tuple[bytes, bytes]], master_key: bytes
+) -> List[str]:
+    """
+    Decrypt many (ciphertext, salt) pairs.
+
+    Pairs sharing a salt (all envelope fields of one user) reuse one
+    derived key, so N fields cost one KDF run per distinct salt.
+
+    Args:
+        items: Iterable of (ciphertext, salt)
+        master_key: The master encryption key
+
+    Returns:
+        Plaintexts in input order
+
+    Raises:
+        EncryptionError: If any field fails to decrypt
+    """
+    return [decrypt_field(ciphertext, salt, master_key) for ciphertext, salt in items]
+
+
+class FieldCipher:
+    """
+    Per-user field cipher using the v1 envelope format.
+
+    One data key is derived from (master_key, user_salt); every field gets
+    its own random nonce. encrypt() returns (ciphertext, salt) so results
+    drop into the existing *_encrypted / *_salt columns.
+
+    Usage:
+        cipher = get_user_cipher(conn, user_id, master_key)
+        encrypted, salt = cipher.encrypt("AAPPS0793R")
+        plaintext = cipher.decrypt(encrypted, salt)
+    """
+
+    def __init__(
+        self,
+        master_key: bytes,
+        user_salt: bytes,
+        cache: Optional[KeyCache] = None,
+    ):
+        """
+        Initialize the cipher.
+
+        Args:
+            master_key: The master encryption key
+            user_salt: Per-user salt for data key derivation
+            cache: Key cache to use (default: process-wide cache)
+        """
+        self.master_key = master_key
+        self.user_salt = bytes(user_salt)
+        self._cache = cache or _key_cache
+
+    @property
+    def _data_key(self) -> bytes:
+        return self._cache.get_or_derive(self.master_key, self.user_salt)
+
+    def encrypt(self, plaintext: str) -> Tuple[bytes, bytes]:
+        """
+        Encrypt a field with the user's data key.
+
+        Returns:
+            Tuple of (envelope ciphertext, user salt)
+
+        Raises:
+            EncryptionError: If encryption fails
+        """
+        try:
+            return _encrypt_envelope(plaintext, self._data_key), self.user_salt
+        except Exception as e:
+            raise EncryptionError(f"Encryption failed: {e}")
+
+    def decrypt(self, ciphertext: bytes, salt: bytes = None) -> str:
+        """
+        Decrypt a field (envelope or legacy).
+
+        Args:
+            ciphertext: Encrypted value
+            salt: Stored salt (default: the user salt)
+        """
+        return decrypt_field(ciphertext, salt or self.user_salt, self.master_key)
+
+    def decrypt_many(self, items: Iterable[Tuple[bytes, bytes]]) -> List[str]:
+        """Decrypt many (ciphertext, salt) pairs."""
+        return decrypt_fields(items, self.master_key)
+
+
+def get_user_cipher(conn, user_id: int, master_key: bytes) -> FieldCipher:
+    """
+    Get the FieldCipher for a user, creating the user's key salt if needed.
+
+    A new salt is committed only if the connection was not already in a
+    transaction; otherwise it is written in (and committed with) the
+    caller's transaction.
+
+    Args:
+        conn: Database connection
+        user_id: User ID
+        master_key: The master encryption key
+
+    Returns:
+        FieldCipher bound to the user's salt
+    """
+    row = conn.execute(
+        "SELECT key_salt FROM user_encryption_keys WHERE user_id = ?", (user_id,)
+    ).fetchone()
+    if row:
+        return FieldCipher(master_key, row[0])
+
+    salt = os.urandom(SALT_LENGTH)
+    in_transaction = conn.in_transaction
+    conn.execute(
+        "INSERT INTO user_encryption_keys (user_id, key_salt, version) VALUES (?, ?, ?)",
+        (user_id, salt, ENVELOPE_VERSION),
+    )
+    if not in_transaction:
+        conn.commit()
+    return FieldCipher(master_key, salt)
+
+
+def find_encrypted_columns(conn) -> Dict[str, List[str]]:
+    """
+    Find tables holding *_encrypted / *_salt column pairs.
+
+    Returns:
+        Dict of table name -> list of field prefixes (e.g. {"users": ["pan"]})
+    """
+    found: Dict[str, List[str]] = {}
+    tables = [
+        row[0] for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%'"
+        ).fetchall()
+    ]
+    for table in tables:
+        columns = {col[1] for col in conn.execute(f"PRAGMA table_info({table})").fetchall()}
+        prefixes = [
+            col[:-len("_encrypted")] for col in sorted(columns)
+            if col.endswith("_encrypted") and f"{col[:-len('_encrypted')]}_salt" in columns
+        ]
+        if prefixes:
+            found[table] = prefixes
+    return found
+
+
+def reencrypt_to_envelope(conn, master_key: bytes, dry_run: bool = False) -> Dict[str, int]:
+    """
+    Re-encrypt legacy per-field-salt values into per-user envelopes.
+
+    The owning user is taken from the row's user_id column (or id for the
+    users table). Rows without an owner and rows already in envelope
+    format with the user's salt are left unchanged. New user salts and
+    the rewritten values are committed together, unless the connection
+    was already in a transaction.
+
+    Args:
+        conn: Database connection
+        master_key: The master encryption key
+        dry_run: Count rows without writing (no user salts are kept either)
+
+    Returns:
+        Dict of "table.field" -> number of values re-encrypted
+    """
+    counts: Dict[str, int] = {}
+    ciphers: Dict[int, FieldCipher] = {}
+    in_transaction = conn.in_transaction
+    if not in_transaction:
+        # New user salts and the re-encrypted values commit together
+        conn.execute("BEGIN IMMEDIATE")
+
+    try:
+        for table, prefixes in find_encrypted_columns(conn).items():
+            columns = {col[1] for col in conn.execute(f"PRAGMA table_info({table})").fetchall()}
+            if table == "users":
+                owner_col = "id"
+            elif "user_id" in columns:
+                owner_col = "user_id"
+            else:
+                logger.warning(f"Skipping {table}: no user column to derive a data key from")
+                continue
+
+            for prefix in prefixes:
+                enc_col, salt_col = f"{prefix}_encrypted", f"{prefix}_salt"
+                rows = conn.execute(
+                    f"SELECT id, {owner_col}, {enc_col}, {salt_col} FROM {table} "
+                    f"WHERE {owner_col} IS NOT NULL"
+                ).fetchall()
+
+                updates = []
+                for row_id, owner_id, ciphertext, salt in rows:
+                    if owner_id not in ciphers:
+                        ciphers[owner_id] = get_user_cipher(conn, owner_id, master_key)
+                    cipher = ciphers[owner_id]
+                    if is_envelope(ciphertext) and bytes(salt) == cipher.user_salt:
+                        continue
+                    plaintext = decrypt_field(ciphertext, salt, master_key)
+                    new_ciphertext, new_salt = cipher.encrypt(plaintext)
+                    updates.append((new_ciphertext, new_salt, row_id))
+
+                counts[f"{table}.{prefix}"] = len(updates)
+                if updates and not dry_run:
+                    conn.executemany(
+                        f"UPDATE {table} SET {enc_col} = ?, {salt_col} = ? WHERE id = ?",
+                        updates,
+                    )
+    except Exception:
+        if not in_transaction:
+            conn.rollback()
+        raise
+
+    if not in_transaction:
+        if dry_run:
+            conn.rollback()
+        else:
+            conn.commit()
+    return counts
+
+
 def generate_master_key(password: str, salt: bytes = None) -> Tuple[bytes, bytes]:
     """
     Generate a master key from a password.
@@ -0,0 +1,328 @@
+"""
+Content fingerprints for statement files.
+
+Scanners, ingesters and the archiver each hashed the same inbox file on
+their own (MD5 in some places, SHA-256 in others), so a scan, ingest and
+archive run read every file three to five times. FileFingerprintCache
+reads a file once per change: MD5 and SHA-256 are computed in the same
+pass and kept under the file's (path, size, mtime_ns, inode). With a
+cache_path the table is persisted in a small SQLite file, so unchanged
+files are not re-read on the next run either. It holds only paths and
+digests, so it is plain (unencrypted) SQLite.
+
+Usage:
+    cache = configure_fingerprint_cache(resolver.cache_dir() / "file_hashes.db")
+    cache.hash_many(inbox_files)                # new files hashed in parallel
+    file_fingerprint(path)                      # SHA-256, served from cache
+    file_fingerprint(path, "md5")
+    print(f"File hash cache: {cache.stats}")    # e.g. 40/42 hits (95%)
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+ALGORITHMS = ("md5", "sha256")
+
+# hashlib releases the GIL for large updates, so threads hash in parallel
+DEFAULT_BUFFER_SIZE = 1 << 20
+DEFAULT_WORKERS = min(8, os.cpu_count() or 1)
+
+# (size, mtime_ns, inode)
+StatKey = Tuple[int, int, int]
+
+
+@dataclass
+class FingerprintStats:
+    """
+    Cache lookups since the cache was created (or reset_stats()).
+
+    Each file version counts once per window, as a hit if it was already
+    cached when first requested: a hash() after hash_many() hashed the
+    file in the same window is not a second lookup.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    bytes_hashed: int = 0
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.lookups if self.lookups else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.hits}/{self.lookups} hits ({self.hit_rate:.0%}), "
+            f"{self.bytes_hashed / (1 << 20):.1f} MiB hashed"
+        )
+
+
+def _stat_key(path: Path) -> StatKey:
+    st = os.stat(path)
+    return (st.st_size, st.st_mtime_ns, st.st_ino)
+
+
+class FileFingerprintCache:
+    """
+    (path, size, mtime_ns, inode) -> MD5/SHA-256 of the file contents.
+
+    Thread-safe. A file whose size, mtime or inode changed is re-hashed;
+    one modified during hashing is returned but not cached.
+    """
+
+    def __init__(
+        self,
+        cache_path: Optional[Path] = None,
+        workers: int = DEFAULT_WORKERS,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_path: SQLite file persisting fingerprints across runs
+                (in-memory only if None)
+            workers: Threads used by hash_many()
+            buffer_size: Read size when hashing
+        """
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.workers = max(1, workers)
+        self.buffer_size = buffer_size
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Tuple[StatKey, str, str]] = {}
+        self._stats = FingerprintStats()
+        # (path, stat) already counted in the current stats window
+        self._counted: Set[Tuple[str, StatKey]] = set()
+        self._conn: Optional[sqlite3.Connection] = None
+        if self.cache_path is not None:
+            self._open(self.cache_path)
+
+    def _open(self, cache_path: Path) -> None:
+        """Open (or create) the persistent table and load it."""
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(cache_path, check_same_thread=False)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS file_fingerprints (
+                    path TEXT PRIMARY KEY,
+                    size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    inode INTEGER NOT NULL,
+                    md5 TEXT NOT NULL,
+                    sha256 TEXT NOT NULL
+                )
+            """)
+            rows = conn.execute(
+                "SELECT path, size, mtime_ns, inode, md5, sha256 FROM file_fingerprints"
+            ).fetchall()
+        except sqlite3.Error as e:
+            logger.warning(f"File hash cache unavailable at {cache_path}, not persisting: {e}")
+            return
+
+        self._conn = conn
+        for path, size, mtime_ns, inode, md5, sha256 in rows:
+            self._entries[path] = ((size, mtime_ns, inode), md5, sha256)
+
+    @property
+    def stats(self) -> FingerprintStats:
+        """Snapshot of hit/miss counters."""
+        with self._lock:
+            return replace(self._stats)
+
+    def reset_stats(self) -> None:
+        """Start a new hit-rate window."""
+        with self._lock:
+            self._stats = FingerprintStats()
+            self._counted = set()
+
+    def hash(self, path: Path, algorithm: str = "sha256") -> str:
+        """
+        Return the hex digest of a file's contents.
+
+        Args:
+            path: File to fingerprint
+            algorithm: "md5" or "sha256"
+
+        Returns:
+            Hex digest
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        index = self._index(algorithm)
+        key, stat_key = self._key(path)
+        cached = self._lookup(key, stat_key)
+        if cached is None:
+            cached = self._store(key, stat_key, *self._compute(path))
+        return cached[index]
+
+    def hash_many(self, paths: Iterable[Path], algorithm: str = "sha256") -> Dict[Path, str]:
+        """
+        Fingerprint several files, hashing the uncached ones in parallel.
+
+        Files that cannot be read are logged and left out of the result;
+        a later hash() call on them raises as usual.
+
+        Args:
+            paths: Files to fingerprint
+            algorithm: "md5" or "sha256"
+
+        Returns:
+            Dict of path -> hex digest
+        """
+        index = self._index(algorithm)
+        result: Dict[Path, str] = {}
+        pending = []
+        for path in paths:
+            path = Path(path)
+            try:
+                key, stat_key = self._key(path)
+            except OSError as e:
+                logger.warning(f"Cannot fingerprint {path}: {e}")
+                continue
+            cached = self._lookup(key, stat_key)
+            if cached is None:
+                pending.append((path, key, stat_key))
+            else:
+                result[path] = cached[index]
+
+        if not pending:
+            return result
+
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(pending))) as pool:
+            futures = [(item, pool.submit(self._compute, item[0])) for item in pending]
+            for (path, key, stat_key), future in futures:
+                try:
+                    computed = future.result()
+                except OSError as e:
+                    logger.warning(f"Cannot fingerprint {path}: {e}")
+                    continue
+                result[path] = self._store(key, stat_key, *computed, commit=False)[index]
+        self._commit()
+        return result
+
+    def close(self) -> None:
+        """Close the persistent table (the in-memory entries stay usable)."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    @staticmethod
+    def _index(algorithm: str) -> int:
+        try:
+            return ALGORITHMS.index(algorithm)
+        except ValueError:
+            raise ValueError(f"Unsupported hash algorithm: {algorithm} (use one of {ALGORITHMS})")
+
+    @staticmethod
+    def _key(path: Path) -> Tuple[str, StatKey]:
+        path = Path(path)
+        return str(path.resolve()), _stat_key(path)
+
+    def _lookup(self, key: str, stat_key: StatKey) -> Optional[Tuple[str, str]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            cached = entry is not None and entry[0] == stat_key
+            if (key, stat_key) not in self._counted:
+                self._counted.add((key, stat_key))
+                if cached:
+                    self._stats.hits += 1
+                else:
+                    self._stats.misses += 1
+            return (entry[1], entry[2]) if cached else None
+
+    def _compute(self, path: Path) -> Tuple[str, str, int, StatKey]:
+        """Read the file once; returns (md5, sha256, bytes read, stat after read)."""
+        md5 = hashlib.md5()
+        sha256 = hashlib.sha256()
+        size = 0
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(self.buffer_size), b""):
+                md5.update(chunk)
+                sha256.update(chunk)
+                size += len(chunk)
+        return md5.hexdigest(), sha256.hexdigest(), size, _stat_key(path)
+
+    def _store(
+        self,
+        key: str,
+        stat_key: StatKey,
+        md5: str,
+        sha256: str,
+        size: int,
+        stat_after: StatKey,
+        commit: bool = True,
+    ) -> Tuple[str, str]:
+        with self._lock:
+            self._stats.bytes_hashed += size
+            if stat_after != stat_key:
+                # Changed while we read it; the digest may be of neither version
+                return md5, sha256
+            self._entries[key] = (stat_key, md5, sha256)
+            if self._conn is not None:
+                try:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO file_fingerprints "
+                        "(path, size, mtime_ns, inode, md5, sha256) VALUES (?, ?, ?, ?, ?, ?)",
+                        (key, *stat_key, md5, sha256),
+                    )
+                    if commit:
+                        self._conn.commit()
+                except sqlite3.Error as e:
+                    logger.warning(f"Could not persist file hash for {key}: {e}")
+        return md5, sha256
+
+    def _commit(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    self._conn.commit()
+                except sqlite3.Error as e:
+                    logger.warning(f"Could not persist file hashes: {e}")
+
+
+_default_cache = FileFingerprintCache()
+
+
+def get_fingerprint_cache() -> FileFingerprintCache:
+    """Return the process-wide fingerprint cache."""
+    return _default_cache
+
+
+def configure_fingerprint_cache(
+    cache_path: Optional[Path] = None,
+    workers: int = DEFAULT_WORKERS,
+) -> FileFingerprintCache:
+    """
+    Replace the process-wide cache, e.g. with a persistent one.
+
+    Args:
+        cache_path: SQLite file persisting fingerprints (in-memory if None)
+        workers: Threads used by hash_many()
+
+    Returns:
+        The new process-wide cache
+    """
+    global _default_cache
+    previous = _default_cache
+    _default_cache = FileFingerprintCache(cache_path, workers=workers)
+    previous.close()
+    return _default_cache
+
+
+def file_fingerprint(path: Path, algorithm: str = "sha256") -> str:
+    """Hex digest of a file via the process-wide cache."""
+    return _default_cache.hash(path, algorithm)
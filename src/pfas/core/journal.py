@@ -4,14 +4,19 @@ Double-entry journal engine with balance validation.
 Ensures all journal entries follow accounting principles:
 - Sum of Debits = Sum of Credits
 - Proper audit trail for all transactions
+
+Account balances are materialized in account_daily_balances (one row per
+account per day with a running balance), maintained in the same
+transaction as every journal write, so an as-of balance is one index seek.
 """
 
 from dataclasses import dataclass, field
 from decimal import Decimal
 from datetime import date
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 import sqlite3
 
+from pfas.core.accounts import get_account_directory
 from pfas.core.exceptions import UnbalancedJournalError, AccountNotFoundError
 
 
@@ -72,6 +77,31 @@ class JournalEngine:
     # Tolerance for balance validation (handles floating point issues)
     BALANCE_TOLERANCE = Decimal("0.01")
 
+    # Decimal places kept in the materialized running balance
+    BALANCE_PRECISION = 6
+
+    # Recomputes account_daily_balances from journal_entries (rebuild and
+    # schema migration 4). The rollup stores debit-minus-credit (natural
+    # sign) in INR; callers flip the sign for credit-normal accounts.
+    DAILY_BALANCES_SQL = f"""
+        INSERT INTO account_daily_balances (account_id, date, debit, credit, running_balance)
+        SELECT
+            account_id, date, debit, credit,
+            ROUND(SUM(debit - credit) OVER (
+                PARTITION BY account_id ORDER BY date
+            ), {BALANCE_PRECISION})
+        FROM (
+            SELECT
+                je.account_id AS account_id,
+                j.date AS date,
+                ROUND(SUM(je.debit * je.exchange_rate), {BALANCE_PRECISION}) AS debit,
+                ROUND(SUM(je.credit * je.exchange_rate), {BALANCE_PRECISION}) AS credit
+            FROM journal_entries je
+            JOIN journals j ON je.journal_id = j.id
+            GROUP BY je.account_id, j.date
+        )
+    """
+
     def __init__(self, db_connection: sqlite3.Connection):
         """
         Initialize the journal engine.
@@ -81,6 +111,149 @@ class JournalEngine:
         """
         self.conn = db_connection
 
+    def rebuild_daily_balances(self) -> int:
+        """
+        Rebuild account_daily_balances from journal_entries.
+
+        Commits unless called inside an open transaction.
+
+        Returns:
+            Number of (account, date) rows written
+        """
+        in_transaction = self.conn.in_transaction
+        self.conn.execute("DELETE FROM account_daily_balances")
+        cursor = self.conn.execute(self.DAILY_BALANCES_SQL)
+        if not in_transaction:
+            self.conn.commit()
+        return cursor.rowcount
+
+    def check_daily_balances(self) -> List[dict]:
+        """
+        Compare account_daily_balances against a full recomputation.
+
+        Returns:
+            List of mismatches with account_id, date, expected and actual
+            running balances (empty when consistent)
+        """
+        cursor = self.conn.execute(f"""
+            WITH expected AS (
+                SELECT
+                    account_id, date,
+                    ROUND(SUM(debit - credit) OVER (
+                        PARTITION BY account_id ORDER BY date
+                    ), {self.BALANCE_PRECISION}) AS running_balance
+                FROM (
+                    SELECT je.account_id AS account_id, j.date AS date,
+                           SUM(je.debit * je.exchange_rate) AS debit,
+                           SUM(je.credit * je.exchange_rate) AS credit
+                    FROM journal_entries je
+                    JOIN journals j ON je.journal_id = j.id
+                    GROUP BY je.account_id, j.date
+                )
+            )
+            SELECT e.account_id, e.date, e.running_balance, b.running_balance
+            FROM expected e
+            LEFT JOIN account_daily_balances b
+                ON b.account_id = e.account_id AND b.date = e.date
+            WHERE b.running_balance IS NULL
+               OR ABS(b.running_balance - e.running_balance) >= 0.005
+            UNION ALL
+            SELECT b.account_id, b.date, NULL, b.running_balance
+            FROM account_daily_balances b
+            LEFT JOIN expected e
+                ON e.account_id = b.account_id AND e.date = b.date
+            WHERE e.account_id IS NULL
+        """)
+        return [
+            {
+                "account_id": row[0],
+                "date": row[1],
+                "expected": Decimal(str(row[2])) if row[2] is not None else None,
+                "actual": Decimal(str(row[3])) if row[3] is not None else None,
+            }
+            for row in cursor.fetchall()
+        ]
+
+    def apply_balance_deltas(
+        self, deltas: Dict[Tuple[int, str], Tuple[Decimal, Decimal]]
+    ) -> None:
+        """
+        Fold journal entry amounts into account_daily_balances.
+
+        Runs inside the caller's transaction and does not commit. The three
+        statements are order-independent, so each runs as one executemany.
+
+        Args:
+            deltas: {(account_id, iso_date): (debit_inr, credit_inr)}
+        """
+        if not deltas:
+            return
+
+        keys = sorted(deltas)
+        self.conn.executemany(
+            """
+            INSERT OR IGNORE INTO account_daily_balances
+            (account_id, date, debit, credit, running_balance)
+            SELECT ?, ?, 0, 0, COALESCE((
+                SELECT running_balance FROM account_daily_balances
+                WHERE account_id = ? AND date < ?
+                ORDER BY date DESC LIMIT 1
+            ), 0)
+            """,
+            [(account_id, day, account_id, day) for account_id, day in keys],
+        )
+        self.conn.executemany(
+            f"""
+            UPDATE account_daily_balances
+            SET debit = ROUND(debit + ?, {self.BALANCE_PRECISION}),
+                credit = ROUND(credit + ?, {self.BALANCE_PRECISION})
+            WHERE account_id = ? AND date = ?
+            """,
+            [
+                (str(deltas[key][0]), str(deltas[key][1]), key[0], key[1])
+                for key in keys
+            ],
+        )
+        self.conn.executemany(
+            f"""
+            UPDATE account_daily_balances
+            SET running_balance = ROUND(running_balance + ?, {self.BALANCE_PRECISION})
+            WHERE account_id = ? AND date >= ?
+            """,
+            [
+                (str(deltas[key][0] - deltas[key][1]), key[0], key[1])
+                for key in keys
+            ],
+        )
+
+    @staticmethod
+    def collect_balance_deltas(
+        items: Iterable[Tuple[date, List["JournalEntry"]]],
+        deltas: Dict[Tuple[int, str], Tuple[Decimal, Decimal]] = None,
+    ) -> Dict[Tuple[int, str], Tuple[Decimal, Decimal]]:
+        """
+        Aggregate (txn_date, entries) pairs into per-account, per-day deltas.
+
+        Args:
+            items: Iterable of (txn_date, entries)
+            deltas: Optional dict to accumulate into
+
+        Returns:
+            {(account_id, iso_date): (debit_inr, credit_inr)}
+        """
+        if deltas is None:
+            deltas = {}
+        for txn_date, entries in items:
+            day = txn_date.isoformat()
+            for entry in entries:
+                key = (entry.account_id, day)
+                debit, credit = deltas.get(key, (Decimal("0"), Decimal("0")))
+                deltas[key] = (
+                    debit + entry.debit * entry.exchange_rate,
+                    credit + entry.credit * entry.exchange_rate,
+                )
+        return deltas
+
     def create_journal(
         self,
         txn_date: date,
@@ -159,6 +332,9 @@ class JournalEngine:
                     ),
                 )
 
+            # Maintain materialized balances in the same transaction
+            self.apply_balance_deltas(self.collect_balance_deltas([(txn_date, entries)]))
+
             # Commit transaction (only if we started it)
             if not in_transaction:
                 self.conn.commit()
@@ -183,13 +359,29 @@ class JournalEngine:
 
     def _validate_accounts(self, entries: List[JournalEntry]) -> None:
         """Validate that all accounts in entries exist."""
+        directory = get_account_directory(self.conn)
         for entry in entries:
+            if directory is not None:
+                if directory.get_by_id(entry.account_id) is None:
+                    raise AccountNotFoundError(str(entry.account_id))
+                continue
             cursor = self.conn.execute(
                 "SELECT id FROM accounts WHERE id = ?", (entry.account_id,)
             )
             if not cursor.fetchone():
                 raise AccountNotFoundError(str(entry.account_id))
 
+    def _get_account_type(self, account_id: int) -> Optional[str]:
+        """Get an account's type, or None if the account does not exist."""
+        directory = get_account_directory(self.conn)
+        if directory is not None:
+            account = directory.get_by_id(account_id)
+            return account.account_type if account else None
+        row = self.conn.execute(
+            "SELECT account_type FROM accounts WHERE id = ?", (account_id,)
+        ).fetchone()
+        return row["account_type"] if row else None
+
     def get_journal(self, journal_id: int) -> Optional[Journal]:
         """
         Get a journal with all its entries.
@@ -318,36 +510,68 @@ class JournalEngine:
             as_of_date = date.today()
 
         # Get account type
-        cursor = self.conn.execute(
-            "SELECT account_type FROM accounts WHERE id = ?", (account_id,)
-        )
-        row = cursor.fetchone()
-        if not row:
+        account_type = self._get_account_type(account_id)
+        if account_type is None:
             raise AccountNotFoundError(str(account_id))
 
-        account_type = row["account_type"]
-
-        # Sum debits and credits (include both original and reversal entries)
-        cursor = self.conn.execute(
+        # Latest materialized running balance on or before the date
+        # (includes both original and reversal entries)
+        row = self.conn.execute(
             """
-            SELECT
-                COALESCE(SUM(je.debit * je.exchange_rate), 0) as total_debit,
-                COALESCE(SUM(je.credit * je.exchange_rate), 0) as total_credit
-            FROM journal_entries je
-            JOIN journals j ON je.journal_id = j.id
-            WHERE je.account_id = ? AND j.date <= ?
+            SELECT running_balance FROM account_daily_balances
+            WHERE account_id = ? AND date <= ?
+            ORDER BY date DESC LIMIT 1
             """,
             (account_id, as_of_date.isoformat()),
-        )
-        row = cursor.fetchone()
-        total_debit = Decimal(str(row["total_debit"]))
-        total_credit = Decimal(str(row["total_credit"]))
+        ).fetchone()
+        natural_balance = Decimal(str(row[0])) if row else Decimal("0")
+
+        return self._signed_balance(account_type, natural_balance)
 
-        # Calculate balance based on account type
+    def get_account_balances(
+        self, account_ids: List[int] = None, as_of_date: date = None
+    ) -> Dict[int, Decimal]:
+        """
+        Calculate balances for many accounts with one query.
+
+        Args:
+            account_ids: Accounts to include (default: all accounts)
+            as_of_date: Calculate balances as of this date (defaults to today)
+
+        Returns:
+            Dict of account_id -> balance (same sign rules as get_account_balance)
+        """
+        if as_of_date is None:
+            as_of_date = date.today()
+
+        query = """
+            SELECT a.id, a.account_type, (
+                SELECT b.running_balance FROM account_daily_balances b
+                WHERE b.account_id = a.id AND b.date <= ?
+                ORDER BY b.date DESC LIMIT 1
+            )
+            FROM accounts a
+        """
+        params: list = [as_of_date.isoformat()]
+        if account_ids is not None:
+            if not account_ids:
+                return {}
+            query += f" WHERE a.id IN ({','.join('?' for _ in account_ids)})"
+            params.extend(account_ids)
+
+        balances = {}
+        for account_id, account_type, running in self.conn.execute(query, params).fetchall():
+            natural_balance = Decimal(str(running)) if running is not None else Decimal("0")
+            balances[account_id] = self._signed_balance(account_type, natural_balance)
+        return balances
+
+    @staticmethod
+    def _signed_balance(account_type: str, natural_balance: Decimal) -> Decimal:
+        """Convert a debit-minus-credit balance to the account's normal sign."""
         if account_type in ("ASSET", "EXPENSE"):
-            return total_debit - total_credit
-        else:  # LIABILITY, EQUITY, INCOME
-            return total_credit - total_debit
+            return natural_balance
+        # LIABILITY, EQUITY, INCOME
+        return Decimal("0") - natural_balance
 
     def get_account_ledger(
         self,
@@ -397,10 +621,7 @@ class JournalEngine:
         running_balance = Decimal("0")
 
         # Get account type for balance calculation
-        type_cursor = self.conn.execute(
-            "SELECT account_type FROM accounts WHERE id = ?", (account_id,)
-        )
-        account_type = type_cursor.fetchone()["account_type"]
+        account_type = self._get_account_type(account_id)
         is_debit_account = account_type in ("ASSET", "EXPENSE")
 
         for row in cursor.fetchall():
@@ -0,0 +1,157 @@
+"""
+Compiled keyword rule matcher.
+
+Transaction categorizers all follow the same first-match scheme: rules
+are checked in priority order and the first rule with any keyword
+contained in the (upper-cased) narration wins. KeywordMatcher compiles
+the keywords of all rules into a single prefix-trie regex, so one
+narration is scanned once instead of once per keyword:
+
+    matcher = KeywordMatcher([
+        ("SALARY", ["SALARY", "SAL CR"]),
+        ("INTEREST", ["INT PD", "INTEREST"]),
+    ])
+    matcher.match("NEFT-ACME SAL CR JAN")      # "SALARY"
+    matcher.match_many(descriptions)            # one result per narration
+
+A regex hit only proves that *some* rule matches. Priority is resolved
+by re-searching with the trie of strictly better-ranked rules until none
+matches, which keeps the result identical to the rule-by-rule scan.
+
+Results are memoized per narration, since bank exports repeat the same
+narration (UPI payee, standing instruction, card merchant) many times.
+"""
+
+import re
+from collections import OrderedDict
+from typing import Dict, Generic, Iterable, List, Optional, Pattern, Sequence, Tuple, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_CACHE_SIZE = 16384
+
+# Marks a keyword end in the trie; cannot collide with a one-character key
+_TERMINAL = ""
+
+
+def _compile_trie(keywords: Sequence[Tuple[str, int]]) -> Optional[Tuple[Pattern, List[int]]]:
+    """
+    Compile (keyword, rank) pairs into a prefix-trie regex.
+
+    Every keyword end is an empty capture group, so ``match.lastindex``
+    identifies the keyword that matched. A keyword listed by several
+    rules keeps its best (lowest) rank.
+
+    Returns:
+        (pattern, rank of each capture group) or None if there are no keywords
+    """
+    if not keywords:
+        return None
+
+    trie: Dict[str, dict] = {}
+    for keyword, rank in keywords:
+        node = trie
+        for ch in keyword:
+            node = node.setdefault(ch, {})
+        if _TERMINAL not in node or rank < node[_TERMINAL]:
+            node[_TERMINAL] = rank
+
+    group_ranks: List[int] = []
+
+    def emit(node: dict) -> str:
+        branches = [
+            re.escape(ch) + emit(child)
+            for ch, child in sorted(node.items()) if ch != _TERMINAL
+        ]
+        if _TERMINAL in node:
+            # Longer keywords are tried first; the shorter one still matches
+            group_ranks.append(node[_TERMINAL])
+            branches.append("()")
+        if len(branches) == 1:
+            return branches[0]
+        return "(?:" + "|".join(branches) + ")"
+
+    return re.compile(emit(trie)), group_ranks
+
+
+class KeywordMatcher(Generic[T]):
+    """
+    First-match keyword classifier over prioritized rules.
+
+    Args:
+        rules: (value, keywords) pairs, best rule first
+        cache_size: Narrations memoized per matcher (0 disables the memo)
+    """
+
+    def __init__(
+        self,
+        rules: Iterable[Tuple[T, Iterable[str]]],
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ):
+        self.values: List[T] = []
+        keywords: List[Tuple[str, int]] = []
+        for rank, (value, rule_keywords) in enumerate(rules):
+            self.values.append(value)
+            keywords.extend((kw.upper(), rank) for kw in rule_keywords)
+
+        # _tries[n] matches the keywords of rules ranked below n
+        self._tries = [
+            _compile_trie([(kw, rank) for kw, rank in keywords if rank < n])
+            for n in range(len(self.values) + 1)
+        ]
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, Optional[int]]" = OrderedDict()
+
+    def match(self, text: str) -> Optional[T]:
+        """
+        Value of the best-ranked rule with a keyword in ``text``.
+
+        Args:
+            text: Narration (matched case-insensitively)
+
+        Returns:
+            Rule value, or None if no rule matches
+        """
+        rank = self._cached_rank(text)
+        return None if rank is None else self.values[rank]
+
+    def match_many(self, texts: Iterable[str]) -> List[Optional[T]]:
+        """Match a batch of narrations; repeated narrations are scanned once."""
+        ranks: Dict[str, Optional[int]] = {}
+        results: List[Optional[T]] = []
+        for text in texts:
+            if text in ranks:
+                rank = ranks[text]
+            else:
+                rank = ranks[text] = self._cached_rank(text)
+            results.append(None if rank is None else self.values[rank])
+        return results
+
+    def clear_cache(self) -> None:
+        """Drop memoized narrations."""
+        self._cache.clear()
+
+    def _cached_rank(self, text: str) -> Optional[int]:
+        cache = self._cache
+        if text in cache:
+            cache.move_to_end(text)
+            return cache[text]
+
+        rank = self._rank(text.upper())
+        if self.cache_size > 0:
+            cache[text] = rank
+            if len(cache) > self.cache_size:
+                cache.popitem(last=False)
+        return rank
+
+    def _rank(self, text: str) -> Optional[int]:
+        best = None
+        trie = self._tries[-1]
+        while trie is not None:
+            pattern, group_ranks = trie
+            found = pattern.search(text)
+            if found is None:
+                break
+            best = group_ranks[found.lastindex - 1]
+            trie = self._tries[best]
+        return best
@@ -39,7 +39,7 @@ from enum import Enum
 import sqlite3
 
 from pfas.core.journal import JournalEntry
-from pfas.core.accounts import get_account_by_code
+from pfas.core.accounts import resolve_account_id
 
 logger = logging.getLogger(__name__)
 
@@ -249,8 +249,7 @@ class AssetCategory(str, Enum):
 def _get_account_id(conn: sqlite3.Connection, code: str) -> Optional[int]:
     """Get account ID from account code, returning None if not found."""
     try:
-        account = get_account_by_code(conn, code)
-        return account.id if account else None
+        return resolve_account_id(conn, code)
     except Exception:
         return None
 
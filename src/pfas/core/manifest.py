@@ -25,7 +25,6 @@ Usage:
     entries = manifest.get_entries_as_of(date(2026, 1, 15))
 """
 
-import hashlib
 import json
 import logging
 from dataclasses import dataclass, field, asdict
@@ -33,6 +32,8 @@ from datetime import date, datetime
 from pathlib import Path
 from typing import Optional, List, Dict, Any, Tuple
 
+from pfas.core.fingerprint import file_fingerprint
+
 logger = logging.getLogger(__name__)
 
 
@@ -590,11 +591,7 @@ def calculate_file_hash(file_path: Path) -> str:
     Returns:
         Hash string in "sha256:hexdigest" format
     """
-    sha256 = hashlib.sha256()
-    with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            sha256.update(chunk)
-    return f"sha256:{sha256.hexdigest()}"
+    return f"sha256:{file_fingerprint(file_path)}"
 
 
 def get_all_category_manifests(archive_base: Path) -> Dict[str, CategoryManifest]:
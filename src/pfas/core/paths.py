@@ -35,7 +35,8 @@ class PathResolver:
                 "user_config_dir": "config",
                 "inbox": "inbox",
                 "archive": "archive",
-                "reports": "reports"
+                "reports": "reports",
+                "cache": "cache"
             },
             "report_naming": {
                 "pattern": "{user}_{asset}_{report_type}_{date}[_v{version}].xlsx",
@@ -58,6 +59,9 @@ class PathResolver:
     def reports(self) -> Path:
         return self.user_dir / self.config["per_user"]["reports"]
 
+    def cache_dir(self) -> Path:
+        return self.user_dir / self.config["per_user"].get("cache", "cache")
+
     def user_config_file(self, filename: str) -> Optional[Path]:
         path = self.user_config_dir() / filename
         return path if path.exists() else None
@@ -0,0 +1,335 @@
+"""
+Dense daily exchange-rate calendars.
+
+Every currency conversion used to look its rate up in exchange_rates with
+an exact-date query followed by a lookback query. A RateCalendar loads a
+currency pair's whole history once into a daily array (one slot per day
+from the first stored rate to the last) holding the index of the latest
+rate on or before that day. rate_on() is then an array index plus the
+lookback check, and rates_on() does the same for a whole date array.
+
+Calendars are shared per connection through rate_calendar(), so the
+SBI TT provider, CurrencyConverter, the RSU/ESPP/DTAA services and the
+balance-sheet valuations all read one copy. Writes through add_rate()/
+bulk_add_rates() of those classes update the shared calendar in place
+(rate_writes()). Other writes are noticed when the database generation
+moves (DataGeneration in pfas.core.connection_cache: total_changes for
+this connection, PRAGMA data_version for commits by other connections).
+Cached calendars are then checked with a one-row fingerprint query and
+reloaded if their rows changed.
+
+Usage:
+    calendar = rate_calendar(conn, "USD")
+    calendar.rate_on(date(2024, 6, 15))                # Decimal or None
+    calendar.rates_on(vest_dates)                      # float ndarray, NaN if none
+"""
+
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from pfas.core.connection_cache import ConnectionCache, DataGeneration
+
+# Days an earlier rate may stand in for a missing one (weekends, holidays)
+DEFAULT_LOOKBACK_DAYS = 7
+
+# Rows rate_writes() reads back into a calendar (below SQLite's 999 host parameters)
+_MAX_READ_BACK = 900
+
+
+@dataclass(frozen=True)
+class RateObservation:
+    """One stored exchange_rates row."""
+
+    id: int
+    rate_date: date
+    rate: Decimal
+    source: str
+
+
+class RateCalendar:
+    """
+    Forward-filled daily rates of one currency pair.
+
+    Lookups take max_days_back: the stored rate used for a day may be at
+    most that many days older (None: any earlier rate). Days before the
+    first stored rate have no rate.
+    """
+
+    def __init__(
+        self,
+        from_currency: str,
+        to_currency: str = "INR",
+        observations: Iterable[RateObservation] = (),
+        max_days_back: Optional[int] = DEFAULT_LOOKBACK_DAYS,
+    ):
+        """
+        Build a calendar.
+
+        Args:
+            from_currency: Source currency as stored (e.g. "USD")
+            to_currency: Target currency
+            observations: Stored rates, any order
+            max_days_back: Default lookback of rate_on()/rates_on()
+        """
+        self.from_currency = from_currency
+        self.to_currency = to_currency
+        self.max_days_back = max_days_back
+        self._by_date: Dict[date, RateObservation] = {}
+        self._state = _CalendarState.build([])
+        self.update(observations)
+
+    def __len__(self) -> int:
+        return len(self._state.observations)
+
+    @property
+    def first_date(self) -> Optional[date]:
+        observations = self._state.observations
+        return observations[0].rate_date if observations else None
+
+    @property
+    def last_date(self) -> Optional[date]:
+        observations = self._state.observations
+        return observations[-1].rate_date if observations else None
+
+    def update(self, observations: Iterable[RateObservation]) -> None:
+        """Add or replace stored rates (one per date) and rebuild the daily array."""
+        for observation in observations:
+            self._by_date[observation.rate_date] = observation
+        # Swapped in one assignment so concurrent lookups see old or new state
+        self._state = _CalendarState.build([self._by_date[d] for d in sorted(self._by_date)])
+
+    def _lookback(self, max_days_back: Optional[int]) -> Optional[int]:
+        return self.max_days_back if max_days_back == -1 else max_days_back
+
+    def observation_on(
+        self, day: date, max_days_back: Optional[int] = -1
+    ) -> Optional[RateObservation]:
+        """
+        Stored rate in effect on a day.
+
+        Args:
+            day: Date to look up
+            max_days_back: Lookback in days; None for unlimited, -1 for the
+                calendar default
+
+        Returns:
+            The latest stored rate on or before day within the lookback, or None
+        """
+        state = self._state
+        if not state.observations:
+            return None
+        offset = day.toordinal() - state.first_ordinal
+        if offset < 0:
+            return None
+        if offset < len(state.source):
+            observation = state.observations[state.source[offset]]
+        else:
+            observation = state.observations[-1]
+        lookback = self._lookback(max_days_back)
+        if lookback is not None and (day - observation.rate_date).days > lookback:
+            return None
+        return observation
+
+    def rate_on(self, day: date, max_days_back: Optional[int] = -1) -> Optional[Decimal]:
+        """Rate in effect on a day (see observation_on()), or None."""
+        observation = self.observation_on(day, max_days_back)
+        return observation.rate if observation else None
+
+    def rates_on(
+        self, days: Sequence[date], max_days_back: Optional[int] = -1
+    ) -> np.ndarray:
+        """
+        Rates in effect on many days at once.
+
+        Args:
+            days: Dates (any order, repeats allowed)
+            max_days_back: As for observation_on()
+
+        Returns:
+            float64 array aligned with days; NaN where no rate applies
+        """
+        state = self._state
+        ordinals = np.fromiter((d.toordinal() for d in days), dtype=np.int64, count=len(days))
+        result = np.full(len(ordinals), np.nan)
+        if not state.observations or not len(ordinals):
+            return result
+
+        offsets = ordinals - state.first_ordinal
+        known = offsets >= 0
+        source = np.where(
+            offsets < len(state.source),
+            state.source[np.clip(offsets, 0, len(state.source) - 1)],
+            len(state.observations) - 1,
+        )
+        lookback = self._lookback(max_days_back)
+        if lookback is not None:
+            known &= ordinals - state.ordinals[source] <= lookback
+        result[known] = state.values[source[known]]
+        return result
+
+    def observations_between(self, start: date, end: date) -> List[RateObservation]:
+        """Stored rates dated start..end inclusive, by date."""
+        return [o for o in self._state.observations if start <= o.rate_date <= end]
+
+
+@dataclass(frozen=True)
+class _CalendarState:
+    """Arrays of a RateCalendar, rebuilt together."""
+
+    observations: List[RateObservation]
+    first_ordinal: int
+    source: np.ndarray      # per day from first_ordinal: index of the rate in effect
+    ordinals: np.ndarray    # per observation: date ordinal
+    values: np.ndarray      # per observation: rate as float
+
+    @classmethod
+    def build(cls, observations: List[RateObservation]) -> "_CalendarState":
+        if not observations:
+            empty = np.empty(0, dtype=np.int64)
+            return cls([], 0, empty, empty, np.empty(0))
+        ordinals = np.array([o.rate_date.toordinal() for o in observations], dtype=np.int64)
+        first = int(ordinals[0])
+        marks = np.zeros(int(ordinals[-1]) - first + 1, dtype=np.int64)
+        marks[ordinals - first] = 1
+        return cls(
+            observations=observations,
+            first_ordinal=first,
+            source=np.cumsum(marks) - 1,
+            ordinals=ordinals,
+            values=np.array([float(o.rate) for o in observations]),
+        )
+
+
+class _ConnectionCalendars:
+    """Calendars of one connection plus what they were validated against."""
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.calendars: Dict[Tuple[str, str], RateCalendar] = {}
+        self.fingerprints: Dict[Tuple[str, str], tuple] = {}
+        self.generation = DataGeneration()
+
+
+_registry: "ConnectionCache[_ConnectionCalendars]" = ConnectionCache(_ConnectionCalendars)
+_lock = threading.RLock()
+
+
+def _fingerprint(conn, pair: Tuple[str, str]) -> tuple:
+    row = conn.execute(
+        """SELECT COUNT(*), MAX(id), TOTAL(rate), MIN(date), MAX(date)
+        FROM exchange_rates
+        WHERE from_currency = ? AND to_currency = ?""",
+        pair
+    ).fetchone()
+    return tuple(row)
+
+
+def _load(conn, pair: Tuple[str, str]) -> RateCalendar:
+    rows = conn.execute(
+        """SELECT id, date, rate, source
+        FROM exchange_rates
+        WHERE from_currency = ? AND to_currency = ?""",
+        pair
+    ).fetchall()
+    return RateCalendar(pair[0], pair[1], (_observation(*row) for row in rows))
+
+
+def _observation(row_id, rate_date, rate, source) -> RateObservation:
+    return RateObservation(
+        id=row_id,
+        rate_date=date.fromisoformat(rate_date[:10]) if isinstance(rate_date, str) else rate_date,
+        rate=Decimal(str(rate)),
+        source=source,
+    )
+
+
+def rate_calendar(conn, from_currency: str, to_currency: str = "INR") -> RateCalendar:
+    """
+    Shared calendar of a currency pair on a connection.
+
+    Loads the pair's history on first use. If the database changed since
+    the last call (on this connection, or committed by another one),
+    cached calendars are checked against a fingerprint of their rows and
+    reloaded when those changed.
+
+    Args:
+        conn: Database connection
+        from_currency: Source currency as stored
+        to_currency: Target currency
+
+    Returns:
+        RateCalendar with the default lookback (shared; read-only for callers)
+    """
+    pair = (from_currency, to_currency)
+    with _lock:
+        entry = _registry.get(conn)
+        if entry.generation.is_stale(conn):
+            entry.generation.mark(conn)
+            for known in list(entry.calendars):
+                if _fingerprint(conn, known) != entry.fingerprints[known]:
+                    del entry.calendars[known]
+
+        calendar = entry.calendars.get(pair)
+        if calendar is None:
+            calendar = _load(conn, pair)
+            entry.calendars[pair] = calendar
+            entry.fingerprints[pair] = _fingerprint(conn, pair)
+        return calendar
+
+
+@contextmanager
+def rate_writes(conn):
+    """
+    Keep shared calendars in step with rates written in the block.
+
+    add_rate()/bulk_add_rates() write inside this block and append the
+    row id of each rate to the yielded list. On exit those rows are read
+    back and applied to the cached calendars in place, so the next lookup
+    needs no reload. If the connection had other unseen writes, the next
+    lookup verifies every cached pair instead.
+
+    Usage:
+        with rate_writes(conn) as written:
+            cursor = conn.execute("INSERT OR REPLACE INTO exchange_rates ...")
+            written.append(cursor.lastrowid)
+            conn.commit()
+    """
+    with _lock:
+        entry = _registry.peek(conn)
+        in_step = entry is not None and not entry.generation.is_stale(conn)
+    written: List[int] = []
+    yield written
+
+    with _lock:
+        if not in_step or _registry.peek(conn) is not entry:
+            return
+        if len(written) > _MAX_READ_BACK:
+            # Large imports: reload on next use
+            entry.calendars.clear()
+        elif written:
+            placeholders = ",".join("?" * len(written))
+            rows = conn.execute(
+                f"""SELECT from_currency, to_currency, id, date, rate, source
+                FROM exchange_rates
+                WHERE id IN ({placeholders})""",
+                written
+            ).fetchall()
+            by_pair: Dict[Tuple[str, str], List[RateObservation]] = {}
+            for row in rows:
+                by_pair.setdefault((row[0], row[1]), []).append(_observation(*row[2:]))
+            for pair, observations in by_pair.items():
+                if pair in entry.calendars:
+                    entry.calendars[pair].update(observations)
+                    entry.fingerprints[pair] = _fingerprint(conn, pair)
+        entry.generation.advance(conn)
+
+
+def refresh_rate_calendars(conn=None) -> None:
+    """Drop cached calendars (of one connection, or all) so they reload on next use."""
+    _registry.discard(conn)
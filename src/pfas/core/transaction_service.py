@@ -5,24 +5,29 @@ All asset changes flow through this service, ensuring:
 - Double-entry accounting via JournalEngine
 - Idempotency via processed_transactions table
 - User isolation and validation
-- Comprehensive audit trail
+- Comprehensive audit trail (mode per connection, see pfas.core.audit)
 - Automatic journal entry generation via ledger_mapper
 """
 
 import hashlib
+import json
 import logging
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import date, datetime
 from decimal import Decimal
 from enum import Enum
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator, Tuple
 import sqlite3
 
+from pfas.core.accounts import get_account_directory
 from pfas.core.journal import JournalEngine, JournalEntry
-from pfas.core.audit import AuditLogger
+from pfas.core.audit import AuditMode, get_audit_context
+from pfas.core.database import schema_is_current
 from pfas.core.security import require_user_context, validate_user_owns_record
 from pfas.core.exceptions import (
     PFASError,
+    AccountNotFoundError,
     IdempotencyError,
     UnbalancedJournalError,
     UserContextError,
@@ -41,6 +46,9 @@ def _get_ledger_mapper():
 
 logger = logging.getLogger(__name__)
 
+# Default number of records committed per transaction in bulk mode
+DEFAULT_BULK_CHUNK_SIZE = 500
+
 
 class TransactionResult(Enum):
     """Result of a transaction recording attempt."""
@@ -116,6 +124,26 @@ class TransactionRecord:
     asset_record_ids: Dict[str, int] = field(default_factory=dict)
 
 
+@dataclass
+class TransactionRequest:
+    """
+    A single transaction queued for bulk recording.
+
+    Mirrors the arguments of TransactionService.record() minus user_id and
+    source, which are fixed for a bulk session.
+    """
+
+    description: str
+    idempotency_key: str
+    entries: List[JournalEntry] = field(default_factory=list)
+    txn_date: Optional[date] = None
+    reference_type: Optional[str] = None
+    reference_id: Optional[int] = None
+    metadata: Optional[Dict[str, Any]] = None
+    asset_records: List[AssetRecord] = field(default_factory=list)
+    normalized_record: Optional[Dict[str, Any]] = None
+
+
 class TransactionService:
     """
     Unified service for recording all financial transactions.
@@ -157,9 +185,15 @@ class TransactionService:
         # Note: Don't set row_factory here as it may not be compatible with sqlcipher3
         self.journal_engine = JournalEngine(db_connection)
         self._ensure_tables_exist()
+        self._audit = get_audit_context(db_connection)
+        # Per open write: True when it joined the caller's transaction
+        self._joined_writes: List[bool] = []
 
     def _ensure_tables_exist(self) -> None:
         """Ensure required tables exist."""
+        if schema_is_current(self.conn):
+            return  # Created by the schema bootstrap
+
         # Processed transactions for idempotency
         self.conn.execute("""
             CREATE TABLE IF NOT EXISTS processed_transactions (
@@ -196,7 +230,8 @@ class TransactionService:
             )
         """)
 
-        self.conn.commit()
+        if not self.conn.in_transaction:
+            self.conn.commit()
 
     @require_user_context
     def record(
@@ -293,7 +328,7 @@ class TransactionService:
         asset_record_ids = {}
 
         try:
-            cursor.execute("BEGIN IMMEDIATE")
+            self._begin_write(cursor)
 
             # 4. Create journal entry (only if we have entries)
             journal_id = None
@@ -337,30 +372,19 @@ class TransactionService:
                 str(metadata) if metadata else None,
             ))
 
-            # 7. Log audit entry
-            audit_logger = AuditLogger(self.conn, user_id=user_id, source=source.value)
-
-            if journal_id:
-                audit_logger.log_insert(
-                    table_name="journals",
-                    record_id=journal_id,
-                    new_values={
-                        "date": txn_date.isoformat(),
-                        "description": description,
-                        "total_amount": str(total_debit),
-                        "entries_count": len(entries),
-                    },
-                )
+            # 7. Audit (in the same transaction, per the connection's audit mode)
+            self._write_audit(cursor, user_id, source.value, [(
+                journal_id,
+                {
+                    "date": txn_date.isoformat(),
+                    "description": description,
+                    "total_amount": str(total_debit),
+                    "entries_count": len(entries),
+                },
+                asset_record_ids,
+            )])
 
-            # Log asset table inserts
-            for table_name, record_id in asset_record_ids.items():
-                if isinstance(record_id, list):
-                    for rid in record_id:
-                        audit_logger.log_insert(table_name=table_name, record_id=rid, new_values={})
-                else:
-                    audit_logger.log_insert(table_name=table_name, record_id=record_id, new_values={})
-
-            self.conn.commit()
+            self._commit_write(cursor)
 
             logger.info(
                 f"Transaction recorded: journal_id={journal_id}, "
@@ -376,7 +400,7 @@ class TransactionService:
             )
 
         except UnbalancedJournalError as e:
-            self.conn.rollback()
+            self._rollback_write()
             logger.error(f"Journal balance error: {e}")
             return TransactionRecord(
                 result=TransactionResult.JOURNAL_ERROR,
@@ -384,7 +408,7 @@ class TransactionService:
             )
 
         except Exception as e:
-            self.conn.rollback()
+            self._rollback_write()
             logger.exception(f"Transaction failed: {e}")
             return TransactionRecord(
                 result=TransactionResult.JOURNAL_ERROR,
@@ -426,6 +450,534 @@ class TransactionService:
             metadata=metadata,
         )
 
+    @require_user_context
+    def record_many(
+        self,
+        user_id: int,
+        requests: List[TransactionRequest],
+        source: TransactionSource,
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+    ) -> List[TransactionRecord]:
+        """
+        Record many transactions with batched writes and chunked commits.
+
+        Equivalent to calling record() for each request, but each chunk of
+        requests shares one idempotency lookup, one BEGIN IMMEDIATE and one
+        commit. If a batched write fails, the chunk is rolled back and
+        replayed record by record, so every record is still all-or-nothing.
+        Inside an open transaction each chunk joins it through a savepoint
+        and the caller commits.
+
+        Args:
+            user_id: User ID (validated by decorator)
+            requests: Transactions to record, in order
+            source: Source of all transactions in this call
+            chunk_size: Number of records committed per transaction
+
+        Returns:
+            One TransactionRecord per request, in input order
+        """
+        with self.bulk(user_id=user_id, source=source, chunk_size=chunk_size) as session:
+            for request in requests:
+                session.add_request(request)
+        return session.results
+
+    @require_user_context
+    @contextmanager
+    def bulk(
+        self,
+        user_id: int,
+        source: TransactionSource,
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+    ) -> Iterator["BulkTransactionSession"]:
+        """
+        Open a bulk-ingest session.
+
+        Records added to the session are buffered and written every
+        chunk_size records; the remainder is flushed when the block exits.
+        If the block raises, buffered (not yet flushed) records are dropped
+        while already committed chunks are kept.
+
+        Usage:
+            with service.bulk(user_id=1, source=TransactionSource.PARSER_CAMS) as session:
+                for txn in parsed:
+                    session.add(description=..., idempotency_key=..., entries=...)
+            results = session.results
+
+        Args:
+            user_id: User ID (validated by decorator)
+            source: Source of all transactions in this session
+            chunk_size: Number of records committed per transaction
+
+        Yields:
+            BulkTransactionSession
+        """
+        session = BulkTransactionSession(self, user_id, source, chunk_size)
+        try:
+            yield session
+        except Exception:
+            session.discard()
+            raise
+        session.flush()
+
+    def _record_chunk(
+        self,
+        user_id: int,
+        source: TransactionSource,
+        requests: List[TransactionRequest],
+    ) -> List[TransactionRecord]:
+        """Record one chunk of requests in a single transaction."""
+        source_value = source.value if isinstance(source, TransactionSource) else source
+        results: List[Optional[TransactionRecord]] = [None] * len(requests)
+
+        # 1. Batched idempotency check (against DB and within the chunk)
+        existing = self._existing_keys([r.idempotency_key for r in requests])
+        seen = set()
+        prepared: List[_PreparedTransaction] = []
+        # Repeats of a key prepared earlier in this chunk; resolved once the
+        # first copy's outcome is known
+        repeats: List[Tuple[int, TransactionRequest]] = []
+
+        for index, request in enumerate(requests):
+            key = request.idempotency_key
+            if key in seen:
+                repeats.append((index, request))
+                continue
+            if key in existing:
+                results[index] = TransactionRecord(
+                    result=TransactionResult.DUPLICATE,
+                    idempotency_key=key,
+                    error_message="Transaction already processed"
+                )
+                continue
+
+            # 2. Build and validate entries without touching the DB
+            item, error = self._prepare_request(index, request)
+            if error:
+                results[index] = error
+                continue
+
+            seen.add(key)
+            prepared.append(item)
+
+        # 3. Validate all referenced accounts with one query
+        account_ids = {e.account_id for item in prepared for e in item.entries}
+        missing = account_ids - self._existing_account_ids(account_ids)
+        if missing:
+            valid = []
+            for item in prepared:
+                bad = [e.account_id for e in item.entries if e.account_id in missing]
+                if bad:
+                    results[item.index] = TransactionRecord(
+                        result=TransactionResult.JOURNAL_ERROR,
+                        idempotency_key=item.request.idempotency_key,
+                        error_message=str(AccountNotFoundError(str(bad[0]))),
+                    )
+                else:
+                    valid.append(item)
+            prepared = valid
+
+        if prepared:
+            # 4. Batched write; on failure replay record by record
+            cursor = self.conn.cursor()
+            try:
+                self._begin_write(cursor)
+                written = self._write_prepared(cursor, user_id, source_value, prepared)
+                self._commit_write(cursor)
+            except Exception as e:
+                self._rollback_write()
+                logger.warning(
+                    f"Bulk write of {len(prepared)} records failed ({e}); "
+                    f"replaying chunk record by record"
+                )
+                written = self._replay_prepared(user_id, source_value, prepared)
+
+            for item, outcome in zip(prepared, written):
+                results[item.index] = outcome
+
+        if repeats:
+            # DUPLICATE if the first copy was written, otherwise recorded in its place
+            retried = self._record_chunk(user_id, source, [request for _, request in repeats])
+            for (index, _), outcome in zip(repeats, retried):
+                results[index] = outcome
+
+        logger.info(
+            f"Bulk chunk recorded: user={user_id}, total={len(requests)}, "
+            f"success={sum(1 for r in results if r.result == TransactionResult.SUCCESS)}"
+        )
+        return results
+
+    def _prepare_request(
+        self, index: int, request: TransactionRequest
+    ) -> Tuple[Optional["_PreparedTransaction"], Optional[TransactionRecord]]:
+        """Resolve and balance-check the entries of a bulk request."""
+        entries = list(request.entries or [])
+
+        if not entries and request.normalized_record:
+            try:
+                entries = _get_ledger_mapper().map_to_journal(request.normalized_record, self.conn) or []
+            except Exception as e:
+                logger.warning(f"Failed to auto-generate journal entries: {e}")
+
+        total_debit = Decimal("0")
+        if entries:
+            total_debit = sum(e.debit * e.exchange_rate for e in entries)
+            total_credit = sum(e.credit * e.exchange_rate for e in entries)
+
+            if abs(total_debit - total_credit) >= Decimal("0.01"):
+                return None, TransactionRecord(
+                    result=TransactionResult.VALIDATION_ERROR,
+                    idempotency_key=request.idempotency_key,
+                    error_message=f"Entries don't balance: debit={total_debit}, credit={total_credit}"
+                )
+
+        return _PreparedTransaction(
+            index=index,
+            request=request,
+            entries=entries,
+            total_debit=total_debit,
+            txn_date=request.txn_date or date.today(),
+        ), None
+
+    def _write_prepared(
+        self,
+        cursor: sqlite3.Cursor,
+        user_id: int,
+        source_value: str,
+        prepared: List["_PreparedTransaction"],
+    ) -> List[TransactionRecord]:
+        """
+        Write prepared records inside the caller's transaction.
+
+        Does not begin or commit; the caller owns the transaction boundary.
+        """
+        # Journals (only for records with entries)
+        journal_items = [item for item in prepared if item.entries]
+        journal_ids = self._insert_rows(
+            cursor,
+            """
+            INSERT INTO journals (date, description, reference_type, reference_id, created_by)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            [
+                (
+                    item.txn_date.isoformat(),
+                    item.request.description,
+                    item.request.reference_type,
+                    item.request.reference_id,
+                    user_id,
+                )
+                for item in journal_items
+            ],
+        )
+        journal_by_index = {
+            item.index: journal_id for item, journal_id in zip(journal_items, journal_ids)
+        }
+
+        cursor.executemany(
+            """
+            INSERT INTO journal_entries
+            (journal_id, account_id, debit, credit, currency, exchange_rate, narration)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (
+                    journal_by_index[item.index],
+                    entry.account_id,
+                    str(entry.debit),
+                    str(entry.credit),
+                    entry.currency,
+                    str(entry.exchange_rate),
+                    entry.narration,
+                )
+                for item in journal_items
+                for entry in item.entries
+            ],
+        )
+        self.journal_engine.apply_balance_deltas(
+            JournalEngine.collect_balance_deltas(
+                (item.txn_date, item.entries) for item in journal_items
+            )
+        )
+
+        # Asset records, grouped by identical INSERT statement
+        asset_ids: Dict[int, Dict[str, Any]] = {item.index: {} for item in prepared}
+        groups: Dict[str, List[Tuple[int, AssetRecord, list]]] = {}
+        for item in prepared:
+            for asset_record in item.request.asset_records or []:
+                sql, values = asset_record.get_insert_sql()
+                groups.setdefault(sql, []).append((item.index, asset_record, values))
+
+        for sql, rows in groups.items():
+            row_ids = self._insert_rows(cursor, sql, [values for _, _, values in rows])
+            for (index, asset_record, _), record_id in zip(rows, row_ids):
+                ids = asset_ids[index]
+                table_key = asset_record.table_name
+                if table_key in ids:
+                    if isinstance(ids[table_key], list):
+                        ids[table_key].append(record_id)
+                    else:
+                        ids[table_key] = [ids[table_key], record_id]
+                else:
+                    ids[table_key] = record_id
+
+        # Idempotency keys
+        cursor.executemany(
+            """
+            INSERT INTO processed_transactions
+            (idempotency_key, user_id, journal_id, source, metadata)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            [
+                (
+                    item.request.idempotency_key,
+                    user_id,
+                    journal_by_index.get(item.index),
+                    source_value,
+                    str(item.request.metadata) if item.request.metadata else None,
+                )
+                for item in prepared
+            ],
+        )
+
+        # Audit entries (same content record() writes)
+        self._write_audit(cursor, user_id, source_value, [
+            (
+                journal_by_index.get(item.index),
+                {
+                    "date": item.txn_date.isoformat(),
+                    "description": item.request.description,
+                    "total_amount": str(item.total_debit),
+                    "entries_count": len(item.entries),
+                },
+                asset_ids[item.index],
+            )
+            for item in prepared
+        ])
+
+        return [
+            TransactionRecord(
+                result=TransactionResult.SUCCESS,
+                journal_id=journal_by_index.get(item.index),
+                idempotency_key=item.request.idempotency_key,
+                asset_record_ids=asset_ids[item.index],
+            )
+            for item in prepared
+        ]
+
+    def _replay_prepared(
+        self,
+        user_id: int,
+        source_value: str,
+        prepared: List["_PreparedTransaction"],
+    ) -> List[TransactionRecord]:
+        """Replay a failed chunk one record at a time, isolating failures with savepoints."""
+        cursor = self.conn.cursor()
+        outcomes = []
+
+        try:
+            self._begin_write(cursor)
+            for item in prepared:
+                cursor.execute("SAVEPOINT bulk_record")
+                try:
+                    outcomes.extend(self._write_prepared(cursor, user_id, source_value, [item]))
+                    cursor.execute("RELEASE SAVEPOINT bulk_record")
+                except Exception as e:
+                    cursor.execute("ROLLBACK TO SAVEPOINT bulk_record")
+                    cursor.execute("RELEASE SAVEPOINT bulk_record")
+                    logger.error(f"Bulk record failed: key={item.request.idempotency_key}: {e}")
+                    outcomes.append(TransactionRecord(
+                        result=TransactionResult.JOURNAL_ERROR,
+                        idempotency_key=item.request.idempotency_key,
+                        error_message=str(e),
+                    ))
+            self._commit_write(cursor)
+        except Exception as e:
+            self._rollback_write()
+            logger.exception(f"Bulk replay failed: {e}")
+            return [
+                TransactionRecord(
+                    result=TransactionResult.JOURNAL_ERROR,
+                    idempotency_key=item.request.idempotency_key,
+                    error_message=str(e),
+                )
+                for item in prepared
+            ]
+
+        return outcomes
+
+    def _begin_write(self, cursor: sqlite3.Cursor) -> None:
+        """
+        Begin a write under the connection's audit mode.
+
+        Inside a caller's transaction (e.g. a batch ingest) the write joins
+        it through a savepoint and leaves the commit to the caller;
+        otherwise it opens its own BEGIN IMMEDIATE transaction.
+        """
+        joined = self.conn.in_transaction
+        self._joined_writes.append(joined)
+        cursor.execute("SAVEPOINT transaction_write" if joined else "BEGIN IMMEDIATE")
+        if self._audit is not None:
+            self._audit.begin_write(cursor)
+
+    def _commit_write(self, cursor: sqlite3.Cursor) -> None:
+        """Restore row-level audit triggers and commit (or release the savepoint)."""
+        if self._audit is not None:
+            self._audit.end_write(cursor)
+        if self._joined_writes[-1]:
+            cursor.execute("RELEASE SAVEPOINT transaction_write")
+        else:
+            self.conn.commit()
+        self._joined_writes.pop()
+        if self._audit is not None:
+            self._audit.commit_staged()
+
+    def _rollback_write(self) -> None:
+        """Roll back a write and drop its deferred audit facts."""
+        if self._joined_writes and self._joined_writes.pop():
+            self.conn.execute("ROLLBACK TO SAVEPOINT transaction_write")
+            self.conn.execute("RELEASE SAVEPOINT transaction_write")
+        else:
+            self.conn.rollback()
+        if self._audit is not None:
+            self._audit.discard_staged()
+
+    def _write_audit(
+        self,
+        cursor: sqlite3.Cursor,
+        user_id: int,
+        source_value: str,
+        audited: List[Tuple[Optional[int], Dict[str, Any], Dict[str, Any]]],
+    ) -> None:
+        """
+        Audit recorded transactions according to the connection's audit mode.
+
+        Args:
+            cursor: Cursor inside the write transaction
+            user_id: User ID
+            source_value: Transaction source
+            audited: (journal_id, journal summary, asset_record_ids) per transaction
+        """
+        mode = self._audit.mode if self._audit is not None else AuditMode.FULL
+        trigger_tables = self._audit.trigger_tables if self._audit is not None else set()
+
+        rows = []
+        for journal_id, summary, asset_record_ids in audited:
+            asset_rows = [
+                (table_name, rid)
+                for table_name, record_id in asset_record_ids.items()
+                for rid in (record_id if isinstance(record_id, list) else [record_id])
+            ]
+
+            if mode is AuditMode.DEFERRED:
+                if journal_id:
+                    self._audit.stage("journals", journal_id)
+                for table_name, rid in asset_rows:
+                    self._audit.stage(table_name, rid)
+
+            elif mode is AuditMode.SUMMARY:
+                # One row per transaction, keyed by its journal (or first asset row)
+                if journal_id:
+                    rows.append(("journals", journal_id, json.dumps(
+                        dict(summary, asset_records=asset_record_ids)
+                    )))
+                elif asset_rows:
+                    table_name, rid = asset_rows[0]
+                    rows.append((table_name, rid, json.dumps({"asset_records": asset_record_ids})))
+
+            else:
+                # Skip tables whose insert trigger already audits the row
+                if journal_id and "journals" not in trigger_tables:
+                    rows.append(("journals", journal_id, json.dumps(summary)))
+                rows.extend(
+                    (table_name, rid, None)
+                    for table_name, rid in asset_rows
+                    if table_name not in trigger_tables
+                )
+
+        self._insert_audit_rows(cursor, user_id, source_value, rows)
+
+    def _insert_rows(
+        self,
+        cursor: sqlite3.Cursor,
+        sql: str,
+        rows: List[Any],
+    ) -> List[Optional[int]]:
+        """
+        Insert rows one statement each and return their rowids.
+
+        Each id is read from its own statement, so ids are exact even with
+        AUTOINCREMENT gaps or explicit ids; rows ignored by a conflict
+        clause map to None. The statement is compiled once and reused.
+        """
+        row_ids = []
+        for row in rows:
+            cursor.execute(sql, row)
+            row_ids.append(cursor.lastrowid if cursor.rowcount > 0 else None)
+        return row_ids
+
+    def _insert_audit_rows(
+        self,
+        cursor: sqlite3.Cursor,
+        user_id: int,
+        source_value: str,
+        rows: List[Tuple[str, int, Optional[str]]],
+    ) -> None:
+        """Insert (table_name, record_id, new_values_json) audit rows in one batch."""
+        if not rows:
+            return
+
+        columns = [col[1] for col in cursor.execute("PRAGMA table_info(audit_log)").fetchall()]
+        if "source" in columns:
+            cursor.executemany(
+                """
+                INSERT INTO audit_log (table_name, record_id, action, new_values, user_id, source)
+                VALUES (?, ?, 'INSERT', ?, ?, ?)
+                """,
+                [(table, rid, values, user_id, source_value) for table, rid, values in rows],
+            )
+        else:
+            cursor.executemany(
+                """
+                INSERT INTO audit_log (table_name, record_id, action, new_values, user_id)
+                VALUES (?, ?, 'INSERT', ?, ?)
+                """,
+                [(table, rid, values, user_id) for table, rid, values in rows],
+            )
+
+    def _existing_keys(self, idempotency_keys: List[str]) -> set:
+        """Return the subset of keys already present in processed_transactions."""
+        existing = set()
+        keys = list(dict.fromkeys(idempotency_keys))
+        # Stay well below SQLite's host-parameter limit
+        for start in range(0, len(keys), 900):
+            batch = keys[start:start + 900]
+            placeholders = ",".join("?" for _ in batch)
+            cursor = self.conn.execute(
+                f"SELECT idempotency_key FROM processed_transactions "
+                f"WHERE idempotency_key IN ({placeholders})",
+                batch,
+            )
+            existing.update(row[0] for row in cursor.fetchall())
+        return existing
+
+    def _existing_account_ids(self, account_ids: set) -> set:
+        """Return the subset of account IDs present in the accounts table."""
+        directory = get_account_directory(self.conn)
+        if directory is not None:
+            return {aid for aid in account_ids if directory.get_by_id(aid) is not None}
+
+        existing = set()
+        ids = list(account_ids)
+        for start in range(0, len(ids), 900):
+            batch = ids[start:start + 900]
+            placeholders = ",".join("?" for _ in batch)
+            cursor = self.conn.execute(
+                f"SELECT id FROM accounts WHERE id IN ({placeholders})", batch
+            )
+            existing.update(row[0] for row in cursor.fetchall())
+        return existing
+
     def _is_duplicate(self, idempotency_key: str) -> bool:
         """Check if idempotency key already exists."""
         cursor = self.conn.execute(
@@ -532,6 +1084,93 @@ class TransactionService:
             )
 
 
+@dataclass
+class _PreparedTransaction:
+    """A validated bulk request with resolved journal entries."""
+
+    index: int
+    request: TransactionRequest
+    entries: List[JournalEntry]
+    total_debit: Decimal
+    txn_date: date
+
+
+class BulkTransactionSession:
+    """
+    Buffered bulk-ingest session returned by TransactionService.bulk().
+
+    Records are written in chunks of chunk_size; results accumulate in
+    input order and are available from the results attribute.
+    """
+
+    def __init__(
+        self,
+        service: TransactionService,
+        user_id: int,
+        source: TransactionSource,
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+    ):
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+
+        self.service = service
+        self.user_id = user_id
+        self.source = source
+        self.chunk_size = chunk_size
+        self.results: List[TransactionRecord] = []
+        self._pending: List[TransactionRequest] = []
+
+    def add(
+        self,
+        description: str,
+        idempotency_key: str,
+        entries: List[JournalEntry] = None,
+        txn_date: date = None,
+        reference_type: str = None,
+        reference_id: int = None,
+        metadata: Dict[str, Any] = None,
+        asset_records: List[AssetRecord] = None,
+        normalized_record: Dict[str, Any] = None,
+    ) -> None:
+        """Queue a transaction; arguments match TransactionService.record()."""
+        self.add_request(TransactionRequest(
+            description=description,
+            idempotency_key=idempotency_key,
+            entries=entries or [],
+            txn_date=txn_date,
+            reference_type=reference_type,
+            reference_id=reference_id,
+            metadata=metadata,
+            asset_records=asset_records or [],
+            normalized_record=normalized_record,
+        ))
+
+    def add_request(self, request: TransactionRequest) -> None:
+        """Queue a prepared TransactionRequest."""
+        self._pending.append(request)
+        if len(self._pending) >= self.chunk_size:
+            self.flush()
+
+    def flush(self) -> List[TransactionRecord]:
+        """Write all buffered records and return their results."""
+        if not self._pending:
+            return []
+
+        chunk, self._pending = self._pending, []
+        chunk_results = self.service._record_chunk(self.user_id, self.source, chunk)
+        self.results.extend(chunk_results)
+        return chunk_results
+
+    def discard(self) -> None:
+        """Drop buffered records that have not been flushed."""
+        self._pending = []
+
+    @property
+    def pending_count(self) -> int:
+        """Number of buffered records not yet written."""
+        return len(self._pending)
+
+
 class IdempotencyKeyGenerator:
     """
     Generates deterministic idempotency keys for various transaction types.
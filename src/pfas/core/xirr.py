@@ -0,0 +1,301 @@
+"""
+Batch XIRR engine.
+
+Solves many cashflow series at once. Series are passed as flat NumPy
+arrays (amounts, day numbers) with CSR-style group offsets, so the
+per-symbol, per-scheme, per-AMC and whole-portfolio XIRR of an analysis
+come out of a single call:
+
+    batch = CashflowBatch()
+    for txn in transactions:
+        batch.add(txn.date, -txn.amount, ("symbol", txn.symbol), "portfolio")
+    solutions = batch.solve()
+    solutions["portfolio"].rate
+
+All series take vectorized Newton-Raphson steps together. Series that do
+not converge (flat derivative, oscillation, rate pinned at a bound) are
+re-solved by bisection over [RATE_FLOOR, RATE_CEILING], again for all of
+them at once.
+
+Rates are annual and compounded on a 365-day year (0.12 = 12%).
+"""
+
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+from enum import IntEnum
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+Number = Union[int, float, Decimal]
+
+# Newton steps are clamped to this range; bisection searches it
+RATE_FLOOR = -0.9999
+RATE_CEILING = 100.0
+NEWTON_RATE_FLOOR = -0.99
+NEWTON_RATE_CEILING = 10.0
+
+# Derivatives smaller than this stall Newton and hand the series to bisection
+MIN_DERIVATIVE = 1e-10
+
+MAX_BISECTION_STEPS = 200
+
+
+class XIRRStatus(IntEnum):
+    """Outcome of solving one series."""
+    CONVERGED = 0    # Newton-Raphson converged
+    BRACKETED = 1    # Solved by the bisection fallback
+    NO_ROOT = 2      # Valid series, but no rate in [RATE_FLOOR, RATE_CEILING]
+    INVALID = 3      # Fewer than two flows, or no inflow/outflow pair
+
+
+@dataclass
+class XIRRSolution:
+    """XIRR of one series."""
+    rate: Optional[float]
+    iterations: int
+    status: XIRRStatus
+
+    @property
+    def converged(self) -> bool:
+        return self.status in (XIRRStatus.CONVERGED, XIRRStatus.BRACKETED)
+
+
+@dataclass
+class XIRRBatchResult:
+    """
+    Per-series results of xirr_batch().
+
+    Attributes:
+        rates: Annual rate per series (NaN where unsolved)
+        iterations: Newton steps plus bisection steps per series
+        status: XIRRStatus code per series
+    """
+    rates: np.ndarray
+    iterations: np.ndarray
+    status: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.rates)
+
+    @property
+    def converged(self) -> np.ndarray:
+        """Boolean mask of series with a rate."""
+        return self.status <= XIRRStatus.BRACKETED
+
+    def solution(self, index: int) -> XIRRSolution:
+        """Get the result of one series."""
+        status = XIRRStatus(int(self.status[index]))
+        rate = float(self.rates[index]) if status <= XIRRStatus.BRACKETED else None
+        return XIRRSolution(rate=rate, iterations=int(self.iterations[index]), status=status)
+
+
+def _npv(
+    rates: np.ndarray,
+    active: np.ndarray,
+    series: np.ndarray,
+    amounts: np.ndarray,
+    years: np.ndarray,
+    derivative: bool = False
+) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """NPV (and dNPV/drate) of every active series at its own rate."""
+    n = len(rates)
+    flows = active[series]
+    s = series[flows]
+    t = years[flows]
+    a = amounts[flows]
+    base = 1.0 + rates[s]
+    with np.errstate(over="ignore", invalid="ignore", divide="ignore"):
+        discounted = a * base ** (-t)
+        npv = np.bincount(s, weights=discounted, minlength=n)
+        dnpv = np.bincount(s, weights=-t * discounted / base, minlength=n) if derivative else None
+    return npv, dnpv
+
+
+def xirr_batch(
+    amounts,
+    days,
+    offsets,
+    guess: float = 0.1,
+    max_iterations: int = 100,
+    tolerance: float = 1e-6
+) -> XIRRBatchResult:
+    """
+    Solve XIRR for many cashflow series at once.
+
+    Series i consists of amounts[offsets[i]:offsets[i + 1]] on the matching
+    days. Flows within a series need not be sorted; time is measured from
+    each series' earliest day.
+
+    Args:
+        amounts: Cashflow amounts (negative = outflow, positive = inflow)
+        days: Day numbers of the flows (e.g. date.toordinal())
+        offsets: Series boundaries, length n_series + 1, starting at 0
+        guess: Initial Newton guess shared by all series
+        max_iterations: Max Newton steps
+        tolerance: Convergence tolerance on the rate
+
+    Returns:
+        XIRRBatchResult with rate, iteration count and status per series
+    """
+    amounts = np.asarray(amounts, dtype=np.float64)
+    days = np.asarray(days, dtype=np.float64)
+    offsets = np.asarray(offsets, dtype=np.int64)
+
+    n = len(offsets) - 1
+    lengths = np.diff(offsets)
+    series = np.repeat(np.arange(n), lengths)
+
+    rates = np.full(n, np.nan)
+    iterations = np.zeros(n, dtype=np.int64)
+    status = np.full(n, XIRRStatus.INVALID, dtype=np.int8)
+    if n == 0:
+        return XIRRBatchResult(rates, iterations, status)
+
+    has_inflow = np.bincount(series, weights=amounts > 0, minlength=n) > 0
+    has_outflow = np.bincount(series, weights=amounts < 0, minlength=n) > 0
+    valid = (lengths >= 2) & has_inflow & has_outflow
+
+    first_day = np.full(n, np.inf)
+    np.minimum.at(first_day, series, days)
+    years = (days - first_day[series]) / 365.0
+
+    # Vectorized Newton-Raphson over all unconverged series
+    rate = np.full(n, float(guess))
+    active = valid.copy()
+    for step in range(1, max_iterations + 1):
+        if not active.any():
+            break
+        npv, dnpv = _npv(rate, active, series, amounts, years, derivative=True)
+        iterations[active] = step
+
+        stalled = active & ~(np.abs(dnpv) >= MIN_DERIVATIVE)
+        active &= ~stalled
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            new_rate = np.where(active, rate - npv / np.where(active, dnpv, 1.0), rate)
+        done = active & (np.abs(new_rate - rate) < tolerance)
+        rates[done] = new_rate[done]
+        status[done] = XIRRStatus.CONVERGED
+        active &= ~done
+
+        diverged = active & ~np.isfinite(new_rate)
+        active &= ~diverged
+        rate = np.where(active, np.clip(new_rate, NEWTON_RATE_FLOOR, NEWTON_RATE_CEILING), rate)
+
+    # Bisection fallback for everything valid that Newton did not solve
+    pending = valid & (status != XIRRStatus.CONVERGED)
+    if pending.any():
+        lo = np.full(n, RATE_FLOOR)
+        hi = np.full(n, RATE_CEILING)
+        f_lo, _ = _npv(lo, pending, series, amounts, years)
+        f_hi, _ = _npv(hi, pending, series, amounts, years)
+
+        bracketed = pending & np.isfinite(f_lo) & np.isfinite(f_hi) & (np.sign(f_lo) != np.sign(f_hi))
+        status[pending & ~bracketed] = XIRRStatus.NO_ROOT
+
+        searching = bracketed.copy()
+        for _ in range(MAX_BISECTION_STEPS):
+            if not searching.any():
+                break
+            mid = (lo + hi) / 2.0
+            f_mid, _ = _npv(mid, searching, series, amounts, years)
+            iterations[searching] += 1
+
+            left = searching & (np.sign(f_mid) == np.sign(f_lo))
+            hi = np.where(searching & ~left, mid, hi)
+            lo = np.where(left, mid, lo)
+            f_lo = np.where(left, f_mid, f_lo)
+
+            searching &= (hi - lo) >= tolerance
+
+        rates[bracketed] = ((lo + hi) / 2.0)[bracketed]
+        status[bracketed] = XIRRStatus.BRACKETED
+
+    return XIRRBatchResult(rates, iterations, status)
+
+
+def xirr(
+    cashflows: Iterable[Tuple[date, Number]],
+    guess: float = 0.1,
+    max_iterations: int = 100,
+    tolerance: float = 1e-6
+) -> Optional[float]:
+    """
+    Solve XIRR for a single series of (date, amount) cashflows.
+
+    Returns:
+        Annual rate, or None if the series has no solution
+    """
+    flows = list(cashflows)
+    result = xirr_batch(
+        [float(amount) for _, amount in flows],
+        [when.toordinal() for when, _ in flows],
+        [0, len(flows)],
+        guess=guess,
+        max_iterations=max_iterations,
+        tolerance=tolerance,
+    )
+    return result.solution(0).rate
+
+
+class CashflowBatch:
+    """
+    Collects keyed cashflow series and solves them with one xirr_batch() call.
+
+    A flow can be added to several series at once (e.g. its symbol and the
+    whole portfolio).
+    """
+
+    def __init__(self):
+        self._index: Dict[Hashable, int] = {}
+        self._series: List[int] = []
+        self._days: List[int] = []
+        self._amounts: List[float] = []
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    @property
+    def keys(self) -> List[Hashable]:
+        return list(self._index)
+
+    def add(self, when: date, amount: Number, *keys: Hashable) -> None:
+        """
+        Add one cashflow to the series named by keys.
+
+        Args:
+            when: Cashflow date
+            amount: Amount (negative = outflow, positive = inflow)
+            keys: Series to add the flow to
+        """
+        amount = float(amount)
+        day = when.toordinal()
+        for key in keys:
+            self._series.append(self._index.setdefault(key, len(self._index)))
+            self._days.append(day)
+            self._amounts.append(amount)
+
+    def solve(self, **kwargs) -> Dict[Hashable, XIRRSolution]:
+        """
+        Solve every series.
+
+        Args:
+            **kwargs: Passed to xirr_batch() (guess, max_iterations, tolerance)
+
+        Returns:
+            Dict mapping each key to its XIRRSolution
+        """
+        series = np.asarray(self._series, dtype=np.int64)
+        order = np.argsort(series, kind="stable")
+        offsets = np.zeros(len(self._index) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(series, minlength=len(self._index)), out=offsets[1:])
+
+        result = xirr_batch(
+            np.asarray(self._amounts)[order],
+            np.asarray(self._days)[order],
+            offsets,
+            **kwargs,
+        )
+        return {key: result.solution(i) for key, i in self._index.items()}
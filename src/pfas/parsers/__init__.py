@@ -14,50 +14,29 @@ Architecture:
 - StagingPipeline: Raw → Normalized → Final table flow
 - ColumnMappingConfig: JSON-based column mapping
 - LedgerIntegration: Double-entry ledger recording for all parsers
+
+Exports are imported from their submodules on first access (pfas._lazy).
 """
 
-from .base import (
-    BaseParser,
-    ParsedRecord,
-    NormalizationResult,
-    ParserRegistry,
-    StrictOpenXMLConverter,
-    ColumnMappingConfig,
-    StagingPipeline,
-)
+from pfas._lazy import lazy_exports
 
-# Ledger integration exports
-from .ledger_integration import (
-    AccountCode,
-    LedgerRecordResult,
-    record_mf_purchase,
-    record_mf_redemption,
-    record_mf_switch,
-    record_mf_dividend,
-    record_bank_credit,
-    record_bank_debit,
-    record_stock_buy,
-    record_stock_sell,
-    record_salary,
-    record_epf_contribution,
-    record_epf_interest,
-    record_ppf_deposit,
-    record_ppf_interest,
-    record_ppf_withdrawal,
-    # Deep accounting functions
-    validate_salary_components,
-    record_salary_multi_leg,
-    record_employer_pf_contribution,
-    record_mf_purchase_with_cost_basis,
-    record_mf_redemption_with_cost_basis,
-    record_stock_buy_with_cost_basis,
-    record_stock_sell_with_cost_basis,
-    record_rsu_vest,
-    record_rsu_sale,
-    record_espp_purchase,
-    record_foreign_dividend,
-    get_sbi_tt_rate,
-)
+__getattr__, __dir__ = lazy_exports(__name__, {
+    ".base": [
+        "BaseParser", "ParsedRecord", "NormalizationResult", "ParserRegistry",
+        "StrictOpenXMLConverter", "ColumnMappingConfig", "StagingPipeline",
+    ],
+    ".ledger_integration": [
+        "AccountCode", "LedgerRecordResult", "record_mf_purchase", "record_mf_redemption",
+        "record_mf_switch", "record_mf_dividend", "record_bank_credit", "record_bank_debit",
+        "record_stock_buy", "record_stock_sell", "record_salary", "record_epf_contribution",
+        "record_epf_interest", "record_ppf_deposit", "record_ppf_interest",
+        "record_ppf_withdrawal", "validate_salary_components", "record_salary_multi_leg",
+        "record_employer_pf_contribution", "record_mf_purchase_with_cost_basis",
+        "record_mf_redemption_with_cost_basis", "record_stock_buy_with_cost_basis",
+        "record_stock_sell_with_cost_basis", "record_rsu_vest", "record_rsu_sale",
+        "record_espp_purchase", "record_foreign_dividend", "get_sbi_tt_rate",
+    ],
+})
 
 __version__ = "0.2.0"
 
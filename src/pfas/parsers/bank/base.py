@@ -21,7 +21,7 @@ except ImportError:
 import pdfplumber
 import pandas as pd
 
-from pfas.core.encryption import encrypt_field
+from pfas.core.encryption import get_user_cipher
 from pfas.core.transaction_service import (
     TransactionService,
     TransactionSource,
@@ -219,8 +219,9 @@ class BankStatementParser(ABC):
         if row:
             return row["id"]
 
-        # Encrypt account number
-        encrypted, salt = encrypt_field(account.account_number, self.master_key)
+        # Encrypt account number with the user's data key
+        cipher = get_user_cipher(self.conn, user_id, self.master_key)
+        encrypted, salt = cipher.encrypt(account.account_number)
 
         # Create via TransactionService
         idempotency_key = f"bank_account:{account.bank_name}:{account.last4}"
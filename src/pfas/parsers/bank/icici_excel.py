@@ -11,6 +11,7 @@ from typing import List, Optional
 import pandas as pd
 
 from pfas.parsers.bank.base import BankStatementParser
+from pfas.parsers.columns import cell_text, column, map_distinct, parse_dates
 from pfas.parsers.bank.models import ParseResult, BankTransaction, BankAccount
 
 
@@ -19,6 +20,15 @@ class ICICIExcelParser(BankStatementParser):
 
     BANK_NAME = "ICICI Bank"
 
+    # Date formats tried by _parse_date_value, in order
+    DATE_FORMATS = [
+        "%d/%m/%Y",
+        "%d-%m-%Y",
+        "%Y-%m-%d",
+        "%d/%m/%y",
+        "%d-%m-%y",
+    ]
+
     def _parse_content(self, content: dict, source_file: str) -> ParseResult:
         """Parse ICICI Excel statement content."""
         result = ParseResult(success=False, source_file=source_file)
@@ -138,46 +148,36 @@ class ICICIExcelParser(BankStatementParser):
         if not column_map["date"] or not column_map["description"]:
             return []
 
+        # Skip empty rows
+        df_txn = df_txn[~df_txn.isna().all(axis=1)]
+
+        def values(name: str) -> pd.Series:
+            return column(df_txn, column_map[name])
+
+        cheque_nos = values("cheque_no")
+        ref_nos = cell_text(cheque_nos, keep_blank=True)
+        ref_nos = ref_nos.where(cheque_nos.map(str) != "nan", None)
+
+        date_memo = {}
+        rows = zip(
+            parse_dates(values("date"), self._parse_date_value, self.DATE_FORMATS, date_memo),
+            parse_dates(values("value_date"), self._parse_date_value, self.DATE_FORMATS, date_memo),
+            cell_text(values("description"), keep_blank=True).fillna("").tolist(),
+            ref_nos.tolist(),
+            map_distinct(values("debit"), self._parse_amount_value),
+            map_distinct(values("credit"), self._parse_amount_value),
+            map_distinct(values("balance"), self._parse_amount_value),
+        )
+
         transactions = []
 
-        for idx, row in df_txn.iterrows():
+        for txn_date, value_date, description, ref_no, debit, credit, balance in rows:
+            if not txn_date or not description or description == "nan":
+                continue
             try:
-                # Skip empty rows
-                if row.isna().all():
-                    continue
-
-                # Extract values
-                date_val = row.get(column_map["date"])
-                value_date_val = row.get(column_map["value_date"])
-                description_val = row.get(column_map["description"])
-                cheque_no_val = row.get(column_map["cheque_no"])
-                debit_val = row.get(column_map["debit"])
-                credit_val = row.get(column_map["credit"])
-                balance_val = row.get(column_map["balance"])
-
-                # Parse date
-                txn_date = self._parse_date_value(date_val)
-                if not txn_date:
-                    continue
-
-                value_date = self._parse_date_value(value_date_val) or txn_date
-
-                # Parse description
-                description = str(description_val).strip() if pd.notna(description_val) else ""
-                if not description or description == "nan":
-                    continue
-
-                # Parse amounts
-                debit = self._parse_amount_value(debit_val)
-                credit = self._parse_amount_value(credit_val)
-                balance = self._parse_amount_value(balance_val)
-
-                # Parse reference number
-                ref_no = str(cheque_no_val).strip() if pd.notna(cheque_no_val) and str(cheque_no_val) != "nan" else None
-
                 txn = BankTransaction(
                     date=txn_date,
-                    value_date=value_date,
+                    value_date=value_date or txn_date,
                     description=description,
                     debit=debit,
                     credit=credit,
@@ -215,15 +215,7 @@ class ICICIExcelParser(BankStatementParser):
             return None
 
         # Try different date formats
-        formats = [
-            "%d/%m/%Y",
-            "%d-%m-%Y",
-            "%Y-%m-%d",
-            "%d/%m/%y",
-            "%d-%m-%y",
-        ]
-
-        for fmt in formats:
+        for fmt in self.DATE_FORMATS:
             try:
                 return datetime.strptime(date_str, fmt).date()
             except ValueError:
@@ -10,6 +10,7 @@ from typing import List, Optional
 import pandas as pd
 
 from pfas.parsers.bank.base import BankStatementParser
+from pfas.parsers.columns import cell_text, column, map_distinct, parse_dates
 from pfas.parsers.bank.models import ParseResult, BankTransaction, BankAccount
 
 
@@ -29,6 +30,16 @@ class SBIParser(BankStatementParser):
         "balance": ["balance", "closing balance", "bal"]
     }
 
+    # Date formats tried by _parse_date_value, in order
+    DATE_FORMATS = [
+        "%d-%m-%Y",
+        "%d/%m/%Y",
+        "%Y-%m-%d",
+        "%d-%b-%Y",
+        "%d %b %Y",
+        "%d.%m.%Y"
+    ]
+
     def _parse_content(self, content: dict, source_file: str) -> ParseResult:
         """Parse SBI Excel statement content."""
         result = ParseResult(success=False, source_file=source_file)
@@ -108,46 +119,32 @@ class SBIParser(BankStatementParser):
         # Map columns to expected names
         column_map = self._map_columns(df_txn.columns)
 
+        # Skip empty rows
+        df_txn = df_txn[~df_txn.isna().all(axis=1)]
+
+        def values(name: str) -> pd.Series:
+            return column(df_txn, column_map.get(name))
+
+        date_memo = {}
+        rows = zip(
+            parse_dates(values("date"), self._parse_date_value, self.DATE_FORMATS, date_memo),
+            parse_dates(values("value_date"), self._parse_date_value, self.DATE_FORMATS, date_memo),
+            cell_text(values("description"), keep_blank=True).fillna("").tolist(),
+            cell_text(values("ref_no"), keep_blank=True).tolist(),
+            map_distinct(values("debit"), self._parse_amount_value),
+            map_distinct(values("credit"), self._parse_amount_value),
+            map_distinct(values("balance"), self._parse_amount_value),
+        )
+
         transactions = []
 
-        for idx, row in df_txn.iterrows():
+        for txn_date, value_date, description, ref_no, debit, credit, balance in rows:
+            if not txn_date or not description:
+                continue
             try:
-                # Skip empty rows
-                if row.isna().all():
-                    continue
-
-                # Extract values
-                date_val = row.get(column_map.get("date"))
-                value_date_val = row.get(column_map.get("value_date"))
-                description_val = row.get(column_map.get("description"))
-                ref_no_val = row.get(column_map.get("ref_no"))
-                debit_val = row.get(column_map.get("debit"))
-                credit_val = row.get(column_map.get("credit"))
-                balance_val = row.get(column_map.get("balance"))
-
-                # Parse date
-                txn_date = self._parse_date_value(date_val)
-                if not txn_date:
-                    continue
-
-                value_date = self._parse_date_value(value_date_val) or txn_date
-
-                # Parse description
-                description = str(description_val).strip() if pd.notna(description_val) else ""
-                if not description:
-                    continue
-
-                # Parse amounts
-                debit = self._parse_amount_value(debit_val)
-                credit = self._parse_amount_value(credit_val)
-                balance = self._parse_amount_value(balance_val)
-
-                # Parse reference number
-                ref_no = str(ref_no_val).strip() if pd.notna(ref_no_val) else None
-
                 txn = BankTransaction(
                     date=txn_date,
-                    value_date=value_date,
+                    value_date=value_date or txn_date,
                     description=description,
                     reference_number=ref_no,
                     debit=debit,
@@ -201,16 +198,7 @@ class SBIParser(BankStatementParser):
         if not date_str:
             return None
 
-        formats = [
-            "%d-%m-%Y",
-            "%d/%m/%Y",
-            "%Y-%m-%d",
-            "%d-%b-%Y",
-            "%d %b %Y",
-            "%d.%m.%Y"
-        ]
-
-        for fmt in formats:
+        for fmt in self.DATE_FORMATS:
             try:
                 return datetime.strptime(date_str, fmt).date()
             except ValueError:
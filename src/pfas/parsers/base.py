@@ -5,6 +5,10 @@ This module provides:
 2. ParserRegistry - Plugin registration and discovery
 3. StrictOpenXMLConverter - Handle ISO 29500 Strict format Excel files
 4. NormalizationPipeline - Staging and normalization flow via TransactionService
+
+Parsers that set streaming = True and yield records from iter_raw() are
+staged in bounded chunks: peak memory follows staging_chunk_size rather
+than the file size, and each chunk costs two commits instead of two per row.
 """
 
 from abc import ABC, abstractmethod
@@ -12,7 +16,7 @@ from dataclasses import dataclass, field
 from datetime import date, datetime
 from decimal import Decimal
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Type, Callable
+from typing import List, Dict, Any, Optional, Type, Callable, Iterable, Iterator, Tuple
 import json
 import zipfile
 import tempfile
@@ -21,8 +25,11 @@ import logging
 import hashlib
 
 from pfas.core.transaction_service import (
+    DEFAULT_BULK_CHUNK_SIZE,
     TransactionService,
     TransactionSource,
+    TransactionResult,
+    TransactionRequest,
     AssetRecord,
     IdempotencyKeyGenerator,
 )
@@ -172,12 +179,22 @@ class BaseParser(ABC):
     - get_source_type(): Return parser identifier
     - get_supported_formats(): Return list of supported extensions
 
+    Streaming (opt-in):
+    - Override iter_raw() to yield records as they are read
+    - Set streaming = True; parse() then consumes iter_raw() lazily and
+      stages rows in chunks of staging_chunk_size via
+      TransactionService.record_many()
+
     Ledger Integration:
     - All storage goes through TransactionService.record()
     - Idempotency keys generated from row checksums
     - Journal entries created for financial transactions
     """
 
+    # Stage rows in bounded chunks (see parse_stream)
+    streaming: bool = False
+    staging_chunk_size: int = DEFAULT_BULK_CHUNK_SIZE
+
     def __init__(
         self,
         db_connection: sqlite3.Connection,
@@ -221,6 +238,21 @@ class BaseParser(ABC):
         """
         pass
 
+    def iter_raw(self, file_path: Path) -> Iterator[ParsedRecord]:
+        """
+        Yield raw records one at a time.
+
+        The default wraps parse_raw(). Streaming parsers override this to
+        read the file incrementally.
+
+        Args:
+            file_path: Path to source file
+
+        Yields:
+            ParsedRecord objects with raw data
+        """
+        yield from self.parse_raw(file_path)
+
     @abstractmethod
     def normalize_record(self, record: ParsedRecord) -> Optional[Dict[str, Any]]:
         """
@@ -258,50 +290,247 @@ class BaseParser(ABC):
         Returns:
             NormalizationResult with status and counts
         """
+        if self.streaming:
+            return self.parse_stream(file_path)
+
         result = NormalizationResult(success=True)
+        raw_records = self.extract_raw(file_path, result)
+        if raw_records:
+            self.normalize_records(raw_records, result)
+        return result
+
+    def parse_stream(
+        self,
+        file_path: Path,
+        chunk_size: Optional[int] = None
+    ) -> NormalizationResult:
+        """
+        Streaming pipeline: validate → iter_raw → normalize → chunked staging.
+
+        Records flow through generators and at most chunk_size of them are
+        buffered before being written. If iter_raw() fails part-way, rows
+        read so far stay staged; re-parsing the file is idempotent.
+
+        Args:
+            file_path: Path to source file
+            chunk_size: Rows per staging write (default: staging_chunk_size)
+
+        Returns:
+            NormalizationResult with status and counts
+        """
         file_path = Path(file_path)
+        result = NormalizationResult(success=True)
 
-        # Validate
         if not self.validate(file_path):
             result.success = False
             result.errors.append(f"Invalid file: {file_path}")
             return result
 
+        working_path = self._converter.convert(file_path)
+
+        try:
+            record_count = self._stage_records(
+                self.iter_raw(working_path), result, chunk_size
+            )
+        except Exception as e:
+            result.success = False
+            result.errors.append(f"Parse error: {str(e)}")
+            return result
+        finally:
+            # The file is read lazily, so clean up only once it is consumed
+            if working_path != file_path and working_path.exists():
+                working_path.unlink()
+
+        if record_count == 0:
+            result.warnings.append("No records found in file")
+
+        return result
+
+    def extract_raw(
+        self,
+        file_path: Path,
+        result: NormalizationResult
+    ) -> List[ParsedRecord]:
+        """
+        Extraction half of parse(): validate → parse_raw.
+
+        Does not touch the database, so it can run in a worker process
+        (see BatchIngester parallel mode). Failures and warnings are
+        recorded on result.
+
+        Args:
+            file_path: Path to source file
+            result: NormalizationResult to record errors and warnings on
+
+        Returns:
+            List of raw records (empty on failure)
+        """
+        file_path = Path(file_path)
+
+        # Validate
+        if not self.validate(file_path):
+            result.success = False
+            result.errors.append(f"Invalid file: {file_path}")
+            return []
+
         # Handle Strict Open XML format
         working_path = self._converter.convert(file_path)
 
         try:
             # Parse raw records
             raw_records = self.parse_raw(working_path)
-
-            if not raw_records:
-                result.warnings.append("No records found in file")
-                return result
-
-            # Normalize each record
-            for record in raw_records:
-                try:
-                    normalized = self.normalize_record(record)
-                    if normalized:
-                        # Store in staging
-                        self._store_normalized(record, normalized)
-                        result.normalized_count += 1
-                    else:
-                        result.warnings.append(f"Row {record.row_index}: Could not normalize")
-                except Exception as e:
-                    result.error_count += 1
-                    result.errors.append(f"Row {record.row_index}: {str(e)}")
-
         except Exception as e:
             result.success = False
             result.errors.append(f"Parse error: {str(e)}")
+            return []
         finally:
             # Clean up temp file
             if working_path != file_path and working_path.exists():
                 working_path.unlink()
 
+        if not raw_records:
+            result.warnings.append("No records found in file")
+            return []
+
+        return raw_records
+
+    def normalize_records(
+        self,
+        raw_records: List[ParsedRecord],
+        result: NormalizationResult = None
+    ) -> NormalizationResult:
+        """
+        Storage half of parse(): normalize and store each raw record.
+
+        Args:
+            raw_records: Records returned by extract_raw()
+            result: NormalizationResult to accumulate into (default: new)
+
+        Returns:
+            NormalizationResult with status and counts
+        """
+        if result is None:
+            result = NormalizationResult(success=True)
+
+        if self.streaming:
+            self._stage_records(raw_records, result)
+            return result
+
+        # Normalize each record
+        for record in raw_records:
+            try:
+                normalized = self.normalize_record(record)
+                if normalized:
+                    # Store in staging
+                    self._store_normalized(record, normalized)
+                    result.normalized_count += 1
+                else:
+                    result.warnings.append(f"Row {record.row_index}: Could not normalize")
+            except Exception as e:
+                result.error_count += 1
+                result.errors.append(f"Row {record.row_index}: {str(e)}")
+
         return result
 
+    def _iter_normalized(
+        self,
+        raw_records: Iterable[ParsedRecord],
+        result: NormalizationResult
+    ) -> Iterator[Tuple[ParsedRecord, Dict[str, Any]]]:
+        """
+        Normalization stage of the streaming pipeline.
+
+        Yields (raw, normalized) pairs; rows that cannot be normalized are
+        recorded on result and skipped.
+        """
+        for record in raw_records:
+            try:
+                normalized = self.normalize_record(record)
+            except Exception as e:
+                result.error_count += 1
+                result.errors.append(f"Row {record.row_index}: {str(e)}")
+                continue
+
+            if normalized:
+                yield record, normalized
+            else:
+                result.warnings.append(f"Row {record.row_index}: Could not normalize")
+
+    def _stage_records(
+        self,
+        raw_records: Iterable[ParsedRecord],
+        result: NormalizationResult,
+        chunk_size: Optional[int] = None
+    ) -> int:
+        """
+        Normalize and stage records in chunks of at most chunk_size rows.
+
+        Returns:
+            Number of raw records consumed
+        """
+        chunk_size = chunk_size or self.staging_chunk_size
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+
+        consumed = 0
+
+        def counted(records: Iterable[ParsedRecord]) -> Iterator[ParsedRecord]:
+            nonlocal consumed
+            for record in records:
+                consumed += 1
+                yield record
+
+        chunk: List[Tuple[ParsedRecord, Dict[str, Any]]] = []
+        try:
+            for pair in self._iter_normalized(counted(raw_records), result):
+                chunk.append(pair)
+                if len(chunk) >= chunk_size:
+                    pending, chunk = chunk, []
+                    self._store_chunk(pending, result)
+        finally:
+            if chunk:
+                self._store_chunk(chunk, result)
+
+        return consumed
+
+    def _store_chunk(
+        self,
+        chunk: List[Tuple[ParsedRecord, Dict[str, Any]]],
+        result: NormalizationResult
+    ):
+        """
+        Stage one chunk: all staging_raw rows in one write, then all
+        staging_normalized rows (linked to their raw rows) in another.
+        """
+        requests = [self._build_staging_requests(raw, normalized) for raw, normalized in chunk]
+        source = self._get_transaction_source()
+
+        raw_results = self.transaction_service.record_many(
+            user_id=self.user_id,
+            requests=[raw_request for raw_request, _ in requests],
+            source=source,
+            chunk_size=len(requests),
+        )
+        for (_, normalized_request), raw_result in zip(requests, raw_results):
+            if raw_result.asset_record_ids.get("staging_raw"):
+                normalized_request.asset_records[0].data["staging_raw_id"] = \
+                    raw_result.asset_record_ids["staging_raw"]
+
+        normalized_results = self.transaction_service.record_many(
+            user_id=self.user_id,
+            requests=[normalized_request for _, normalized_request in requests],
+            source=source,
+            chunk_size=len(requests),
+        )
+        for (raw, _), outcome in zip(chunk, normalized_results):
+            if outcome.result == TransactionResult.SUCCESS:
+                result.normalized_count += 1
+            elif outcome.result == TransactionResult.DUPLICATE:
+                result.duplicate_count += 1
+            else:
+                result.error_count += 1
+                result.errors.append(f"Row {raw.row_index}: {outcome.error_message}")
+
     def _store_normalized(self, raw: ParsedRecord, normalized: Dict[str, Any]):
         """
         Store normalized record via TransactionService.
@@ -313,6 +542,46 @@ class BaseParser(ABC):
             raw: ParsedRecord with source data and checksum
             normalized: Normalized data dictionary
         """
+        raw_request, request = self._build_staging_requests(raw, normalized)
+        source = self._get_transaction_source()
+
+        # Record raw data first
+        raw_result = self.transaction_service.record_asset_only(
+            user_id=self.user_id,
+            asset_records=raw_request.asset_records,
+            idempotency_key=raw_request.idempotency_key,
+            source=source,
+            description=raw_request.description,
+        )
+
+        # Update staging_raw_id if raw record was created
+        if raw_result.asset_record_ids.get("staging_raw"):
+            request.asset_records[0].data["staging_raw_id"] = raw_result.asset_record_ids["staging_raw"]
+
+        # Record normalized data with journal entries
+        self.transaction_service.record(
+            user_id=self.user_id,
+            entries=request.entries,
+            description=request.description,
+            source=source,
+            idempotency_key=request.idempotency_key,
+            txn_date=request.txn_date,
+            reference_type=request.reference_type,
+            asset_records=request.asset_records,
+        )
+
+    def _build_staging_requests(
+        self,
+        raw: ParsedRecord,
+        normalized: Dict[str, Any]
+    ) -> Tuple[TransactionRequest, TransactionRequest]:
+        """
+        Build the staging_raw and staging_normalized writes for one row.
+
+        Returns:
+            (raw request, normalized request); the normalized request's
+            staging_raw_id is filled in once the raw row has an id
+        """
         # Generate idempotency key from row checksum
         idempotency_key = IdempotencyKeyGenerator.from_checksum(
             source_type=raw.source_type,
@@ -361,8 +630,7 @@ class BaseParser(ABC):
             on_conflict="IGNORE"
         )
 
-        # Store raw record first via TransactionService
-        raw_idempotency_key = f"raw:{raw.source_type}:{raw.checksum}"
+        # Raw record, keyed separately so it is stored once per checksum
         raw_asset_record = AssetRecord(
             table_name="staging_raw",
             data={
@@ -375,31 +643,22 @@ class BaseParser(ABC):
             on_conflict="IGNORE"
         )
 
-        # Record raw data first
-        raw_result = self.transaction_service.record_asset_only(
-            user_id=self.user_id,
-            asset_records=[raw_asset_record],
-            idempotency_key=raw_idempotency_key,
-            source=self._get_transaction_source(),
+        raw_request = TransactionRequest(
             description=f"Raw record: {raw.source_type} row {raw.row_index}",
+            idempotency_key=f"raw:{raw.source_type}:{raw.checksum}",
+            asset_records=[raw_asset_record],
         )
 
-        # Update staging_raw_id if raw record was created
-        if raw_result.asset_record_ids.get("staging_raw"):
-            asset_record.data["staging_raw_id"] = raw_result.asset_record_ids["staging_raw"]
-
-        # Record normalized data with journal entries
         description = f"{raw.source_type}: {normalized.get('asset_name', 'Transaction')}"
-        self.transaction_service.record(
-            user_id=self.user_id,
-            entries=entries,
+        request = TransactionRequest(
             description=description[:100],
-            source=self._get_transaction_source(),
             idempotency_key=idempotency_key,
+            entries=entries,
             txn_date=txn_date,
             reference_type=normalized.get('transaction_type', 'NORMALIZED'),
             asset_records=[asset_record],
         )
+        return raw_request, request
 
     def _create_journal_entries(self, normalized: Dict[str, Any]) -> List[JournalEntry]:
         """
@@ -685,6 +944,10 @@ class ColumnMappingConfig:
                     raise ValueError(f"Required field missing: {source_col}")
                 value = default
 
+            value_mapping = mapping.get('value_mapping')
+            if value_mapping and isinstance(value, str):
+                value = value_mapping.get(value, value)
+
             result[target_field] = value
 
         return result
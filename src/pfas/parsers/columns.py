@@ -0,0 +1,232 @@
+"""
+Column-at-a-time normalization for tabular statements.
+
+RTA and broker exports are read into a DataFrame and normalized one column
+at a time instead of walking rows with iterrows(): candidate headers are
+coalesced with vectorized string ops, and dates and Decimals are converted
+once per distinct cell value (statements repeat dates, NAVs, folios and
+blanks heavily). Parsers then zip the resulting columns into their record
+dataclasses.
+
+Usage:
+    names = coalesce(df, ['Scheme Name', 'SCHEME NAME'])
+    isins = extract(names, r'ISIN\\s*:\\s*([A-Z0-9]{12})', re.IGNORECASE)
+    dates = map_distinct(coalesce(df, ['Date']), self._parse_date)
+    amounts = map_distinct(coalesce(df, ['Amount']), self._to_decimal)
+
+The scalar converter passed to map_distinct() is the parser's own cell
+parser, so the columnar path gives the same values as the per-row one.
+"""
+
+import re
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+def cell_text(values: pd.Series, keep_blank: bool = False) -> pd.Series:
+    """
+    Cells as stripped strings.
+
+    Args:
+        values: DataFrame column
+        keep_blank: Keep blank and 'nan' text instead of treating it as missing
+
+    Returns:
+        Object Series; None where the cell is NaN (or blank, unless keep_blank)
+    """
+    present = values.notna()
+    text = values.astype(object).where(present, "").map(str).str.strip()
+    missing = ~present if keep_blank else (text == "") | (text.str.lower() == "nan")
+    return text.astype(object).where(~missing, None)
+
+
+def column(df: pd.DataFrame, name: Any) -> pd.Series:
+    """A column as objects, or all None if the sheet lacks it (like row.get())."""
+    if name in df.columns:
+        return df[name].astype(object)
+    return pd.Series(None, index=df.index, dtype=object)
+
+
+def coalesce(df: pd.DataFrame, columns: Iterable[Any]) -> pd.Series:
+    """
+    First non-blank cell per row among candidate columns.
+
+    Columns missing from the frame are skipped, so one call covers the
+    header variants different statement versions use.
+
+    Args:
+        df: Statement DataFrame
+        columns: Candidate column names, in order of preference
+
+    Returns:
+        Object Series of stripped strings (None where every candidate is blank)
+    """
+    result = pd.Series(None, index=df.index, dtype=object)
+    for column in columns:
+        if column not in df.columns:
+            continue
+        missing = result.isna()
+        if not missing.any():
+            break
+        result = result.where(~missing, cell_text(df[column]))
+    return result
+
+
+def map_distinct(
+    values: Iterable[Any],
+    convert: Callable[[Any], Any],
+    memo: Optional[Dict[Any, Any]] = None,
+) -> List[Any]:
+    """
+    Apply a scalar converter once per distinct value.
+
+    Args:
+        values: Column values (Series or list)
+        convert: Cell parser, e.g. a parser's _parse_date or _to_decimal
+        memo: Optional dict shared between calls, e.g. for a statement's
+            transaction and purchase date columns
+
+    Returns:
+        List of converted values, one per input value
+    """
+    codes, uniques = pd.factorize(pd.Series(values, dtype=object), use_na_sentinel=False)
+    if memo is None:
+        converted = [convert(value) for value in uniques]
+    else:
+        converted = []
+        for value in uniques:
+            try:
+                result = memo[value]
+            except (KeyError, TypeError):
+                result = convert(value)
+                try:
+                    memo[value] = result
+                except TypeError:
+                    pass
+            converted.append(result)
+
+    table = np.empty(len(converted), dtype=object)
+    table[:] = converted
+    return table[codes].tolist()
+
+
+def parse_dates(
+    values: Iterable[Any],
+    convert: Callable[[Any], Optional[date]],
+    formats: Iterable[str] = (),
+    memo: Optional[Dict[Any, Any]] = None,
+) -> List[Optional[date]]:
+    """
+    Parse a date column with a parser's scalar date function.
+
+    Distinct text values matching one of formats are parsed in one
+    vectorized pass per format; everything else goes through convert.
+    Only pass formats that convert reads the same way (e.g. '%d-%b-%Y'),
+    not ambiguous day/month orders.
+
+    Args:
+        values: Column values
+        convert: Cell parser, e.g. a parser's _parse_date
+        formats: strptime formats to parse column-wise
+        memo: Optional dict shared with other map_distinct() calls
+
+    Returns:
+        List of dates (None where convert gives None)
+    """
+    codes, uniques = pd.factorize(pd.Series(values, dtype=object), use_na_sentinel=False)
+    table = np.empty(len(uniques), dtype=object)
+    text = pd.Series(uniques, dtype=object)
+    todo = text.map(lambda value: isinstance(value, str)).to_numpy(dtype=bool)
+    done = np.zeros(len(uniques), dtype=bool)
+
+    for fmt in formats:
+        candidates = np.flatnonzero(todo & ~done)
+        if not len(candidates):
+            break
+        converted = pd.to_datetime(text.iloc[candidates], format=fmt, errors="coerce")
+        matched = candidates[converted.notna().to_numpy()]
+        for i, ts in zip(matched, converted.dropna().tolist()):
+            table[i] = ts.date()
+        done[matched] = True
+
+    # Text no format matched, and non-text cells
+    rest = np.flatnonzero(~done).tolist()
+    converted = map_distinct([uniques[i] for i in rest], convert, memo)
+    for i, parsed in zip(rest, converted):
+        table[i] = parsed
+    return table[codes].tolist()
+
+
+def date_column(
+    values: pd.Series,
+    formats: List[str],
+    fallback: Optional[Callable[[str], Optional[date]]] = None,
+) -> List[Optional[date]]:
+    """
+    Parse a date column, one vectorized pass per candidate format.
+
+    Datetime cells are kept; blank and 'nan'/'none'/'nat' text is missing.
+
+    Args:
+        values: DataFrame column
+        formats: strptime formats, tried in order
+        fallback: Scalar parser for text no format matches (default: None)
+
+    Returns:
+        List of dates
+    """
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return [None if pd.isna(v) else v.date() for v in values.tolist()]
+
+    parsed: List[Optional[date]] = [None] * len(values)
+    pending_rows = []
+    pending_text = []
+    for i, value in enumerate(values.tolist()):
+        if value is None or pd.isna(value):
+            continue
+        if isinstance(value, date):
+            parsed[i] = value.date() if isinstance(value, datetime) else value
+        else:
+            text = str(value).strip()
+            if text.lower() not in ('', 'nan', 'none', 'nat'):
+                pending_rows.append(i)
+                pending_text.append(text)
+
+    for fmt in formats:
+        if not pending_rows:
+            break
+        converted = pd.to_datetime(pd.Series(pending_text, dtype=object), format=fmt, errors="coerce")
+        matched = converted.notna().tolist()
+        for i, ok, ts in zip(pending_rows, matched, converted.tolist()):
+            if ok:
+                parsed[i] = ts.date()
+        pending_rows = [i for i, ok in zip(pending_rows, matched) if not ok]
+        pending_text = [t for t, ok in zip(pending_text, matched) if not ok]
+
+    if fallback is not None:
+        for i, text in zip(pending_rows, pending_text):
+            parsed[i] = fallback(text)
+
+    return parsed
+
+
+def extract(values: pd.Series, pattern: str, flags: int = 0) -> pd.Series:
+    """
+    First regex match per cell, e.g. an ISIN embedded in a scheme name.
+
+    Args:
+        values: Text column (see cell_text/coalesce)
+        pattern: Regex; its first group (or the whole match) is returned
+        flags: re flags
+
+    Returns:
+        Object Series; None where the cell is blank or does not match
+    """
+    if re.compile(pattern).groups == 0:
+        pattern = f"({pattern})"
+    text = values.astype(object).where(values.notna(), "").map(str)
+    matches = text.str.extract(pattern, flags=flags, expand=True)[0]
+    return matches.astype(object).where(matches.notna(), None)
@@ -30,7 +30,7 @@ from pfas.core.transaction_service import (
     TransactionResult,
     TransactionRecord,
 )
-from pfas.core.accounts import get_account_by_code
+from pfas.core.accounts import get_account_by_code, get_account_directory
 from pfas.core.exceptions import AccountingBalanceError, ForexRateNotFoundError
 
 logger = logging.getLogger(__name__)
@@ -133,6 +133,9 @@ def get_account_id_by_code(conn: sqlite3.Connection, code: str) -> Optional[int]
     Returns:
         Account ID or None if not found
     """
+    directory = get_account_directory(conn)
+    if directory is not None:
+        return directory.get_id(code)
     account = get_account_by_code(conn, code)
     return account.id if account else None
 
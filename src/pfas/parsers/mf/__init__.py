@@ -1,33 +1,39 @@
-"""Mutual Fund parsers for CAMS CAS, Karvy/KFintech, and other formats."""
+"""Mutual Fund parsers for CAMS CAS, Karvy/KFintech, and other formats.
 
-from .models import (
-    MFScheme, MFTransaction, AssetClass, TransactionType, ParseResult,
-    # CAS-specific models
-    CASFileType, CASSource, InvestorInfo, StatementPeriod, CASTransaction,
-    SchemeValuation, CASScheme, CASFolio, CASData
-)
-from .cams import CAMSParser
-from .karvy import KarvyParser
-from .classifier import classify_scheme
-from .capital_gains import CapitalGainsCalculator, CapitalGainsSummary
-from .pdf_extractor import check_pdf_support
-from .scanner import MFStatementScanner, ScannedFile, ScanResult, RTA, FileType, scan_mf_inbox
-from .ingester import MFIngester, IngestionResult, ingest_mf_statements
+Exports are imported from their submodules on first access (pfas._lazy).
+"""
 
-# Phase 1 gap fixes
-from .exceptions import (
-    MFParserError, CASParseError, HeaderParseError, IncorrectPasswordError,
-    UnsupportedFormatError, IntegrityError, BalanceMismatchError,
-    IncompleteDataError, GainsCalculationError, FIFOMismatchError, GrandfatheringError
-)
-from .fifo_tracker import (
-    PurchaseLot, GainResult, FIFOUnitTracker, PortfolioFIFOTracker
-)
-from .cas_pdf_parser import (
-    CASPDFParser, parse_cas_pdf, check_cas_support,
-    ConsolidationResult, FolioConsolidationEntry
-)
-from .cas_report_generator import CASReportGenerator, generate_cas_reports
+from pfas._lazy import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    ".models": [
+        "MFScheme", "MFTransaction", "AssetClass", "TransactionType", "ParseResult",
+        "CASFileType", "CASSource", "InvestorInfo", "StatementPeriod", "CASTransaction",
+        "SchemeValuation", "CASScheme", "CASFolio", "CASData",
+    ],
+    ".cams": ["CAMSParser"],
+    ".karvy": ["KarvyParser"],
+    ".classifier": ["classify_scheme"],
+    ".capital_gains": ["CapitalGainsCalculator", "CapitalGainsSummary"],
+    ".pdf_extractor": ["check_pdf_support"],
+    ".scanner": [
+        "MFStatementScanner", "ScannedFile", "ScanResult", "RTA", "FileType", "scan_mf_inbox",
+    ],
+    ".ingester": ["MFIngester", "IngestionResult", "ingest_mf_statements"],
+    ".exceptions": [
+        "MFParserError", "CASParseError", "HeaderParseError", "IncorrectPasswordError",
+        "UnsupportedFormatError", "IntegrityError", "BalanceMismatchError",
+        "IncompleteDataError", "GainsCalculationError", "FIFOMismatchError",
+        "GrandfatheringError",
+    ],
+    ".fifo_tracker": ["PurchaseLot", "GainResult", "FIFOUnitTracker", "PortfolioFIFOTracker"],
+    ".cas_pdf_parser": [
+        "CASPDFParser", "parse_cas_pdf", "check_cas_support", "ConsolidationResult",
+        "FolioConsolidationEntry",
+    ],
+    ".text_cache": ["CASTextCache"],
+    ".cas_report_generator": ["CASReportGenerator", "generate_cas_reports"],
+})
 
 __all__ = [
     # Core models
@@ -51,6 +57,7 @@ __all__ = [
     "KarvyParser",
     "CASPDFParser",
     "parse_cas_pdf",
+    "CASTextCache",
     "classify_scheme",
     "CapitalGainsCalculator",
     "CapitalGainsSummary",
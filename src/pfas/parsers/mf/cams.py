@@ -20,6 +20,7 @@ except ImportError:
 from .models import MFTransaction, MFScheme, AssetClass, TransactionType, ParseResult
 from .classifier import classify_scheme
 from .capital_gains import CapitalGainsCalculator
+from pfas.parsers.columns import coalesce, extract, map_distinct, parse_dates
 
 # Ledger integration imports
 from pfas.core.transaction_service import TransactionService, TransactionSource
@@ -60,6 +61,9 @@ class CAMSParser:
         'OTHER': AssetClass.OTHER,
     }
 
+    # Date layouts _parse_date reads unambiguously; parsed column-wise
+    DATE_FORMATS = ['%d-%b-%Y', '%Y-%m-%d', '%Y-%m-%d %H:%M:%S']
+
     def __init__(self, db_connection: sqlite3.Connection, master_key: bytes = None):
         """
         Initialize CAMS parser.
@@ -139,15 +143,7 @@ class CAMSParser:
                 result.success = False
                 return result
 
-            for idx, row in df.iterrows():
-                try:
-                    txn = self._parse_transaction_row(row)
-                    if txn:
-                        transactions.append(txn)
-                except Exception as e:
-                    result.add_warning(f"Row {idx}: {str(e)}")
-                    continue
-
+            transactions = self._parse_frame(df, result)
             result.transactions = transactions
 
             if len(transactions) == 0:
@@ -286,105 +282,124 @@ class CAMSParser:
 
         return required_cols.issubset(df_cols_lower)
 
-    def _parse_transaction_row(self, row: pd.Series) -> Optional[MFTransaction]:
+    def _parse_frame(self, df: pd.DataFrame, result: ParseResult) -> List[MFTransaction]:
         """
-        Parse a single transaction row from CAMS Excel.
+        Build transactions from a CAMS transaction sheet, column at a time.
+
+        Header variants are coalesced per column and each distinct cell is
+        parsed once with _parse_date/_to_decimal, so the result matches
+        parsing row by row. Rows without a scheme name or date are skipped.
 
         Args:
-            row: Pandas Series representing one row
+            df: TRXN_DETAILS sheet
+            result: ParseResult for per-row warnings
 
         Returns:
-            MFTransaction or None if row should be skipped
+            List of MFTransaction
         """
-        # Extract scheme info (handle various column name formats)
-        scheme_name = self._get_column_value(row, ['Scheme Name', 'scheme_name', 'SCHEME NAME'])
-        if not scheme_name:
-            return None  # Skip empty rows
+        def text(*names: str) -> pd.Series:
+            return coalesce(df, names)
 
-        # Extract ISIN from scheme name
-        isin = self._extract_isin(scheme_name)
+        def decimals(*names: str) -> List[Decimal]:
+            return map_distinct(text(*names), self._to_decimal, decimal_memo)
 
-        # Get asset class from CAMS or classify
-        asset_class_str = self._get_column_value(row, ['ASSET CLASS', 'Asset Class', 'asset_class'])
-        asset_class_str = str(asset_class_str).upper().strip() if asset_class_str else ''
+        decimal_memo: Dict[Any, Decimal] = {}
+        date_memo: Dict[Any, Optional[date_type]] = {}
 
-        # Use mapping for CAMS-specific values (including CASH -> DEBT)
-        if asset_class_str in self.ASSET_CLASS_MAPPING:
-            asset_class = self.ASSET_CLASS_MAPPING[asset_class_str]
-        else:
-            asset_class = classify_scheme(scheme_name)
-
-        # Get AMC name
-        amc_name = self._get_column_value(row, ['AMC Name', 'amc_name', 'AMC NAME', ' Fund Name'])
-        amc_name = amc_name if amc_name else ''
-
-        # Get grandfathering NAV (try multiple column name formats)
-        nav_31jan = self._to_decimal(self._get_column_value(row, [
-            'NAV As On 31/01/2018 (Grandfathered NAV)',
-            'NAV As On 31/01/2018',
-            'Grandfathered NAV'
-        ]))
-
-        # Create scheme object
-        scheme = MFScheme(
-            name=scheme_name,
-            amc_name=amc_name,
-            isin=isin,
-            asset_class=asset_class,
-            nav_31jan2018=nav_31jan if nav_31jan > 0 else None
-        )
+        # Extract scheme info (handle various column name formats)
+        scheme_names = text('Scheme Name', 'scheme_name', 'SCHEME NAME')
+        txn_dates = parse_dates(text('Date', 'date', 'Date.1'), self._parse_date, self.DATE_FORMATS, date_memo)
+        rows = [
+            i for i, (name, txn_date) in enumerate(zip(scheme_names.tolist(), txn_dates))
+            if name and txn_date
+        ]
+        if not rows:
+            return []
+        if len(rows) < len(df):
+            df = df.iloc[rows]
+            scheme_names = scheme_names.iloc[rows]
+            txn_dates = [txn_dates[i] for i in rows]
 
-        # Determine transaction type (handle trailing spaces)
-        desc = self._get_column_value(row, ['Desc', 'desc', 'Trxn.Type', 'Transaction Type'])
-        desc = desc if desc else ''
-        txn_type = self._determine_transaction_type(desc)
-
-        # Parse dates
-        txn_date_val = self._get_column_value(row, ['Date', 'date', 'Date.1'])
-        txn_date = self._parse_date(txn_date_val)
-        if not txn_date:
-            return None  # Skip if no date
-
-        purchase_date_val = self._get_column_value(row, ['Date_1', 'Date.1', 'Purchase Date'])
-        purchase_date = self._parse_date(purchase_date_val)
-
-        # Get folio number
-        folio = self._get_column_value(row, ['Folio No', 'Folio Number', 'folio_number'])
-        folio = folio if folio else ''
-
-        # Create transaction
-        txn = MFTransaction(
-            folio_number=folio,
-            scheme=scheme,
-            transaction_type=txn_type,
-            date=txn_date,
-            units=self._to_decimal(self._get_column_value(row, ['Units', 'units', 'Current Units'])),
-            nav=self._to_decimal(self._get_column_value(row, ['Price', 'NAV', 'nav'])),
-            amount=self._to_decimal(self._get_column_value(row, ['Amount', 'amount'])),
-            stt=self._to_decimal(self._get_column_value(row, ['STT', 'stt'])),
-            # Purchase info (for redemptions)
-            purchase_date=purchase_date,
-            purchase_units=self._to_decimal(self._get_column_value(row, ['PurhUnit', 'Purchase Units', 'Source Scheme units'])),
-            purchase_nav=self._to_decimal(self._get_column_value(row, ['Unit Cost', 'Original Purchase Cost', 'Purchase NAV'])),
-            # Grandfathering
-            grandfathered_units=self._to_decimal(self._get_column_value(row, [
-                'Units As On 31/01/2018 (Grandfathered Units)',
-                'Grandfathered Units'
-            ])),
-            grandfathered_nav=self._to_decimal(self._get_column_value(row, [
+        # Extract ISIN from scheme name
+        isins = extract(scheme_names, r'ISIN\s*:\s*([A-Z0-9]{12})', re.IGNORECASE).tolist()
+
+        # Use mapping for CAMS-specific values (including CASH -> DEBT),
+        # otherwise classify from the scheme name
+        asset_class_strs = text('ASSET CLASS', 'Asset Class', 'asset_class').str.upper().fillna('').tolist()
+        classified = map_distinct(scheme_names, classify_scheme)
+        asset_classes = [
+            self.ASSET_CLASS_MAPPING.get(code, fallback)
+            for code, fallback in zip(asset_class_strs, classified)
+        ]
+
+        columns = zip(
+            df.index.tolist(),
+            scheme_names.tolist(),
+            isins,
+            asset_classes,
+            text('AMC Name', 'amc_name', 'AMC NAME', ' Fund Name').fillna('').tolist(),
+            decimals(
                 'NAV As On 31/01/2018 (Grandfathered NAV)',
-                ' Grandfathered\n NAV as on 31/01/2018'
-            ])),
-            grandfathered_value=self._to_decimal(self._get_column_value(row, [
-                'Market Value As On 31/01/2018 (Grandfathered Value)',
-                'GrandFathered Cost Value'
-            ])),
-            # Capital gains from CAMS
-            short_term_gain=self._to_decimal(self._get_column_value(row, ['Short Term', 'short_term'])),
-            long_term_gain=self._to_decimal(self._get_column_value(row, ['Long Term Without Index', 'Long Term']))
+                'NAV As On 31/01/2018',
+                'Grandfathered NAV'
+            ),
+            map_distinct(
+                text('Desc', 'desc', 'Trxn.Type', 'Transaction Type').fillna(''),
+                self._determine_transaction_type
+            ),
+            txn_dates,
+            parse_dates(text('Date_1', 'Date.1', 'Purchase Date'), self._parse_date, self.DATE_FORMATS, date_memo),
+            text('Folio No', 'Folio Number', 'folio_number').fillna('').tolist(),
+            decimals('Units', 'units', 'Current Units'),
+            decimals('Price', 'NAV', 'nav'),
+            decimals('Amount', 'amount'),
+            decimals('STT', 'stt'),
+            decimals('PurhUnit', 'Purchase Units', 'Source Scheme units'),
+            decimals('Unit Cost', 'Original Purchase Cost', 'Purchase NAV'),
+            decimals('Units As On 31/01/2018 (Grandfathered Units)', 'Grandfathered Units'),
+            decimals('NAV As On 31/01/2018 (Grandfathered NAV)', ' Grandfathered\n NAV as on 31/01/2018'),
+            decimals('Market Value As On 31/01/2018 (Grandfathered Value)', 'GrandFathered Cost Value'),
+            decimals('Short Term', 'short_term'),
+            decimals('Long Term Without Index', 'Long Term'),
         )
 
-        return txn
+        transactions = []
+        for (idx, scheme_name, isin, asset_class, amc_name, nav_31jan, txn_type, txn_date,
+             purchase_date, folio, units, nav, amount, stt, purchase_units, purchase_nav,
+             gf_units, gf_nav, gf_value, short_term, long_term) in columns:
+            try:
+                scheme = MFScheme(
+                    name=scheme_name,
+                    amc_name=amc_name,
+                    isin=isin,
+                    asset_class=asset_class,
+                    nav_31jan2018=nav_31jan if nav_31jan > 0 else None
+                )
+                transactions.append(MFTransaction(
+                    folio_number=folio,
+                    scheme=scheme,
+                    transaction_type=txn_type,
+                    date=txn_date,
+                    units=units,
+                    nav=nav,
+                    amount=amount,
+                    stt=stt,
+                    # Purchase info (for redemptions)
+                    purchase_date=purchase_date,
+                    purchase_units=purchase_units,
+                    purchase_nav=purchase_nav,
+                    # Grandfathering
+                    grandfathered_units=gf_units,
+                    grandfathered_nav=gf_nav,
+                    grandfathered_value=gf_value,
+                    # Capital gains from CAMS
+                    short_term_gain=short_term,
+                    long_term_gain=long_term
+                ))
+            except Exception as e:
+                result.add_warning(f"Row {idx}: {str(e)}")
+
+        return transactions
 
     def _get_column_value(self, row: pd.Series, column_names: List[str]) -> Optional[str]:
         """
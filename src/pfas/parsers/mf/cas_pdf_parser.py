@@ -11,14 +11,18 @@ Features:
 - Balance reconciliation
 - Support for both SUMMARY and DETAILED CAS formats
 - Proper exception handling
+- Page-parallel extraction for large statements
+- Optional encrypted extracted-text cache (see text_cache.CASTextCache)
 """
 
 import re
 import logging
+from concurrent.futures import ProcessPoolExecutor
+from enum import Enum
 from pathlib import Path
 from datetime import datetime, date
 from decimal import Decimal, InvalidOperation
-from typing import List, Optional, Dict, Tuple, Any
+from typing import List, Optional, Dict, Tuple, Any, Iterator
 from dataclasses import dataclass, field
 
 # Try PyMuPDF first (faster and more accurate)
@@ -47,9 +51,13 @@ from .exceptions import (
     UnsupportedFormatError, BalanceMismatchError
 )
 from .classifier import classify_scheme
+from .text_cache import CASTextCache
 
 logger = logging.getLogger(__name__)
 
+# Statements with at least this many pages are sharded across processes
+PARALLEL_MIN_PAGES = 100
+
 
 @dataclass
 class FolioConsolidationEntry:
@@ -247,6 +255,49 @@ RTA_PATTERN = re.compile(
     re.IGNORECASE
 )
 
+# Line starts with a transaction date (e.g. "02-Mar-2015")
+DATE_PREFIX_PATTERN = re.compile(r'^\d{1,2}[-/][A-Za-z]{3}[-/]\d{4}')
+
+# Opening/closing unit balance with captured value
+OPENING_BALANCE_PATTERN = re.compile(
+    r'Opening\s+(?:Unit\s+)?Balance\s*:?\s*([\d,]+\.?\d*)',
+    re.IGNORECASE
+)
+CLOSING_BALANCE_PATTERN = re.compile(
+    r'Closing\s+(?:Unit\s+)?Balance\s*:?\s*([\d,]+\.?\d*)',
+    re.IGNORECASE
+)
+
+
+# Lines rejected by _is_scheme_line before the scheme-header checks
+SCHEME_LINE_EXCLUDE_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'^[A-Za-z\s]+(?:Mutual\s+Fund|MF)\s+[\d,\.]+\s+[\d,\.]+$',  # AMC name with totals
+    r'^[A-Za-z\s]+(?:Mutual\s+Fund|Asset\s+Management)$',         # AMC name only
+    r'^(?:Opening|Closing)\s+(?:Unit\s+)?Balance',                # Balance lines
+    r'^Valuation\s+on',                                          # Valuation lines
+    r'^[\d,\.\s\-]+$',                                            # Bare numbers
+    r'^(?:PAN|KYC|PANKYC|Registrar|Advisor|Folio|F\.No|Email|Mobile)[\s:]+',
+    r'^\*{3}\s*(?:Stamp\s*Duty|STT)',                             # Stamp duty / STT
+))
+SCHEME_CODE_PATTERN = re.compile(r'^[A-Z][A-Z0-9]{2,9}-[A-Za-z]')
+SCHEME_ADVISOR_PATTERN = re.compile(r'\(Advisor:\s*(?:DIRECT|[A-Z][A-Za-z\s]+)\)', re.IGNORECASE)
+SCHEME_KEYWORD_PATTERN = re.compile(r'(?:Fund|Plan|Growth|IDCW)', re.IGNORECASE)
+
+
+class LineKind(Enum):
+    """Role of a line in a DETAILED CAS, as tagged by the line classifier."""
+    AMC = "amc"
+    FOLIO = "folio"
+    SCHEME = "scheme"
+    STAMP_DUTY_TXN = "stamp_duty_txn"
+    STAMP_DUTY = "stamp_duty"
+    STT_TXN = "stt_txn"
+    STT = "stt"
+    TRANSACTION = "transaction"
+    CLOSING_BALANCE = "closing_balance"
+    VALUATION = "valuation"
+    OTHER = "other"
+
 
 class CASPDFParser:
     """
@@ -269,7 +320,9 @@ class CASPDFParser:
         clean_scheme_names: bool = True,
         parse_stamp_duty: bool = True,
         parse_valuation: bool = True,
-        balance_tolerance: float = 0.01
+        balance_tolerance: float = 0.01,
+        text_cache: Optional[CASTextCache] = None,
+        extraction_workers: int = 1
     ):
         """
         Initialize parser with configuration options.
@@ -280,6 +333,10 @@ class CASPDFParser:
             parse_stamp_duty: Parse stamp duty as separate transactions (default: True)
             parse_valuation: Parse NAV, Cost, Value from valuation lines (default: True)
             balance_tolerance: Tolerance for balance mismatch detection (default: 0.01)
+            text_cache: Encrypted cache of extracted text; repeat parses of
+                the same file skip PDF decoding (default: None)
+            extraction_workers: Processes used to extract pages of statements
+                with PARALLEL_MIN_PAGES or more pages (default: 1)
         """
         if not HAS_PYMUPDF and not HAS_PDFPLUMBER:
             raise ImportError(
@@ -292,6 +349,8 @@ class CASPDFParser:
         self.parse_stamp_duty_enabled = parse_stamp_duty
         self.parse_valuation_enabled = parse_valuation
         self.balance_tolerance = balance_tolerance
+        self.text_cache = text_cache
+        self.extraction_workers = max(1, extraction_workers)
 
         # Track consolidation for reporting
         self.consolidation_result: Optional[ConsolidationResult] = None
@@ -382,10 +441,63 @@ class CASPDFParser:
         Returns:
             Extracted text content
         """
+        extractor = "pymupdf" if HAS_PYMUPDF else "pdfplumber"
+
+        cache_key = None
+        if self.text_cache is not None:
+            cache_key = self.text_cache.key_for(pdf_path, extractor, password)
+            cached = self.text_cache.get(cache_key)
+            if cached is not None:
+                logger.debug(f"Using cached text for {pdf_path.name}")
+                return cached
+
         if HAS_PYMUPDF:
-            return self._extract_with_pymupdf(pdf_path, password)
+            text = self._extract_with_pymupdf(pdf_path, password)
         else:
-            return self._extract_with_pdfplumber(pdf_path, password)
+            text = self._extract_with_pdfplumber(pdf_path, password)
+
+        if cache_key is not None and text:
+            self.text_cache.put(cache_key, text)
+
+        return text
+
+    def _page_shards(self, page_count: int) -> List[Tuple[int, int]]:
+        """
+        Split pages into contiguous [start, stop) ranges, one per worker.
+
+        Returns a single range when the statement is too small to be
+        worth the process start-up cost.
+        """
+        if self.extraction_workers <= 1 or page_count < PARALLEL_MIN_PAGES:
+            return [(0, page_count)]
+
+        shard_count = min(self.extraction_workers, page_count)
+        size, extra = divmod(page_count, shard_count)
+        shards = []
+        start = 0
+        for i in range(shard_count):
+            stop = start + size + (1 if i < extra else 0)
+            shards.append((start, stop))
+            start = stop
+        return shards
+
+    def _extract_shards(
+        self,
+        extract_range,
+        pdf_path: Path,
+        password: Optional[str],
+        shards: List[Tuple[int, int]]
+    ) -> List[str]:
+        """Run extract_range over page shards in a process pool, in page order."""
+        with ProcessPoolExecutor(max_workers=len(shards)) as pool:
+            futures = [
+                pool.submit(extract_range, str(pdf_path), password, start, stop)
+                for start, stop in shards
+            ]
+            text_parts = []
+            for future in futures:
+                text_parts.extend(future.result())
+        return text_parts
 
     def _extract_with_pymupdf(
         self,
@@ -406,13 +518,20 @@ class CASPDFParser:
                     doc.close()
                     raise IncorrectPasswordError(str(pdf_path))
 
-            # Extract text from all pages
-            text_parts = []
-            for page_num in range(len(doc)):
-                page = doc[page_num]
-                text_parts.append(page.get_text())
+            shards = self._page_shards(len(doc))
+            if len(shards) == 1:
+                # Extract text from all pages
+                text_parts = []
+                for page_num in range(len(doc)):
+                    page = doc[page_num]
+                    text_parts.append(page.get_text())
+                doc.close()
+            else:
+                doc.close()
+                text_parts = self._extract_shards(
+                    _extract_pages_pymupdf, pdf_path, password, shards
+                )
 
-            doc.close()
             return "\n".join(text_parts)
 
         except fitz.FileDataError as e:
@@ -436,12 +555,19 @@ class CASPDFParser:
         """Extract text using pdfplumber as fallback."""
         try:
             with pdfplumber.open(str(pdf_path), password=password or "") as pdf:
-                text_parts = []
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text_parts.append(page_text)
-                return "\n".join(text_parts)
+                shards = self._page_shards(len(pdf.pages))
+                if len(shards) == 1:
+                    text_parts = []
+                    for page in pdf.pages:
+                        page_text = page.extract_text()
+                        if page_text:
+                            text_parts.append(page_text)
+                    return "\n".join(text_parts)
+
+            text_parts = self._extract_shards(
+                _extract_pages_pdfplumber, pdf_path, password, shards
+            )
+            return "\n".join(text_parts)
 
         except Exception as e:
             error_msg = str(e).lower()
@@ -579,41 +705,121 @@ class CASPDFParser:
         """
         Parse DETAILED CAS with full transaction history.
 
+        Lines are tagged once by _classify_lines() and streamed into the
+        folio/scheme builder, instead of trying every pattern on every line.
+
         Returns:
             List of CASFolio with schemes and transactions
         """
-        folios = []
-        current_folio = None
-        current_scheme = None
-        current_amc = ""
+        return self._build_detailed_folios(self._classify_lines(text))
 
-        lines = text.split('\n')
-        i = 0
-
-        while i < len(lines):
-            line = lines[i].strip()
+    def _classify_lines(
+        self,
+        text: str
+    ) -> Iterator[Tuple[LineKind, str, Optional[re.Match]]]:
+        """
+        Tag each non-empty line of a DETAILED CAS.
 
-            if not line:
-                i += 1
-                continue
+        Yields:
+            (kind, stripped line, match object for kinds that carry values)
+        """
+        for raw_line in text.split('\n'):
+            line = raw_line.strip()
+            if line:
+                kind, match = self._classify_line(line)
+                yield kind, line, match
 
-            # Check for AMC header
-            amc_match = AMC_PATTERN.match(line)
-            if amc_match:
-                current_amc = amc_match.group(1).strip()
-                i += 1
-                continue
+    def _classify_line(self, line: str) -> Tuple[LineKind, Optional[re.Match]]:
+        """
+        Classify a single stripped, non-empty line.
 
-            # Check for folio line
-            folio_match = FOLIO_PATTERN.search(line)
-            if folio_match:
-                folio_number = folio_match.group(1)
+        Kinds are tested in the same priority order as the original
+        pattern cascade, but each pattern is only run when a cheap
+        substring or first-character check shows it can match.
+        """
+        lower = line.lower()
+        first = line[0]
+
+        if 'mutual' in lower or 'asset' in lower or 'amc' in lower:
+            match = AMC_PATTERN.match(line)
+            if match:
+                return LineKind.AMC, match
+
+        if 'folio' in lower:
+            match = FOLIO_PATTERN.search(line)
+            if match:
+                return LineKind.FOLIO, match
+
+        # Scheme headers start with an RTA scheme code or mention ISIN/Advisor
+        if (SCHEME_PREFIX_PATTERN.match(line) or 'isin' in lower or 'advisor' in lower) \
+                and self._is_scheme_line(line):
+            return LineKind.SCHEME, None
+
+        if first.isdigit():
+            if '*' in line:
+                match = STAMP_DUTY_TXN_PATTERN.match(line)
+                if match:
+                    return LineKind.STAMP_DUTY_TXN, match
+                match = STT_TXN_PATTERN.match(line)
+                if match:
+                    return LineKind.STT_TXN, match
+            if DATE_PREFIX_PATTERN.match(line):
+                return LineKind.TRANSACTION, None
+
+        if first == '*':
+            if STAMP_DUTY_PATTERN.match(line):
+                return LineKind.STAMP_DUTY, None
+            if STT_PATTERN.match(line):
+                return LineKind.STT, None
+
+        if 'closing' in lower:
+            match = CLOSING_BALANCE_PATTERN.search(line)
+            if match:
+                return LineKind.CLOSING_BALANCE, match
+
+        if 'valuation' in lower:
+            match = VALUATION_PATTERN.search(line)
+            if match:
+                return LineKind.VALUATION, match
+
+        return LineKind.OTHER, None
+
+    def _build_detailed_folios(
+        self,
+        tagged_lines: Iterator[Tuple[LineKind, str, Optional[re.Match]]]
+    ) -> List[CASFolio]:
+        """
+        Build folios, schemes and transactions from classified lines.
 
+        Returns:
+            List of CASFolio with schemes and transactions
+        """
+        folios = []
+        current_folio = None
+        current_scheme = None
+        current_amc = ""
+        seeking_opening = False
+
+        for kind, line, match in tagged_lines:
+            if seeking_opening:
+                # After a scheme header, skip lines until the opening
+                # balance or the first transaction
+                open_match = OPENING_BALANCE_PATTERN.search(line)
+                if open_match:
+                    current_scheme.open = self._parse_decimal(open_match.group(1))
+                    seeking_opening = False
+                    continue
+                if not DATE_PREFIX_PATTERN.match(line):
+                    continue
+                seeking_opening = False
+
+            if kind is LineKind.AMC:
+                current_amc = match.group(1).strip()
+
+            elif kind is LineKind.FOLIO:
                 # Extract PAN/KYC if on same line
-                pan = ""
                 pan_match = PAN_PATTERN.search(line)
-                if pan_match:
-                    pan = pan_match.group(1)
+                pan = pan_match.group(1) if pan_match else ""
 
                 # Save previous folio
                 if current_folio:
@@ -623,23 +829,19 @@ class CASPDFParser:
                     folios.append(current_folio)
 
                 current_folio = CASFolio(
-                    folio=folio_number,
+                    folio=match.group(1),
                     amc=current_amc,
                     pan=pan
                 )
                 current_scheme = None
-                i += 1
-                continue
 
-            # Check for scheme header (contains Fund, Growth, etc.)
-            if self._is_scheme_line(line):
+            elif kind is LineKind.SCHEME:
                 # Finalize previous scheme
                 if current_scheme and current_folio:
                     self._finalize_scheme(current_scheme)
                     current_folio.schemes.append(current_scheme)
 
-                # Parse scheme info
-                scheme_info = self._parse_scheme_line(line, lines, i)
+                scheme_info = self._parse_scheme_line(line, [], 0)
                 current_scheme = CASScheme(
                     scheme=scheme_info.get('name', 'Unknown'),
                     isin=scheme_info.get('isin'),
@@ -647,133 +849,43 @@ class CASPDFParser:
                     rta_code=scheme_info.get('rta_code', ''),
                     advisor=scheme_info.get('advisor'),
                 )
+                seeking_opening = True
 
-                # Look for opening balance
-                i += 1
-                while i < len(lines):
-                    next_line = lines[i].strip()
-                    open_match = re.search(
-                        r'Opening\s+(?:Unit\s+)?Balance\s*:?\s*([\d,]+\.?\d*)',
-                        next_line, re.IGNORECASE
-                    )
-                    if open_match:
-                        current_scheme.open = self._parse_decimal(open_match.group(1))
-                        i += 1
-                        break
-                    elif self._is_transaction_line(next_line):
-                        # No opening balance line, start processing transactions
-                        break
-                    i += 1
+            elif current_scheme is None or kind is LineKind.OTHER:
                 continue
 
-            # Check for stamp duty transaction line (date + *** Stamp Duty *** + amount)
-            stamp_txn_match = STAMP_DUTY_TXN_PATTERN.match(line)
-            if current_scheme and stamp_txn_match:
-                txn_date = self._parse_date(stamp_txn_match.group(1))
-                amount = self._parse_decimal(stamp_txn_match.group(2)) if stamp_txn_match.group(2) else Decimal("0")
-                stamp_txn = CASTransaction(
-                    date=txn_date or date.today(),
-                    description="*** Stamp Duty ***",
-                    amount=amount,
-                    units=Decimal("0"),
-                    nav=Decimal("0"),
-                    balance=None,
-                    transaction_type=TransactionType.STAMP_DUTY_TAX
+            elif kind is LineKind.STAMP_DUTY_TXN or kind is LineKind.STT_TXN:
+                txn_date = self._parse_date(match.group(1))
+                amount = self._parse_decimal(match.group(2)) if match.group(2) else Decimal("0")
+                current_scheme.transactions.append(
+                    self._create_tax_transaction(kind, txn_date, amount)
                 )
-                current_scheme.transactions.append(stamp_txn)
-                i += 1
-                continue
 
-            # Check for stamp duty line without date (*** Stamp Duty ***)
-            if current_scheme and STAMP_DUTY_PATTERN.match(line):
-                # Create a stamp duty transaction linked to previous transaction's date
+            elif kind is LineKind.STAMP_DUTY or kind is LineKind.STT:
+                # Linked to the previous transaction's date
                 prev_date = None
                 if current_scheme.transactions:
                     prev_date = current_scheme.transactions[-1].date
-                stamp_txn = CASTransaction(
-                    date=prev_date or date.today(),
-                    description="*** Stamp Duty ***",
-                    amount=Decimal("0"),
-                    units=Decimal("0"),
-                    nav=Decimal("0"),
-                    balance=None,
-                    transaction_type=TransactionType.STAMP_DUTY_TAX
+                current_scheme.transactions.append(
+                    self._create_tax_transaction(kind, prev_date, Decimal("0"))
                 )
-                current_scheme.transactions.append(stamp_txn)
-                i += 1
-                continue
 
-            # Check for STT transaction line (date + *** STT *** + amount)
-            stt_txn_match = STT_TXN_PATTERN.match(line)
-            if current_scheme and stt_txn_match:
-                txn_date = self._parse_date(stt_txn_match.group(1))
-                amount = self._parse_decimal(stt_txn_match.group(2)) if stt_txn_match.group(2) else Decimal("0")
-                stt_txn = CASTransaction(
-                    date=txn_date or date.today(),
-                    description="*** STT Paid ***",
-                    amount=amount,
-                    units=Decimal("0"),
-                    nav=Decimal("0"),
-                    balance=None,
-                    transaction_type=TransactionType.STT_TAX
-                )
-                current_scheme.transactions.append(stt_txn)
-                i += 1
-                continue
-
-            # Check for STT line without date (*** STT Paid ***)
-            if current_scheme and STT_PATTERN.match(line):
-                prev_date = None
-                if current_scheme.transactions:
-                    prev_date = current_scheme.transactions[-1].date
-                stt_txn = CASTransaction(
-                    date=prev_date or date.today(),
-                    description="*** STT Paid ***",
-                    amount=Decimal("0"),
-                    units=Decimal("0"),
-                    nav=Decimal("0"),
-                    balance=None,
-                    transaction_type=TransactionType.STT_TAX
-                )
-                current_scheme.transactions.append(stt_txn)
-                i += 1
-                continue
-
-            # Check for transaction line
-            if current_scheme and self._is_transaction_line(line):
+            elif kind is LineKind.TRANSACTION:
                 txn = self._parse_transaction_line(line)
                 if txn:
                     current_scheme.transactions.append(txn)
-                i += 1
-                continue
-
-            # Check for closing balance
-            close_match = re.search(
-                r'Closing\s+(?:Unit\s+)?Balance\s*:?\s*([\d,]+\.?\d*)',
-                line, re.IGNORECASE
-            )
-            if close_match and current_scheme:
-                current_scheme.close = self._parse_decimal(close_match.group(1))
-                i += 1
-                continue
 
-            # Check for valuation line
-            val_match = VALUATION_PATTERN.search(line)
-            if val_match and current_scheme:
-                val_date = self._parse_date(val_match.group(1))
-                val_nav = self._parse_decimal(val_match.group(2))
-                val_value = self._parse_decimal(val_match.group(3))
+            elif kind is LineKind.CLOSING_BALANCE:
+                current_scheme.close = self._parse_decimal(match.group(1))
 
+            elif kind is LineKind.VALUATION:
+                val_date = self._parse_date(match.group(1))
                 if val_date:
                     current_scheme.valuation = SchemeValuation(
                         date=val_date,
-                        nav=val_nav,
-                        value=val_value
+                        nav=self._parse_decimal(match.group(2)),
+                        value=self._parse_decimal(match.group(3))
                     )
-                i += 1
-                continue
-
-            i += 1
 
         # Don't forget last folio/scheme
         if current_scheme and current_folio:
@@ -785,6 +897,30 @@ class CASPDFParser:
 
         return folios
 
+    def _create_tax_transaction(
+        self,
+        kind: LineKind,
+        txn_date: Optional[date],
+        amount: Decimal
+    ) -> CASTransaction:
+        """Create a stamp duty or STT transaction."""
+        if kind in (LineKind.STAMP_DUTY_TXN, LineKind.STAMP_DUTY):
+            description = "*** Stamp Duty ***"
+            txn_type = TransactionType.STAMP_DUTY_TAX
+        else:
+            description = "*** STT Paid ***"
+            txn_type = TransactionType.STT_TAX
+
+        return CASTransaction(
+            date=txn_date or date.today(),
+            description=description,
+            amount=amount,
+            units=Decimal("0"),
+            nav=Decimal("0"),
+            balance=None,
+            transaction_type=txn_type
+        )
+
     def _parse_summary_cas(self, text: str) -> List[CASFolio]:
         """
         Parse SUMMARY CAS (holdings only, no transactions).
@@ -869,36 +1005,14 @@ class CASPDFParser:
             return False
 
         # Skip if line starts with a date (transaction line)
-        if re.match(r'^\d{1,2}[-/][A-Za-z]{3}[-/]\d{4}', line_stripped):
+        if DATE_PREFIX_PATTERN.match(line_stripped):
             return False
 
-        # Skip if line is just AMC name with numbers (portfolio summary format)
-        if re.match(r'^[A-Za-z\s]+(?:Mutual\s+Fund|MF)\s+[\d,\.]+\s+[\d,\.]+$', line_stripped, re.IGNORECASE):
-            return False
-
-        # Skip lines that are just AMC names
-        if re.match(r'^[A-Za-z\s]+(?:Mutual\s+Fund|Asset\s+Management)$', line_stripped, re.IGNORECASE):
-            return False
-
-        # Skip balance lines
-        if re.match(r'^(?:Opening|Closing)\s+(?:Unit\s+)?Balance', line_stripped, re.IGNORECASE):
-            return False
-
-        # Skip valuation lines
-        if re.match(r'^Valuation\s+on', line_stripped, re.IGNORECASE):
-            return False
-
-        # Skip lines that are just numbers (continuation of previous line)
-        if re.match(r'^[\d,\.\s\-]+$', line_stripped):
-            return False
-
-        # Skip lines that start with common non-scheme prefixes
-        if re.match(r'^(?:PAN|KYC|PANKYC|Registrar|Advisor|Folio|F\.No|Email|Mobile)[\s:]+', line_stripped, re.IGNORECASE):
-            return False
-
-        # Skip stamp duty and STT lines
-        if re.match(r'^\*{3}\s*(?:Stamp\s*Duty|STT)', line_stripped, re.IGNORECASE):
-            return False
+        # Skip AMC names, balance/valuation lines, bare numbers, PAN/KYC/Folio
+        # labels and stamp duty/STT lines
+        for pattern in SCHEME_LINE_EXCLUDE_PATTERNS:
+            if pattern.match(line_stripped):
+                return False
 
         # ONLY match lines with STRONG scheme indicators
         # These are the definitive markers of a scheme header line
@@ -906,19 +1020,19 @@ class CASPDFParser:
         # 1. Scheme code prefix pattern (most reliable)
         # Matches: B92Z-Aditya, RMFLFAGG-NIPPON, HSTOGT-HDFC, PP001ZG-Parag, etc.
         # Pattern: 3-10 alphanumeric chars starting with letter, followed by hyphen and letter
-        if re.match(r'^[A-Z][A-Z0-9]{2,9}-[A-Za-z]', line_stripped):
+        if SCHEME_CODE_PATTERN.match(line_stripped):
             return True
 
         # 2. ISIN line pattern
         # Matches: ISIN: INF209K01YY7(Advisor: DIRECT)
-        if re.search(r'ISIN:\s*[A-Z]{2}[A-Z0-9]{10}', line_stripped, re.IGNORECASE):
+        if ISIN_PATTERN.search(line_stripped):
             return True
 
         # 3. Scheme with Advisor notation
         # Matches: (Advisor: DIRECT), (Advisor: IFA Name)
-        if re.search(r'\(Advisor:\s*(?:DIRECT|[A-Z][A-Za-z\s]+)\)', line_stripped, re.IGNORECASE):
+        if SCHEME_ADVISOR_PATTERN.search(line_stripped):
             # But only if it also looks like a scheme name (has Fund or Plan in it)
-            if re.search(r'(?:Fund|Plan|Growth|IDCW)', line_stripped, re.IGNORECASE):
+            if SCHEME_KEYWORD_PATTERN.search(line_stripped):
                 return True
 
         # Do NOT use moderate patterns - they cause too many false positives
@@ -927,7 +1041,7 @@ class CASPDFParser:
 
     def _is_transaction_line(self, line: str) -> bool:
         """Check if line is a transaction line (starts with date)."""
-        return bool(re.match(r'^\d{1,2}[-/][A-Za-z]{3}[-/]\d{4}', line))
+        return bool(DATE_PREFIX_PATTERN.match(line))
 
     def _parse_scheme_line(
         self,
@@ -1193,13 +1307,47 @@ class CASPDFParser:
             return Decimal("0")
 
 
+def _extract_pages_pymupdf(
+    pdf_path: str,
+    password: Optional[str],
+    start: int,
+    stop: int
+) -> List[str]:
+    """Extract text of pages [start, stop) with PyMuPDF (process pool worker)."""
+    doc = fitz.open(pdf_path)
+    try:
+        if doc.is_encrypted:
+            doc.authenticate(password or "")
+        return [doc[page_num].get_text() for page_num in range(start, stop)]
+    finally:
+        doc.close()
+
+
+def _extract_pages_pdfplumber(
+    pdf_path: str,
+    password: Optional[str],
+    start: int,
+    stop: int
+) -> List[str]:
+    """Extract non-empty page texts of pages [start, stop) with pdfplumber (process pool worker)."""
+    with pdfplumber.open(pdf_path, password=password or "") as pdf:
+        text_parts = []
+        for page in pdf.pages[start:stop]:
+            page_text = page.extract_text()
+            if page_text:
+                text_parts.append(page_text)
+        return text_parts
+
+
 def parse_cas_pdf(
     pdf_path: Path,
     password: Optional[str] = None,
     consolidate_folios: bool = True,
     clean_scheme_names: bool = True,
     parse_stamp_duty: bool = True,
-    parse_valuation: bool = True
+    parse_valuation: bool = True,
+    text_cache: Optional[CASTextCache] = None,
+    extraction_workers: int = 1
 ) -> Tuple[CASData, Optional[ConsolidationResult]]:
     """
     Convenience function to parse a CAS PDF.
@@ -1211,6 +1359,8 @@ def parse_cas_pdf(
         clean_scheme_names: Remove prefix codes like "B92Z-" (default: True)
         parse_stamp_duty: Parse stamp duty as separate transactions (default: True)
         parse_valuation: Parse NAV, Cost, Value from valuation lines (default: True)
+        text_cache: Encrypted extracted-text cache (default: None)
+        extraction_workers: Processes for page-parallel extraction (default: 1)
 
     Returns:
         Tuple of (CASData with all parsed information, ConsolidationResult if consolidation was performed)
@@ -1219,7 +1369,9 @@ def parse_cas_pdf(
         consolidate_folios=consolidate_folios,
         clean_scheme_names=clean_scheme_names,
         parse_stamp_duty=parse_stamp_duty,
-        parse_valuation=parse_valuation
+        parse_valuation=parse_valuation,
+        text_cache=text_cache,
+        extraction_workers=extraction_workers
     )
     cas_data = parser.parse(pdf_path, password)
     return cas_data, parser.consolidation_result
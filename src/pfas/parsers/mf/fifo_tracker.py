@@ -10,13 +10,14 @@ Features:
 - LTCG/STCG classification
 - Cost of acquisition calculation with 3 scenarios
 - STT and stamp duty allocation
+- Open-lot state export/restore for resuming from a checkpoint
 """
 
 from collections import deque
 from dataclasses import dataclass, field
 from datetime import date
 from decimal import Decimal, ROUND_HALF_UP
-from typing import Deque, List, Optional, Dict, Tuple
+from typing import Any, Deque, List, Optional, Dict, Tuple
 import logging
 
 from .models import AssetClass, TransactionType
@@ -154,10 +155,13 @@ class FIFOUnitTracker:
         self.total_purchased: Decimal = Decimal("0")
         self.total_redeemed: Decimal = Decimal("0")
 
+        # Running sum of remaining_units over self._lots
+        self._available_units: Decimal = Decimal("0")
+
     @property
     def available_units(self) -> Decimal:
         """Total units available for redemption."""
-        return sum(lot.remaining_units for lot in self._lots)
+        return self._available_units
 
     @property
     def total_gains(self) -> List[GainResult]:
@@ -201,6 +205,7 @@ class FIFOUnitTracker:
             amount=amount
         )
         self._lots.append(lot)
+        self._available_units += units
         self.total_purchased += units
 
         logger.debug(
@@ -287,9 +292,11 @@ class FIFOUnitTracker:
             # Update lot
             lot.remaining_units -= matched_units
             remaining_units -= matched_units
+            self._available_units -= matched_units
 
-            # Remove exhausted lot
+            # Remove exhausted lot (dropping any dust left in it)
             if lot.is_exhausted:
+                self._available_units -= lot.remaining_units
                 self._lots.popleft()
 
         self.total_redeemed += units
@@ -415,6 +422,49 @@ class FIFOUnitTracker:
 
         return coa, True, fmv_value
 
+    def to_state(self) -> Dict[str, Any]:
+        """
+        Export the open lots and unit totals.
+
+        Computed gains are not included; a tracker restored from this
+        state only reports gains of redemptions processed after it.
+
+        Returns:
+            JSON-serializable dict accepted by restore_state()
+        """
+        return {
+            "lots": [
+                [lot.date.isoformat(), str(lot.units), str(lot.nav),
+                 str(lot.amount), str(lot.remaining_units)]
+                for lot in self._lots
+            ],
+            "total_purchased": str(self.total_purchased),
+            "total_redeemed": str(self.total_redeemed),
+        }
+
+    def restore_state(self, state: Dict[str, Any]):
+        """
+        Replace the open lots and unit totals with an exported state.
+
+        Args:
+            state: Dict produced by to_state()
+        """
+        self._lots.clear()
+        self._available_units = Decimal("0")
+        for lot_date, units, nav, amount, remaining in state["lots"]:
+            lot = PurchaseLot(
+                date=date.fromisoformat(lot_date),
+                units=Decimal(units),
+                nav=Decimal(nav),
+                amount=Decimal(amount)
+            )
+            lot.remaining_units = Decimal(remaining)
+            self._lots.append(lot)
+            self._available_units += lot.remaining_units
+
+        self.total_purchased = Decimal(state["total_purchased"])
+        self.total_redeemed = Decimal(state["total_redeemed"])
+
     def get_summary(self) -> Dict:
         """Get summary of FIFO tracking."""
         return {
@@ -474,6 +524,36 @@ class PortfolioFIFOTracker:
 
         return self._trackers[key]
 
+    def restore_tracker(
+        self,
+        folio: str,
+        scheme_name: str,
+        asset_class: AssetClass,
+        state: Dict[str, Any],
+        fmv_31jan2018: Optional[Decimal] = None
+    ) -> FIFOUnitTracker:
+        """
+        Create or reset the tracker for a scheme/folio from an exported state.
+
+        Args:
+            folio: Folio number
+            scheme_name: Scheme name
+            asset_class: Asset class for LTCG rules
+            state: Dict produced by FIFOUnitTracker.to_state()
+            fmv_31jan2018: FMV on 31-Jan-2018 for grandfathering
+
+        Returns:
+            The restored FIFOUnitTracker
+        """
+        tracker = self.get_tracker(folio, scheme_name, asset_class, fmv_31jan2018)
+        tracker.restore_state(state)
+        return tracker
+
+    def get_tracker_state(self, folio: str, scheme_name: str) -> Optional[Dict[str, Any]]:
+        """Export the open lots of a scheme/folio, or None if it is not tracked."""
+        tracker = self._trackers.get((folio, scheme_name))
+        return tracker.to_state() if tracker else None
+
     def process_transaction(
         self,
         folio: str,
@@ -4,7 +4,7 @@ import pandas as pd
 from pathlib import Path
 from datetime import datetime, date as date_type
 from decimal import Decimal
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 import re
 import logging
 import warnings
@@ -19,6 +19,7 @@ except ImportError:
 
 from .models import MFTransaction, MFScheme, AssetClass, TransactionType, ParseResult
 from .classifier import classify_scheme
+from pfas.parsers.columns import coalesce, extract, map_distinct, parse_dates
 
 # Ledger integration imports
 from pfas.core.transaction_service import TransactionService, TransactionSource
@@ -50,6 +51,9 @@ class KarvyParser:
     - Sheet name is typically 'Trasaction_Details' (with typo)
     """
 
+    # Date layouts _parse_date reads unambiguously (day first); parsed column-wise
+    DATE_FORMATS = ['%d-%b-%Y', '%d/%m/%Y', '%d-%m-%Y']
+
     def __init__(self, db_connection: sqlite3.Connection, master_key: bytes = None):
         """
         Initialize Karvy parser.
@@ -122,15 +126,7 @@ class KarvyParser:
                 result.success = False
                 return result
 
-            for idx, row in df.iterrows():
-                try:
-                    txn = self._parse_transaction_row(row)
-                    if txn:
-                        transactions.append(txn)
-                except Exception as e:
-                    result.add_warning(f"Row {idx}: {str(e)}")
-                    continue
-
+            transactions = self._parse_frame(df, result)
             result.transactions = transactions
 
             if len(transactions) == 0:
@@ -256,96 +252,127 @@ class KarvyParser:
 
         return required_cols.issubset(df_cols_lower)
 
-    def _parse_transaction_row(self, row: pd.Series) -> Optional[MFTransaction]:
+    def _parse_frame(self, df: pd.DataFrame, result: ParseResult) -> List[MFTransaction]:
         """
-        Parse a single transaction row from Karvy Excel.
+        Build transactions from a Karvy transaction sheet, column at a time.
+
+        Header variants are coalesced per column and each distinct cell is
+        parsed once with _parse_date/_to_decimal, so the result matches
+        parsing row by row. Rows without a scheme name or date are skipped.
 
         Args:
-            row: Pandas Series representing one row
+            df: Trasaction_Details sheet
+            result: ParseResult for per-row warnings
 
         Returns:
-            MFTransaction or None if row should be skipped
+            List of MFTransaction
         """
-        # Extract scheme info
-        scheme_name = self._get_column_value(row, ['Scheme Name', 'scheme_name', 'SCHEME NAME'])
-        if not scheme_name:
-            return None
-
-        # Extract ISIN from scheme name (Karvy format: "... ( INF123456789)")
-        isin = self._extract_isin(scheme_name)
-
-        # Karvy doesn't typically include asset class - classify from name
-        asset_class = classify_scheme(scheme_name)
+        def text(*names: str) -> pd.Series:
+            return coalesce(df, names)
+
+        def decimals(*names: str) -> List[Decimal]:
+            return map_distinct(text(*names), self._to_decimal, decimal_memo)
+
+        def dates(*names: str) -> List[Optional[date_type]]:
+            return parse_dates(text(*names), self._parse_date, self.DATE_FORMATS, date_memo)
+
+        decimal_memo: Dict[Any, Decimal] = {}
+        date_memo: Dict[Any, Optional[date_type]] = {}
+
+        scheme_names = text('Scheme Name', 'scheme_name', 'SCHEME NAME')
+
+        # Redemption date (Section B), else the purchase date (Section A)
+        purchase_dates = dates('Date', 'Purchase Date')
+        txn_dates = [
+            redemption_date or purchase_date
+            for redemption_date, purchase_date
+            in zip(dates('Date.1', 'Date_1', 'Redemption Date'), purchase_dates)
+        ]
+        rows = [
+            i for i, (name, txn_date) in enumerate(zip(scheme_names.tolist(), txn_dates))
+            if name and txn_date
+        ]
+        if not rows:
+            return []
+        if len(rows) < len(df):
+            df = df.iloc[rows]
+            scheme_names = scheme_names.iloc[rows]
+            txn_dates = [txn_dates[i] for i in rows]
+            purchase_dates = [purchase_dates[i] for i in rows]
+
+        # ISIN in parentheses at end of name (Karvy), else CAMS format
+        isins = extract(scheme_names, r'\(\s*([A-Z0-9]{12})\s*\)')
+        isins = isins.where(isins.notna(), extract(scheme_names, r'ISIN\s*:\s*([A-Z0-9]{12})', re.IGNORECASE))
 
-        # Get AMC name
-        amc_name = self._get_column_value(row, [' Fund Name', 'Fund Name', 'AMC Name'])
-        amc_name = amc_name.strip() if amc_name else ''
-
-        # Create scheme object
-        scheme = MFScheme(
-            name=scheme_name,
-            amc_name=amc_name,
-            isin=isin,
-            asset_class=asset_class
-        )
-
-        # Determine transaction type from outflow column (Section B)
         # Karvy has purchase type in 'Trxn.Type' and redemption type in 'Trxn.Type.1'
-        outflow_type = self._get_column_value(row, ['Trxn.Type.1', 'Trxn Type'])
-        if outflow_type and 'redemption' in outflow_type.lower():
-            txn_type = TransactionType.REDEMPTION
-        else:
-            # Use purchase type
-            purchase_type = self._get_column_value(row, ['Trxn.Type', 'Transaction Type'])
-            txn_type = self._determine_transaction_type(purchase_type or '')
-
-        # Parse redemption date (from Section B)
-        txn_date_val = self._get_column_value(row, ['Date.1', 'Date_1', 'Redemption Date'])
-        txn_date = self._parse_date(txn_date_val)
-
-        # If no redemption date, try purchase date
-        if not txn_date:
-            txn_date_val = self._get_column_value(row, ['Date', 'Purchase Date'])
-            txn_date = self._parse_date(txn_date_val)
-
-        if not txn_date:
-            return None  # Skip if no date
-
-        # Get purchase date (from Section A)
-        purchase_date_val = self._get_column_value(row, ['Date', 'Purchase Date'])
-        purchase_date = self._parse_date(purchase_date_val)
-
-        # Get folio number
-        folio = self._get_column_value(row, ['Folio Number', 'Folio No', 'folio_number'])
-        folio = folio.strip() if folio else ''
-
-        # Create transaction
-        txn = MFTransaction(
-            folio_number=folio,
-            scheme=scheme,
-            transaction_type=txn_type,
-            date=txn_date,
-            units=self._to_decimal(self._get_column_value(row, ['Units', 'Current Units'])),
-            nav=self._to_decimal(self._get_column_value(row, ['Price', 'NAV'])),
-            amount=self._to_decimal(self._get_column_value(row, ['Amount'])),
-            stt=Decimal("0"),  # Karvy doesn't typically include STT in CG file
-            # Purchase info
-            purchase_date=purchase_date,
-            purchase_units=self._to_decimal(self._get_column_value(row, ['Source Scheme units', 'Current Units'])),
-            purchase_nav=self._to_decimal(self._get_column_value(row, ['Original Purchase Cost', 'IT Applicable\nNAV'])),
-            # Grandfathering
-            grandfathered_units=None,  # Karvy format doesn't have separate units
-            grandfathered_nav=self._to_decimal(self._get_column_value(row, [
-                ' Grandfathered\n NAV as on 31/01/2018',
-                'Grandfathered NAV'
-            ])),
-            grandfathered_value=self._to_decimal(self._get_column_value(row, ['GrandFathered Cost Value'])),
-            # Capital gains from Karvy
-            short_term_gain=self._to_decimal(self._get_column_value(row, ['Short Term'])),
-            long_term_gain=self._to_decimal(self._get_column_value(row, ['Long Term Without Index', 'Long Term']))
+        outflow_types = text('Trxn.Type.1', 'Trxn Type').fillna('')
+        redeemed = outflow_types.str.lower().str.contains('redemption', regex=False).astype(bool)
+        purchase_types = map_distinct(
+            text('Trxn.Type', 'Transaction Type').fillna(''), self._determine_transaction_type
+        )
+        txn_types = [
+            TransactionType.REDEMPTION if is_redemption else purchase_type
+            for is_redemption, purchase_type in zip(redeemed.tolist(), purchase_types)
+        ]
+
+        columns = zip(
+            df.index.tolist(),
+            scheme_names.tolist(),
+            isins.tolist(),
+            # Karvy doesn't typically include asset class - classify from name
+            map_distinct(scheme_names, classify_scheme),
+            text(' Fund Name', 'Fund Name', 'AMC Name').fillna('').tolist(),
+            txn_types,
+            txn_dates,
+            purchase_dates,
+            text('Folio Number', 'Folio No', 'folio_number').fillna('').tolist(),
+            decimals('Units', 'Current Units'),
+            decimals('Price', 'NAV'),
+            decimals('Amount'),
+            decimals('Source Scheme units', 'Current Units'),
+            decimals('Original Purchase Cost', 'IT Applicable\nNAV'),
+            decimals(' Grandfathered\n NAV as on 31/01/2018', 'Grandfathered NAV'),
+            decimals('GrandFathered Cost Value'),
+            decimals('Short Term'),
+            decimals('Long Term Without Index', 'Long Term'),
         )
 
-        return txn
+        transactions = []
+        for (idx, scheme_name, isin, asset_class, amc_name, txn_type, txn_date, purchase_date,
+             folio, units, nav, amount, purchase_units, purchase_nav, gf_nav, gf_value,
+             short_term, long_term) in columns:
+            try:
+                scheme = MFScheme(
+                    name=scheme_name,
+                    amc_name=amc_name,
+                    isin=isin,
+                    asset_class=asset_class
+                )
+                transactions.append(MFTransaction(
+                    folio_number=folio,
+                    scheme=scheme,
+                    transaction_type=txn_type,
+                    date=txn_date,
+                    units=units,
+                    nav=nav,
+                    amount=amount,
+                    stt=Decimal("0"),  # Karvy doesn't typically include STT in CG file
+                    # Purchase info
+                    purchase_date=purchase_date,
+                    purchase_units=purchase_units,
+                    purchase_nav=purchase_nav,
+                    # Grandfathering
+                    grandfathered_units=None,  # Karvy format doesn't have separate units
+                    grandfathered_nav=gf_nav,
+                    grandfathered_value=gf_value,
+                    # Capital gains from Karvy
+                    short_term_gain=short_term,
+                    long_term_gain=long_term
+                ))
+            except Exception as e:
+                result.add_warning(f"Row {idx}: {str(e)}")
+
+        return transactions
 
     def _get_column_value(self, row: pd.Series, column_names: List[str]) -> Optional[str]:
         """
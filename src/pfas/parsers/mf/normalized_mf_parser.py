@@ -41,11 +41,12 @@ Flow:
     └─────────────────────┘
 """
 
+import openpyxl
 import pandas as pd
 from pathlib import Path
 from datetime import datetime, date
 from decimal import Decimal
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 import sqlite3
 import json
 import re
@@ -88,6 +89,13 @@ class NormalizedCAMSParser(BaseParser):
         'CASH': AssetCategory.MUTUAL_FUND_DEBT,
     }
 
+    # Stage rows in chunks as they are read (see BaseParser.parse_stream)
+    streaming = True
+
+    # Candidate transaction sheets (name or position) and 0-based header rows
+    SHEET_NAMES = ['TRXN_DETAILS', 'Transaction_Details', 1]
+    HEADER_ROWS = [3, 4, 2]
+
     # Transaction type mapping
     TXN_TYPE_MAP = {
         'PURCHASE': 'BUY',
@@ -120,15 +128,97 @@ class NormalizedCAMSParser(BaseParser):
         2. Find the correct sheet (TRXN_DETAILS)
         3. Extract each row as ParsedRecord
         """
-        records = []
+        return list(self.iter_raw(file_path))
+
+    def iter_raw(self, file_path: Path) -> Iterator[ParsedRecord]:
+        """
+        Yield raw records of the transaction sheet as it is read.
+
+        .xlsx files are read row by row with openpyxl in read-only mode,
+        so memory follows the staging chunk, not the sheet. Legacy .xls
+        files cannot be read incrementally (xlrd loads the whole
+        workbook); their sheet is read into a DataFrame once and only the
+        row-dict stage is chunked.
+        """
+        if file_path.suffix.lower() == '.xls':
+            yield from self._iter_frame_records(file_path)
+            return
+
+        workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            located = self._find_header(workbook)
+            if located is None:
+                logger.warning(f"No {self.get_source_type()} data found in {file_path}")
+                return
+
+            sheet, header, columns = located
+            count = 0
+            rows = sheet.iter_rows(min_row=header + 2, values_only=True)
+            for idx, values in enumerate(rows):
+                first = values[0] if values else None
+                if not self._keep_row('' if first is None else str(first).strip()):
+                    continue
+                count += 1
+                yield ParsedRecord(
+                    source_type=self.get_source_type(),
+                    source_file=str(file_path),
+                    raw_data={
+                        column: values[i] if i < len(values) else None
+                        for i, column in enumerate(columns)
+                    },
+                    row_index=idx
+                )
+            logger.info(f"Parsed {count} raw {self.get_source_type()} records from {file_path.name}")
+        finally:
+            workbook.close()
+
+    def _find_header(self, workbook) -> Optional[Tuple[Any, int, List[str]]]:
+        """Locate (sheet, header row, column names) of the transaction table."""
+        for sheet_name in self.SHEET_NAMES:
+            if isinstance(sheet_name, int):
+                if sheet_name >= len(workbook.worksheets):
+                    continue
+                sheet = workbook.worksheets[sheet_name]
+            elif sheet_name in workbook.sheetnames:
+                sheet = workbook[sheet_name]
+            else:
+                continue
+
+            for header in self.HEADER_ROWS:
+                row = next(
+                    sheet.iter_rows(min_row=header + 1, max_row=header + 1, values_only=True),
+                    None
+                )
+                if not row:
+                    continue
+                columns = _column_names(row)
+                if self._is_header(columns):
+                    logger.debug(f"{self.get_source_type()}: sheet={sheet_name}, header={header}")
+                    return sheet, header, columns
+        return None
+
+    def _is_header(self, columns: List[str]) -> bool:
+        """Whether a candidate header row looks like the transaction table."""
+        return sum(1 for c in columns if not c.startswith('Unnamed: ')) > 5
+
+    def _keep_row(self, first_value: str) -> bool:
+        """Whether a data row (by its stripped first cell) is a transaction."""
+        return first_value != ''
 
-        # Try different sheet names and header rows
-        sheet_names = ['TRXN_DETAILS', 'Transaction_Details', 1]
-        header_rows = [3, 4, 2]
+    def _iter_frame_records(self, file_path: Path) -> Iterator[ParsedRecord]:
+        """Yield records of a whole-sheet DataFrame read, one chunk at a time."""
+        df = self._read_transactions(file_path)
+        if df is None:
+            return
 
-        df = None
-        for sheet in sheet_names:
-            for header in header_rows:
+        logger.info(f"Parsed {len(df)} raw {self.get_source_type()} records from {file_path.name}")
+        for start in range(0, len(df), self.staging_chunk_size):
+            yield from self._to_records(df.iloc[start:start + self.staging_chunk_size], file_path)
+
+    def _read_transactions(self, file_path: Path) -> Optional[pd.DataFrame]:
+        """Read the whole transaction sheet without skipped rows (None if not found)."""
+        for sheet in self.SHEET_NAMES:
+            for header in self.HEADER_ROWS:
                 try:
                     df = pd.read_excel(
                         file_path,
@@ -136,38 +226,29 @@ class NormalizedCAMSParser(BaseParser):
                         header=header,
                         engine='calamine'
                     )
-                    if not df.empty and len(df.columns) > 5:
-                        logger.debug(f"Successfully read sheet={sheet}, header={header}")
-                        break
-                except Exception as e:
+                except Exception:
                     continue
-            if df is not None and not df.empty:
-                break
-
-        if df is None or df.empty:
-            logger.warning(f"No data found in {file_path}")
-            return records
+                if not df.empty and self._is_header(_column_names(df.columns)):
+                    logger.debug(f"{self.get_source_type()}: sheet={sheet}, header={header}")
+                    first_col = df.iloc[:, 0]
+                    first_val = first_col.astype(object).where(first_col.notna(), '').map(str).str.strip()
+                    return df[first_val.map(self._keep_row).astype(bool)]
 
-        # Convert each row to ParsedRecord
-        for idx, row in df.iterrows():
-            # Skip empty rows
-            if pd.isna(row.iloc[0]) or str(row.iloc[0]).strip() == '':
-                continue
-
-            raw_data = row.to_dict()
-            # Clean up NaN values
-            raw_data = {k: (None if pd.isna(v) else v) for k, v in raw_data.items()}
+        logger.warning(f"No {self.get_source_type()} data found in {file_path}")
+        return None
 
-            record = ParsedRecord(
+    def _to_records(self, df: pd.DataFrame, file_path: Path) -> List[ParsedRecord]:
+        """Wrap DataFrame rows as ParsedRecords, with NaN cells as None."""
+        raw_rows = df.astype(object).where(df.notna(), None).to_dict('records')
+        return [
+            ParsedRecord(
                 source_type=self.get_source_type(),
                 source_file=str(file_path),
                 raw_data=raw_data,
                 row_index=idx
             )
-            records.append(record)
-
-        logger.info(f"Parsed {len(records)} raw records from {file_path.name}")
-        return records
+            for idx, raw_data in zip(df.index.tolist(), raw_rows)
+        ]
 
     def normalize_record(self, record: ParsedRecord) -> Optional[Dict[str, Any]]:
         """
@@ -349,66 +430,43 @@ class NormalizedKarvyParser(NormalizedCAMSParser):
     def get_source_type(self) -> str:
         return "KARVY"
 
-    def parse_raw(self, file_path: Path) -> List[ParsedRecord]:
-        """
-        Parse Karvy Excel file.
+    # Karvy-specific handling:
+    # - Sheet name often has typo: 'Trasaction_Details'
+    # - Header row is typically row 4 (0-indexed)
+    # - Multi-section layout with Section A/B/C headers
+    SHEET_NAMES = ['Trasaction_Details', 'Transaction_Details', 2]
+    HEADER_ROWS = [4, 3, 5]
 
-        Karvy-specific handling:
-        - Sheet name often has typo: 'Trasaction_Details'
-        - Header row is typically row 4 (0-indexed)
-        - Multi-section layout with Section A/B/C headers
-        """
-        records = []
+    def _is_header(self, columns: List[str]) -> bool:
+        """Require fund/scheme/folio columns on top of the CAMS check."""
+        cols = [c.lower() for c in columns]
+        return super()._is_header(columns) and any(
+            'fund' in c or 'scheme' in c or 'folio' in c for c in cols
+        )
 
-        # Karvy-specific sheet names
-        sheet_names = ['Trasaction_Details', 'Transaction_Details', 2]
-        header_rows = [4, 3, 5]
+    def _keep_row(self, first_value: str) -> bool:
+        """Skip section header rows and empty rows."""
+        return first_value != '' and first_value.lower() not in ('fund', 'section')
 
-        df = None
-        for sheet in sheet_names:
-            for header in header_rows:
-                try:
-                    df = pd.read_excel(
-                        file_path,
-                        sheet_name=sheet,
-                        header=header,
-                        engine='calamine'
-                    )
-                    if not df.empty and len(df.columns) > 5:
-                        # Check if it looks like transaction data
-                        cols = [str(c).lower() for c in df.columns]
-                        if any('fund' in c or 'scheme' in c or 'folio' in c for c in cols):
-                            logger.debug(f"Karvy: sheet={sheet}, header={header}")
-                            break
-                except Exception as e:
-                    continue
-            if df is not None and not df.empty:
-                break
-
-        if df is None or df.empty:
-            logger.warning(f"No Karvy data found in {file_path}")
-            return records
-
-        # Convert each row to ParsedRecord
-        for idx, row in df.iterrows():
-            # Skip section header rows and empty rows
-            first_val = str(row.iloc[0]).strip() if not pd.isna(row.iloc[0]) else ''
-            if not first_val or first_val.lower() in ['fund ', 'fund', 'section', '']:
-                continue
-
-            raw_data = row.to_dict()
-            raw_data = {k: (None if pd.isna(v) else v) for k, v in raw_data.items()}
 
-            record = ParsedRecord(
-                source_type=self.get_source_type(),
-                source_file=str(file_path),
-                raw_data=raw_data,
-                row_index=idx
-            )
-            records.append(record)
+def _column_names(header) -> List[str]:
+    """
+    Column names of a header row as pandas reads them.
 
-        logger.info(f"Parsed {len(records)} raw Karvy records from {file_path.name}")
-        return records
+    Blank cells become 'Unnamed: <position>' and repeated names get
+    '.1', '.2', ... suffixes, so raw_data keys do not depend on the reader.
+    """
+    names: List[str] = []
+    seen: Dict[str, int] = {}
+    for position, value in enumerate(header):
+        name = str(value) if value is not None and str(value) != '' else f'Unnamed: {position}'
+        if name in seen:
+            seen[name] += 1
+            name = f'{name}.{seen[name]}'
+        else:
+            seen[name] = 0
+        names.append(name)
+    return names
 
 
 # Register parsers
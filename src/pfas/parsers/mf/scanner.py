@@ -5,13 +5,14 @@ Detects RTA (CAMS/KARVY) from folder structure or file content.
 Handles password-protected PDFs with user prompt.
 """
 
-import hashlib
 import logging
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 from typing import List, Optional, Callable
 
+from pfas.core.fingerprint import file_fingerprint, get_fingerprint_cache
+
 logger = logging.getLogger(__name__)
 
 
@@ -59,11 +60,7 @@ class ScannedFile:
 
     def _calculate_hash(self) -> str:
         """Calculate SHA256 hash of file."""
-        sha256 = hashlib.sha256()
-        with open(self.path, 'rb') as f:
-            for chunk in iter(lambda: f.read(8192), b''):
-                sha256.update(chunk)
-        return sha256.hexdigest()
+        return file_fingerprint(self.path)
 
 
 @dataclass
@@ -173,8 +170,10 @@ class MFStatementScanner:
             result.errors.append(f"Inbox path is not a directory: {self.inbox_path}")
             return result
 
-        # Scan recursively
-        for file_path in self._find_files():
+        # Scan recursively; new files are hashed in parallel up front
+        files = self._find_files()
+        get_fingerprint_cache().hash_many(files)
+        for file_path in files:
             result.total_scanned += 1
 
             try:
@@ -0,0 +1,188 @@
+"""
+Encrypted on-disk cache of text extracted from CAS PDFs.
+
+The same CAS is typically parsed several times (capital gains CLI, CAS
+CLI, golden-reference reconciliation). Decoding a 100+ page statement
+dominates each run, so the extracted text is cached per file.
+
+Cache entries are keyed by the SHA-256 of the PDF, the extractor name
+and EXTRACTOR_VERSION; bump the version whenever extraction output
+changes. The PDF password is folded into the key so a wrong password
+misses the cache and fails exactly as it would without one.
+
+Extracted text contains PII (PAN, name, holdings), so entries are
+encrypted with a FieldCipher derived from the caller's master key and a
+per-directory salt.
+
+Usage:
+    cache = CASTextCache(Path("Data/Users/Sanjay/cache/cas_text"), master_key)
+    parser = CASPDFParser(text_cache=cache)
+    parser.parse(pdf_path, password)   # decodes PDF, fills cache
+    parser.parse(pdf_path, password)   # served from cache
+"""
+
+import hashlib
+import logging
+import os
+import secrets
+import tempfile
+from pathlib import Path
+from typing import Dict, Optional
+
+from pfas.core.encryption import FieldCipher, KeyCache
+from pfas.core.exceptions import EncryptionError
+from pfas.core.fingerprint import file_fingerprint
+
+logger = logging.getLogger(__name__)
+
+# Bump when extraction output changes to invalidate existing entries
+EXTRACTOR_VERSION = 1
+
+SALT_FILE = ".salt"
+ENTRY_SUFFIX = ".enc"
+
+
+def file_sha256(path: Path) -> str:
+    """SHA-256 of file contents (via the shared fingerprint cache)."""
+    return file_fingerprint(path)
+
+
+class CASTextCache:
+    """
+    Encrypted extracted-text cache for PDF statements.
+
+    Safe to share between processes: entries are written to a temp file
+    and atomically renamed into place.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        master_key: bytes,
+        key_cache: Optional[KeyCache] = None,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding cache entries (created if missing)
+            master_key: Key used to encrypt entries
+            key_cache: Key cache to use (default: process-wide cache)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._cipher = FieldCipher(master_key, self._load_salt(), key_cache)
+        self.hits = 0
+        self.misses = 0
+
+    def _load_salt(self) -> bytes:
+        """Read the directory salt, creating it on first use."""
+        salt_path = self.cache_dir / SALT_FILE
+        if not salt_path.exists():
+            self._write_atomic(salt_path, secrets.token_bytes(16), replace=False)
+        return salt_path.read_bytes()
+
+    def key_for(
+        self,
+        pdf_path: Path,
+        extractor: str,
+        password: Optional[str] = None,
+    ) -> str:
+        """
+        Compute the cache key for a PDF.
+
+        Args:
+            pdf_path: Path to the PDF
+            extractor: Extractor name (e.g. 'pymupdf', 'pdfplumber')
+            password: PDF password, if any
+
+        Returns:
+            Hex digest identifying the cache entry
+        """
+        material = "\0".join([
+            file_sha256(Path(pdf_path)),
+            extractor,
+            str(EXTRACTOR_VERSION),
+            password or "",
+        ])
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{ENTRY_SUFFIX}"
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Get cached text.
+
+        Unreadable or undecryptable entries (e.g. written under another
+        master key) are treated as misses.
+
+        Args:
+            key: Key from key_for()
+
+        Returns:
+            Cached text or None
+        """
+        path = self._entry_path(key)
+        if not path.exists():
+            self.misses += 1
+            return None
+
+        try:
+            text = self._cipher.decrypt(path.read_bytes())
+        except (OSError, EncryptionError) as e:
+            logger.warning(f"Ignoring unreadable text cache entry {path.name}: {e}")
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return text
+
+    def put(self, key: str, text: str) -> None:
+        """
+        Store extracted text.
+
+        Args:
+            key: Key from key_for()
+            text: Extracted text
+        """
+        ciphertext, _ = self._cipher.encrypt(text)
+        self._write_atomic(self._entry_path(key), ciphertext)
+
+    def clear(self) -> int:
+        """
+        Delete all cache entries.
+
+        Returns:
+            Number of entries deleted
+        """
+        count = 0
+        for path in self.cache_dir.glob(f"*{ENTRY_SUFFIX}"):
+            path.unlink()
+            count += 1
+        return count
+
+    def stats(self) -> Dict[str, int]:
+        """Get hit/miss counters and entry count."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": sum(1 for _ in self.cache_dir.glob(f"*{ENTRY_SUFFIX}")),
+        }
+
+    def _write_atomic(self, path: Path, data: bytes, replace: bool = True) -> None:
+        """Write via temp file + rename; with replace=False, first writer wins."""
+        fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            if replace:
+                os.replace(tmp_name, path)
+            else:
+                try:
+                    os.link(tmp_name, path)
+                except FileExistsError:
+                    pass
+        finally:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
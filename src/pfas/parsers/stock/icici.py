@@ -16,6 +16,8 @@ from pfas.core.transaction_service import (
 from pfas.core.journal import JournalEntry
 from pfas.core.accounts import get_account_by_code
 
+from pfas.parsers.columns import cell_text, column, map_distinct, parse_dates
+
 from .models import StockTrade, TradeType, TradeCategory, ParseResult, CapitalGainsSummary
 
 
@@ -44,6 +46,9 @@ class ICICIDirectParser:
     LTCG_MARKER = "Long Term Capital Gain (STT paid)"
     SKIP_MARKERS = ["Total", "Grand Total", "Note:"]
 
+    # Date formats tried by _parse_date, in order
+    DATE_FORMATS = ["%d-%b-%y", "%Y-%m-%d", "%d/%m/%Y", "%d-%m-%Y"]
+
     def __init__(self, db_connection: sqlite3.Connection):
         """
         Initialize ICICI Direct parser.
@@ -107,141 +112,98 @@ class ICICIDirectParser:
         Returns:
             List of StockTrade objects
         """
-        trades = []
-        current_section = None  # 'STCG' or 'LTCG'
+        symbols = cell_text(column(df, 'Stock Symbol'), keep_blank=True)
+
+        # Section marker rows set 'STCG' or 'LTCG' for the rows below them
+        sections = pd.Series(None, index=df.index, dtype=object)
+        sections[symbols.str.contains(self.LTCG_MARKER, regex=False).fillna(False).astype(bool)] = 'LTCG'
+        sections[symbols.str.contains(self.STCG_MARKER, regex=False).fillna(False).astype(bool)] = 'STCG'
+        is_marker = sections.notna()
+        sections = sections.ffill()
+
+        # Skip empty rows, markers, totals and notes, and rows without ISIN
+        skip = symbols.isna() | is_marker | column(df, 'ISIN').isna()
+        for marker in self.SKIP_MARKERS:
+            skip |= symbols.str.contains(marker, regex=False).fillna(False).astype(bool)
+        keep = ~skip
+        df = df[keep]
+        if df.empty:
+            return []
+
+        date_memo = {}
+        rows = zip(
+            df.index.tolist(),
+            symbols[keep].tolist(),
+            cell_text(df['ISIN'], keep_blank=True).tolist(),
+            column(df, 'Qty').tolist(),
+            sections[keep].tolist(),
+            parse_dates(column(df, 'Sale Date'), self._parse_date, self.DATE_FORMATS, date_memo),
+            parse_dates(column(df, 'Purchase Date'), self._parse_date, self.DATE_FORMATS, date_memo),
+            *(
+                map_distinct(column(df, name), self._to_decimal)
+                for name in (
+                    'Sale Rate', 'Sale Value', 'Sale Expenses', 'Purchase Rate',
+                    'Purchase Value', 'Purchase Expenses', 'Profit/Loss(-)',
+                    'Purchase Price Considered',
+                )
+            ),
+        )
 
-        for idx, row in df.iterrows():
+        trades = []
+        for (idx, symbol, isin, qty, section, sale_date, purchase_date, sale_rate, sale_value,
+             sale_expenses, purchase_rate, purchase_value, purchase_expenses, profit_loss,
+             purchase_price_considered) in rows:
             try:
-                stock_symbol = row.get('Stock Symbol')
-
-                # Skip empty rows
-                if pd.isna(stock_symbol):
-                    continue
-
-                stock_symbol = str(stock_symbol).strip()
-
-                # Check for section markers
-                if self.STCG_MARKER in stock_symbol:
-                    current_section = 'STCG'
-                    continue
-                elif self.LTCG_MARKER in stock_symbol:
-                    current_section = 'LTCG'
-                    continue
+                quantity = int(float(qty))
 
-                # Skip total rows and notes
-                if any(marker in stock_symbol for marker in self.SKIP_MARKERS):
+                if not sale_date:
+                    result.add_warning(f"Row {idx}: Invalid sale date")
                     continue
 
-                # Skip rows without ISIN (section headers, notes)
-                isin = row.get('ISIN')
-                if pd.isna(isin):
-                    continue
-
-                # Parse trade data
-                trade = self._parse_trade_row(row, current_section, result, idx)
-                if trade:
-                    trades.append(trade)
+                # Determine if long term based on section
+                is_long_term = section == 'LTCG'
+
+                # Calculate holding period
+                holding_days = None
+                if sale_date and purchase_date:
+                    holding_days = (sale_date - purchase_date).days
+
+                # Calculate cost of acquisition
+                # For LTCG with grandfathering, use purchase_price_considered if available
+                if purchase_price_considered and purchase_price_considered > 0:
+                    cost_of_acquisition = purchase_price_considered * quantity
+                else:
+                    cost_of_acquisition = purchase_value + purchase_expenses
+
+                # Net amount = Sale Value - Sale Expenses
+                net_amount = sale_value - sale_expenses
+
+                trades.append(StockTrade(
+                    symbol=symbol,
+                    isin=isin,
+                    trade_date=sale_date,
+                    trade_type=TradeType.SELL,
+                    quantity=quantity,
+                    price=sale_rate,
+                    amount=sale_value,
+                    brokerage=sale_expenses,  # ICICI bundles all charges
+                    stt=Decimal("0"),  # Included in sale_expenses
+                    net_amount=net_amount,
+                    trade_category=TradeCategory.DELIVERY,
+                    # Pre-matched buy info
+                    buy_date=purchase_date,
+                    buy_price=purchase_rate,
+                    cost_of_acquisition=cost_of_acquisition,
+                    holding_period_days=holding_days,
+                    is_long_term=is_long_term,
+                    capital_gain=profit_loss
+                ))
 
             except Exception as e:
-                result.add_warning(f"Row {idx}: {str(e)}")
-                continue
+                result.add_warning(f"Row {idx}: Failed to parse - {str(e)}")
 
         return trades
 
-    def _parse_trade_row(
-        self,
-        row: pd.Series,
-        section: Optional[str],
-        result: ParseResult,
-        idx: int
-    ) -> Optional[StockTrade]:
-        """
-        Parse a single trade row.
-
-        Creates a SELL trade with pre-matched buy information.
-
-        Args:
-            row: DataFrame row
-            section: Current section ('STCG' or 'LTCG')
-            result: ParseResult for warnings
-            idx: Row index for error messages
-
-        Returns:
-            StockTrade object or None if invalid
-        """
-        try:
-            symbol = str(row['Stock Symbol']).strip()
-            isin = str(row['ISIN']).strip()
-            quantity = int(float(row['Qty']))
-
-            # Parse dates
-            sale_date = self._parse_date(row.get('Sale Date'))
-            purchase_date = self._parse_date(row.get('Purchase Date'))
-
-            if not sale_date:
-                result.add_warning(f"Row {idx}: Invalid sale date")
-                return None
-
-            # Parse amounts
-            sale_rate = self._to_decimal(row.get('Sale Rate'))
-            sale_value = self._to_decimal(row.get('Sale Value'))
-            sale_expenses = self._to_decimal(row.get('Sale Expenses'))
-
-            purchase_rate = self._to_decimal(row.get('Purchase Rate'))
-            purchase_value = self._to_decimal(row.get('Purchase Value'))
-            purchase_expenses = self._to_decimal(row.get('Purchase Expenses'))
-
-            profit_loss = self._to_decimal(row.get('Profit/Loss(-)'))
-
-            # Grandfathering for LTCG
-            fmv_31jan2018 = self._to_decimal(row.get('Price as on 31st Jan 2018'))
-            purchase_price_considered = self._to_decimal(row.get('Purchase Price Considered'))
-
-            # Determine if long term based on section
-            is_long_term = section == 'LTCG'
-
-            # Calculate holding period
-            holding_days = None
-            if sale_date and purchase_date:
-                holding_days = (sale_date - purchase_date).days
-
-            # Calculate cost of acquisition
-            # For LTCG with grandfathering, use purchase_price_considered if available
-            if purchase_price_considered and purchase_price_considered > 0:
-                cost_of_acquisition = purchase_price_considered * quantity
-            else:
-                cost_of_acquisition = purchase_value + purchase_expenses
-
-            # Net amount = Sale Value - Sale Expenses
-            net_amount = sale_value - sale_expenses
-
-            trade = StockTrade(
-                symbol=symbol,
-                isin=isin,
-                trade_date=sale_date,
-                trade_type=TradeType.SELL,
-                quantity=quantity,
-                price=sale_rate,
-                amount=sale_value,
-                brokerage=sale_expenses,  # ICICI bundles all charges
-                stt=Decimal("0"),  # Included in sale_expenses
-                net_amount=net_amount,
-                trade_category=TradeCategory.DELIVERY,
-                # Pre-matched buy info
-                buy_date=purchase_date,
-                buy_price=purchase_rate,
-                cost_of_acquisition=cost_of_acquisition,
-                holding_period_days=holding_days,
-                is_long_term=is_long_term,
-                capital_gain=profit_loss
-            )
-
-            return trade
-
-        except Exception as e:
-            result.add_warning(f"Row {idx}: Failed to parse - {str(e)}")
-            return None
-
     def _parse_date(self, value) -> Optional[date_type]:
         """
         Parse date from ICICI format (DD-MMM-YY).
@@ -268,15 +230,8 @@ class ICICIDirectParser:
         if isinstance(value, pd.Timestamp):
             return value.date()
 
-        # Parse DD-MMM-YY format
-        try:
-            dt = datetime.strptime(str(value).strip(), "%d-%b-%y")
-            return dt.date()
-        except ValueError:
-            pass
-
-        # Try other common formats
-        for fmt in ["%Y-%m-%d", "%d/%m/%Y", "%d-%m-%Y"]:
+        # DD-MMM-YY first, then other common formats
+        for fmt in self.DATE_FORMATS:
             try:
                 dt = datetime.strptime(str(value).strip(), fmt)
                 return dt.date()
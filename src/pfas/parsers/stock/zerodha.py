@@ -17,6 +17,8 @@ from pfas.core.transaction_service import (
 from pfas.core.journal import JournalEntry
 from pfas.core.accounts import get_account_by_code
 
+from pfas.parsers.columns import cell_text, column, map_distinct, parse_dates
+
 from .models import (
     StockTrade,
     StockDividend,
@@ -46,6 +48,13 @@ class ZerodhaParser:
     - Period of Holding, Fair Market Value, Taxable Profit, Turnover
     """
 
+    # Section markers and repeated headers in the Tradewise Exits sheet
+    SECTION_MARKERS = ['Symbol', 'Equity', 'Mutual Funds', 'Currency',
+                       'Commodity', 'Equity - Buyback', 'F&O']
+
+    # Date layouts _parse_date reads unambiguously; parsed column-wise
+    DATE_FORMATS = ['%d-%b-%Y', '%Y-%m-%d', '%Y-%m-%d %H:%M:%S']
+
     def __init__(self, db_connection: sqlite3.Connection):
         """
         Initialize Zerodha parser.
@@ -171,50 +180,42 @@ class ZerodhaParser:
         Returns:
             List of StockTrade objects (SELL trades only with pre-matched buy info)
         """
-        trades = []
+        # Skip empty rows, section markers and repeated headers
+        symbols = cell_text(column(df, 'Symbol'), keep_blank=True)
+        isins = cell_text(column(df, 'ISIN'), keep_blank=True)
+        keep = (
+            symbols.notna()
+            & ~symbols.isin(self.SECTION_MARKERS)
+            # Validate ISIN (must start with INE or INF)
+            & (isins.str.startswith('INE') | isins.str.startswith('INF')).fillna(False).astype(bool)
+        )
+        df = df[keep]
+        if df.empty:
+            return []
+
+        date_memo = {}
+        rows = zip(
+            df.index.tolist(),
+            symbols[keep].tolist(),
+            isins[keep].tolist(),
+            self._dates(df, 'Entry Date', date_memo),
+            self._dates(df, 'Exit Date', date_memo),
+            map_distinct(column(df, 'Quantity'), self._to_int),
+            map_distinct(column(df, 'Buy Value'), self._to_decimal),
+            map_distinct(column(df, 'Sell Value'), self._to_decimal),
+            map_distinct(column(df, 'Profit'), self._to_decimal),
+            map_distinct(column(df, 'Period of Holding'), self._to_int),
+        )
 
-        for idx, row in df.iterrows():
+        trades = []
+        for (idx, symbol, isin, entry_date, exit_date, quantity, buy_value, sell_value,
+             profit, holding_days) in rows:
+            if not exit_date or quantity <= 0:
+                continue
             try:
-                # Skip empty rows and section headers
-                symbol = row.get('Symbol')
-                if pd.isna(symbol):
-                    continue
-
-                symbol = str(symbol).strip()
-
-                # Skip section markers and repeated headers
-                if symbol in ['Symbol', 'Equity', 'Mutual Funds', 'Currency',
-                              'Commodity', 'Equity - Buyback', 'F&O']:
-                    continue
-
-                # Validate ISIN (must start with INE or INF)
-                isin = row.get('ISIN')
-                if pd.isna(isin):
-                    continue
-                isin = str(isin).strip()
-                if not (isin.startswith('INE') or isin.startswith('INF')):
-                    continue
-
-                # Parse dates
-                entry_date = self._parse_date(row.get('Entry Date'))
-                exit_date = self._parse_date(row.get('Exit Date'))
-
-                if not exit_date:
-                    continue
-
-                # Parse quantities and amounts
-                quantity = self._to_int(row.get('Quantity'))
-                if quantity <= 0:
-                    continue
-
-                buy_value = self._to_decimal(row.get('Buy Value'))
-                sell_value = self._to_decimal(row.get('Sell Value'))
-                profit = self._to_decimal(row.get('Profit'))
-                holding_days = self._to_int(row.get('Period of Holding'))
-
                 # Calculate prices from values
-                buy_price = buy_value / quantity if quantity > 0 else Decimal("0")
-                sell_price = sell_value / quantity if quantity > 0 else Decimal("0")
+                buy_price = buy_value / quantity
+                sell_price = sell_value / quantity
 
                 # Determine if long-term (>365 days)
                 is_long_term = holding_days > 365 if holding_days else False
@@ -263,23 +264,35 @@ class ZerodhaParser:
         Returns:
             List of StockTrade objects
         """
-        trades = []
+        # Skip empty rows
+        symbols = cell_text(column(df, 'Symbol'), keep_blank=True)
+        df = df[symbols.notna()]
+        if df.empty:
+            return []
+
+        date_memo = {}
+        rows = zip(
+            df.index.tolist(),
+            symbols[symbols.notna()].tolist(),
+            cell_text(column(df, 'ISIN'), keep_blank=True).tolist(),
+            column(df, 'Quantity').tolist(),
+            self._dates(df, 'Buy Date', date_memo),
+            map_distinct(column(df, 'Buy Price'), self._to_decimal),
+            map_distinct(column(df, 'Buy Value'), self._to_decimal),
+            self._dates(df, 'Sell Date', date_memo),
+            map_distinct(column(df, 'Sell Price'), self._to_decimal),
+            map_distinct(column(df, 'Sell Value'), self._to_decimal),
+            map_distinct(column(df, 'STT'), self._to_decimal),
+            map_distinct(column(df, 'Profit/Loss'), self._to_decimal),
+        )
 
-        for idx, row in df.iterrows():
+        trades = []
+        for (idx, symbol, isin, quantity, buy_date, buy_price, buy_value, sell_date,
+             sell_price, sell_value, stt, profit_loss) in rows:
             try:
-                # Skip empty rows
-                if pd.isna(row.get('Symbol')):
-                    continue
-
-                symbol = str(row['Symbol']).strip()
-                isin = str(row.get('ISIN', '')).strip() if not pd.isna(row.get('ISIN')) else None
-                quantity = int(row['Quantity'])
-
-                # Parse buy trade
-                buy_date = self._parse_date(row.get('Buy Date'))
-                buy_price = self._to_decimal(row.get('Buy Price'))
-                buy_value = self._to_decimal(row.get('Buy Value'))
+                quantity = int(quantity)
 
+                # Buy trade
                 if buy_date and buy_price and buy_value:
                     buy_trade = StockTrade(
                         symbol=symbol,
@@ -294,13 +307,7 @@ class ZerodhaParser:
                     )
                     trades.append(buy_trade)
 
-                # Parse sell trade
-                sell_date = self._parse_date(row.get('Sell Date'))
-                sell_price = self._to_decimal(row.get('Sell Price'))
-                sell_value = self._to_decimal(row.get('Sell Value'))
-                stt = self._to_decimal(row.get('STT'))
-                profit_loss = self._to_decimal(row.get('Profit/Loss'))
-
+                # Sell trade
                 if sell_date and sell_price and sell_value:
                     # Calculate holding period
                     holding_days = (sell_date - buy_date).days if buy_date else None
@@ -346,26 +353,36 @@ class ZerodhaParser:
         Returns:
             List of StockTrade objects
         """
-        trades = []
+        # Skip empty rows
+        symbols = cell_text(column(df, 'Symbol'), keep_blank=True)
+        df = df[symbols.notna()]
+        if df.empty:
+            return []
+
+        rows = zip(
+            df.index.tolist(),
+            symbols[symbols.notna()].tolist(),
+            cell_text(column(df, 'ISIN'), keep_blank=True).tolist(),
+            column(df, 'Quantity').tolist(),
+            self._dates(df, 'Trade Date' if 'Trade Date' in df.columns else 'Date', {}),
+            map_distinct(column(df, 'Buy Price'), self._to_decimal),
+            map_distinct(column(df, 'Buy Value'), self._to_decimal),
+            map_distinct(column(df, 'Sell Price'), self._to_decimal),
+            map_distinct(column(df, 'Sell Value'), self._to_decimal),
+            map_distinct(column(df, 'STT'), self._to_decimal),
+            map_distinct(column(df, 'Profit/Loss'), self._to_decimal),
+        )
 
-        for idx, row in df.iterrows():
+        trades = []
+        for (idx, symbol, isin, quantity, trade_date, buy_price, buy_value, sell_price,
+             sell_value, stt, profit_loss) in rows:
             try:
-                # Skip empty rows
-                if pd.isna(row.get('Symbol')):
-                    continue
-
-                symbol = str(row['Symbol']).strip()
-                isin = str(row.get('ISIN', '')).strip() if not pd.isna(row.get('ISIN')) else None
-                quantity = int(row['Quantity'])
-                trade_date = self._parse_date(row.get('Trade Date', row.get('Date')))
+                quantity = int(quantity)
 
                 if not trade_date:
                     continue
 
                 # Buy trade
-                buy_price = self._to_decimal(row.get('Buy Price'))
-                buy_value = self._to_decimal(row.get('Buy Value'))
-
                 if buy_price and buy_value:
                     buy_trade = StockTrade(
                         symbol=symbol,
@@ -381,11 +398,6 @@ class ZerodhaParser:
                     trades.append(buy_trade)
 
                 # Sell trade
-                sell_price = self._to_decimal(row.get('Sell Price'))
-                sell_value = self._to_decimal(row.get('Sell Value'))
-                stt = self._to_decimal(row.get('STT'))
-                profit_loss = self._to_decimal(row.get('Profit/Loss'))
-
                 if sell_price and sell_value:
                     sell_trade = StockTrade(
                         symbol=symbol,
@@ -437,32 +449,32 @@ class ZerodhaParser:
         if len(df.columns) >= 7:
             df.columns = ['_', 'Symbol', 'ISIN', 'Date', 'Quantity', 'Dividend_Per_Share', 'Net_Amount']
 
-        for idx, row in df.iterrows():
-            try:
-                symbol = row.get('Symbol')
-                if pd.isna(symbol) or str(symbol).strip() == '':
-                    continue
-
-                symbol = str(symbol).strip()
-
-                # Skip header row that may appear in data
-                if symbol == 'Symbol':
-                    continue
-
-                isin = str(row.get('ISIN', '')).strip() if not pd.isna(row.get('ISIN')) else ''
-
-                # Validate ISIN
-                if not (isin.startswith('INE') or isin.startswith('INF')):
-                    continue
-
-                dividend_date = self._parse_date(row.get('Date'))
-                if not dividend_date:
-                    continue
-
-                quantity = self._to_int(row.get('Quantity'))
-                dividend_per_share = self._to_decimal(row.get('Dividend_Per_Share'))
-                net_amount = self._to_decimal(row.get('Net_Amount'))
+        # Skip empty rows, header rows repeated in the data and invalid ISINs
+        symbols = cell_text(column(df, 'Symbol'), keep_blank=True)
+        isins = cell_text(column(df, 'ISIN'), keep_blank=True).fillna('')
+        keep = (
+            symbols.notna()
+            & ~symbols.isin(['', 'Symbol'])
+            & (isins.str.startswith('INE') | isins.str.startswith('INF')).astype(bool)
+        )
+        df = df[keep]
+        if df.empty:
+            return dividends
+
+        rows = zip(
+            df.index.tolist(),
+            symbols[keep].tolist(),
+            isins[keep].tolist(),
+            self._dates(df, 'Date', {}),
+            map_distinct(column(df, 'Quantity'), self._to_int),
+            map_distinct(column(df, 'Dividend_Per_Share'), self._to_decimal),
+            map_distinct(column(df, 'Net_Amount'), self._to_decimal),
+        )
 
+        for idx, symbol, isin, dividend_date, quantity, dividend_per_share, net_amount in rows:
+            if not dividend_date:
+                continue
+            try:
                 # Calculate gross amount (net + estimated TDS)
                 # Zerodha provides net amount after TDS
                 # TDS is 10% if dividend > Rs 5000 per company per year
@@ -532,6 +544,10 @@ class ZerodhaParser:
 
         return summary
 
+    def _dates(self, df: pd.DataFrame, name: str, memo: dict) -> list:
+        """Parse a date column with _parse_date, once per distinct value."""
+        return parse_dates(column(df, name), self._parse_date, self.DATE_FORMATS, memo)
+
     def _parse_date(self, value) -> Optional[date_type]:
         """
         Parse date from various formats.
@@ -23,7 +23,6 @@ Usage:
     print(f"Validation: {result.validation_status}")
 """
 
-import hashlib
 import logging
 import re
 from dataclasses import dataclass, field
@@ -34,6 +33,8 @@ from typing import Any, Dict, List, Optional, Set, Tuple
 
 import pandas as pd
 
+from pfas.core.fingerprint import file_fingerprint, get_fingerprint_cache
+
 logger = logging.getLogger(__name__)
 
 
@@ -278,6 +279,8 @@ class ICICIDirectProcessor:
         cg_files = []
         holdings_files = []
 
+        # Hash new files in parallel; _compute_file_hash reads the warmed cache
+        get_fingerprint_cache().hash_many(all_files, "md5")
         for file_path in all_files:
             file_hash = self._compute_file_hash(file_path)
 
@@ -378,11 +381,7 @@ class ICICIDirectProcessor:
 
     def _compute_file_hash(self, file_path: Path) -> str:
         """Compute MD5 hash of file for deduplication."""
-        md5 = hashlib.md5()
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                md5.update(chunk)
-        return md5.hexdigest()
+        return file_fingerprint(file_path, "md5")
 
     def _load_existing_records(self):
         """Load existing record keys to avoid re-processing."""
@@ -12,6 +12,8 @@ from typing import Optional
 import pandas as pd
 from datetime import datetime
 
+from pfas.services.tax_rules_service import TaxRuleTables, get_tax_rule_tables
+
 
 class FinancialYear(Enum):
     """Supported financial years."""
@@ -90,6 +92,39 @@ class TaxSlabs:
             ltcg_equity_rate=Decimal("0.125"),
         )
 
+    @classmethod
+    def from_rules(cls, rules: TaxRuleTables, financial_year: str) -> Optional["TaxSlabs"]:
+        """New Tax Regime configuration from the tax rule tables, or None if the FY is missing."""
+        slabs = rules.tax_slabs(financial_year, "NEW")
+        stcg = rules.capital_gains_rate(financial_year, "EQUITY_LISTED", "STCG")
+        ltcg = rules.capital_gains_rate(financial_year, "EQUITY_LISTED", "LTCG")
+        if not slabs or stcg is None or ltcg is None:
+            return None
+        return cls(
+            slabs=[
+                (
+                    slab.lower_limit,
+                    slab.upper_limit if slab.upper_limit is not None else Decimal("99999999999"),
+                    slab.tax_rate,
+                )
+                for slab in slabs
+            ],
+            standard_deduction=rules.standard_deduction(financial_year, "NEW", "SALARY"),
+            ltcg_exemption=ltcg.exemption_limit,
+            stcg_equity_rate=stcg.tax_rate,
+            ltcg_equity_rate=ltcg.tax_rate,
+            health_cess_rate=rules.cess_rate(financial_year),
+        )
+
+    @classmethod
+    def for_fy(cls, fy: FinancialYear, rules: Optional[TaxRuleTables] = None) -> "TaxSlabs":
+        """Configuration for a FY: from the rule tables when given and populated, else built in."""
+        if rules is not None:
+            tax_slabs = cls.from_rules(rules, fy.value)
+            if tax_slabs is not None:
+                return tax_slabs
+        return cls.for_fy_2024_25() if fy == FinancialYear.FY_2024_25 else cls.for_fy_2025_26()
+
 
 @dataclass
 class IncomeItem:
@@ -141,13 +176,9 @@ class AdvanceTaxSummary:
 class AdvanceTaxCalculator:
     """Calculator for advance tax computation."""
 
-    def __init__(self, financial_year: FinancialYear):
+    def __init__(self, financial_year: FinancialYear, tax_slabs: Optional[TaxSlabs] = None):
         self.financial_year = financial_year
-        self.tax_slabs = (
-            TaxSlabs.for_fy_2024_25()
-            if financial_year == FinancialYear.FY_2024_25
-            else TaxSlabs.for_fy_2025_26()
-        )
+        self.tax_slabs = tax_slabs or TaxSlabs.for_fy(financial_year)
 
     def calculate_slab_tax(self, taxable_income: Decimal) -> Decimal:
         """Calculate tax based on income slabs."""
@@ -381,10 +412,24 @@ class UserIncomeDataLoader:
 class AdvanceTaxReportGenerator:
     """Generates advance tax reports in Excel format."""
 
-    def __init__(self, base_data_path: Path, output_path: Path):
+    def __init__(self, base_data_path: Path, output_path: Path, db_connection=None):
+        """
+        Initialize report generator.
+
+        Args:
+            base_data_path: Base path to the Data folder
+            output_path: Directory for generated reports
+            db_connection: Optional connection whose tax rule tables replace
+                the built-in FY configuration
+        """
         self.base_data_path = base_data_path
         self.output_path = output_path
         self.output_path.mkdir(parents=True, exist_ok=True)
+        self.conn = db_connection
+
+    def _tax_slabs(self, fy: FinancialYear) -> TaxSlabs:
+        rules = get_tax_rule_tables(self.conn) if self.conn is not None else None
+        return TaxSlabs.for_fy(fy, rules)
 
     def generate_report(
         self,
@@ -400,7 +445,7 @@ class AdvanceTaxReportGenerator:
 
         for fy in financial_years:
             summary = self._build_income_summary(user_name, fy, loader)
-            calculator = AdvanceTaxCalculator(fy)
+            calculator = AdvanceTaxCalculator(fy, self._tax_slabs(fy))
             summary = calculator.calculate_tax(summary)
 
             output_file = self._generate_excel_report(summary)
@@ -550,11 +595,7 @@ class AdvanceTaxReportGenerator:
         )
 
         # Standard deduction for salary
-        tax_slabs = (
-            TaxSlabs.for_fy_2024_25()
-            if fy == FinancialYear.FY_2024_25
-            else TaxSlabs.for_fy_2025_26()
-        )
+        tax_slabs = self._tax_slabs(fy)
         if summary.total_salary_income > 0:
             summary.total_deductions += tax_slabs.standard_deduction
 
@@ -587,11 +628,7 @@ class AdvanceTaxReportGenerator:
             df_income.to_excel(writer, sheet_name="Income Details", index=False)
 
             # Tax Summary Sheet
-            tax_slabs = (
-                TaxSlabs.for_fy_2024_25()
-                if summary.financial_year == FinancialYear.FY_2024_25
-                else TaxSlabs.for_fy_2025_26()
-            )
+            tax_slabs = self._tax_slabs(summary.financial_year)
 
             summary_data = [
                 {"Particulars": "Financial Year", "Amount (₹)": summary.financial_year.value},
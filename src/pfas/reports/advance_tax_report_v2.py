@@ -16,11 +16,11 @@ from pfas.services.tax_rules_service import TaxRulesService
 class AdvanceTaxReportGeneratorV2:
     """Database-driven advance tax report generator."""
 
-    def __init__(self, db_connection, output_path: Path):
+    def __init__(self, db_connection, output_path: Path, history_connection=None):
         self.conn = db_connection
         self.output_path = Path(output_path)
         self.output_path.mkdir(parents=True, exist_ok=True)
-        self.calculator = AdvanceTaxCalculator(db_connection)
+        self.calculator = AdvanceTaxCalculator(db_connection, history_connection)
         self.tax_rules = TaxRulesService(db_connection)
 
     def generate_report(
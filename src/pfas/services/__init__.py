@@ -11,25 +11,41 @@ Provides services for:
 - Liabilities: Loan and liability management
 - NAV Service: Mutual fund NAV history with interpolation
 - Batch Ingester: Atomic batch file ingestion
+
+Exports are imported from their submodules on first access (pfas._lazy).
 """
 
-from .tax_rules_service import TaxRulesService, TaxSlab, CapitalGainsRate
-from .income_aggregation_service import IncomeAggregationService, IncomeRecord
-from .statement_tracker import StatementTracker
-from .advance_tax_calculator import AdvanceTaxCalculator, AdvanceTaxResult
-from .cash_flow_service import CashFlowStatementService
-from .balance_sheet_service import BalanceSheetService
-from .portfolio_valuation_service import PortfolioValuationService, PortfolioSummary, XIRRResult
-from .liabilities_service import LiabilitiesService, LoanSummary, AmortizationEntry
-from .nav_service import NAVService, NAVRecord
-from .batch_ingester import BatchIngester, BatchResult, FileResult, FileStatus
-from .cost_basis_tracker import CostBasisTracker, CostMethod, Lot, CostBasisResult, HoldingSummary
+from pfas._lazy import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    ".tax_rules_service": [
+        "TaxRulesService", "TaxSlab", "CapitalGainsRate",
+        "TaxRuleTables", "get_tax_rule_tables", "clear_tax_rule_tables",
+    ],
+    ".income_aggregation_service": ["IncomeAggregationService", "IncomeRecord"],
+    ".statement_tracker": ["StatementTracker"],
+    ".advance_tax_calculator": ["AdvanceTaxCalculator", "AdvanceTaxResult"],
+    ".cash_flow_service": ["CashFlowStatementService"],
+    ".balance_sheet_service": ["BalanceSheetService"],
+    ".portfolio_valuation_service": [
+        "PortfolioValuationService", "PortfolioSummary", "XIRRResult",
+    ],
+    ".liabilities_service": ["LiabilitiesService", "LoanSummary", "AmortizationEntry"],
+    ".nav_service": ["NAVService", "NAVRecord", "get_navs", "get_transaction_navs"],
+    ".batch_ingester": ["BatchIngester", "BatchResult", "FileResult", "FileStatus"],
+    ".cost_basis_tracker": [
+        "CostBasisTracker", "CostMethod", "Lot", "LotSale", "CostBasisResult", "HoldingSummary",
+    ],
+})
 
 __all__ = [
     # Tax Services
     "TaxRulesService",
     "TaxSlab",
     "CapitalGainsRate",
+    "TaxRuleTables",
+    "get_tax_rule_tables",
+    "clear_tax_rule_tables",
     "IncomeAggregationService",
     "IncomeRecord",
     "StatementTracker",
@@ -49,6 +65,8 @@ __all__ = [
     # NAV Services
     "NAVService",
     "NAVRecord",
+    "get_navs",
+    "get_transaction_navs",
     # Batch Ingestion
     "BatchIngester",
     "BatchResult",
@@ -58,6 +76,7 @@ __all__ = [
     "CostBasisTracker",
     "CostMethod",
     "Lot",
+    "LotSale",
     "CostBasisResult",
     "HoldingSummary",
 ]
@@ -64,14 +64,18 @@ class AdvanceTaxCalculator:
     All tax rules fetched from database - no hardcoded rates.
     """
 
-    def __init__(self, db_connection):
+    def __init__(self, db_connection, history_connection=None):
         """
         Initialize with database connection.
 
         Args:
             db_connection: SQLite connection object
+            history_connection: Connection computations are stored through
+                (default: db_connection); lets reports compute on a
+                read-only pooled reader
         """
         self.conn = db_connection
+        self.history_conn = history_connection or db_connection
         self.tax_rules = TaxRulesService(db_connection)
         self.income_service = IncomeAggregationService(db_connection)
 
@@ -309,7 +313,7 @@ class AdvanceTaxCalculator:
     def _store_computation(self, result: AdvanceTaxResult):
         """Store computation result in database for history."""
         # Mark previous computations as not latest
-        self.conn.execute("""
+        self.history_conn.execute("""
             UPDATE advance_tax_computation
             SET is_latest = FALSE
             WHERE user_id = ? AND financial_year = ?
@@ -333,7 +337,7 @@ class AdvanceTaxCalculator:
         })
 
         # Insert new computation
-        self.conn.execute("""
+        self.history_conn.execute("""
             INSERT INTO advance_tax_computation (
                 user_id, financial_year, tax_regime, computation_date,
                 total_salary_income, total_stcg_equity, total_ltcg_equity,
@@ -359,7 +363,7 @@ class AdvanceTaxCalculator:
             float(result.tds_deducted), float(result.advance_tax_paid),
             float(result.balance_payable), computation_json
         ))
-        self.conn.commit()
+        self.history_conn.commit()
 
     def get_latest_computation(
         self,
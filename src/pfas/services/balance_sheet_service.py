@@ -7,11 +7,20 @@ Generates balance sheet snapshots by:
 3. Computing net worth
 
 All data is fetched from database - no file parsing.
+
+Series of snapshots (e.g. month-end net worth) are built incrementally:
+a BalanceSheetState holds the running per-section totals and is advanced
+with only the rows dated since the previous snapshot. States are
+checkpointed in balance_sheet_checkpoints next to saved snapshots so a
+later run resumes from the latest valid checkpoint instead of replaying
+all history.
 """
 
+import calendar
+from dataclasses import dataclass, field
 from datetime import date
 from decimal import Decimal
-from typing import List, Optional, Dict, Any
+from typing import Callable, Iterable, List, Optional, Dict, Any, Tuple
 import json
 import sqlite3
 
@@ -22,6 +31,162 @@ from pfas.core.models import (
     LiabilityType,
     BalanceSheetSnapshot,
 )
+from pfas.core.rate_calendar import rate_calendar
+from pfas.services.nav_service import get_navs, get_transaction_navs
+
+
+# Bump when BalanceSheetState changes shape to invalidate stored checkpoints
+CHECKPOINT_VERSION = 1
+
+# Tables feeding BalanceSheetState, with the date column used for windowing.
+# A checkpoint is valid while COUNT(*) and MAX(id) of the rows dated on or
+# before it are unchanged in each table. In-place UPDATEs of old rows are
+# not detected; call clear_checkpoints() after editing history.
+CHECKPOINT_SOURCES = (
+    ("bank_transactions", "date"),
+    ("mf_transactions", "date"),
+    ("stock_trades", "trade_date"),
+    ("foreign_holdings", "valuation_date"),
+    ("epf_transactions", "transaction_date"),
+    ("ppf_transactions", "transaction_date"),
+    ("nps_transactions", "transaction_date"),
+    ("liability_transactions", "transaction_date"),
+)
+
+
+def month_ends(start_date: date, end_date: date) -> List[date]:
+    """Get all month-end dates between start_date and end_date (inclusive)."""
+    dates = []
+    year, month = start_date.year, start_date.month
+    while True:
+        month_end = date(year, month, calendar.monthrange(year, month)[1])
+        if month_end > end_date:
+            break
+        if month_end >= start_date:
+            dates.append(month_end)
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return dates
+
+
+@dataclass
+class BalanceSheetState:
+    """
+    Running balance sheet totals as of a date.
+
+    Every section is either additive (units, quantities, contributions) or
+    "latest row wins" (balances, loan outstanding), so moving to a later
+    date only needs the rows dated in between. Amounts are kept exactly as
+    the SQL aggregates in BalanceSheetService see them.
+
+    Attributes:
+        as_of: Date the state reflects (None = before any transaction)
+        bank: bank_account_id -> [latest txn id, balance]
+        mf: scheme_id -> [net units, sum of NAVs, count of NAVs]
+        stocks: symbol -> [isin, net qty, total buy amount, total buy qty]
+        foreign: symbol -> [shares held, value USD]
+        epf: [date, id, balance] of the latest EPF row
+        ppf: [date, id, balance] of the latest PPF row
+        nps: tier -> contributions
+        liabilities: liability_id -> [date, id, outstanding_after]
+    """
+    as_of: Optional[date] = None
+    bank: Dict[int, list] = field(default_factory=dict)
+    mf: Dict[int, list] = field(default_factory=dict)
+    stocks: Dict[str, list] = field(default_factory=dict)
+    foreign: Dict[str, list] = field(default_factory=dict)
+    epf: Optional[list] = None
+    ppf: Optional[list] = None
+    nps: Dict[str, Decimal] = field(default_factory=dict)
+    liabilities: Dict[int, list] = field(default_factory=dict)
+
+    def apply_bank(self, row: tuple) -> None:
+        """Apply (date, id, bank_account_id, balance)."""
+        current = self.bank.get(row[2])
+        if current is None or row[1] > current[0]:
+            self.bank[row[2]] = [row[1], row[3]]
+
+    def apply_mf(self, row: tuple) -> None:
+        """Apply (date, id, scheme_id, signed units, nav)."""
+        entry = self.mf.setdefault(row[2], [Decimal("0"), Decimal("0"), 0])
+        if row[3] is not None:
+            entry[0] += Decimal(str(row[3]))
+        if row[4] is not None:
+            entry[1] += Decimal(str(row[4]))
+            entry[2] += 1
+
+    def apply_stock(self, row: tuple) -> None:
+        """Apply (date, id, symbol, isin, trade_type, quantity, net_amount)."""
+        entry = self.stocks.setdefault(row[2], [None, Decimal("0"), Decimal("0"), Decimal("0")])
+        if row[3] is not None:
+            entry[0] = row[3]
+        quantity = Decimal(str(row[5] or 0))
+        if row[4] == 'BUY':
+            entry[1] += quantity
+            entry[2] += Decimal(str(row[6] or 0))
+            entry[3] += quantity
+        else:
+            entry[1] -= quantity
+
+    def apply_foreign(self, row: tuple) -> None:
+        """Apply (date, id, symbol, shares_held, total_value_usd)."""
+        entry = self.foreign.setdefault(row[2], [Decimal("0"), Decimal("0")])
+        if row[3] is not None:
+            entry[0] += Decimal(str(row[3]))
+        if row[4] is not None:
+            entry[1] += Decimal(str(row[4]))
+
+    def apply_epf(self, row: tuple) -> None:
+        """Apply (date, id, employee + employer balance)."""
+        if self.epf is None or (row[0], row[1]) > (self.epf[0], self.epf[1]):
+            self.epf = list(row)
+
+    def apply_ppf(self, row: tuple) -> None:
+        """Apply (date, id, balance)."""
+        if self.ppf is None or (row[0], row[1]) > (self.ppf[0], self.ppf[1]):
+            self.ppf = list(row)
+
+    def apply_nps(self, row: tuple) -> None:
+        """Apply (date, id, tier, amount) of a contribution."""
+        self.nps[row[2]] = self.nps.get(row[2], Decimal("0")) + Decimal(str(row[3] or 0))
+
+    def apply_liability(self, row: tuple) -> None:
+        """Apply (date, id, liability_id, outstanding_after)."""
+        current = self.liabilities.get(row[2])
+        if current is None or (row[0], row[1]) > (current[0], current[1]):
+            self.liabilities[row[2]] = [row[0], row[1], row[3]]
+
+    def to_json(self) -> str:
+        """Serialize for storage (dict sections as [key, *values] lists)."""
+        return json.dumps({
+            "as_of": self.as_of.isoformat() if self.as_of else None,
+            "bank": [[k, *v] for k, v in self.bank.items()],
+            "mf": [[k, *v] for k, v in self.mf.items()],
+            "stocks": [[k, *v] for k, v in self.stocks.items()],
+            "foreign": [[k, *v] for k, v in self.foreign.items()],
+            "epf": self.epf,
+            "ppf": self.ppf,
+            "nps": [[k, v] for k, v in self.nps.items()],
+            "liabilities": [[k, *v] for k, v in self.liabilities.items()],
+        }, default=str)
+
+    @classmethod
+    def from_json(cls, data: str) -> "BalanceSheetState":
+        """Restore a state serialized by to_json()."""
+        raw = json.loads(data)
+        return cls(
+            as_of=date.fromisoformat(raw["as_of"]) if raw["as_of"] else None,
+            bank={k: [txn_id, balance] for k, txn_id, balance in raw["bank"]},
+            mf={k: [Decimal(units), Decimal(nav_sum), count] for k, units, nav_sum, count in raw["mf"]},
+            stocks={
+                k: [isin, Decimal(qty), Decimal(buy), Decimal(buy_qty)]
+                for k, isin, qty, buy, buy_qty in raw["stocks"]
+            },
+            foreign={k: [Decimal(shares), Decimal(value)] for k, shares, value in raw["foreign"]},
+            epf=raw["epf"],
+            ppf=raw["ppf"],
+            nps={k: Decimal(v) for k, v in raw["nps"]},
+            liabilities={k: [d, txn_id, outstanding] for k, d, txn_id, outstanding in raw["liabilities"]},
+        )
 
 
 class BalanceSheetService:
@@ -54,6 +219,9 @@ class BalanceSheetService:
             db_connection: SQLite connection object
         """
         self.conn = db_connection
+        # user_id -> earliest stale checkpoint seen by _load_checkpoint();
+        # removed by the next save_checkpoint()
+        self._stale_checkpoints: Dict[int, date] = {}
 
     def get_balance_sheet(
         self,
@@ -107,15 +275,18 @@ class BalanceSheetService:
         """, (user_id, as_of.isoformat(), as_of.isoformat()))
 
         for row in cursor.fetchall():
-            account_type = row[0]
-            balance = Decimal(str(row[1] or 0))
+            self._add_bank_balance(snapshot, row[0], row[1])
 
-            if account_type == 'SAVINGS':
-                snapshot.bank_savings += balance
-            elif account_type == 'CURRENT':
-                snapshot.bank_current += balance
-            elif account_type == 'FD':
-                snapshot.bank_fd += balance
+    def _add_bank_balance(self, snapshot: BalanceSheetSnapshot, account_type: str, balance) -> None:
+        """Add one account's latest balance to the snapshot."""
+        balance = Decimal(str(balance or 0))
+
+        if account_type == 'SAVINGS':
+            snapshot.bank_savings += balance
+        elif account_type == 'CURRENT':
+            snapshot.bank_current += balance
+        elif account_type == 'FD':
+            snapshot.bank_fd += balance
 
     def _populate_mutual_funds(
         self,
@@ -137,47 +308,63 @@ class BalanceSheetService:
             GROUP BY ms.id
             HAVING net_units > 0
         """, (user_id, as_of.isoformat()))
+        rows = cursor.fetchall()
+        latest_navs = self._get_latest_navs([row[0] for row in rows], as_of)
 
-        for row in cursor.fetchall():
+        for row in rows:
             scheme_id = row[0]
-            scheme_name = row[1]
-            asset_class = row[2]
-            isin = row[3]
             units = Decimal(str(row[4] or 0))
             avg_nav = Decimal(str(row[5] or 0))
 
             # Get latest NAV (or use average if not available)
-            current_nav = self._get_latest_nav(scheme_id) or avg_nav
-            total_value = units * current_nav
-
-            # Categorize by asset class
-            if asset_class == 'EQUITY':
-                snapshot.mutual_funds_equity += total_value
-                asset_cat = AssetCategory.MUTUAL_FUND_EQUITY
-            elif asset_class == 'DEBT':
-                snapshot.mutual_funds_debt += total_value
-                asset_cat = AssetCategory.MUTUAL_FUND_DEBT
-            elif asset_class == 'HYBRID':
-                snapshot.mutual_funds_hybrid += total_value
-                asset_cat = AssetCategory.MUTUAL_FUND_HYBRID
-            else:
-                snapshot.mutual_funds_liquid += total_value
-                asset_cat = AssetCategory.MUTUAL_FUND_LIQUID
-
-            # Add to holdings list for drill-down
-            snapshot.asset_holdings.append(AssetHolding(
-                asset_type=asset_cat,
-                asset_identifier=isin or str(scheme_id),
-                asset_name=scheme_name,
-                quantity=units,
-                unit_price=current_nav,
-                total_value=total_value,
-                cost_basis=units * avg_nav,  # Approximate cost
-                unrealized_gain=total_value - (units * avg_nav),
-                source_table="mf_schemes",
-                source_id=scheme_id,
-                as_of_date=as_of,
-            ))
+            current_nav = latest_navs.get(scheme_id) or avg_nav
+            self._add_mf_holding(
+                snapshot, scheme_id, row[1], row[2], row[3], units, avg_nav, current_nav, as_of
+            )
+
+    def _add_mf_holding(
+        self,
+        snapshot: BalanceSheetSnapshot,
+        scheme_id: int,
+        scheme_name: str,
+        asset_class: str,
+        isin: Optional[str],
+        units: Decimal,
+        avg_nav: Decimal,
+        current_nav: Decimal,
+        as_of: date
+    ) -> None:
+        """Add one mutual fund scheme holding to the snapshot."""
+        total_value = units * current_nav
+
+        # Categorize by asset class
+        if asset_class == 'EQUITY':
+            snapshot.mutual_funds_equity += total_value
+            asset_cat = AssetCategory.MUTUAL_FUND_EQUITY
+        elif asset_class == 'DEBT':
+            snapshot.mutual_funds_debt += total_value
+            asset_cat = AssetCategory.MUTUAL_FUND_DEBT
+        elif asset_class == 'HYBRID':
+            snapshot.mutual_funds_hybrid += total_value
+            asset_cat = AssetCategory.MUTUAL_FUND_HYBRID
+        else:
+            snapshot.mutual_funds_liquid += total_value
+            asset_cat = AssetCategory.MUTUAL_FUND_LIQUID
+
+        # Add to holdings list for drill-down
+        snapshot.asset_holdings.append(AssetHolding(
+            asset_type=asset_cat,
+            asset_identifier=isin or str(scheme_id),
+            asset_name=scheme_name,
+            quantity=units,
+            unit_price=current_nav,
+            total_value=total_value,
+            cost_basis=units * avg_nav,  # Approximate cost
+            unrealized_gain=total_value - (units * avg_nav),
+            source_table="mf_schemes",
+            source_id=scheme_id,
+            as_of_date=as_of,
+        ))
 
     def _populate_stocks(
         self,
@@ -200,34 +387,7 @@ class BalanceSheetService:
         """, (user_id, as_of.isoformat()))
 
         for row in cursor.fetchall():
-            symbol = row[0]
-            isin = row[1]
-            net_qty = int(row[2] or 0)
-            total_buy_cost = Decimal(str(row[3] or 0))
-            total_buy_qty = int(row[4] or 0)
-
-            # Calculate average cost
-            avg_cost = total_buy_cost / total_buy_qty if total_buy_qty > 0 else Decimal("0")
-
-            # Get current price (placeholder - would need external API)
-            current_price = avg_cost  # Use avg cost as placeholder
-            total_value = net_qty * current_price
-            cost_basis = net_qty * avg_cost
-
-            snapshot.stocks_indian += total_value
-
-            snapshot.asset_holdings.append(AssetHolding(
-                asset_type=AssetCategory.STOCK_INDIAN,
-                asset_identifier=isin or symbol,
-                asset_name=symbol,
-                quantity=Decimal(str(net_qty)),
-                unit_price=current_price,
-                total_value=total_value,
-                cost_basis=cost_basis,
-                unrealized_gain=total_value - cost_basis,
-                source_table="stock_trades",
-                as_of_date=as_of,
-            ))
+            self._add_stock_holding(snapshot, row[0], row[1], row[2], row[3], row[4], as_of)
 
         # Foreign stocks (from foreign holdings)
         cursor = self.conn.execute("""
@@ -239,29 +399,77 @@ class BalanceSheetService:
         """, (user_id, as_of.isoformat()))
 
         for row in cursor.fetchall():
-            symbol = row[0]
-            shares = Decimal(str(row[1] or 0))
-            value_usd = Decimal(str(row[2] or 0))
-
             # Convert to INR (approximate)
             exchange_rate = self._get_exchange_rate(as_of, "USD")
-            total_value = value_usd * exchange_rate
-
-            snapshot.stocks_foreign += total_value
-
-            snapshot.asset_holdings.append(AssetHolding(
-                asset_type=AssetCategory.STOCK_FOREIGN,
-                asset_identifier=symbol,
-                asset_name=f"{symbol} (US)",
-                quantity=shares,
-                unit_price=total_value / shares if shares > 0 else Decimal("0"),
-                total_value=total_value,
-                cost_basis=total_value,  # Would need proper cost tracking
-                unrealized_gain=Decimal("0"),
-                currency="USD",
-                source_table="foreign_holdings",
-                as_of_date=as_of,
-            ))
+            self._add_foreign_holding(snapshot, row[0], row[1], row[2], exchange_rate, as_of)
+
+    def _add_stock_holding(
+        self,
+        snapshot: BalanceSheetSnapshot,
+        symbol: str,
+        isin: Optional[str],
+        net_qty,
+        total_buy_cost,
+        total_buy_qty,
+        as_of: date
+    ) -> None:
+        """Add one Indian stock holding to the snapshot."""
+        net_qty = int(net_qty or 0)
+        total_buy_cost = Decimal(str(total_buy_cost or 0))
+        total_buy_qty = int(total_buy_qty or 0)
+
+        # Calculate average cost
+        avg_cost = total_buy_cost / total_buy_qty if total_buy_qty > 0 else Decimal("0")
+
+        # Get current price (placeholder - would need external API)
+        current_price = avg_cost  # Use avg cost as placeholder
+        total_value = net_qty * current_price
+        cost_basis = net_qty * avg_cost
+
+        snapshot.stocks_indian += total_value
+
+        snapshot.asset_holdings.append(AssetHolding(
+            asset_type=AssetCategory.STOCK_INDIAN,
+            asset_identifier=isin or symbol,
+            asset_name=symbol,
+            quantity=Decimal(str(net_qty)),
+            unit_price=current_price,
+            total_value=total_value,
+            cost_basis=cost_basis,
+            unrealized_gain=total_value - cost_basis,
+            source_table="stock_trades",
+            as_of_date=as_of,
+        ))
+
+    def _add_foreign_holding(
+        self,
+        snapshot: BalanceSheetSnapshot,
+        symbol: str,
+        shares,
+        value_usd,
+        exchange_rate: Decimal,
+        as_of: date
+    ) -> None:
+        """Add one foreign stock holding to the snapshot."""
+        shares = Decimal(str(shares or 0))
+        value_usd = Decimal(str(value_usd or 0))
+        total_value = value_usd * exchange_rate
+
+        snapshot.stocks_foreign += total_value
+
+        snapshot.asset_holdings.append(AssetHolding(
+            asset_type=AssetCategory.STOCK_FOREIGN,
+            asset_identifier=symbol,
+            asset_name=f"{symbol} (US)",
+            quantity=shares,
+            unit_price=total_value / shares if shares > 0 else Decimal("0"),
+            total_value=total_value,
+            cost_basis=total_value,  # Would need proper cost tracking
+            unrealized_gain=Decimal("0"),
+            currency="USD",
+            source_table="foreign_holdings",
+            as_of_date=as_of,
+        ))
 
     def _populate_retirement_funds(
         self,
@@ -347,74 +555,76 @@ class BalanceSheetService:
         """, (user_id, as_of.isoformat()))
 
         for row in cursor.fetchall():
-            liability_id = row[0]
-            liability_type = row[1]
-            lender = row[2]
-            principal = Decimal(str(row[3] or 0))
-            outstanding = Decimal(str(row[4] or principal))
-            interest_rate = Decimal(str(row[5] or 0))
-            emi = Decimal(str(row[6] or 0)) if row[6] else None
-            start_date = date.fromisoformat(row[7]) if isinstance(row[7], str) else row[7]
-            end_date = date.fromisoformat(row[8]) if row[8] and isinstance(row[8], str) else None
-
             # Get latest outstanding if liability_transactions exist
-            latest_outstanding = self._get_latest_outstanding(liability_id, as_of)
-            if latest_outstanding is not None:
-                outstanding = latest_outstanding
-
-            # Categorize
-            if liability_type == 'HOME_LOAN':
-                snapshot.home_loans += outstanding
-            elif liability_type == 'CAR_LOAN':
-                snapshot.car_loans += outstanding
-            elif liability_type == 'PERSONAL_LOAN':
-                snapshot.personal_loans += outstanding
-            elif liability_type == 'EDUCATION_LOAN':
-                snapshot.education_loans += outstanding
-            elif liability_type == 'CREDIT_CARD':
-                snapshot.credit_cards += outstanding
-            else:
-                snapshot.other_liabilities += outstanding
-
-            # Add to liability details
-            snapshot.liability_details.append(Liability(
-                id=liability_id,
-                liability_type=LiabilityType(liability_type),
-                lender_name=lender,
-                principal_amount=principal,
-                outstanding_amount=outstanding,
-                interest_rate=interest_rate,
-                emi_amount=emi,
-                start_date=start_date,
-                end_date=end_date,
-                is_active=True,
-            ))
+            latest_outstanding = self._get_latest_outstanding(row[0], as_of)
+            self._add_liability(snapshot, row, latest_outstanding)
 
-    def _get_latest_nav(self, scheme_id: int) -> Optional[Decimal]:
-        """Get latest NAV for a scheme (placeholder)."""
-        # Would integrate with NAV API or stored NAV history
-        cursor = self.conn.execute("""
-            SELECT nav FROM mf_transactions
-            WHERE folio_id IN (SELECT id FROM mf_folios WHERE scheme_id = ?)
-            ORDER BY date DESC
-            LIMIT 1
-        """, (scheme_id,))
+    def _add_liability(
+        self,
+        snapshot: BalanceSheetSnapshot,
+        row: tuple,
+        latest_outstanding: Optional[Decimal]
+    ) -> None:
+        """Add one liabilities row to the snapshot."""
+        liability_id = row[0]
+        liability_type = row[1]
+        lender = row[2]
+        principal = Decimal(str(row[3] or 0))
+        outstanding = Decimal(str(row[4] or principal))
+        interest_rate = Decimal(str(row[5] or 0))
+        emi = Decimal(str(row[6] or 0)) if row[6] else None
+        start_date = date.fromisoformat(row[7]) if isinstance(row[7], str) else row[7]
+        end_date = date.fromisoformat(row[8]) if row[8] and isinstance(row[8], str) else None
+
+        if latest_outstanding is not None:
+            outstanding = latest_outstanding
+
+        # Categorize
+        if liability_type == 'HOME_LOAN':
+            snapshot.home_loans += outstanding
+        elif liability_type == 'CAR_LOAN':
+            snapshot.car_loans += outstanding
+        elif liability_type == 'PERSONAL_LOAN':
+            snapshot.personal_loans += outstanding
+        elif liability_type == 'EDUCATION_LOAN':
+            snapshot.education_loans += outstanding
+        elif liability_type == 'CREDIT_CARD':
+            snapshot.credit_cards += outstanding
+        else:
+            snapshot.other_liabilities += outstanding
+
+        # Add to liability details
+        snapshot.liability_details.append(Liability(
+            id=liability_id,
+            liability_type=LiabilityType(liability_type),
+            lender_name=lender,
+            principal_amount=principal,
+            outstanding_amount=outstanding,
+            interest_rate=interest_rate,
+            emi_amount=emi,
+            start_date=start_date,
+            end_date=end_date,
+            is_active=True,
+        ))
+
+    def _get_latest_navs(self, scheme_ids: List[int], as_of: date) -> Dict[int, Optional[Decimal]]:
+        """
+        Get latest NAVs for schemes.
 
-        row = cursor.fetchone()
-        return Decimal(str(row[0])) if row and row[0] else None
+        Uses stored NAV history as of the snapshot date, falling back to
+        the NAV of the latest transaction for schemes without history.
+        """
+        navs = get_navs(self.conn, scheme_ids, [as_of], allow_interpolation=False)
+        latest = {scheme_id: nav for (scheme_id, _), nav in navs.items()}
+        missing = [scheme_id for scheme_id in scheme_ids if scheme_id not in latest]
+        if missing:
+            latest.update(get_transaction_navs(self.conn, missing))
+        return latest
 
     def _get_exchange_rate(self, as_of: date, currency: str) -> Decimal:
-        """Get exchange rate for a currency."""
-        cursor = self.conn.execute("""
-            SELECT rate FROM exchange_rates
-            WHERE from_currency = ? AND to_currency = 'INR'
-              AND date <= ?
-            ORDER BY date DESC
-            LIMIT 1
-        """, (currency, as_of.isoformat()))
-
-        row = cursor.fetchone()
-        return Decimal(str(row[0])) if row and row[0] else Decimal("83.5")  # Default
+        """Get exchange rate for a currency (latest rate on or before as_of)."""
+        rate = rate_calendar(self.conn, currency).rate_on(as_of, max_days_back=None)
+        return rate if rate else Decimal("83.5")  # Default
 
     def _get_latest_outstanding(self, liability_id: int, as_of: date) -> Optional[Decimal]:
         """Get latest outstanding amount from transactions."""
@@ -581,3 +791,388 @@ class BalanceSheetService:
             }
             for row in cursor.fetchall()
         ]
+
+    def get_balance_sheets(
+        self,
+        user_id: int,
+        dates: Iterable[date],
+        use_checkpoints: bool = True,
+        save: bool = False
+    ) -> List[BalanceSheetSnapshot]:
+        """
+        Generate balance sheets for several dates in one forward pass.
+
+        Gives the same snapshots as get_balance_sheet() for each date, but
+        starts from the latest valid checkpoint on or before the earliest
+        date and reads each source table once for the whole range.
+
+        Args:
+            user_id: User ID
+            dates: Snapshot dates (any order, duplicates ignored)
+            use_checkpoints: Resume from a stored checkpoint if one is valid
+            save: Save each snapshot, its asset holdings and a checkpoint
+
+        Returns:
+            Snapshots in ascending date order
+        """
+        targets = sorted(set(dates))
+        if not targets:
+            return []
+
+        state = self._load_checkpoint(user_id, targets[0]) if use_checkpoints else None
+        if state is None:
+            state = BalanceSheetState()
+
+        streams = self._load_state_changes(user_id, state, targets[-1])
+        account_types, schemes, liabilities = self._load_series_context(user_id)
+        navs, transaction_navs = self._load_series_navs(state, streams, targets)
+
+        positions = [0] * len(streams)
+        snapshots = []
+        for as_of in targets:
+            until = as_of.isoformat()
+            for i, (rows, apply) in enumerate(streams):
+                position = positions[i]
+                while position < len(rows) and rows[position][0] <= until:
+                    apply(rows[position])
+                    position += 1
+                positions[i] = position
+            state.as_of = as_of
+
+            snapshot = self._build_from_state(
+                state, account_types, schemes, liabilities, navs, transaction_navs
+            )
+            snapshots.append(snapshot)
+
+            if save:
+                self.save_balance_sheet(user_id, snapshot)
+                self.save_asset_holdings(user_id, snapshot.asset_holdings, as_of)
+                self.save_checkpoint(user_id, state)
+
+        return snapshots
+
+    def get_monthly_balance_sheets(
+        self,
+        user_id: int,
+        start_date: date,
+        end_date: date,
+        use_checkpoints: bool = True,
+        save: bool = False
+    ) -> List[BalanceSheetSnapshot]:
+        """
+        Generate month-end balance sheets between two dates.
+
+        Args:
+            user_id: User ID
+            start_date: First date of the series
+            end_date: Last date of the series
+            use_checkpoints: Resume from a stored checkpoint if one is valid
+            save: Save each snapshot, its asset holdings and a checkpoint
+
+        Returns:
+            One snapshot per month end in [start_date, end_date]
+        """
+        return self.get_balance_sheets(
+            user_id, month_ends(start_date, end_date),
+            use_checkpoints=use_checkpoints, save=save,
+        )
+
+    def _load_state_changes(
+        self,
+        user_id: int,
+        state: BalanceSheetState,
+        until: date
+    ) -> List[Tuple[list, Callable[[tuple], None]]]:
+        """
+        Load the rows dated after state.as_of and up to until.
+
+        Returns one (rows, apply) pair per state section; rows start with
+        their date and are ordered by (date, id).
+        """
+        after = state.as_of
+        window = "{column} <= ?" if after is None else "{column} > ? AND {column} <= ?"
+        window_params = [until.isoformat()] if after is None else [after.isoformat(), until.isoformat()]
+
+        def fetch(query: str, column: str) -> list:
+            sql = query.format(window=window.format(column=column))
+            return self.conn.execute(sql, [user_id] + window_params).fetchall()
+
+        bank_rows = fetch("""
+            SELECT bt.date, bt.id, bt.bank_account_id, bt.balance
+            FROM bank_transactions bt
+            JOIN bank_accounts ba ON ba.id = bt.bank_account_id
+            WHERE ba.user_id = ? AND {window}
+            ORDER BY bt.date, bt.id
+        """, "bt.date")
+        mf_rows = fetch("""
+            SELECT mt.date, mt.id, mf.scheme_id,
+                   CASE WHEN mt.transaction_type IN ('PURCHASE', 'SWITCH_IN', 'DIVIDEND_REINVEST')
+                       THEN mt.units ELSE -mt.units END,
+                   mt.nav
+            FROM mf_transactions mt
+            JOIN mf_folios mf ON mt.folio_id = mf.id
+            WHERE mf.user_id = ? AND {window}
+            ORDER BY mt.date, mt.id
+        """, "mt.date")
+        stock_rows = fetch("""
+            SELECT trade_date, id, symbol, isin, trade_type, quantity, net_amount
+            FROM stock_trades
+            WHERE user_id = ? AND trade_category = 'DELIVERY' AND {window}
+            ORDER BY trade_date, id
+        """, "trade_date")
+        foreign_rows = fetch("""
+            SELECT valuation_date, id, symbol, shares_held, total_value_usd
+            FROM foreign_holdings
+            WHERE user_id = ? AND {window}
+            ORDER BY valuation_date, id
+        """, "valuation_date")
+        epf_rows = fetch("""
+            SELECT et.transaction_date, et.id, et.employee_balance + et.employer_balance
+            FROM epf_transactions et
+            JOIN epf_accounts ea ON et.epf_account_id = ea.id
+            WHERE ea.user_id = ? AND {window}
+            ORDER BY et.transaction_date, et.id
+        """, "et.transaction_date")
+        ppf_rows = fetch("""
+            SELECT pt.transaction_date, pt.id, pt.balance
+            FROM ppf_transactions pt
+            JOIN ppf_accounts pa ON pt.ppf_account_id = pa.id
+            WHERE pa.user_id = ? AND {window}
+            ORDER BY pt.transaction_date, pt.id
+        """, "pt.transaction_date")
+        nps_rows = fetch("""
+            SELECT nt.transaction_date, nt.id, nt.tier, nt.amount
+            FROM nps_transactions nt
+            JOIN nps_accounts na ON nt.nps_account_id = na.id
+            WHERE na.user_id = ? AND nt.transaction_type = 'CONTRIBUTION' AND {window}
+            ORDER BY nt.transaction_date, nt.id
+        """, "nt.transaction_date")
+        liability_rows = fetch("""
+            SELECT lt.transaction_date, lt.id, lt.liability_id, lt.outstanding_after
+            FROM liability_transactions lt
+            JOIN liabilities l ON lt.liability_id = l.id
+            WHERE l.user_id = ? AND {window}
+            ORDER BY lt.transaction_date, lt.id
+        """, "lt.transaction_date")
+
+        return [
+            (bank_rows, state.apply_bank),
+            (mf_rows, state.apply_mf),
+            (stock_rows, state.apply_stock),
+            (foreign_rows, state.apply_foreign),
+            (epf_rows, state.apply_epf),
+            (ppf_rows, state.apply_ppf),
+            (nps_rows, state.apply_nps),
+            (liability_rows, state.apply_liability),
+        ]
+
+    def _load_series_context(
+        self,
+        user_id: int
+    ) -> Tuple[Dict[int, str], Dict[int, tuple], List[tuple]]:
+        """
+        Load the non-transactional data needed to build snapshots.
+
+        Returns:
+            (account type per bank account, (name, asset_class, isin) per
+            scheme, active liabilities rows)
+        """
+        account_types = dict(self.conn.execute(
+            "SELECT id, account_type FROM bank_accounts WHERE user_id = ?", (user_id,)
+        ).fetchall())
+
+        schemes = {
+            row[0]: row[1:]
+            for row in self.conn.execute("""
+                SELECT DISTINCT ms.id, ms.name, ms.asset_class, ms.isin
+                FROM mf_schemes ms
+                JOIN mf_folios mf ON mf.scheme_id = ms.id
+                WHERE mf.user_id = ?
+            """, (user_id,)).fetchall()
+        }
+
+        liabilities = self.conn.execute("""
+            SELECT id, liability_type, lender_name, principal_amount,
+                   outstanding_amount, interest_rate, emi_amount,
+                   start_date, end_date, is_active
+            FROM liabilities
+            WHERE user_id = ? AND is_active = TRUE
+            ORDER BY id
+        """, (user_id,)).fetchall()
+
+        return account_types, schemes, liabilities
+
+    def _load_series_navs(
+        self,
+        state: BalanceSheetState,
+        streams: List[Tuple[list, Callable[[tuple], None]]],
+        targets: List[date]
+    ) -> Tuple[Dict[Tuple[int, date], Decimal], Dict[int, Optional[Decimal]]]:
+        """
+        Look up NAVs for every scheme the series can hold, for all dates at once.
+
+        Returns:
+            (NAV history per (scheme_id, date), latest transaction NAV per
+            scheme for pairs without history)
+        """
+        mf_rows = streams[1][0]
+        scheme_ids = set(state.mf) | {row[2] for row in mf_rows}
+        navs = get_navs(self.conn, scheme_ids, targets, allow_interpolation=False)
+
+        missing = {
+            scheme_id for scheme_id in scheme_ids
+            if any((scheme_id, as_of) not in navs for as_of in targets)
+        }
+        transaction_navs = get_transaction_navs(self.conn, missing) if missing else {}
+        return navs, transaction_navs
+
+    def _build_from_state(
+        self,
+        state: BalanceSheetState,
+        account_types: Dict[int, str],
+        schemes: Dict[int, tuple],
+        liabilities: List[tuple],
+        navs: Dict[Tuple[int, date], Decimal],
+        transaction_navs: Dict[int, Optional[Decimal]]
+    ) -> BalanceSheetSnapshot:
+        """Build the snapshot for state.as_of from the running state."""
+        as_of = state.as_of
+        snapshot = BalanceSheetSnapshot(snapshot_date=as_of)
+
+        for account_id, (_, balance) in state.bank.items():
+            self._add_bank_balance(snapshot, account_types.get(account_id), balance)
+
+        for scheme_id in sorted(state.mf):
+            units, nav_sum, nav_count = state.mf[scheme_id]
+            if units <= 0 or scheme_id not in schemes:
+                continue
+            avg_nav = nav_sum / nav_count if nav_count else Decimal("0")
+            nav = navs.get((scheme_id, as_of))
+            if nav is None:
+                nav = transaction_navs.get(scheme_id)
+            name, asset_class, isin = schemes[scheme_id]
+            self._add_mf_holding(
+                snapshot, scheme_id, name, asset_class, isin, units, avg_nav, nav or avg_nav, as_of
+            )
+
+        for symbol in sorted(state.stocks):
+            isin, net_qty, total_buy, total_buy_qty = state.stocks[symbol]
+            if net_qty > 0:
+                self._add_stock_holding(snapshot, symbol, isin, net_qty, total_buy, total_buy_qty, as_of)
+
+        held_abroad = sorted(symbol for symbol, (shares, _) in state.foreign.items() if shares > 0)
+        if held_abroad:
+            exchange_rate = self._get_exchange_rate(as_of, "USD")
+            for symbol in held_abroad:
+                shares, value_usd = state.foreign[symbol]
+                self._add_foreign_holding(snapshot, symbol, shares, value_usd, exchange_rate, as_of)
+
+        if state.epf and state.epf[2]:
+            snapshot.epf_balance = Decimal(str(state.epf[2]))
+        if state.ppf and state.ppf[2]:
+            snapshot.ppf_balance = Decimal(str(state.ppf[2]))
+        if 'I' in state.nps:
+            snapshot.nps_tier1 = state.nps['I']
+        if 'II' in state.nps:
+            snapshot.nps_tier2 = state.nps['II']
+
+        until = as_of.isoformat()
+        for row in liabilities:
+            if row[7] is None or str(row[7]) > until:
+                continue
+            latest = state.liabilities.get(row[0])
+            outstanding = Decimal(str(latest[2])) if latest and latest[2] else None
+            self._add_liability(snapshot, row, outstanding)
+
+        return snapshot
+
+    def _source_marks(self, as_of: date) -> Dict[str, List[int]]:
+        """Get [COUNT(*), MAX(id)] of rows dated on or before as_of per source table."""
+        marks = {}
+        for table, date_column in CHECKPOINT_SOURCES:
+            row = self.conn.execute(
+                f"SELECT COUNT(*), COALESCE(MAX(id), 0) FROM {table} WHERE {date_column} <= ?",
+                (as_of.isoformat(),)
+            ).fetchone()
+            marks[table] = [row[0], row[1]]
+        return marks
+
+    def save_checkpoint(self, user_id: int, state: BalanceSheetState) -> None:
+        """
+        Store a running state so later series can resume from it.
+
+        Stale checkpoints found by an earlier load (and every later one,
+        which covers the same rows) are deleted in the same commit.
+
+        Args:
+            user_id: User ID
+            state: State to store (state.as_of is the checkpoint date)
+        """
+        stale_from = self._stale_checkpoints.pop(user_id, None)
+        if stale_from is not None:
+            self.conn.execute(
+                "DELETE FROM balance_sheet_checkpoints WHERE user_id = ? AND checkpoint_date >= ?",
+                (user_id, stale_from.isoformat())
+            )
+        self.conn.execute("""
+            INSERT OR REPLACE INTO balance_sheet_checkpoints (
+                user_id, checkpoint_date, state, source_marks, version
+            ) VALUES (?, ?, ?, ?, ?)
+        """, (
+            user_id,
+            state.as_of.isoformat(),
+            state.to_json(),
+            json.dumps(self._source_marks(state.as_of)),
+            CHECKPOINT_VERSION,
+        ))
+        self.conn.commit()
+
+    def _load_checkpoint(self, user_id: int, on_or_before: date) -> Optional[BalanceSheetState]:
+        """
+        Get the latest valid checkpoint on or before a date.
+
+        Checkpoints whose source rows changed since they were saved are
+        skipped and left for save_checkpoint() to delete; this read path
+        does not write.
+        """
+        rows = self.conn.execute("""
+            SELECT checkpoint_date, state, source_marks, version
+            FROM balance_sheet_checkpoints
+            WHERE user_id = ? AND checkpoint_date <= ?
+            ORDER BY checkpoint_date DESC
+        """, (user_id, on_or_before.isoformat())).fetchall()
+
+        stale_from = None
+        state = None
+        for checkpoint_date, state_json, marks_json, version in rows:
+            if (version == CHECKPOINT_VERSION
+                    and json.loads(marks_json) == self._source_marks(date.fromisoformat(checkpoint_date))):
+                state = BalanceSheetState.from_json(state_json)
+                break
+            stale_from = checkpoint_date
+
+        if stale_from is not None:
+            stale = date.fromisoformat(stale_from)
+            known = self._stale_checkpoints.get(user_id)
+            self._stale_checkpoints[user_id] = min(stale, known) if known else stale
+        return state
+
+    def clear_checkpoints(self, user_id: int, from_date: Optional[date] = None) -> int:
+        """
+        Delete stored checkpoints, e.g. after editing historical transactions.
+
+        Args:
+            user_id: User ID
+            from_date: Only delete checkpoints on or after this date
+
+        Returns:
+            Number of checkpoints deleted
+        """
+        query = "DELETE FROM balance_sheet_checkpoints WHERE user_id = ?"
+        params: list = [user_id]
+        if from_date:
+            query += " AND checkpoint_date >= ?"
+            params.append(from_date.isoformat())
+        cursor = self.conn.execute(query, params)
+        self.conn.commit()
+        return cursor.rowcount
@@ -5,9 +5,11 @@ Provides rule-based classification of bank transactions into
 income categories and expense categories for PFAS asset extraction.
 """
 
-from typing import Optional, Dict, List, Tuple
+from typing import Optional, Dict, Iterable, List, Tuple
 from dataclasses import dataclass
 
+from pfas.core.keyword_matcher import KeywordMatcher
+
 
 @dataclass
 class CategoryMapping:
@@ -191,39 +193,58 @@ class CategoryClassifier:
         self._build_rules()
 
     def _build_rules(self) -> None:
-        """Build sorted rules list from all categories."""
+        """Build sorted rules list and compile overrides + rules into one matcher."""
         all_rules = INCOME_CATEGORIES + TRANSFER_CATEGORIES
         # Sort by priority (descending)
         self.rules = sorted(all_rules, key=lambda x: x.priority, reverse=True)
 
+        # Overrides come first, each carrying the metadata of its category's rule
+        compiled = [
+            (self._override_result(category), [keyword])
+            for keyword, category in self.custom_overrides.items()
+        ]
+        compiled.extend(
+            ((rule.category, rule.sub_category, rule.is_income), rule.keywords)
+            for rule in self.rules
+        )
+        self._matcher = KeywordMatcher(compiled)
+
+    def _override_result(self, category: str) -> Tuple[str, Optional[str], bool]:
+        for rule in self.rules:
+            if rule.category == category:
+                return (category, rule.sub_category, rule.is_income)
+        return (category, None, False)
+
     def classify(self, description: str) -> Tuple[Optional[str], Optional[str], bool]:
         """
         Classify a transaction description.
 
+        Custom overrides are checked first, then rules by priority.
+
         Args:
             description: Transaction description/narration
 
         Returns:
             Tuple of (category, sub_category, is_income)
         """
-        description_upper = description.upper()
+        return self._matcher.match(description) or ("OTHER", None, False)
 
-        # Check custom overrides first
-        for keyword, category in self.custom_overrides.items():
-            if keyword.upper() in description_upper:
-                # Find matching rule for category metadata
-                for rule in self.rules:
-                    if rule.category == category:
-                        return (category, rule.sub_category, rule.is_income)
-                return (category, None, False)
+    def classify_many(
+        self, descriptions: Iterable[str]
+    ) -> List[Tuple[Optional[str], Optional[str], bool]]:
+        """
+        Classify a batch of transaction descriptions.
 
-        # Check rules by priority
-        for rule in self.rules:
-            for keyword in rule.keywords:
-                if keyword.upper() in description_upper:
-                    return (rule.category, rule.sub_category, rule.is_income)
+        Args:
+            descriptions: Transaction descriptions/narrations
 
-        return ("OTHER", None, False)
+        Returns:
+            List of (category, sub_category, is_income), one per description
+        """
+        return [
+            result or ("OTHER", None, False)
+            for result in self._matcher.match_many(descriptions)
+        ]
 
     def get_asset_mapping(self, category: str) -> Optional[Tuple[str, str]]:
         """
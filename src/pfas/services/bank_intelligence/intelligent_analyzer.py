@@ -22,6 +22,8 @@ try:
 except ImportError:
     HAS_RAPIDFUZZ = False
 
+from pfas.parsers.columns import date_column
+
 from .models import (
     BankTransactionIntel, UserBankConfig, IngestionResult, TransactionType
 )
@@ -389,12 +391,10 @@ class BankIntelligenceAnalyzer:
 
             result.transactions_processed = len(transactions)
 
-            # Insert transactions
-            for txn in transactions:
-                if self._insert_transaction(txn):
-                    result.transactions_inserted += 1
-                else:
-                    result.transactions_skipped += 1  # Duplicate
+            # Insert transactions (duplicates skipped)
+            inserted = self._insert_transactions(transactions)
+            result.transactions_inserted = inserted
+            result.transactions_skipped = len(transactions) - inserted
 
             # Log ingestion
             self._log_ingestion(result, user_name, bank_name, file_path)
@@ -445,7 +445,8 @@ class BankIntelligenceAnalyzer:
 
         # Only check first 20 rows
         for idx in range(min(20, len(df))):
-            row_values = df.iloc[idx].astype(str).tolist()
+            # str() per cell: newer pandas keeps NaN as float under astype(str)
+            row_values = [str(v) for v in df.iloc[idx].tolist()]
             row_text = " ".join(row_values).upper()
 
             # Count keyword matches
@@ -580,74 +581,105 @@ class BankIntelligenceAnalyzer:
         source_file: str,
         config: Optional[UserBankConfig] = None
     ) -> List[BankTransactionIntel]:
-        """Parse DataFrame rows into transactions."""
-        transactions = []
+        """
+        Parse DataFrame rows into transactions.
 
-        for _, row in df.iterrows():
-            try:
-                # Parse date
-                date_val = row.get(column_map["date"])
-                txn_date = self._parse_date(date_val, config)
-                if txn_date is None:
-                    continue
-
-                # Get description
-                description = str(row.get(column_map["description"], ""))
-                if not description or description.lower() in ['nan', 'none', '']:
-                    continue
-
-                # Parse amounts
-                debit = Decimal("0")
-                credit = Decimal("0")
-
-                if "debit" in column_map:
-                    debit = self._parse_amount(row.get(column_map["debit"]))
-                if "credit" in column_map:
-                    credit = self._parse_amount(row.get(column_map["credit"]))
-
-                # Skip if no amount
-                if debit == 0 and credit == 0:
-                    continue
-
-                # Determine transaction type
-                if debit > 0:
-                    txn_type = TransactionType.DEBIT
-                    amount = debit
-                else:
-                    txn_type = TransactionType.CREDIT
-                    amount = credit
-
-                # Parse balance
-                balance = None
-                if "balance" in column_map:
-                    balance = self._parse_amount(row.get(column_map["balance"]))
-                    if balance == 0:
-                        balance = None
-
-                # Classify category
-                category, sub_category, is_income = self.classifier.classify(description)
-
-                # Create transaction
-                txn = BankTransactionIntel(
-                    user_name=user_name,
-                    bank_name=bank_name,
-                    txn_date=txn_date,
-                    base_string=description,
-                    amount=amount,
-                    txn_type=txn_type,
-                    balance=balance,
-                    category=category,
-                    sub_category=sub_category,
-                    source_file=source_file
-                )
+        Works column-at-a-time: dates are parsed per configured format over
+        the whole column, amounts are cleaned with vectorized string ops and
+        descriptions are classified in one batch. Produces the same
+        transactions as parsing each row with _parse_date/_parse_amount.
+        """
+        if df.empty:
+            return []
+
+        dates = self._parse_date_column(df[column_map["date"]], config)
+        descriptions = [str(v) for v in df[column_map["description"]].tolist()]
+
+        zeros = [Decimal("0")] * len(df)
+        debits = self._parse_amount_column(df[column_map["debit"]]) if "debit" in column_map else zeros
+        credits = self._parse_amount_column(df[column_map["credit"]]) if "credit" in column_map else zeros
+        balances = self._parse_amount_column(df[column_map["balance"]]) if "balance" in column_map else zeros
+
+        # Rows with a date, a description and an amount
+        rows = [
+            i for i, (txn_date, description, debit, credit)
+            in enumerate(zip(dates, descriptions, debits, credits))
+            if txn_date is not None
+            and description.lower() not in ('nan', 'none', '')
+            and (debit != 0 or credit != 0)
+        ]
 
-                transactions.append(txn)
+        classifications = self.classifier.classify_many(descriptions[i] for i in rows)
 
-            except Exception:
-                continue  # Skip problematic rows
+        transactions = []
+        for i, (category, sub_category, _) in zip(rows, classifications):
+            if debits[i] > 0:
+                txn_type = TransactionType.DEBIT
+                amount = debits[i]
+            else:
+                txn_type = TransactionType.CREDIT
+                amount = credits[i]
+
+            transactions.append(BankTransactionIntel(
+                user_name=user_name,
+                bank_name=bank_name,
+                txn_date=dates[i],
+                base_string=descriptions[i],
+                amount=amount,
+                txn_type=txn_type,
+                balance=balances[i] or None,
+                category=category,
+                sub_category=sub_category,
+                source_file=source_file
+            ))
 
         return transactions
 
+    def _parse_date_column(
+        self, values: pd.Series, config: Optional[UserBankConfig] = None
+    ) -> List[Optional[date]]:
+        """
+        Parse a date column, one pass per candidate format.
+
+        Cells that no format matches (out-of-range years, free-form
+        dates) fall back to _parse_date.
+        """
+        formats = DATE_FORMATS
+        if config and config.date_format:
+            formats = [config.date_format] + DATE_FORMATS
+
+        return date_column(values, formats, lambda text: self._parse_date(text, config))
+
+    def _parse_amount_column(self, values: pd.Series) -> List[Decimal]:
+        """Parse an amount column; same rules as _parse_amount."""
+        missing = values.isna().tolist()
+        text = pd.Series([str(v) for v in values.tolist()], dtype=object)
+        text = (
+            text.str.strip()
+            .str.replace(",", "", regex=False)
+            .str.replace("₹", "", regex=False)
+            .str.replace("$", "", regex=False)
+            .str.replace("(", "-", regex=False)
+            .str.replace(")", "", regex=False)
+            .str.strip()
+        )
+
+        # Statement columns repeat amounts (and blanks) heavily
+        decimals: Dict[str, Decimal] = {}
+        for amount_str in text.unique().tolist():
+            if amount_str.lower() in ('nan', 'none', '', '-'):
+                decimals[amount_str] = Decimal("0")
+                continue
+            try:
+                decimals[amount_str] = Decimal(amount_str)
+            except InvalidOperation:
+                decimals[amount_str] = Decimal("0")
+
+        return [
+            Decimal("0") if is_missing else decimals[amount_str]
+            for is_missing, amount_str in zip(missing, text.tolist())
+        ]
+
     def _parse_date(
         self, date_val: Any, config: Optional[UserBankConfig] = None
     ) -> Optional[date]:
@@ -744,6 +776,68 @@ class BankIntelligenceAnalyzer:
             # Duplicate UID
             return False
 
+    def _insert_transactions(self, transactions: List[BankTransactionIntel]) -> int:
+        """
+        Insert a file's transactions in one database transaction.
+
+        UIDs already stored (or repeated within the file) are dropped with
+        one set-based lookup before the rows go in via executemany.
+
+        Returns:
+            Number of transactions inserted
+        """
+        new_rows: Dict[str, BankTransactionIntel] = {}
+        for txn in transactions:
+            new_rows.setdefault(txn.uid, txn)
+
+        uids = list(new_rows)
+        # Stay well below SQLite's host-parameter limit
+        for start in range(0, len(uids), 900):
+            batch = uids[start:start + 900]
+            placeholders = ",".join("?" for _ in batch)
+            cursor = self.conn.execute(
+                f"SELECT uid FROM bank_transactions_intel WHERE uid IN ({placeholders})",
+                batch,
+            )
+            for row in cursor.fetchall():
+                del new_rows[row[0]]
+
+        if not new_rows:
+            return 0
+
+        rows = []
+        for txn in new_rows.values():
+            data = txn.to_dict()
+            rows.append((
+                data["uid"],
+                data["user_name"],
+                data["bank_name"],
+                data["txn_date"],
+                data["value_date"],
+                data["remarks"],
+                data["base_string"],
+                data["amount"],
+                data["txn_type"],
+                data["balance"],
+                data["category"],
+                data["sub_category"],
+                data["fiscal_year"],
+                data["source_file"],
+            ))
+
+        with self.conn:
+            self.conn.executemany(
+                """
+                INSERT INTO bank_transactions_intel
+                (uid, user_name, bank_name, txn_date, value_date, remarks,
+                 base_string, amount, txn_type, balance, category, sub_category,
+                 fiscal_year, source_file)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                rows,
+            )
+        return len(rows)
+
     def _log_ingestion(
         self,
         result: IngestionResult,
@@ -3,23 +3,34 @@ Batch Ingester for PFAS.
 
 Provides atomic batch ingestion with rollback on partial failure.
 All files in a batch are processed as a single unit - either all succeed or all fail.
+
+With workers > 1, raw extraction runs in a process pool (files are hashed up
+front through the shared fingerprint cache) while a single writer applies the
+results to SQLite in input order.
 """
 
-import hashlib
 import logging
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Callable, Type
+from typing import List, Optional, Dict, Any, Callable, Iterator, Tuple, Type, Union
 import sqlite3
 
+from pfas.core.accounts import get_account_directory
 from pfas.core.exceptions import BatchIngestionError, PFASError
-from pfas.core.audit import AuditLogger
+from pfas.core.audit import AuditLogger, AuditMode, audit_session, get_audit_context
+from pfas.core.database import schema_is_current
+from pfas.core.fingerprint import file_fingerprint, get_fingerprint_cache
 from pfas.core.security import require_user_context
 
 logger = logging.getLogger(__name__)
 
+# Schema-only connection used by parsers constructed in worker processes
+_worker_conn: Optional[sqlite3.Connection] = None
+
 
 class FileStatus(Enum):
     """Status of individual file processing."""
@@ -58,6 +69,7 @@ class BatchResult:
     error_message: Optional[str] = None
     batch_id: Optional[str] = None
     processing_time_ms: int = 0
+    account_lookups_avoided: int = 0
 
     def add_file_result(self, result: FileResult) -> None:
         """Add a file result to the batch."""
@@ -71,6 +83,51 @@ class BatchResult:
             self.files_skipped += 1
 
 
+@dataclass
+class _PreparedFile:
+    """
+    Work done for a file ahead of the writer (extraction in a worker process).
+
+    raw_records is None when the parser has no separate extraction step
+    (or extraction could not run in the worker); the writer then parses
+    the file itself.
+    """
+
+    file_hash: Optional[str] = None
+    raw_records: Optional[List[Any]] = None
+    parse_result: Optional[Any] = None
+
+
+def _get_worker_connection() -> sqlite3.Connection:
+    """Get this worker process's in-memory connection with the PFAS schema."""
+    global _worker_conn
+    if _worker_conn is None:
+        from pfas.core.database import SCHEMA_SQL
+
+        _worker_conn = sqlite3.connect(":memory:")
+        _worker_conn.executescript(SCHEMA_SQL)
+    return _worker_conn
+
+
+def _extract_file(
+    file_path: Path,
+    parser_class: Type,
+    parser_kwargs: Dict[str, Any]
+) -> _PreparedFile:
+    """
+    Run a parser's extraction step in a worker process.
+
+    The parser is bound to a throwaway in-memory database; extract_raw()
+    must not write, so nothing reaches the real database from here.
+    """
+    from pfas.parsers.base import NormalizationResult
+
+    parse_result = NormalizationResult(success=True)
+    parser = parser_class(_get_worker_connection(), **parser_kwargs)
+    raw_records = parser.extract_raw(file_path, parse_result)
+    return _PreparedFile(raw_records=raw_records, parse_result=parse_result)
+
+
 class BatchIngester:
     """
     Batch file ingester with atomic transaction support.
@@ -82,7 +139,8 @@ class BatchIngester:
     - Atomic batch processing (all or nothing)
     - File-level deduplication via MD5 hash
     - Progress tracking and detailed results
-    - Audit logging for compliance
+    - Audit logging for compliance (full, summary or deferred per file)
+    - Optional parallel hashing/extraction (workers > 1)
 
     Usage:
         ingester = BatchIngester(conn, user_id=1)
@@ -96,6 +154,12 @@ class BatchIngester:
         files = list(Path("inbox").glob("*"))
         result = ingester.ingest_batch(files)
 
+        # Extract in 4 processes; writes stay sequential
+        result = ingester.ingest_batch(files, workers=4)
+
+        # One compact audit record per file instead of one per row
+        ingester = BatchIngester(conn, user_id=1, audit_mode="deferred")
+
         if result.success:
             print(f"Processed {result.total_records} records from {result.files_processed} files")
         else:
@@ -106,7 +170,8 @@ class BatchIngester:
         self,
         db_connection: sqlite3.Connection,
         user_id: int,
-        audit_source: str = "batch_ingester"
+        audit_source: str = "batch_ingester",
+        audit_mode: Union[AuditMode, str] = AuditMode.FULL
     ):
         """
         Initialize batch ingester.
@@ -115,15 +180,21 @@ class BatchIngester:
             db_connection: Database connection
             user_id: User ID for all operations
             audit_source: Source identifier for audit logs
+            audit_mode: Audit mode applied while each file is written
+                (see pfas.core.audit.AuditMode)
         """
         self.conn = db_connection
         self.user_id = user_id
         self.audit_source = audit_source
+        self.audit_mode = AuditMode(audit_mode)
         self._parsers: Dict[str, Type] = {}
         self._ensure_tables_exist()
 
     def _ensure_tables_exist(self) -> None:
         """Ensure required tables exist."""
+        if schema_is_current(self.conn):
+            return  # Created by the schema bootstrap
+
         self.conn.execute("""
             CREATE TABLE IF NOT EXISTS processed_files (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -207,11 +278,7 @@ class BatchIngester:
         Returns:
             MD5 hash string
         """
-        hasher = hashlib.md5()
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                hasher.update(chunk)
-        return hasher.hexdigest()
+        return file_fingerprint(file_path, "md5")
 
     def is_file_processed(self, file_hash: str) -> bool:
         """
@@ -235,19 +302,29 @@ class BatchIngester:
         files: List[Path],
         user_id: int = None,
         stop_on_error: bool = True,
-        dry_run: bool = False
+        dry_run: bool = False,
+        workers: int = 1
     ) -> BatchResult:
         """
         Ingest a batch of files atomically.
 
         All files are processed within a single transaction. If any file fails
-        and stop_on_error is True, the entire batch is rolled back.
+        and stop_on_error is True, the entire batch is rolled back; otherwise
+        only the failed file's rows are rolled back (per-file savepoint).
+
+        With workers > 1, extraction (parse_raw) runs in a process pool after
+        the files are hashed through the fingerprint cache. Writes still happen on this connection, one file at a time, in
+        the order given, so FIFO-sensitive MF/stock files for the same folio
+        or symbol are applied exactly as in sequential mode and FileResult
+        accounting is unchanged.
 
         Args:
             files: List of file paths to process
             user_id: User ID (validated by decorator, uses self.user_id if not provided)
             stop_on_error: Stop and rollback on first error (default: True)
             dry_run: Validate without committing (default: False)
+            workers: Worker processes for extraction (default: 1, fully
+                sequential)
 
         Returns:
             BatchResult with processing details
@@ -258,7 +335,10 @@ class BatchIngester:
         if user_id is None:
             user_id = self.user_id
 
-        batch_id = f"batch_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{user_id}"
+        if workers < 1:
+            raise ValueError(f"workers must be positive, got {workers}")
+
+        batch_id = f"batch_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}_{user_id}"
         start_time = datetime.now()
 
         result = BatchResult(
@@ -276,11 +356,16 @@ class BatchIngester:
             result.error_message = "No files to process"
             return result
 
+        account_directory = get_account_directory(self.conn)
+        lookups_avoided_start = account_directory.lookups_avoided if account_directory else 0
+
         # Record batch start
         self.conn.execute("""
             INSERT INTO batch_runs (batch_id, user_id, files_count, status)
             VALUES (?, ?, ?, 'processing')
         """, (batch_id, user_id, len(files)))
+        # Commit the start marker so BEGIN IMMEDIATE below opens a fresh transaction
+        self.conn.commit()
 
         cursor = self.conn.cursor()
 
@@ -288,24 +373,44 @@ class BatchIngester:
             # Begin atomic transaction
             cursor.execute("BEGIN IMMEDIATE")
 
-            for file_path in files:
-                file_start = datetime.now()
-                file_result = self._process_single_file(
-                    file_path=file_path,
-                    user_id=user_id,
-                    batch_id=batch_id
-                )
-
-                file_result.processing_time_ms = int(
-                    (datetime.now() - file_start).total_seconds() * 1000
-                )
-                result.add_file_result(file_result)
-
-                if file_result.status == FileStatus.FAILED and stop_on_error:
-                    raise BatchIngestionError(
-                        f"File processing failed: {file_path}",
-                        failed_files=[str(file_path)]
+            with self._prepare_files(files, workers) as prepared_files:
+                for file_path, prepared in prepared_files:
+                    file_start = datetime.now()
+                    # Each file's rows (and their audit records) are kept or
+                    # dropped together; writers inside join this savepoint
+                    cursor.execute("SAVEPOINT batch_file")
+                    try:
+                        with audit_session(
+                            self.conn,
+                            self.audit_mode,
+                            label=Path(file_path).name,
+                            user_id=user_id,
+                            source=self.audit_source
+                        ):
+                            file_result = self._process_single_file(
+                                file_path=file_path,
+                                user_id=user_id,
+                                batch_id=batch_id,
+                                prepared=prepared
+                            )
+                    except BaseException:
+                        cursor.execute("ROLLBACK TO SAVEPOINT batch_file")
+                        cursor.execute("RELEASE SAVEPOINT batch_file")
+                        raise
+                    if file_result.status == FileStatus.FAILED:
+                        cursor.execute("ROLLBACK TO SAVEPOINT batch_file")
+                    cursor.execute("RELEASE SAVEPOINT batch_file")
+
+                    file_result.processing_time_ms = int(
+                        (datetime.now() - file_start).total_seconds() * 1000
                     )
+                    result.add_file_result(file_result)
+
+                    if file_result.status == FileStatus.FAILED and stop_on_error:
+                        raise BatchIngestionError(
+                            f"File processing failed: {file_path}",
+                            failed_files=[str(file_path)]
+                        )
 
             # All files processed successfully
             if dry_run:
@@ -357,13 +462,89 @@ class BatchIngester:
             (datetime.now() - start_time).total_seconds() * 1000
         )
 
+        if account_directory is not None:
+            result.account_lookups_avoided = (
+                account_directory.lookups_avoided - lookups_avoided_start
+            )
+            logger.info(
+                f"Batch {batch_id}: {result.account_lookups_avoided} account lookups "
+                f"served from AccountDirectory"
+            )
+
         return result
 
+    @contextmanager
+    def _prepare_files(
+        self,
+        files: List[Path],
+        workers: int
+    ) -> Iterator[Iterator[Tuple[Path, Optional[_PreparedFile]]]]:
+        """
+        Yield (file_path, prepared) pairs in input order.
+
+        Sequential mode yields None for every file. Parallel mode hashes all
+        files first, then submits extraction for files that have a
+        parser with an extract_raw() step and are not already processed.
+        Results are consumed in input order, so the writer sees the same
+        sequence as in sequential mode.
+        """
+        if workers == 1:
+            yield ((file_path, None) for file_path in files)
+            return
+
+        pool = ProcessPoolExecutor(max_workers=workers)
+        try:
+            yield self._iter_prepared(pool, files)
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def _iter_prepared(
+        self,
+        pool: ProcessPoolExecutor,
+        files: List[Path]
+    ) -> Iterator[Tuple[Path, Optional[_PreparedFile]]]:
+        """Hash files (threads, shared cache), submit extraction and collect in order."""
+        paths = [Path(f) for f in files]
+        hashes = get_fingerprint_cache().hash_many(
+            (path for path in paths if path.exists()), "md5"
+        )
+
+        extractions: List[Optional[Future]] = []
+        for path in paths:
+            spec = self._parsers.get(path.suffix.lower())
+            if (path not in hashes or spec is None
+                    or not hasattr(spec[0], "extract_raw")
+                    or self.is_file_processed(hashes[path])):
+                extractions.append(None)
+                continue
+            parser_class, kwargs = spec
+            extractions.append(pool.submit(_extract_file, path, parser_class, kwargs))
+
+        for path, extraction in zip(paths, extractions):
+            if path not in hashes:
+                # Let the writer report missing/unreadable files as usual
+                yield path, None
+                continue
+
+            prepared = _PreparedFile(file_hash=hashes[path])
+            if extraction is not None:
+                try:
+                    extracted = extraction.result()
+                    prepared.raw_records = extracted.raw_records
+                    prepared.parse_result = extracted.parse_result
+                except Exception as e:
+                    logger.warning(
+                        f"Parallel extraction failed for {path.name}, "
+                        f"parsing in writer: {e}"
+                    )
+            yield path, prepared
+
     def _process_single_file(
         self,
         file_path: Path,
         user_id: int,
-        batch_id: str
+        batch_id: str,
+        prepared: Optional[_PreparedFile] = None
     ) -> FileResult:
         """
         Process a single file within the batch transaction.
@@ -372,6 +553,8 @@ class BatchIngester:
             file_path: Path to file
             user_id: User ID
             batch_id: Batch identifier
+            prepared: Hash and extracted records from a worker process
+                (parallel mode only)
 
         Returns:
             FileResult with processing details
@@ -387,7 +570,10 @@ class BatchIngester:
 
         # Calculate hash for deduplication
         try:
-            file_hash = self.calculate_file_hash(file_path)
+            if prepared is not None and prepared.file_hash:
+                file_hash = prepared.file_hash
+            else:
+                file_hash = self.calculate_file_hash(file_path)
         except Exception as e:
             return FileResult(
                 file_path=file_path,
@@ -417,7 +603,12 @@ class BatchIngester:
 
         # Parse file
         try:
-            parse_result = parser.parse(file_path)
+            if prepared is not None and prepared.raw_records is not None:
+                parse_result = parser.normalize_records(
+                    prepared.raw_records, prepared.parse_result
+                )
+            else:
+                parse_result = parser.parse(file_path)
 
             if not parse_result.success:
                 return FileResult(
@@ -430,7 +621,7 @@ class BatchIngester:
             records_count = len(parse_result.transactions) if hasattr(parse_result, 'transactions') else 0
 
             # Record successful processing
-            self.conn.execute("""
+            cursor = self.conn.execute("""
                 INSERT INTO processed_files
                 (file_hash, file_name, file_path, file_size, user_id, batch_id, parser_type, records_count, status)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, 'success')
@@ -445,18 +636,22 @@ class BatchIngester:
                 records_count
             ))
 
-            # Log audit entry
-            audit_logger = AuditLogger(self.conn, user_id=user_id, source=self.audit_source)
-            audit_logger.log_insert(
-                table_name="processed_files",
-                record_id=0,  # Will be set by database
-                new_values={
-                    "file_name": file_path.name,
-                    "file_hash": file_hash,
-                    "records_count": records_count,
-                    "batch_id": batch_id
-                }
-            )
+            # Log audit entry (folded into the file's batch record when deferred)
+            audit_context = get_audit_context(self.conn)
+            if audit_context is not None and audit_context.batch is not None:
+                audit_context.batch.add("processed_files", cursor.lastrowid)
+            else:
+                audit_logger = AuditLogger(self.conn, user_id=user_id, source=self.audit_source)
+                audit_logger.log_insert(
+                    table_name="processed_files",
+                    record_id=cursor.lastrowid,
+                    new_values={
+                        "file_name": file_path.name,
+                        "file_hash": file_hash,
+                        "records_count": records_count,
+                        "batch_id": batch_id
+                    }
+                )
 
             return FileResult(
                 file_path=file_path,
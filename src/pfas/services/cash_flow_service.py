@@ -16,6 +16,7 @@ from typing import List, Optional, Dict, Any
 import json
 import sqlite3
 
+from pfas.core.keyword_matcher import KeywordMatcher
 from pfas.core.models import (
     CashFlow,
     CashFlowStatement,
@@ -178,6 +179,15 @@ class CashFlowStatementService:
             db_connection: SQLite connection object
         """
         self.conn = db_connection
+        # Rules only apply in their own direction: one matcher per side
+        self._rule_matchers = {
+            is_credit: KeywordMatcher(
+                (rule, rule.keywords)
+                for rule in self.CLASSIFICATION_RULES
+                if (rule.flow_direction == FlowDirection.INFLOW) == is_credit
+            )
+            for is_credit in (True, False)
+        }
 
     def get_cash_flow_statement(
         self,
@@ -505,19 +515,14 @@ class CashFlowStatementService:
         Returns:
             Dict with activity_type, flow_direction, category or None
         """
-        desc_upper = description.upper()
-
-        # Try rule-based classification
-        for rule in self.CLASSIFICATION_RULES:
-            if any(kw in desc_upper for kw in rule.keywords):
-                # Check if direction matches
-                expected_credit = rule.flow_direction == FlowDirection.INFLOW
-                if is_credit == expected_credit:
-                    return {
-                        "activity_type": rule.activity_type,
-                        "flow_direction": rule.flow_direction,
-                        "category": rule.category.value,
-                    }
+        # Try rule-based classification (first matching rule of this direction)
+        rule = self._rule_matchers[is_credit].match(description)
+        if rule is not None:
+            return {
+                "activity_type": rule.activity_type,
+                "flow_direction": rule.flow_direction,
+                "category": rule.category.value,
+            }
 
         # Default classification based on debit/credit
         if is_credit:
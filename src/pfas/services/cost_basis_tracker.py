@@ -7,15 +7,20 @@ Provides FIFO and Average Cost tracking for:
 - Foreign stocks (RSU, ESPP)
 
 Ensures ledger entries stay in sync with holdings tables.
+
+For bulk work (a year's tradebook) preload_lots() fetches every open lot
+of a user/asset type in one query and deplete_many() applies a whole sell
+ledger in memory, writing units_remaining back in one executemany.
 """
 
 import logging
 import sqlite3
-from dataclasses import dataclass, field
+from bisect import bisect_right
+from dataclasses import dataclass, field, replace
 from datetime import date
 from decimal import Decimal, ROUND_HALF_UP
 from enum import Enum
-from typing import Optional, List, Dict, Tuple
+from typing import Iterable, Optional, List, Dict, Set, Tuple
 
 from pfas.core.exceptions import InsufficientSharesError, AccountingBalanceError
 
@@ -62,6 +67,15 @@ class CostBasisResult:
     holding_period_days: int = 0
 
 
+@dataclass
+class LotSale:
+    """One sale in a sell ledger passed to CostBasisTracker.deplete_many()."""
+    symbol: str
+    units: Decimal
+    sell_date: date
+    sale_proceeds: Optional[Decimal] = None
+
+
 @dataclass
 class HoldingSummary:
     """Summary of holdings with cost basis."""
@@ -107,7 +121,12 @@ class CostBasisTracker:
         """
         self.conn = db_connection
         self.cost_method = cost_method
-        self._lots_cache: Dict[str, List[Lot]] = {}
+        # "user_id:asset_type:symbol" -> open lots in FIFO order.
+        # None marks an entry whose rows changed and must be re-read.
+        self._lots_cache: Dict[str, Optional[List[Lot]]] = {}
+        # (user_id, asset_type) pairs whose open lots are all cached, so a
+        # missing symbol has no open lots
+        self._preloaded: Set[Tuple[int, str]] = set()
 
     def record_purchase(
         self,
@@ -161,10 +180,25 @@ class CostBasisTracker:
 
         lot_id = cursor.lastrowid
 
-        # Invalidate cache for this symbol
+        # Keep a cached lot list current rather than re-reading it
         cache_key = f"{user_id}:{asset_type}:{symbol}"
-        if cache_key in self._lots_cache:
-            del self._lots_cache[cache_key]
+        lots = self._lots_cache.get(cache_key)
+        if lots is None and cache_key not in self._lots_cache \
+                and (user_id, asset_type) in self._preloaded:
+            lots = self._lots_cache[cache_key] = []
+        if lots is not None:
+            lot = Lot(
+                lot_id=lot_id,
+                acquisition_date=purchase_date,
+                units_acquired=units,
+                units_remaining=units,
+                cost_per_unit=cost_per_unit,
+                total_cost=total_cost,
+                currency=currency,
+                reference=reference,
+            )
+            position = bisect_right([l.acquisition_date for l in lots], purchase_date)
+            lots.insert(position, lot)
 
         logger.debug(f"Created lot {lot_id}: {units} units of {symbol} @ {cost_per_unit}")
         return lot_id
@@ -215,7 +249,20 @@ class CostBasisTracker:
     ) -> CostBasisResult:
         """Calculate cost basis using FIFO method."""
         lots = self._load_lots(user_id, asset_type, symbol)
+        return self._fifo_cost_from_lots(
+            lots, asset_type, symbol, units_to_sell, sell_date, sale_proceeds
+        )
 
+    def _fifo_cost_from_lots(
+        self,
+        lots: List[Lot],
+        asset_type: str,
+        symbol: str,
+        units_to_sell: Decimal,
+        sell_date: date,
+        sale_proceeds: Optional[Decimal]
+    ) -> CostBasisResult:
+        """Match a sale against open lots in FIFO order."""
         # Check total available
         total_available = sum(lot.units_remaining for lot in lots)
         if total_available < units_to_sell:
@@ -290,7 +337,20 @@ class CostBasisTracker:
     ) -> CostBasisResult:
         """Calculate cost basis using weighted average cost method."""
         lots = self._load_lots(user_id, asset_type, symbol)
+        return self._average_cost_from_lots(
+            lots, asset_type, symbol, units_to_sell, sell_date, sale_proceeds
+        )
 
+    def _average_cost_from_lots(
+        self,
+        lots: List[Lot],
+        asset_type: str,
+        symbol: str,
+        units_to_sell: Decimal,
+        sell_date: date,
+        sale_proceeds: Optional[Decimal]
+    ) -> CostBasisResult:
+        """Cost a sale at the weighted average cost of open lots."""
         # Calculate weighted average
         total_units = sum(lot.units_remaining for lot in lots)
         total_cost = sum(lot.units_remaining * lot.cost_per_unit for lot in lots)
@@ -387,10 +447,89 @@ class CostBasisTracker:
                         (str(units_to_deplete), lot.lot_id, user_id)
                     )
 
-        # Invalidate cache
-        cache_key = f"{user_id}:{asset_type}:{symbol}"
-        if cache_key in self._lots_cache:
-            del self._lots_cache[cache_key]
+        self._invalidate_lots(user_id, asset_type, symbol)
+
+    def deplete_many(
+        self,
+        user_id: int,
+        asset_type: str,
+        sales: Iterable[LotSale]
+    ) -> List[CostBasisResult]:
+        """
+        Cost and deplete a whole sell ledger in one pass.
+
+        Sales are applied in the given order against in-memory copies of
+        the open lots (loaded with one query if not already cached). The
+        resulting units_remaining of every touched lot is written with a
+        single executemany. If any sale exceeds the units available,
+        nothing is written and the cache is left unchanged.
+
+        Args:
+            user_id: User ID
+            asset_type: Asset type
+            sales: Sales in chronological order
+
+        Returns:
+            CostBasisResult per sale, in input order
+
+        Raises:
+            InsufficientSharesError: If a sale exceeds available units
+        """
+        sales = list(sales)
+        if not sales:
+            return []
+
+        if (user_id, asset_type) not in self._preloaded:
+            self.preload_lots(user_id, asset_type)
+
+        working: Dict[str, List[Lot]] = {}
+        touched: Dict[int, Lot] = {}
+        results = []
+
+        for sale in sales:
+            lots = working.get(sale.symbol)
+            if lots is None:
+                lots = working[sale.symbol] = [
+                    replace(lot) for lot in self._load_lots(user_id, asset_type, sale.symbol)
+                ]
+
+            if self.cost_method == CostMethod.FIFO:
+                result = self._fifo_cost_from_lots(
+                    lots, asset_type, sale.symbol, sale.units, sale.sell_date, sale.sale_proceeds
+                )
+                by_id = {lot.lot_id: lot for lot in lots}
+                for match in result.matched_lots:
+                    lot = by_id[match['lot_id']]
+                    lot.units_remaining -= match['units_used']
+                    touched[lot.lot_id] = lot
+            else:
+                result = self._average_cost_from_lots(
+                    lots, asset_type, sale.symbol, sale.units, sale.sell_date, sale.sale_proceeds
+                )
+                total_units = sum(lot.units_remaining for lot in lots)
+                for lot in lots:
+                    if lot.units_remaining > Decimal("0"):
+                        lot.units_remaining -= sale.units * (lot.units_remaining / total_units)
+                        touched[lot.lot_id] = lot
+
+            working[sale.symbol] = [lot for lot in lots if lot.units_remaining > Decimal("0")]
+            results.append(result)
+
+        self.conn.executemany(
+            """UPDATE cost_basis_lots
+            SET units_remaining = ?, updated_at = CURRENT_TIMESTAMP
+            WHERE id = ? AND user_id = ?""",
+            [(str(lot.units_remaining), lot_id, user_id) for lot_id, lot in touched.items()]
+        )
+
+        for symbol, lots in working.items():
+            self._lots_cache[f"{user_id}:{asset_type}:{symbol}"] = lots
+
+        logger.debug(
+            f"Depleted {len(touched)} lots for {len(sales)} {asset_type} sales "
+            f"across {len(working)} symbols"
+        )
+        return results
 
     def get_holding_summary(
         self,
@@ -465,6 +604,63 @@ class CostBasisTracker:
 
         return True
 
+    def preload_lots(self, user_id: int, asset_type: str) -> Dict[str, List[Lot]]:
+        """
+        Load every open lot of a user and asset type in one query.
+
+        Replaces the cached lots of that user/asset type. Until a write
+        invalidates them, _load_lots() serves every symbol from the cache,
+        including symbols with no open lots.
+
+        Args:
+            user_id: User ID
+            asset_type: Asset type
+
+        Returns:
+            Dict of symbol -> open lots in FIFO order
+        """
+        cursor = self.conn.execute(
+            """SELECT id, symbol, acquisition_date, units_acquired, units_remaining,
+                      cost_per_unit, total_cost, currency, reference
+            FROM cost_basis_lots
+            WHERE user_id = ?
+                AND asset_type = ?
+                AND units_remaining > 0
+            ORDER BY symbol, acquisition_date ASC, id ASC""",
+            (user_id, asset_type)
+        )
+
+        by_symbol: Dict[str, List[Lot]] = {}
+        for row in cursor.fetchall():
+            by_symbol.setdefault(row['symbol'], []).append(self._row_to_lot(row))
+
+        prefix = f"{user_id}:{asset_type}:"
+        for key in [k for k in self._lots_cache if k.startswith(prefix)]:
+            del self._lots_cache[key]
+        for symbol, lots in by_symbol.items():
+            self._lots_cache[prefix + symbol] = lots
+        self._preloaded.add((user_id, asset_type))
+
+        logger.debug(
+            f"Preloaded {sum(len(l) for l in by_symbol.values())} {asset_type} lots "
+            f"for {len(by_symbol)} symbols"
+        )
+        return by_symbol
+
+    def clear_cache(self) -> None:
+        """Drop all cached lots, e.g. after editing cost_basis_lots directly."""
+        self._lots_cache.clear()
+        self._preloaded.clear()
+
+    def _invalidate_lots(self, user_id: int, asset_type: str, symbol: str) -> None:
+        """Force the next _load_lots() of a symbol to re-read the database."""
+        cache_key = f"{user_id}:{asset_type}:{symbol}"
+        if (user_id, asset_type) in self._preloaded:
+            # Keep the key so a preloaded miss is not mistaken for "no lots"
+            self._lots_cache[cache_key] = None
+        else:
+            self._lots_cache.pop(cache_key, None)
+
     def _load_lots(
         self,
         user_id: int,
@@ -474,8 +670,13 @@ class CostBasisTracker:
         """Load lots from database, using cache if available."""
         cache_key = f"{user_id}:{asset_type}:{symbol}"
 
-        if cache_key in self._lots_cache:
-            return self._lots_cache[cache_key]
+        lots = self._lots_cache.get(cache_key)
+        if lots is not None:
+            return lots
+
+        if cache_key not in self._lots_cache and (user_id, asset_type) in self._preloaded:
+            lots = self._lots_cache[cache_key] = []
+            return lots
 
         cursor = self.conn.execute(
             """SELECT id, acquisition_date, units_acquired, units_remaining,
@@ -485,28 +686,31 @@ class CostBasisTracker:
                 AND asset_type = ?
                 AND symbol = ?
                 AND units_remaining > 0
-            ORDER BY acquisition_date ASC""",  # FIFO order
+            ORDER BY acquisition_date ASC, id ASC""",  # FIFO order
             (user_id, asset_type, symbol)
         )
 
-        lots = []
-        for row in cursor.fetchall():
-            lots.append(Lot(
-                lot_id=row['id'],
-                acquisition_date=date.fromisoformat(row['acquisition_date'])
-                    if isinstance(row['acquisition_date'], str)
-                    else row['acquisition_date'],
-                units_acquired=Decimal(str(row['units_acquired'])),
-                units_remaining=Decimal(str(row['units_remaining'])),
-                cost_per_unit=Decimal(str(row['cost_per_unit'])),
-                total_cost=Decimal(str(row['total_cost'])),
-                currency=row['currency'],
-                reference=row['reference'] or "",
-            ))
+        lots = [self._row_to_lot(row) for row in cursor.fetchall()]
 
         self._lots_cache[cache_key] = lots
         return lots
 
+    @staticmethod
+    def _row_to_lot(row) -> Lot:
+        """Build a Lot from a cost_basis_lots row."""
+        return Lot(
+            lot_id=row['id'],
+            acquisition_date=date.fromisoformat(row['acquisition_date'])
+                if isinstance(row['acquisition_date'], str)
+                else row['acquisition_date'],
+            units_acquired=Decimal(str(row['units_acquired'])),
+            units_remaining=Decimal(str(row['units_remaining'])),
+            cost_per_unit=Decimal(str(row['cost_per_unit'])),
+            total_cost=Decimal(str(row['total_cost'])),
+            currency=row['currency'],
+            reference=row['reference'] or "",
+        )
+
     def _get_ltcg_threshold(self, asset_type: str) -> int:
         """Get LTCG threshold days based on asset type."""
         if asset_type in ('MF_EQUITY', 'STOCK'):
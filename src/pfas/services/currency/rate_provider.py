@@ -13,11 +13,15 @@ for all income tax related conversions.
 """
 
 from dataclasses import dataclass
-from datetime import date, timedelta
+from datetime import date
 from decimal import Decimal
-from typing import Optional, List
+from typing import Optional, List, Sequence
 import sqlite3
 
+import numpy as np
+
+from pfas.core.rate_calendar import RateCalendar, RateObservation, rate_calendar, rate_writes
+
 
 @dataclass
 class ExchangeRate:
@@ -40,6 +44,10 @@ class SBITTRateProvider:
     3. Manual fallback entry
 
     Note: For holidays/weekends, use the last available business day rate.
+
+    Lookups are served from the connection's shared RateCalendar
+    (pfas.core.rate_calendar): the pair's history is loaded once and each
+    lookup is an array index.
     """
 
     MAX_LOOKBACK_DAYS = 7  # Max days to look back for rate
@@ -73,15 +81,11 @@ class SBITTRateProvider:
         Raises:
             ValueError: If no rate is available
         """
-        # Check exact date first
-        cached = self._get_cached_rate(rate_date, from_currency, to_currency)
-        if cached:
-            return cached.rate
-
-        # Try nearest available rate
-        nearest = self._get_nearest_rate(rate_date, from_currency, to_currency)
-        if nearest:
-            return nearest.rate
+        rate = self.calendar(from_currency, to_currency).rate_on(
+            rate_date, self.MAX_LOOKBACK_DAYS
+        )
+        if rate is not None:
+            return rate
 
         raise ValueError(
             f"No exchange rate available for {from_currency}/{to_currency} "
@@ -105,11 +109,35 @@ class SBITTRateProvider:
         Returns:
             ExchangeRate record or None
         """
-        cached = self._get_cached_rate(rate_date, from_currency, to_currency)
-        if cached:
-            return cached
+        observation = self.calendar(from_currency, to_currency).observation_on(
+            rate_date, self.MAX_LOOKBACK_DAYS
+        )
+        return self._to_record(observation, from_currency, to_currency)
+
+    def rates_on(
+        self,
+        dates: Sequence[date],
+        from_currency: str = "USD",
+        to_currency: str = "INR"
+    ) -> np.ndarray:
+        """
+        Get exchange rates for many dates at once.
 
-        return self._get_nearest_rate(rate_date, from_currency, to_currency)
+        Args:
+            dates: Dates for which rates are needed
+            from_currency: Source currency (default: USD)
+            to_currency: Target currency (default: INR)
+
+        Returns:
+            float64 array aligned with dates; NaN where get_rate() would raise
+        """
+        return self.calendar(from_currency, to_currency).rates_on(
+            dates, self.MAX_LOOKBACK_DAYS
+        )
+
+    def calendar(self, from_currency: str = "USD", to_currency: str = "INR") -> RateCalendar:
+        """Shared daily rate calendar of a currency pair."""
+        return rate_calendar(self.conn, from_currency, to_currency)
 
     def add_rate(
         self,
@@ -129,13 +157,15 @@ class SBITTRateProvider:
             rate: Exchange rate
             source: Rate source ('SBI', 'RBI', 'MANUAL')
         """
-        self.conn.execute(
-            """INSERT OR REPLACE INTO exchange_rates
-            (date, from_currency, to_currency, rate, source)
-            VALUES (?, ?, ?, ?, ?)""",
-            (rate_date.isoformat(), from_currency, to_currency, str(rate), source)
-        )
-        self.conn.commit()
+        with rate_writes(self.conn) as written:
+            cursor = self.conn.execute(
+                """INSERT OR REPLACE INTO exchange_rates
+                (date, from_currency, to_currency, rate, source)
+                VALUES (?, ?, ?, ?, ?)""",
+                (rate_date.isoformat(), from_currency, to_currency, str(rate), source)
+            )
+            written.append(cursor.lastrowid)
+            self.conn.commit()
 
     def add_manual_rate(
         self,
@@ -164,25 +194,27 @@ class SBITTRateProvider:
             Number of rates added
         """
         count = 0
-        for rate in rates:
-            try:
-                self.conn.execute(
-                    """INSERT OR REPLACE INTO exchange_rates
-                    (date, from_currency, to_currency, rate, source)
-                    VALUES (?, ?, ?, ?, ?)""",
-                    (
-                        rate.rate_date.isoformat(),
-                        rate.from_currency,
-                        rate.to_currency,
-                        str(rate.rate),
-                        rate.source
+        with rate_writes(self.conn) as written:
+            for rate in rates:
+                try:
+                    cursor = self.conn.execute(
+                        """INSERT OR REPLACE INTO exchange_rates
+                        (date, from_currency, to_currency, rate, source)
+                        VALUES (?, ?, ?, ?, ?)""",
+                        (
+                            rate.rate_date.isoformat(),
+                            rate.from_currency,
+                            rate.to_currency,
+                            str(rate.rate),
+                            rate.source
+                        )
                     )
-                )
-                count += 1
-            except Exception:
-                continue
+                    written.append(cursor.lastrowid)
+                    count += 1
+                except Exception:
+                    continue
 
-        self.conn.commit()
+            self.conn.commit()
         return count
 
     def get_rates_for_period(
@@ -202,29 +234,12 @@ class SBITTRateProvider:
         Returns:
             List of ExchangeRate records
         """
-        cursor = self.conn.execute(
-            """SELECT date, from_currency, to_currency, rate, source
-            FROM exchange_rates
-            WHERE from_currency = ?
-                AND to_currency = 'INR'
-                AND date >= ?
-                AND date <= ?
-            ORDER BY date""",
-            (from_currency, start_date.isoformat(), end_date.isoformat())
-        )
-
-        rates = []
-        for row in cursor.fetchall():
-            rates.append(ExchangeRate(
-                rate_date=date.fromisoformat(row['date'])
-                if isinstance(row['date'], str) else row['date'],
-                from_currency=row['from_currency'],
-                to_currency=row['to_currency'],
-                rate=Decimal(str(row['rate'])),
-                source=row['source']
-            ))
-
-        return rates
+        return [
+            self._to_record(observation, from_currency, "INR")
+            for observation in self.calendar(from_currency, "INR").observations_between(
+                start_date, end_date
+            )
+        ]
 
     def get_fy_end_rate(
         self,
@@ -270,70 +285,19 @@ class SBITTRateProvider:
         rate = self.get_rate(rate_date, from_currency, to_currency)
         return amount * rate
 
-    def _get_cached_rate(
-        self,
-        rate_date: date,
+    @staticmethod
+    def _to_record(
+        observation: Optional[RateObservation],
         from_currency: str,
         to_currency: str
     ) -> Optional[ExchangeRate]:
-        """Get exact date match from cache."""
-        cursor = self.conn.execute(
-            """SELECT date, from_currency, to_currency, rate, source
-            FROM exchange_rates
-            WHERE date = ?
-                AND from_currency = ?
-                AND to_currency = ?""",
-            (rate_date.isoformat(), from_currency, to_currency)
+        """ExchangeRate for a calendar entry."""
+        if observation is None:
+            return None
+        return ExchangeRate(
+            rate_date=observation.rate_date,
+            from_currency=from_currency,
+            to_currency=to_currency,
+            rate=observation.rate,
+            source=observation.source
         )
-
-        row = cursor.fetchone()
-        if row:
-            return ExchangeRate(
-                rate_date=date.fromisoformat(row['date'])
-                if isinstance(row['date'], str) else row['date'],
-                from_currency=row['from_currency'],
-                to_currency=row['to_currency'],
-                rate=Decimal(str(row['rate'])),
-                source=row['source']
-            )
-
-        return None
-
-    def _get_nearest_rate(
-        self,
-        rate_date: date,
-        from_currency: str,
-        to_currency: str
-    ) -> Optional[ExchangeRate]:
-        """
-        Get nearest available rate within lookback window.
-
-        For weekends/holidays, returns last business day rate.
-        """
-        # Look for rate on or before the date (within window)
-        min_date = rate_date - timedelta(days=self.MAX_LOOKBACK_DAYS)
-
-        cursor = self.conn.execute(
-            """SELECT date, from_currency, to_currency, rate, source
-            FROM exchange_rates
-            WHERE from_currency = ?
-                AND to_currency = ?
-                AND date <= ?
-                AND date >= ?
-            ORDER BY date DESC
-            LIMIT 1""",
-            (from_currency, to_currency, rate_date.isoformat(), min_date.isoformat())
-        )
-
-        row = cursor.fetchone()
-        if row:
-            return ExchangeRate(
-                rate_date=date.fromisoformat(row['date'])
-                if isinstance(row['date'], str) else row['date'],
-                from_currency=row['from_currency'],
-                to_currency=row['to_currency'],
-                rate=Decimal(str(row['rate'])),
-                source=row['source']
-            )
-
-        return None
@@ -4,7 +4,6 @@ Generic Asset Ingester - Common ingestion logic for all asset types.
 Provides a base class that all asset-specific ingesters can inherit from.
 """
 
-import hashlib
 import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
@@ -17,6 +16,8 @@ try:
 except ImportError:
     import sqlite3
 
+from pfas.core.fingerprint import file_fingerprint
+
 logger = logging.getLogger(__name__)
 
 
@@ -352,11 +353,7 @@ class GenericAssetIngester(ABC):
 
     def _calculate_file_hash(self, file_path: Path) -> str:
         """Calculate SHA256 hash of file."""
-        sha256 = hashlib.sha256()
-        with open(file_path, 'rb') as f:
-            for chunk in iter(lambda: f.read(8192), b''):
-                sha256.update(chunk)
-        return sha256.hexdigest()
+        return file_fingerprint(file_path)
 
     def _is_already_processed(self, file_hash: str) -> bool:
         """Check if file has already been processed."""
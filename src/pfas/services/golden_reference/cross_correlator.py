@@ -27,6 +27,7 @@ from .models import (
     SuspenseItem,
 )
 from .truth_resolver import TruthResolver
+from pfas.services.nav_service import get_navs
 
 logger = logging.getLogger(__name__)
 
@@ -417,13 +418,15 @@ class CrossCorrelator:
                 GROUP BY ms.isin, ms.name, mf.folio_number
                 HAVING total_units > 0.001
             """, (self.user_id, as_of_date.isoformat()))
+            rows = cursor.fetchall()
+            latest_navs = self._get_latest_navs([row[0] for row in rows], as_of_date)
 
-            for row in cursor.fetchall():
+            for row in rows:
                 units = Decimal(str(row[3])) if row[3] else Decimal("0")
                 cost = Decimal(str(row[4])) if row[4] else Decimal("0")
 
                 # Get latest NAV for valuation
-                nav = self._get_latest_nav(row[0], as_of_date)  # isin
+                nav = latest_navs.get(row[0])  # isin
                 market_value = units * nav if nav else Decimal("0")
 
                 holding = SystemHolding(
@@ -557,18 +560,22 @@ class CrossCorrelator:
 
         return holdings
 
-    def _get_latest_nav(self, isin: str, as_of_date: date) -> Optional[Decimal]:
-        """Get latest NAV for a scheme."""
-        cursor = self.conn.execute("""
-            SELECT nav FROM mf_nav_history
-            WHERE scheme_id = (SELECT id FROM mf_schemes WHERE isin = ?)
-            AND nav_date <= ?
-            ORDER BY nav_date DESC
-            LIMIT 1
-        """, (isin, as_of_date.isoformat()))
-
-        row = cursor.fetchone()
-        return Decimal(str(row[0])) if row else None
+    def _get_latest_navs(self, isins: List[str], as_of_date: date) -> Dict[str, Decimal]:
+        """Get latest NAV for each scheme ISIN from NAV history."""
+        isins = sorted({isin for isin in isins if isin})
+        if not isins:
+            return {}
+
+        placeholders = ",".join("?" * len(isins))
+        cursor = self.conn.execute(f"""
+            SELECT isin, MIN(id) FROM mf_schemes
+            WHERE isin IN ({placeholders})
+            GROUP BY isin
+        """, isins)
+        scheme_ids = {row[1]: row[0] for row in cursor.fetchall()}
+
+        navs = get_navs(self.conn, scheme_ids, [as_of_date], allow_interpolation=False)
+        return {scheme_ids[scheme_id]: nav for (scheme_id, _), nav in navs.items()}
 
     def _get_golden_reference(self, golden_ref_id: int) -> Optional[Dict[str, Any]]:
         """Get golden reference record."""
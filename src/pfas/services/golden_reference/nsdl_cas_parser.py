@@ -5,7 +5,6 @@ Parses NSDL Consolidated Account Statements (CAS) from password-protected PDFs.
 Extracts holdings for Stocks, Mutual Funds, and NPS.
 """
 
-import hashlib
 import json
 import logging
 import re
@@ -13,8 +12,12 @@ from dataclasses import dataclass, field
 from datetime import date, datetime
 from decimal import Decimal, InvalidOperation
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Tuple, TYPE_CHECKING
 
+if TYPE_CHECKING:
+    from pfas.parsers.mf.text_cache import CASTextCache
+
+from pfas.core.fingerprint import file_fingerprint
 from .models import (
     AssetClass,
     SourceType,
@@ -165,8 +168,15 @@ class NSDLCASParser:
     BOND_SECTION_PATTERN = re.compile(r'(?:BONDS?|Government\s+Securities)', re.IGNORECASE)
     SGB_SECTION_PATTERN = re.compile(r'(?:SGB|Sovereign\s+Gold\s+Bond)', re.IGNORECASE)
 
-    def __init__(self):
-        """Initialize NSDL CAS parser."""
+    def __init__(self, text_cache: Optional["CASTextCache"] = None):
+        """
+        Initialize NSDL CAS parser.
+
+        Args:
+            text_cache: Encrypted extracted-text cache shared with the CAMS
+                CAS parser; repeat parses skip PDF decoding (default: None)
+        """
+        self.text_cache = text_cache
         self._fitz_available = self._check_fitz()
         self._pdfplumber_available = self._check_pdfplumber()
 
@@ -249,14 +259,26 @@ class NSDLCASParser:
         return data
 
     def _extract_text(self, file_path: Path, password: Optional[str]) -> str:
-        """Extract text from PDF using available library."""
+        """Extract text from PDF using available library (or the text cache)."""
         if self._fitz_available:
-            return self._extract_with_fitz(file_path, password)
+            extract, extractor = self._extract_with_fitz, "pymupdf"
         elif self._pdfplumber_available:
-            return self._extract_with_pdfplumber(file_path, password)
+            extract, extractor = self._extract_with_pdfplumber, "pdfplumber"
         else:
             raise NSDLCASParseError("No PDF library available")
 
+        cache_key = None
+        if self.text_cache is not None:
+            cache_key = self.text_cache.key_for(file_path, extractor, password)
+            cached = self.text_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        text = extract(file_path, password)
+        if cache_key is not None and text:
+            self.text_cache.put(cache_key, text)
+        return text
+
     def _extract_with_fitz(self, file_path: Path, password: Optional[str]) -> str:
         """Extract text using PyMuPDF (fitz)."""
         import fitz
@@ -894,11 +916,7 @@ class NSDLCASParser:
 
     def calculate_file_hash(self, file_path: Path) -> str:
         """Calculate MD5 hash of file."""
-        hasher = hashlib.md5()
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                hasher.update(chunk)
-        return hasher.hexdigest()
+        return file_fingerprint(file_path, "md5")
 
 
 class GoldenReferenceIngester:
@@ -2,14 +2,18 @@
 
 Provides generators for:
 - Schedule FA (Foreign Assets)
+- Daily peak/closing valuation of foreign equity for Schedule FA
 - ITR-2 JSON export
 """
 
 from .schedule_fa import ScheduleFAGenerator, ScheduleFAData
+from .fa_valuation import ForeignEquityValuationEngine, EquityValuation
 from .itr2_exporter import ITR2Exporter
 
 __all__ = [
     "ScheduleFAGenerator",
     "ScheduleFAData",
+    "ForeignEquityValuationEngine",
+    "EquityValuation",
     "ITR2Exporter",
 ]
@@ -0,0 +1,492 @@
+"""Daily valuation of foreign equity holdings for Schedule FA.
+
+Schedule FA (A3) reports, for every foreign equity held at any time during
+the calendar year ending 31 December:
+- Initial value of the investment (at the TT rate on the date of acquisition)
+- Peak value during the year (at the TT rate on the date of the peak)
+- Closing value on 31 December
+- Gross income (dividends) credited during the year
+
+The engine rebuilds each symbol's daily share position from rsu_vests,
+rsu_sales, espp_purchases and espp_sales (sales are matched FIFO against
+vest/purchase lots, as RSUProcessor/ESPPProcessor do), joins it with the
+daily close from foreign_stock_prices and the daily SBI TT rate, and finds
+peak and closing values in one pass over (symbol x day) NumPy arrays.
+
+Prices are forward-filled between observations. Days without a stored
+close fall back to prices seen in the user's own data (foreign_holdings
+snapshots, vest FMV, ESPP market price, sale price). Rates come from the
+provider's rate calendar, forward-filled within MAX_LOOKBACK_DAYS.
+
+Usage:
+    engine = ForeignEquityValuationEngine(conn)
+    for valuation in engine.value_holdings(user_id, 2024):
+        print(valuation.symbol, valuation.peak_value_inr, valuation.peak_date)
+"""
+
+import sqlite3
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from pfas.services.currency import SBITTRateProvider
+
+# Position key for ESPP lots when the user's ESPP plan symbol is unknown
+ESPP_KEY = "ESPP"
+
+
+@dataclass
+class EquityValuation:
+    """Schedule FA valuation of one foreign equity for a calendar year."""
+
+    symbol: str
+    company_name: str
+    calendar_year: int
+    date_of_acquisition: Optional[date] = None
+
+    # Lots held during the year, at cost
+    initial_value_usd: Decimal = Decimal("0")
+    initial_value_inr: Decimal = Decimal("0")
+
+    # Highest INR value during the year
+    peak_date: Optional[date] = None
+    peak_shares: Decimal = Decimal("0")
+    peak_value_usd: Decimal = Decimal("0")
+    peak_value_inr: Decimal = Decimal("0")
+
+    # 31 December
+    closing_shares: Decimal = Decimal("0")
+    closing_price_usd: Decimal = Decimal("0")
+    closing_value_usd: Decimal = Decimal("0")
+    closing_value_inr: Decimal = Decimal("0")
+
+    # Dividends credited during the year
+    income_usd: Decimal = Decimal("0")
+    income_inr: Decimal = Decimal("0")
+
+
+@dataclass
+class _Lot:
+    """Shares from one vest or ESPP purchase, reduced FIFO by sales."""
+
+    symbol: str
+    acquired: date
+    shares: Decimal
+    cost_per_share_usd: Decimal
+    tt_rate: Optional[Decimal]
+    sales: List[Tuple[date, Decimal]] = field(default_factory=list)
+
+    def remaining_before(self, day: date) -> Decimal:
+        """Shares still held at the start of day."""
+        return self.shares - sum((s for d, s in self.sales if d < day), Decimal("0"))
+
+
+def _to_date(value) -> date:
+    return date.fromisoformat(value[:10]) if isinstance(value, str) else value
+
+
+def _to_decimal(value) -> Decimal:
+    return Decimal(str(value)) if value is not None else Decimal("0")
+
+
+def _last_valid(valid: np.ndarray) -> np.ndarray:
+    """Index of the last valid entry at or before each position (-1 if none), along the last axis."""
+    positions = np.where(valid, np.arange(valid.shape[-1]), -1)
+    return np.maximum.accumulate(positions, axis=-1)
+
+
+class ForeignEquityValuationEngine:
+    """
+    Peak, closing and initial values of foreign equity per calendar year.
+
+    Results are cached per (user, calendar year); call clear_cache() after
+    ingesting new vests, sales, prices or rates.
+    """
+
+    def __init__(
+        self,
+        db_connection: sqlite3.Connection,
+        rate_provider: Optional[SBITTRateProvider] = None,
+    ):
+        """
+        Initialize valuation engine.
+
+        Args:
+            db_connection: Database connection
+            rate_provider: SBI TT rate provider (default: one on db_connection)
+        """
+        self.conn = db_connection
+        self.rate_provider = rate_provider or SBITTRateProvider(db_connection)
+        self._cache: Dict[Tuple[int, int], List[EquityValuation]] = {}
+
+    def value_holdings(self, user_id: int, calendar_year: int) -> List[EquityValuation]:
+        """
+        Value every foreign equity the user held during a calendar year.
+
+        Args:
+            user_id: User ID
+            calendar_year: Calendar year (e.g. 2024 for FY 2024-25 filing)
+
+        Returns:
+            One EquityValuation per symbol held on at least one day
+
+        Raises:
+            ValueError: If no TT rate is available for a day shares were held
+        """
+        key = (user_id, calendar_year)
+        if key not in self._cache:
+            self._cache[key] = self._value_holdings(user_id, calendar_year)
+        return self._cache[key]
+
+    def clear_cache(self, user_id: Optional[int] = None) -> None:
+        """Drop cached valuations (all users, or one user's years)."""
+        if user_id is None:
+            self._cache.clear()
+        else:
+            for key in [k for k in self._cache if k[0] == user_id]:
+                del self._cache[key]
+
+    def add_prices(
+        self,
+        symbol: str,
+        prices: Iterable[Tuple[date, Decimal]],
+        source: str = "MANUAL",
+    ) -> int:
+        """
+        Store daily closing prices for a symbol.
+
+        Args:
+            symbol: Ticker
+            prices: (date, close in USD) pairs
+            source: Price source
+
+        Returns:
+            Number of prices stored
+        """
+        rows = [(symbol, d.isoformat(), str(close), source) for d, close in prices]
+        self.conn.executemany(
+            """INSERT OR REPLACE INTO foreign_stock_prices
+            (symbol, price_date, close_usd, source)
+            VALUES (?, ?, ?, ?)""",
+            rows
+        )
+        self.conn.commit()
+        self._cache.clear()
+        return len(rows)
+
+    def _value_holdings(self, user_id: int, calendar_year: int) -> List[EquityValuation]:
+        start = date(calendar_year, 1, 1)
+        end = date(calendar_year, 12, 31)
+
+        lots, names, observed = self._load_lots(user_id, end)
+        symbols = sorted({
+            lot.symbol for lot in lots if lot.remaining_before(start) > 0 or lot.acquired >= start
+        })
+        if not symbols:
+            return []
+
+        n_days = (end - start).days + 1
+        days = [start + timedelta(days=i) for i in range(n_days)]
+
+        # Column 0 holds everything before 1 January; column i + 1 is days[i]
+        row = {symbol: i for i, symbol in enumerate(symbols)}
+        deltas = np.zeros((len(symbols), n_days + 1))
+        for lot in lots:
+            if lot.symbol not in row:
+                continue
+            moves = [(lot.acquired, lot.shares)] + [(d, -s) for d, s in lot.sales]
+            for moved, shares in moves:
+                column = max((moved - start).days + 1, 0)
+                deltas[row[lot.symbol], column] += float(shares)
+        positions = np.cumsum(deltas, axis=1)[:, 1:]
+        positions[np.abs(positions) < 1e-9] = 0.0
+
+        prices, price_table = self._daily_prices(symbols, observed, start, end)
+        rates, rate_table = self._daily_rates(start, end)
+
+        held = positions > 0
+        missing_rate = held & np.isnan(rates)[None, :]
+        if missing_rate.any():
+            day = days[int(np.argmax(missing_rate.any(axis=0)))]
+            raise ValueError(f"No exchange rate available for USD/INR on or near {day}")
+
+        values_usd = positions * np.nan_to_num(prices)
+        values_inr = np.where(held, values_usd * np.nan_to_num(rates)[None, :], -np.inf)
+        peak_days = np.argmax(values_inr, axis=1)
+
+        income = self._load_dividends(user_id, symbols, start, end)
+        valuations = []
+        for i, symbol in enumerate(symbols):
+            if not held[i].any():
+                continue
+            symbol_lots = [lot for lot in lots if lot.symbol == symbol]
+
+            def shares_on(day: date) -> Decimal:
+                return sum(
+                    (lot.remaining_before(day + timedelta(days=1))
+                     for lot in symbol_lots if lot.acquired <= day),
+                    Decimal("0")
+                )
+
+            def value_on(column: int) -> Tuple[Decimal, Decimal, Decimal]:
+                shares = shares_on(days[column])
+                price = price_table[i][column] or Decimal("0")
+                if not shares:
+                    return shares, price, Decimal("0")
+                return shares, price, shares * price
+
+            valuation = EquityValuation(
+                symbol=symbol,
+                company_name=names.get(symbol) or symbol,
+                calendar_year=calendar_year,
+            )
+
+            # Initial value: cost of each lot as it entered the year
+            entering = [
+                (lot, lot.shares if lot.acquired >= start else lot.remaining_before(start))
+                for lot in symbol_lots if lot.acquired <= end
+            ]
+            entering = [(lot, shares) for lot, shares in entering if shares > 0]
+            valuation.date_of_acquisition = min(lot.acquired for lot, _ in entering)
+            for lot, shares in entering:
+                cost = shares * lot.cost_per_share_usd
+                rate = lot.tt_rate or self.rate_provider.get_rate(lot.acquired)
+                valuation.initial_value_usd += cost
+                valuation.initial_value_inr += cost * rate
+
+            peak = int(peak_days[i])
+            valuation.peak_date = days[peak]
+            valuation.peak_shares, _, valuation.peak_value_usd = value_on(peak)
+            valuation.peak_value_inr = valuation.peak_value_usd * rate_table[peak]
+
+            shares, price, value = value_on(n_days - 1)
+            valuation.closing_shares = shares
+            valuation.closing_price_usd = price
+            valuation.closing_value_usd = value
+            if shares:
+                valuation.closing_value_inr = value * rate_table[n_days - 1]
+
+            for credited, gross_usd, tt_rate in income.get(symbol, []):
+                rate = (tt_rate or rate_table[(credited - start).days]
+                        or self.rate_provider.get_rate(credited))
+                valuation.income_usd += gross_usd
+                valuation.income_inr += gross_usd * rate
+
+            valuations.append(valuation)
+
+        return valuations
+
+    def _load_lots(
+        self, user_id: int, end: date
+    ) -> Tuple[List[_Lot], Dict[str, str], Dict[str, Dict[date, Decimal]]]:
+        """
+        Vest and ESPP lots acquired up to end, with FIFO-matched sales.
+
+        Returns:
+            (lots, company name per symbol, prices seen per symbol and date)
+        """
+        names: Dict[str, str] = {}
+        observed: Dict[str, Dict[date, Decimal]] = {}
+
+        def observe(symbol: str, day: date, price) -> None:
+            if price is not None:
+                observed.setdefault(symbol, {})[day] = _to_decimal(price)
+
+        rsu_lots = []
+        for row in self.conn.execute(
+            """SELECT rv.vest_date, rv.net_shares, rv.fmv_usd, rv.tt_rate,
+                      sp.symbol, sp.company_name
+            FROM rsu_vests rv
+            LEFT JOIN stock_plans sp ON rv.grant_number = sp.grant_number
+            WHERE rv.user_id = ?
+                AND rv.vest_date <= ?
+            ORDER BY rv.vest_date, rv.id""",
+            (user_id, end.isoformat())
+        ).fetchall():
+            symbol = row['symbol'] or 'UNKNOWN'
+            names.setdefault(symbol, row['company_name'] or symbol)
+            vested = _to_date(row['vest_date'])
+            observe(symbol, vested, row['fmv_usd'])
+            rsu_lots.append(_Lot(
+                symbol=symbol,
+                acquired=vested,
+                shares=_to_decimal(row['net_shares']),
+                cost_per_share_usd=_to_decimal(row['fmv_usd']),
+                tt_rate=_to_decimal(row['tt_rate']) if row['tt_rate'] else None,
+            ))
+
+        espp_plans = self.conn.execute(
+            """SELECT symbol, MAX(company_name) as company_name
+            FROM stock_plans
+            WHERE user_id = ? AND grant_type = 'ESPP'
+            GROUP BY symbol""",
+            (user_id,)
+        ).fetchall()
+        if len(espp_plans) == 1:
+            espp_symbol = espp_plans[0]['symbol']
+            names.setdefault(espp_symbol, espp_plans[0]['company_name'] or espp_symbol)
+        else:
+            espp_symbol = ESPP_KEY
+            names[ESPP_KEY] = 'ESPP Holdings'
+
+        espp_lots = []
+        for row in self.conn.execute(
+            """SELECT purchase_date, shares_purchased, purchase_price_usd,
+                      market_price_usd, tt_rate
+            FROM espp_purchases
+            WHERE user_id = ?
+                AND purchase_date <= ?
+            ORDER BY purchase_date, id""",
+            (user_id, end.isoformat())
+        ).fetchall():
+            purchased = _to_date(row['purchase_date'])
+            observe(espp_symbol, purchased, row['market_price_usd'])
+            espp_lots.append(_Lot(
+                symbol=espp_symbol,
+                acquired=purchased,
+                shares=_to_decimal(row['shares_purchased']),
+                cost_per_share_usd=_to_decimal(row['purchase_price_usd']),
+                tt_rate=_to_decimal(row['tt_rate']) if row['tt_rate'] else None,
+            ))
+
+        for table, lots in (("rsu_sales", rsu_lots), ("espp_sales", espp_lots)):
+            sales = self.conn.execute(
+                f"""SELECT sale_date, shares_sold, sell_price_usd
+                FROM {table}
+                WHERE user_id = ?
+                    AND sale_date <= ?
+                ORDER BY sale_date, id""",
+                (user_id, end.isoformat())
+            ).fetchall()
+            self._match_sales(lots, sales, observe)
+
+        for symbol in {lot.symbol for lot in rsu_lots + espp_lots}:
+            for row in self.conn.execute(
+                """SELECT valuation_date, price_usd
+                FROM foreign_holdings
+                WHERE user_id = ?
+                    AND symbol = ?
+                    AND valuation_date <= ?
+                    AND price_usd IS NOT NULL
+                ORDER BY valuation_date""",
+                (user_id, symbol, end.isoformat())
+            ).fetchall():
+                observe(symbol, _to_date(row['valuation_date']), row['price_usd'])
+
+        return rsu_lots + espp_lots, names, observed
+
+    @staticmethod
+    def _match_sales(lots: List[_Lot], sales, observe) -> None:
+        """Allocate sales to lots first-in first-out."""
+        open_lots = iter(lots)
+        lot = next(open_lots, None)
+        available = lot.shares if lot else Decimal("0")
+        for sale in sales:
+            sold = _to_date(sale['sale_date'])
+            remaining = _to_decimal(sale['shares_sold'])
+            while remaining > 0 and lot is not None:
+                if lot.acquired > sold:
+                    break
+                taken = min(available, remaining)
+                if taken > 0:
+                    lot.sales.append((sold, taken))
+                    observe(lot.symbol, sold, sale['sell_price_usd'])
+                    available -= taken
+                    remaining -= taken
+                if available <= 0:
+                    lot = next(open_lots, None)
+                    available = lot.shares if lot else Decimal("0")
+
+    def _daily_prices(
+        self,
+        symbols: List[str],
+        observed: Dict[str, Dict[date, Decimal]],
+        start: date,
+        end: date,
+    ) -> Tuple[np.ndarray, List[List[Optional[Decimal]]]]:
+        """
+        Closing price per symbol and day, forward-filled.
+
+        Stored closes win over prices seen in transactions on the same day.
+        The last price before start opens the year; a symbol first priced
+        during the year is back-filled to 1 January.
+
+        Returns:
+            (float array of shape (symbols, days), Decimal prices per symbol and day)
+        """
+        n_days = (end - start).days + 1
+        placeholders = ",".join("?" * len(symbols))
+        stored = self.conn.execute(
+            f"""SELECT symbol, price_date, close_usd
+            FROM foreign_stock_prices
+            WHERE symbol IN ({placeholders})
+                AND price_date <= ?
+            ORDER BY price_date""",
+            (*symbols, end.isoformat())
+        ).fetchall()
+        by_symbol = {symbol: dict(observed.get(symbol, {})) for symbol in symbols}
+        for row in stored:
+            by_symbol[row['symbol']][_to_date(row['price_date'])] = _to_decimal(row['close_usd'])
+
+        # Column 0 holds the last price before 1 January
+        table = np.full((len(symbols), n_days + 1), None, dtype=object)
+        for i, symbol in enumerate(symbols):
+            closes = by_symbol[symbol]
+            before = [day for day in closes if day < start]
+            if before:
+                table[i, 0] = closes[max(before)]
+            for day, price in closes.items():
+                if day >= start:
+                    table[i, (day - start).days + 1] = price
+
+        valid = table != None  # noqa: E711 - elementwise comparison
+        source = _last_valid(valid)
+        first = np.argmax(valid, axis=1)
+        source = np.where(source < 0, first[:, None], source)
+        filled = np.take_along_axis(table, source, axis=1)[:, 1:]
+
+        prices = np.where(filled == None, np.nan, filled).astype(float)  # noqa: E711
+        return prices, filled.tolist()
+
+    def _daily_rates(
+        self, start: date, end: date
+    ) -> Tuple[np.ndarray, List[Optional[Decimal]]]:
+        """
+        USD/INR TT rate per day, forward-filled within the provider's lookback.
+
+        Returns:
+            (float array, NaN where no rate; Decimal rate or None per day)
+        """
+        calendar = self.rate_provider.calendar("USD", "INR")
+        lookback = self.rate_provider.MAX_LOOKBACK_DAYS
+        days = [start + timedelta(days=i) for i in range((end - start).days + 1)]
+        return (
+            calendar.rates_on(days, lookback),
+            [calendar.rate_on(day, lookback) for day in days],
+        )
+
+    def _load_dividends(
+        self, user_id: int, symbols: List[str], start: date, end: date
+    ) -> Dict[str, List[Tuple[date, Decimal, Optional[Decimal]]]]:
+        """Gross dividends credited during the year, per symbol."""
+        placeholders = ",".join("?" * len(symbols))
+        income: Dict[str, List[Tuple[date, Decimal, Optional[Decimal]]]] = {}
+        for row in self.conn.execute(
+            f"""SELECT symbol, dividend_date, gross_dividend_usd, tt_rate
+            FROM foreign_dividends
+            WHERE user_id = ?
+                AND symbol IN ({placeholders})
+                AND dividend_date >= ?
+                AND dividend_date <= ?
+            ORDER BY dividend_date""",
+            (user_id, *symbols, start.isoformat(), end.isoformat())
+        ).fetchall():
+            income.setdefault(row['symbol'], []).append((
+                _to_date(row['dividend_date']),
+                _to_decimal(row['gross_dividend_usd']),
+                _to_decimal(row['tt_rate']) if row['tt_rate'] else None,
+            ))
+        return income
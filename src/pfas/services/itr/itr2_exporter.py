@@ -18,6 +18,7 @@ from decimal import Decimal
 from typing import Optional, List, Dict, Any
 
 from pfas.services.currency import SBITTRateProvider
+from pfas.services.tax_rules_service import TaxRulesService
 from .schedule_fa import ScheduleFAGenerator, ScheduleFAData
 
 
@@ -252,7 +253,8 @@ class ITR2Exporter:
     JSON utility (available at https://www.incometax.gov.in).
     """
 
-    # Tax slabs for AY 2025-26 (Old Regime)
+    # Tax slabs for AY 2025-26 (Old Regime), used when the tax rule tables
+    # have no slabs for the financial year
     OLD_REGIME_SLABS = [
         (Decimal("250000"), Decimal("0")),      # 0-2.5L: 0%
         (Decimal("500000"), Decimal("0.05")),   # 2.5-5L: 5%
@@ -289,6 +291,7 @@ class ITR2Exporter:
         """
         self.conn = db_connection
         self.rate_provider = SBITTRateProvider(db_connection)
+        self.tax_rules = TaxRulesService(db_connection)
         self.schedule_fa_gen = ScheduleFAGenerator(db_connection)
 
     def generate(
@@ -586,7 +589,7 @@ class ITR2Exporter:
             )
 
         # Calculate tax
-        slabs = self.NEW_REGIME_SLABS if use_new_regime else self.OLD_REGIME_SLABS
+        slabs = self._regime_slabs(itr_data.financial_year, use_new_regime)
 
         # Normal income (excluding special rate income)
         normal_income = itr_data.total_income - itr_data.capital_gains.total_stcg - itr_data.capital_gains.total_ltcg
@@ -628,6 +631,16 @@ class ITR2Exporter:
             itr_data.tax_refund = total_paid - itr_data.tax_payable
             itr_data.tax_due = Decimal("0")
 
+    def _regime_slabs(self, financial_year: str, use_new_regime: bool) -> List[tuple]:
+        """(upper limit, rate) slabs from the tax rule tables, else the class defaults."""
+        slabs = self.tax_rules.get_tax_slabs(financial_year, 'NEW' if use_new_regime else 'OLD')
+        if not slabs:
+            return self.NEW_REGIME_SLABS if use_new_regime else self.OLD_REGIME_SLABS
+        return [
+            (slab.upper_limit if slab.upper_limit is not None else Decimal("999999999"), slab.tax_rate)
+            for slab in slabs
+        ]
+
     def _calculate_slab_tax(self, income: Decimal, slabs: List[tuple]) -> Decimal:
         """Calculate tax using slab rates."""
         if income <= 0:
@@ -21,6 +21,7 @@ from decimal import Decimal
 from typing import Optional, List, Dict
 
 from pfas.services.currency import SBITTRateProvider
+from .fa_valuation import ForeignEquityValuationEngine
 
 
 @dataclass
@@ -178,6 +179,8 @@ class ScheduleFAGenerator:
     - Peak value: Highest value during the financial year
     - Closing value: Value as on March 31 (FY end)
     - Exchange rate: SBI TT Buying Rate
+    - A3 equity holdings: calendar year ending December 31, valued daily
+      (peak at the TT rate on the peak date)
     """
 
     # Country codes for common jurisdictions
@@ -202,6 +205,9 @@ class ScheduleFAGenerator:
         """
         self.conn = db_connection
         self.rate_provider = SBITTRateProvider(db_connection)
+        self.valuation_engine = ForeignEquityValuationEngine(
+            db_connection, self.rate_provider
+        )
 
     def generate(self, user_id: int, financial_year: str) -> ScheduleFAData:
         """
@@ -233,7 +239,7 @@ class ScheduleFAGenerator:
 
         # Generate A3: Equity holdings (from RSU/ESPP data)
         schedule_fa.equity_holdings = self._generate_equity_holdings(
-            user_id, financial_year, fy_end_rate
+            user_id, financial_year
         )
 
         # Calculate totals
@@ -327,213 +333,43 @@ class ScheduleFAGenerator:
     def _generate_equity_holdings(
         self,
         user_id: int,
-        financial_year: str,
-        fy_end_rate: Decimal
+        financial_year: str
     ) -> List[ForeignEquityHolding]:
-        """Generate A3 equity holding entries."""
-        start_year = int(financial_year.split('-')[0])
-        fy_start = date(start_year, 4, 1)
-        fy_end = date(start_year + 1, 3, 31)
-
-        holdings = []
-
-        # Get distinct symbols from RSU vests
-        cursor = self.conn.execute(
-            """SELECT DISTINCT symbol, company_name
-            FROM rsu_vests rv
-            LEFT JOIN stock_plans sp ON rv.grant_number = sp.grant_number
-            WHERE rv.user_id = ?""",
-            (user_id,)
-        )
-
-        for row in cursor.fetchall():
-            symbol = row['symbol'] or 'UNKNOWN'
-            company_name = row['company_name'] or symbol
-
-            # Calculate total shares held (vests - sales)
-            vest_cursor = self.conn.execute(
-                """SELECT SUM(net_shares) as total_vested
-                FROM rsu_vests
-                WHERE user_id = ?
-                    AND vest_date <= ?""",
-                (user_id, fy_end.isoformat())
-            )
-            vest_row = vest_cursor.fetchone()
-            total_vested = Decimal(str(vest_row['total_vested'])) if vest_row and vest_row['total_vested'] else Decimal("0")
-
-            sale_cursor = self.conn.execute(
-                """SELECT SUM(shares_sold) as total_sold
-                FROM rsu_sales
-                WHERE user_id = ?
-                    AND sale_date <= ?""",
-                (user_id, fy_end.isoformat())
-            )
-            sale_row = sale_cursor.fetchone()
-            total_sold = Decimal(str(sale_row['total_sold'])) if sale_row and sale_row['total_sold'] else Decimal("0")
-
-            shares_held = total_vested - total_sold
-
-            if shares_held <= 0:
-                continue
-
-            # Get closing price (use last vest FMV as approximation)
-            price_cursor = self.conn.execute(
-                """SELECT fmv_usd
-                FROM rsu_vests
-                WHERE user_id = ?
-                ORDER BY vest_date DESC
-                LIMIT 1""",
-                (user_id,)
-            )
-            price_row = price_cursor.fetchone()
-            share_price = Decimal(str(price_row['fmv_usd'])) if price_row else Decimal("0")
-
-            closing_value_usd = shares_held * share_price
-
-            # Get total cost basis
-            cost_cursor = self.conn.execute(
-                """SELECT SUM(net_shares * fmv_usd) as total_cost
-                FROM rsu_vests
-                WHERE user_id = ?
-                    AND vest_date <= ?""",
-                (user_id, fy_end.isoformat())
-            )
-            cost_row = cost_cursor.fetchone()
-            total_cost_usd = Decimal(str(cost_row['total_cost'])) if cost_row and cost_row['total_cost'] else Decimal("0")
+        """
+        Generate A3 equity holding entries (RSU and ESPP shares).
 
-            # Get dividend income for this symbol
-            div_cursor = self.conn.execute(
-                """SELECT SUM(gross_dividend_usd) as total_div
-                FROM foreign_dividends
-                WHERE user_id = ?
-                    AND symbol = ?
-                    AND dividend_date >= ?
-                    AND dividend_date <= ?""",
-                (user_id, symbol, fy_start.isoformat(), fy_end.isoformat())
-            )
-            div_row = div_cursor.fetchone()
-            dividend_income_usd = Decimal(str(div_row['total_div'])) if div_row and div_row['total_div'] else Decimal("0")
-
-            # Get first acquisition date
-            first_vest_cursor = self.conn.execute(
-                """SELECT MIN(vest_date) as first_vest
-                FROM rsu_vests
-                WHERE user_id = ?""",
-                (user_id,)
-            )
-            first_vest_row = first_vest_cursor.fetchone()
-            first_vest_date = None
-            if first_vest_row and first_vest_row['first_vest']:
-                first_vest_date = date.fromisoformat(first_vest_row['first_vest']) if isinstance(first_vest_row['first_vest'], str) else first_vest_row['first_vest']
+        Values cover the calendar year ending 31 December of the FY start
+        year, from the daily valuation in ForeignEquityValuationEngine.
+        """
+        calendar_year = int(financial_year.split('-')[0])
 
+        holdings = []
+        for valuation in self.valuation_engine.value_holdings(user_id, calendar_year):
             holding = ForeignEquityHolding(
                 country_code='1',  # USA
                 country_name='United States',
-                entity_name=company_name,
+                entity_name=valuation.company_name,
                 entity_address='USA',
                 zip_code='',
                 nature_of_entity='Company',
-                date_of_acquisition=first_vest_date,
-                initial_investment_foreign=total_cost_usd,
-                initial_investment_inr=total_cost_usd * fy_end_rate,
-                peak_value_foreign=closing_value_usd,  # Simplified
-                peak_value_inr=closing_value_usd * fy_end_rate,
-                closing_value_foreign=closing_value_usd,
-                closing_value_inr=closing_value_usd * fy_end_rate,
-                total_investment_foreign=total_cost_usd,
-                total_investment_inr=total_cost_usd * fy_end_rate,
-                income_accrued_foreign=dividend_income_usd,
-                income_accrued_inr=dividend_income_usd * fy_end_rate,
-                nature_of_income='Dividend' if dividend_income_usd > 0 else '',
-                symbol=symbol,
-                shares_held=shares_held,
-                share_price_closing=share_price,
+                date_of_acquisition=valuation.date_of_acquisition,
+                initial_investment_foreign=valuation.initial_value_usd,
+                initial_investment_inr=valuation.initial_value_inr,
+                peak_value_foreign=valuation.peak_value_usd,
+                peak_value_inr=valuation.peak_value_inr,
+                closing_value_foreign=valuation.closing_value_usd,
+                closing_value_inr=valuation.closing_value_inr,
+                total_investment_foreign=valuation.initial_value_usd,
+                total_investment_inr=valuation.initial_value_inr,
+                income_accrued_foreign=valuation.income_usd,
+                income_accrued_inr=valuation.income_inr,
+                nature_of_income='Dividend' if valuation.income_usd > 0 else '',
+                symbol=valuation.symbol,
+                shares_held=valuation.closing_shares,
+                share_price_closing=valuation.closing_price_usd,
             )
             holdings.append(holding)
 
-        # Also add ESPP holdings
-        espp_holdings = self._get_espp_holdings(user_id, financial_year, fy_end_rate)
-        holdings.extend(espp_holdings)
-
-        return holdings
-
-    def _get_espp_holdings(
-        self,
-        user_id: int,
-        financial_year: str,
-        fy_end_rate: Decimal
-    ) -> List[ForeignEquityHolding]:
-        """Get ESPP holdings for Schedule FA."""
-        start_year = int(financial_year.split('-')[0])
-        fy_end = date(start_year + 1, 3, 31)
-
-        holdings = []
-
-        # Get ESPP purchases not yet sold
-        cursor = self.conn.execute(
-            """SELECT SUM(shares_purchased) as total_purchased,
-                      SUM(purchase_price_usd * shares_purchased) as total_cost,
-                      MIN(purchase_date) as first_purchase
-            FROM espp_purchases
-            WHERE user_id = ?
-                AND purchase_date <= ?""",
-            (user_id, fy_end.isoformat())
-        )
-
-        row = cursor.fetchone()
-        if not row or not row['total_purchased']:
-            return holdings
-
-        total_purchased = Decimal(str(row['total_purchased']))
-
-        # Get total sold
-        sale_cursor = self.conn.execute(
-            """SELECT SUM(shares_sold) as total_sold
-            FROM espp_sales
-            WHERE user_id = ?
-                AND sale_date <= ?""",
-            (user_id, fy_end.isoformat())
-        )
-        sale_row = sale_cursor.fetchone()
-        total_sold = Decimal(str(sale_row['total_sold'])) if sale_row and sale_row['total_sold'] else Decimal("0")
-
-        shares_held = total_purchased - total_sold
-
-        if shares_held <= 0:
-            return holdings
-
-        total_cost_usd = Decimal(str(row['total_cost']))
-        first_purchase = None
-        if row['first_purchase']:
-            first_purchase = date.fromisoformat(row['first_purchase']) if isinstance(row['first_purchase'], str) else row['first_purchase']
-
-        # Get average cost per share
-        avg_cost = total_cost_usd / total_purchased if total_purchased > 0 else Decimal("0")
-        closing_value_usd = shares_held * avg_cost
-
-        holding = ForeignEquityHolding(
-            country_code='1',
-            country_name='United States',
-            entity_name='ESPP Holdings',
-            entity_address='USA',
-            zip_code='',
-            nature_of_entity='Company',
-            date_of_acquisition=first_purchase,
-            initial_investment_foreign=total_cost_usd,
-            initial_investment_inr=total_cost_usd * fy_end_rate,
-            peak_value_foreign=closing_value_usd,
-            peak_value_inr=closing_value_usd * fy_end_rate,
-            closing_value_foreign=closing_value_usd,
-            closing_value_inr=closing_value_usd * fy_end_rate,
-            total_investment_foreign=total_cost_usd,
-            total_investment_inr=total_cost_usd * fy_end_rate,
-            nature_of_income='',
-            symbol='ESPP',
-            shares_held=shares_held,
-            share_price_closing=avg_cost,
-        )
-        holdings.append(holding)
-
         return holdings
 
     def save_schedule_fa(self, schedule_fa: ScheduleFAData, user_id: int) -> int:
@@ -4,6 +4,7 @@ NAV History Service for PFAS.
 Manages historical NAV data for mutual funds with:
 - Backfill from existing transactions
 - Point-in-time NAV lookup with interpolation
+- Batched as-of lookups for many (scheme, date) pairs
 - Daily update stub for AMFI feed integration
 """
 
@@ -11,11 +12,25 @@ import logging
 from dataclasses import dataclass
 from datetime import date, timedelta
 from decimal import Decimal
-from typing import Optional, List, Dict, Tuple
+from typing import Optional, List, Dict, Iterable, Tuple
 import sqlite3
 
+import numpy as np
+
+from pfas.core.database import schema_is_current
+
 logger = logging.getLogger(__name__)
 
+# Maximum gap (days) between two known NAVs that may be interpolated
+INTERPOLATION_MAX_GAP_DAYS = 30
+
+# SQLite's default limit on host parameters is 999; stay below it
+_SQL_BATCH_SIZE = 900
+
+# Stride separating schemes in the composite (scheme, day) sort key.
+# date.max.toordinal() is 3,652,059, so every day of a scheme fits.
+_SCHEME_STRIDE = 4_000_000
+
 
 @dataclass
 class NAVRecord:
@@ -72,6 +87,9 @@ class NAVService:
 
     def _ensure_table_exists(self) -> None:
         """Ensure mf_nav_history table exists with proper schema."""
+        if schema_is_current(self.conn):
+            return  # Created by the schema bootstrap
+
         self.conn.execute("""
             CREATE TABLE IF NOT EXISTS mf_nav_history (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -181,7 +199,7 @@ class NAVService:
         date_after = date.fromisoformat(after[1]) if isinstance(after[1], str) else after[1]
 
         # Only interpolate if dates are within 30 days
-        if (date_after - date_before).days > 30:
+        if (date_after - date_before).days > INTERPOLATION_MAX_GAP_DAYS:
             logger.debug(f"Gap too large for interpolation: {date_before} to {date_after}")
             return None
 
@@ -198,6 +216,29 @@ class NAVService:
 
         return interpolated.quantize(Decimal("0.0001"))
 
+    def get_navs(
+        self,
+        scheme_ids: Iterable[int],
+        dates: Iterable[date],
+        allow_interpolation: bool = True
+    ) -> Dict[Tuple[int, date], Decimal]:
+        """
+        Get NAVs for every combination of schemes and dates.
+
+        Batched equivalent of get_nav_at(): the relevant slice of
+        mf_nav_history is read once and all lookups are answered from it.
+
+        Args:
+            scheme_ids: Scheme IDs
+            dates: Dates to get NAVs for
+            allow_interpolation: Allow linear interpolation between dates
+
+        Returns:
+            Dict mapping (scheme_id, date) to NAV; pairs without a NAV
+            are omitted
+        """
+        return get_navs(self.conn, scheme_ids, dates, allow_interpolation)
+
     def get_nav_history(
         self,
         scheme_id: int,
@@ -399,6 +440,167 @@ class NAVService:
         }
 
 
+def get_navs(
+    conn: sqlite3.Connection,
+    scheme_ids: Iterable[int],
+    dates: Iterable[date],
+    allow_interpolation: bool = True
+) -> Dict[Tuple[int, date], Decimal]:
+    """
+    Look up NAVs for every combination of schemes and dates in one pass.
+
+    Follows the same rules as NAVService.get_nav_at() - exact match, then
+    linear interpolation across gaps of at most 30 days, then the nearest
+    earlier NAV - but loads the mf_nav_history slice once and resolves all
+    lookups with a vectorized searchsorted over a (scheme, day) sort key.
+
+    Unlike NAVService this never creates the table; a database without
+    NAV history simply yields no results.
+
+    Args:
+        conn: Database connection
+        scheme_ids: Scheme IDs
+        dates: Dates to get NAVs for
+        allow_interpolation: Allow linear interpolation between dates
+
+    Returns:
+        Dict mapping (scheme_id, date) to NAV; pairs without a NAV are omitted
+    """
+    schemes = sorted(set(scheme_ids))
+    query_dates = sorted(set(dates))
+    if not schemes or not query_dates:
+        return {}
+
+    upper = query_dates[-1]
+    if allow_interpolation:
+        upper += timedelta(days=INTERPOLATION_MAX_GAP_DAYS)
+
+    rows = _load_nav_slice(conn, schemes, upper)
+    if not rows:
+        return {}
+
+    scheme_index = {scheme_id: i for i, scheme_id in enumerate(schemes)}
+    keys = np.fromiter(
+        (scheme_index[r[0]] * _SCHEME_STRIDE + _to_ordinal(r[1]) for r in rows),
+        dtype=np.int64,
+        count=len(rows),
+    )
+    order = np.argsort(keys, kind="stable")
+    keys = keys[order]
+    navs = [Decimal(str(rows[i][2])) for i in order]
+
+    # One query key per (scheme, date) pair, scheme-major
+    scheme_part = np.arange(len(schemes), dtype=np.int64) * _SCHEME_STRIDE
+    day_part = np.array([d.toordinal() for d in query_dates], dtype=np.int64)
+    query_keys = (scheme_part[:, None] + day_part[None, :]).ravel()
+    query_scheme = query_keys // _SCHEME_STRIDE
+
+    # Last NAV on or before each query date, first NAV after it
+    after = np.searchsorted(keys, query_keys, side="right")
+    before = after - 1
+    clipped_before = np.clip(before, 0, len(keys) - 1)
+    clipped_after = np.clip(after, 0, len(keys) - 1)
+    has_before = (before >= 0) & (keys[clipped_before] // _SCHEME_STRIDE == query_scheme)
+    has_after = (after < len(keys)) & (keys[clipped_after] // _SCHEME_STRIDE == query_scheme)
+    exact = has_before & (keys[clipped_before] == query_keys)
+
+    interpolate = np.zeros(len(query_keys), dtype=bool)
+    if allow_interpolation:
+        gap = keys[clipped_after] - keys[clipped_before]
+        interpolate = ~exact & has_before & has_after & (gap <= INTERPOLATION_MAX_GAP_DAYS)
+
+    results: Dict[Tuple[int, date], Decimal] = {}
+    n_dates = len(query_dates)
+    for q in np.flatnonzero(has_before | interpolate):
+        key = (schemes[q // n_dates], query_dates[q % n_dates])
+        lo = int(before[q])
+        if interpolate[q]:
+            hi = int(after[q])
+            ratio = (
+                Decimal(int(query_keys[q] - keys[lo]))
+                / Decimal(int(keys[hi] - keys[lo]))
+            )
+            nav = navs[lo] + (navs[hi] - navs[lo]) * ratio
+            results[key] = nav.quantize(Decimal("0.0001"))
+        else:
+            results[key] = navs[lo]
+
+    return results
+
+
+def get_transaction_navs(
+    conn: sqlite3.Connection,
+    scheme_ids: Iterable[int],
+    as_of: Optional[date] = None
+) -> Dict[int, Optional[Decimal]]:
+    """
+    Get the NAV of the latest mf_transactions row for each scheme.
+
+    Fallback for schemes without NAV history. Answers all schemes with a
+    single query instead of one per scheme.
+
+    Args:
+        conn: Database connection
+        scheme_ids: Scheme IDs
+        as_of: Ignore transactions after this date (default: no limit)
+
+    Returns:
+        Dict mapping scheme_id to NAV (None if the latest row has no NAV);
+        schemes without transactions are omitted
+    """
+    schemes = sorted(set(scheme_ids))
+    results: Dict[int, Optional[Decimal]] = {}
+    for start in range(0, len(schemes), _SQL_BATCH_SIZE):
+        batch = schemes[start:start + _SQL_BATCH_SIZE]
+        placeholders = ",".join("?" * len(batch))
+        query = f"""
+            SELECT mf.scheme_id, mt.nav FROM mf_transactions mt
+            JOIN mf_folios mf ON mt.folio_id = mf.id
+            WHERE mf.scheme_id IN ({placeholders})
+        """
+        params: list = list(batch)
+        if as_of is not None:
+            query += " AND mt.date <= ?"
+            params.append(as_of.isoformat())
+        query += " ORDER BY mt.date ASC"
+
+        # Rows arrive oldest first, so the last one seen per scheme wins
+        for scheme_id, nav in conn.execute(query, params).fetchall():
+            results[scheme_id] = Decimal(str(nav)) if nav else None
+    return results
+
+
+def _load_nav_slice(
+    conn: sqlite3.Connection,
+    scheme_ids: List[int],
+    upper: date
+) -> List[Tuple]:
+    """Read (scheme_id, nav_date, nav) rows up to upper for the given schemes."""
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'mf_nav_history'"
+    ).fetchone()
+    if not exists:
+        return []
+
+    rows: List[Tuple] = []
+    for start in range(0, len(scheme_ids), _SQL_BATCH_SIZE):
+        batch = scheme_ids[start:start + _SQL_BATCH_SIZE]
+        placeholders = ",".join("?" * len(batch))
+        cursor = conn.execute(f"""
+            SELECT scheme_id, nav_date, nav FROM mf_nav_history
+            WHERE scheme_id IN ({placeholders}) AND nav_date <= ?
+        """, (*batch, upper.isoformat()))
+        rows.extend(cursor.fetchall())
+    return rows
+
+
+def _to_ordinal(value) -> int:
+    """Convert a stored nav_date (ISO string or date) to a day ordinal."""
+    if isinstance(value, str):
+        return date.fromisoformat(value[:10]).toordinal()
+    return value.toordinal()
+
+
 def log_change(
     conn: sqlite3.Connection,
     user_id: int,
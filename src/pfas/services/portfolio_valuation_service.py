@@ -14,11 +14,14 @@ This implementation uses last known prices from database.
 from dataclasses import dataclass, field
 from datetime import date
 from decimal import Decimal, ROUND_HALF_UP
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 import sqlite3
 import math
 
 from pfas.core.models import AssetHolding, AssetCategory
+from pfas.core.rate_calendar import rate_calendar
+from pfas.core.xirr import CashflowBatch, xirr
+from pfas.services.nav_service import get_navs, get_transaction_navs
 
 
 @dataclass
@@ -166,8 +169,10 @@ class PortfolioValuationService:
             GROUP BY ms.id
             HAVING net_units > 0.001
         """, (user_id, as_of.isoformat()))
+        rows = cursor.fetchall()
+        current_navs = self._get_current_navs([row[0] for row in rows], as_of)
 
-        for row in cursor.fetchall():
+        for row in rows:
             scheme_id = row[0]
             scheme_name = row[1]
             asset_class = row[2]
@@ -181,7 +186,7 @@ class PortfolioValuationService:
             cost_basis = units * avg_cost_per_unit
 
             # Get current NAV
-            current_nav = self._get_current_nav(scheme_id, as_of)
+            current_nav = current_navs.get(scheme_id) or Decimal("0")
             current_value = units * current_nav
 
             # Determine asset category
@@ -343,9 +348,10 @@ class PortfolioValuationService:
 
                 if txn_type in ('PURCHASE', 'SWITCH_IN'):
                     cash_flows.append(float(-amount))  # Outflow
+                    dates.append(txn_date)
                 elif txn_type in ('REDEMPTION', 'SWITCH_OUT'):
                     cash_flows.append(float(amount))  # Inflow
-                dates.append(txn_date)
+                    dates.append(txn_date)
 
         # Get stock transactions
         if asset_type in (None, 'ALL', 'STOCK'):
@@ -363,9 +369,10 @@ class PortfolioValuationService:
 
                 if trade_type == 'BUY':
                     cash_flows.append(float(-amount))
+                    dates.append(trade_date)
                 elif trade_type == 'SELL':
                     cash_flows.append(float(amount))
-                dates.append(trade_date)
+                    dates.append(trade_date)
 
         if not cash_flows:
             return XIRRResult(
@@ -417,7 +424,7 @@ class PortfolioValuationService:
         dates: List[date]
     ) -> Optional[float]:
         """
-        Calculate XIRR using Newton-Raphson method.
+        Calculate XIRR with the shared batch engine.
 
         Args:
             cash_flows: List of cash flows (negative for outflows)
@@ -426,49 +433,123 @@ class PortfolioValuationService:
         Returns:
             XIRR as decimal (0.10 = 10%)
         """
-        if len(cash_flows) < 2:
-            return None
+        return xirr(zip(dates, cash_flows))
 
-        # Convert dates to year fractions from first date
-        first_date = min(dates)
-        year_fracs = [(d - first_date).days / 365.0 for d in dates]
+    def calculate_xirr_breakdown(
+        self,
+        user_id: int,
+        as_of: Optional[date] = None
+    ) -> Dict[str, Dict[str, XIRRResult]]:
+        """
+        Calculate XIRR per scheme, per AMC, per stock and for the portfolio.
 
-        def npv(rate):
-            return sum(cf / (1 + rate) ** yf for cf, yf in zip(cash_flows, year_fracs))
+        All series are solved together in one batch. Flows follow
+        calculate_xirr(): purchases/buys out, redemptions/sells in, and the
+        current value of each holding in on as_of. Foreign holdings are
+        left out since their purchase flows are not recorded.
 
-        def npv_derivative(rate):
-            return sum(-yf * cf / (1 + rate) ** (yf + 1) for cf, yf in zip(cash_flows, year_fracs))
+        Args:
+            user_id: User ID
+            as_of: Valuation date (default: today)
 
-        # Newton-Raphson
-        rate = 0.1  # Initial guess
-        for _ in range(100):
-            npv_val = npv(rate)
-            if abs(npv_val) < 0.001:
-                return rate
+        Returns:
+            {"scheme": {name: result}, "amc": {name: result},
+             "symbol": {symbol: result}, "portfolio": {"ALL": result}}
+        """
+        if as_of is None:
+            as_of = date.today()
 
-            derivative = npv_derivative(rate)
-            if abs(derivative) < 1e-10:
-                break
+        batch = CashflowBatch()
+        invested: Dict[tuple, Decimal] = {}
+        current: Dict[tuple, Decimal] = {}
+        first_date: Dict[tuple, date] = {}
+        portfolio = ("portfolio", "ALL")
 
-            rate = rate - npv_val / derivative
+        def add(when: date, amount: Decimal, *keys: tuple) -> None:
+            batch.add(when, amount, *keys)
+            for key in keys:
+                if amount < 0:
+                    invested[key] = invested.get(key, Decimal("0")) - amount
+                first_date[key] = min(first_date.get(key, when), when)
 
-            if rate < -1:
-                rate = -0.99
+        cursor = self.conn.execute("""
+            SELECT mt.date, mt.transaction_type, mt.amount, ms.id, ms.name, COALESCE(ma.name, 'Unknown')
+            FROM mf_transactions mt
+            JOIN mf_folios mf ON mt.folio_id = mf.id
+            JOIN mf_schemes ms ON mf.scheme_id = ms.id
+            LEFT JOIN mf_amcs ma ON ms.amc_id = ma.id
+            WHERE mf.user_id = ? AND mt.date <= ?
+        """, (user_id, as_of.isoformat()))
 
-        return rate if abs(npv(rate)) < 1 else None
+        scheme_amc: Dict[int, str] = {}
+        for txn_date, txn_type, amount, scheme_id, scheme_name, amc_name in cursor.fetchall():
+            txn_date = date.fromisoformat(txn_date) if isinstance(txn_date, str) else txn_date
+            amount = Decimal(str(amount or 0))
+            scheme_amc[scheme_id] = amc_name
+            keys = (("scheme", scheme_name), ("amc", amc_name), portfolio)
+            if txn_type in ('PURCHASE', 'SWITCH_IN'):
+                add(txn_date, -amount, *keys)
+            elif txn_type in ('REDEMPTION', 'SWITCH_OUT'):
+                add(txn_date, amount, *keys)
 
-    def _get_current_nav(self, scheme_id: int, as_of: date) -> Decimal:
-        """Get current NAV for a scheme."""
         cursor = self.conn.execute("""
-            SELECT nav FROM mf_transactions
-            WHERE folio_id IN (SELECT id FROM mf_folios WHERE scheme_id = ?)
-              AND date <= ?
-            ORDER BY date DESC
-            LIMIT 1
-        """, (scheme_id, as_of.isoformat()))
+            SELECT trade_date, trade_type, net_amount, symbol
+            FROM stock_trades
+            WHERE user_id = ? AND trade_category = 'DELIVERY' AND trade_date <= ?
+        """, (user_id, as_of.isoformat()))
 
-        row = cursor.fetchone()
-        return Decimal(str(row[0])) if row and row[0] else Decimal("0")
+        for trade_date, trade_type, amount, symbol in cursor.fetchall():
+            trade_date = date.fromisoformat(trade_date) if isinstance(trade_date, str) else trade_date
+            amount = Decimal(str(amount or 0))
+            keys = (("symbol", symbol), portfolio)
+            if trade_type == 'BUY':
+                add(trade_date, -amount, *keys)
+            elif trade_type == 'SELL':
+                add(trade_date, amount, *keys)
+
+        # Current values close every series on as_of
+        terminal: List[Tuple[Decimal, Tuple[tuple, ...]]] = []
+        for h in self.value_mf_holdings(user_id, as_of):
+            amc_name = scheme_amc.get(h.source_id, 'Unknown')
+            terminal.append((h.total_value, (("scheme", h.asset_name), ("amc", amc_name), portfolio)))
+        for h in self.value_stock_holdings(user_id, as_of):
+            if h.asset_type == AssetCategory.STOCK_INDIAN:
+                terminal.append((h.total_value, (("symbol", h.asset_name), portfolio)))
+
+        for value, keys in terminal:
+            if value > 0:
+                add(as_of, value, *keys)
+                for key in keys:
+                    current[key] = current.get(key, Decimal("0")) + value
+
+        solutions = batch.solve()
+
+        breakdown: Dict[str, Dict[str, XIRRResult]] = {
+            "scheme": {}, "amc": {}, "symbol": {}, "portfolio": {},
+        }
+        for key, solution in solutions.items():
+            group, name = key
+            breakdown[group][name] = XIRRResult(
+                asset_type=group.upper(),
+                xirr_percent=(
+                    Decimal(str(solution.rate * 100)).quantize(Decimal("0.01"))
+                    if solution.rate is not None else None
+                ),
+                total_invested=invested.get(key, Decimal("0")),
+                total_current_value=current.get(key, Decimal("0")),
+                investment_period_days=(as_of - first_date[key]).days,
+                error=None if solution.converged else f"XIRR not solvable ({solution.status.name})",
+            )
+        return breakdown
+
+    def _get_current_navs(self, scheme_ids: List[int], as_of: date) -> Dict[int, Optional[Decimal]]:
+        """Get current NAVs for schemes (NAV history, then last transaction NAV)."""
+        navs = get_navs(self.conn, scheme_ids, [as_of], allow_interpolation=False)
+        current = {scheme_id: nav for (scheme_id, _), nav in navs.items()}
+        missing = [scheme_id for scheme_id in scheme_ids if scheme_id not in current]
+        if missing:
+            current.update(get_transaction_navs(self.conn, missing, as_of))
+        return current
 
     def _get_current_stock_price(self, symbol: str, as_of: date) -> Decimal:
         """Get current stock price (uses last trade price as placeholder)."""
@@ -483,14 +564,6 @@ class PortfolioValuationService:
         return Decimal(str(row[0])) if row and row[0] else Decimal("0")
 
     def _get_exchange_rate(self, as_of: date, currency: str) -> Decimal:
-        """Get exchange rate."""
-        cursor = self.conn.execute("""
-            SELECT rate FROM exchange_rates
-            WHERE from_currency = ? AND to_currency = 'INR'
-              AND date <= ?
-            ORDER BY date DESC
-            LIMIT 1
-        """, (currency, as_of.isoformat()))
-
-        row = cursor.fetchone()
-        return Decimal(str(row[0])) if row and row[0] else Decimal("83.5")
+        """Get exchange rate (latest rate on or before as_of)."""
+        rate = rate_calendar(self.conn, currency).rate_on(as_of, max_days_back=None)
+        return rate if rate else Decimal("83.5")
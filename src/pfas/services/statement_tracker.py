@@ -4,11 +4,12 @@ Prevents re-parsing of already processed files using SHA256 hash comparison.
 Supports parser version tracking for automatic re-parsing when parsers are updated.
 """
 
-import hashlib
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
 
+from pfas.core.fingerprint import file_fingerprint
+
 
 class StatementTracker:
     """
@@ -297,11 +298,7 @@ class StatementTracker:
 
     def _calculate_hash(self, file_path: Path) -> str:
         """Calculate SHA256 hash of file content."""
-        sha256 = hashlib.sha256()
-        with open(file_path, 'rb') as f:
-            for chunk in iter(lambda: f.read(8192), b''):
-                sha256.update(chunk)
-        return sha256.hexdigest()
+        return file_fingerprint(file_path)
 
     @classmethod
     def get_parser_version(cls, statement_type: str) -> str:
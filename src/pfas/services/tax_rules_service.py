@@ -2,14 +2,80 @@
 
 All tax rates, slabs, exemptions are fetched from database tables.
 No hardcoded tax rates in application code.
+
+The rule tables are small and read by every tax computation, so they are
+loaded once per connection into an immutable TaxRuleTables snapshot
+(get_tax_rule_tables()) shared by every TaxRulesService, the advance tax
+calculators, the report generators and the ITR-2 exporter. The snapshot
+is reloaded when the database generation moves (DataGeneration in
+pfas.core.connection_cache: total_changes for this connection, PRAGMA
+data_version for commits by other connections). The rule rows are then
+re-read and the snapshot is only replaced if they differ.
+
+Usage:
+    rules = get_tax_rule_tables(conn)
+    rules.tax_slabs("2025-26", "NEW")
+    incomes = np.arange(500_000, 5_000_000, 10_000)
+    rules.tax_liability("2025-26", "NEW", incomes, 75_000)
+    rules.tax_liability("2025-26", "OLD", incomes[:, None], [50_000, 200_000])
 """
 
+import threading
 from dataclasses import dataclass
+from datetime import date
 from decimal import Decimal
-from typing import Optional
-
-
-@dataclass
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple
+
+import numpy as np
+
+from pfas.core.connection_cache import ConnectionCache, DataGeneration
+
+# Rule tables read into a TaxRuleTables snapshot
+RULE_TABLES = (
+    "income_tax_slabs",
+    "capital_gains_rates",
+    "standard_deductions",
+    "surcharge_rates",
+    "cess_rates",
+    "rebate_limits",
+    "chapter_via_limits",
+)
+
+_RULE_QUERIES = {
+    "income_tax_slabs": """
+        SELECT financial_year, tax_regime, lower_limit, upper_limit, tax_rate, effective_to
+        FROM income_tax_slabs
+        ORDER BY financial_year, tax_regime, slab_order""",
+    "capital_gains_rates": """
+        SELECT financial_year, asset_type, gain_type, holding_period_months,
+               tax_rate, rate_type, exemption_limit, stt_required, effective_to
+        FROM capital_gains_rates
+        ORDER BY id""",
+    "standard_deductions": """
+        SELECT financial_year, tax_regime, deduction_type, deduction_amount, deduction_percent
+        FROM standard_deductions
+        ORDER BY id""",
+    "surcharge_rates": """
+        SELECT financial_year, income_type, lower_limit, upper_limit, surcharge_rate
+        FROM surcharge_rates
+        ORDER BY financial_year, income_type, lower_limit""",
+    "cess_rates": """
+        SELECT financial_year, cess_type, rate
+        FROM cess_rates
+        ORDER BY id""",
+    "rebate_limits": """
+        SELECT financial_year, tax_regime, income_limit, max_rebate
+        FROM rebate_limits
+        ORDER BY id""",
+    "chapter_via_limits": """
+        SELECT financial_year, tax_regime, section, max_limit
+        FROM chapter_via_limits
+        ORDER BY id""",
+}
+
+
+@dataclass(frozen=True)
 class TaxSlab:
     """Tax slab configuration loaded from database."""
     lower_limit: Decimal
@@ -17,7 +83,7 @@ class TaxSlab:
     tax_rate: Decimal
 
 
-@dataclass
+@dataclass(frozen=True)
 class CapitalGainsRate:
     """Capital gains rate configuration."""
     asset_type: str
@@ -29,10 +95,299 @@ class CapitalGainsRate:
     stt_required: bool
 
 
+def _decimal(value) -> Optional[Decimal]:
+    return Decimal(str(value)) if value is not None else None
+
+
+def _in_effect(effective_to: Optional[str]) -> bool:
+    return effective_to is None or str(effective_to) >= date.today().isoformat()
+
+
+class TaxRuleTables:
+    """
+    Immutable snapshot of all tax-rule tables, indexed by financial year.
+
+    Scalar lookups return the same values TaxRulesService used to query
+    row by row. slab_tax() and tax_liability() evaluate many incomes at
+    once with numpy (float rupees, rounded half-up like the calculators).
+    """
+
+    def __init__(self, rows: Mapping[str, tuple]):
+        """
+        Build the indexes.
+
+        Args:
+            rows: Rows of each rule table as returned by _RULE_QUERIES
+                (tables missing from the database map to ())
+        """
+        self.rows = MappingProxyType(dict(rows))
+
+        slabs: Dict[Tuple[str, str], list] = {}
+        for fy, regime, lower, upper, rate, effective_to in self.rows.get("income_tax_slabs", ()):
+            slabs.setdefault((fy, regime), []).append(
+                (effective_to, TaxSlab(_decimal(lower), _decimal(upper) if upper else None, _decimal(rate)))
+            )
+
+        cg_rates: Dict[Tuple[str, str, str], list] = {}
+        for row in self.rows.get("capital_gains_rates", ()):
+            cg_rates.setdefault((row[0], row[1], row[2]), []).append((row[8], CapitalGainsRate(
+                asset_type=row[1],
+                gain_type=row[2],
+                holding_period_months=row[3],
+                tax_rate=_decimal(row[4]),
+                rate_type=row[5],
+                exemption_limit=_decimal(row[6] or 0),
+                stt_required=bool(row[7]),
+            )))
+
+        standard: Dict[Tuple[str, str, str], Tuple[Optional[Decimal], Optional[Decimal]]] = {}
+        house_property: Dict[str, Optional[Decimal]] = {}
+        for fy, regime, deduction_type, amount, percent in self.rows.get("standard_deductions", ()):
+            standard.setdefault((fy, regime, deduction_type), (_decimal(amount), _decimal(percent)))
+            if deduction_type == "HOUSE_PROPERTY":
+                house_property.setdefault(fy, _decimal(percent))
+
+        surcharge: Dict[Tuple[str, str], list] = {}
+        for fy, income_type, lower, upper, rate in self.rows.get("surcharge_rates", ()):
+            surcharge.setdefault((fy, income_type), []).append(
+                (_decimal(lower), _decimal(upper), _decimal(rate))
+            )
+
+        self._slabs = MappingProxyType({k: tuple(v) for k, v in slabs.items()})
+        self._cg_rates = MappingProxyType({k: tuple(v) for k, v in cg_rates.items()})
+        self._standard = MappingProxyType(standard)
+        self._house_property = MappingProxyType(house_property)
+        self._surcharge = MappingProxyType({k: tuple(v) for k, v in surcharge.items()})
+        self._cess = MappingProxyType({
+            fy: _decimal(rate)
+            for fy, cess_type, rate in reversed(self.rows.get("cess_rates", ()))
+            if cess_type == "HEALTH_EDUCATION"
+        })
+        self._rebates = MappingProxyType({
+            (fy, regime): (_decimal(limit), _decimal(max_rebate))
+            for fy, regime, limit, max_rebate in reversed(self.rows.get("rebate_limits", ()))
+        })
+        self._via_limits = MappingProxyType({
+            (fy, regime, section): _decimal(limit)
+            for fy, regime, section, limit in reversed(self.rows.get("chapter_via_limits", ()))
+        })
+        self._arrays: Dict[tuple, tuple] = {}
+
+    @property
+    def financial_years(self) -> Tuple[str, ...]:
+        """Financial years that have income tax slabs."""
+        return tuple(sorted({fy for fy, _ in self._slabs}))
+
+    def tax_slabs(self, financial_year: str, tax_regime: str = 'NEW') -> Tuple[TaxSlab, ...]:
+        """Slabs in effect for a FY and regime, by slab order."""
+        return tuple(
+            slab for effective_to, slab in self._slabs.get((financial_year, tax_regime), ())
+            if _in_effect(effective_to)
+        )
+
+    def capital_gains_rate(
+        self,
+        financial_year: str,
+        asset_type: str,
+        gain_type: str
+    ) -> Optional[CapitalGainsRate]:
+        """Capital gains rate in effect, or None."""
+        for effective_to, rate in self._cg_rates.get((financial_year, asset_type, gain_type), ()):
+            if _in_effect(effective_to):
+                return rate
+        return None
+
+    def standard_deduction(
+        self,
+        financial_year: str,
+        tax_regime: str,
+        deduction_type: str = 'SALARY'
+    ) -> Decimal:
+        """Standard deduction amount (0 if not found)."""
+        row = (
+            self._standard.get((financial_year, tax_regime, deduction_type))
+            or self._standard.get((financial_year, 'BOTH', deduction_type))
+        )
+        return row[0] if row and row[0] else Decimal('0')
+
+    def house_property_deduction_percent(self, financial_year: str) -> Decimal:
+        """House property standard deduction percentage (default 30%)."""
+        percent = self._house_property.get(financial_year)
+        return percent if percent is not None else Decimal('0.30')
+
+    def surcharge_rate(
+        self,
+        financial_year: str,
+        total_income: Decimal,
+        income_type: str = 'NORMAL'
+    ) -> Decimal:
+        """Surcharge rate of the bracket containing total_income (0 if none)."""
+        income = Decimal(str(total_income))
+        for lower, upper, rate in reversed(self._surcharge.get((financial_year, income_type), ())):
+            if lower <= income and (upper is None or upper > income):
+                return rate
+        return Decimal('0')
+
+    def cess_rate(self, financial_year: str) -> Decimal:
+        """Health & Education Cess rate (default 4%)."""
+        return self._cess.get(financial_year, Decimal('0.04'))
+
+    def rebate_limit(self, financial_year: str, tax_regime: str) -> Tuple[Decimal, Decimal]:
+        """Section 87A (income_limit, max_rebate); zeros if not found."""
+        return self._rebates.get((financial_year, tax_regime), (Decimal('0'), Decimal('0')))
+
+    def chapter_via_limit(self, financial_year: str, tax_regime: str, section: str) -> Decimal:
+        """Chapter VI-A limit for a section (0 if not found)."""
+        return self._via_limits.get((financial_year, tax_regime, section), Decimal('0'))
+
+    def _slab_arrays(self, financial_year: str, tax_regime: str) -> tuple:
+        key = ("slabs", financial_year, tax_regime, date.today())
+        arrays = self._arrays.get(key)
+        if arrays is None:
+            slabs = self.tax_slabs(financial_year, tax_regime)
+            if not slabs:
+                raise ValueError(f"No tax slabs for FY {financial_year} ({tax_regime} regime)")
+            lower = np.array([float(s.lower_limit) for s in slabs])
+            upper = np.array([float(s.upper_limit) if s.upper_limit is not None else np.inf for s in slabs])
+            arrays = (lower, upper - lower, np.array([float(s.tax_rate) for s in slabs]))
+            self._arrays[key] = arrays
+        return arrays
+
+    def slab_tax(self, financial_year: str, tax_regime: str, incomes, deductions=0) -> np.ndarray:
+        """
+        Slab tax on many incomes at once.
+
+        Args:
+            financial_year: e.g., '2024-25'
+            tax_regime: 'OLD' or 'NEW'
+            incomes: Income amounts (any array shape)
+            deductions: Deductions, broadcast against incomes
+
+        Returns:
+            Tax on max(income - deductions, 0), rounded to the rupee
+
+        Raises:
+            ValueError: No slabs for the FY and regime
+        """
+        lower, width, rate = self._slab_arrays(financial_year, tax_regime)
+        taxable = np.maximum(np.asarray(incomes, dtype=float) - np.asarray(deductions, dtype=float), 0)
+        in_slab = np.clip(taxable[..., None] - lower, 0, width)
+        return _round(in_slab @ rate)
+
+    def tax_liability(self, financial_year: str, tax_regime: str, incomes, deductions=0) -> np.ndarray:
+        """
+        Total tax on many slab-rate incomes at once.
+
+        Applies the same steps as AdvanceTaxCalculator: slab tax, the 87A
+        rebate, surcharge on the gross income's bracket, then cess.
+
+        Args:
+            financial_year: e.g., '2024-25'
+            tax_regime: 'OLD' or 'NEW'
+            incomes: Gross incomes (any array shape)
+            deductions: Deductions, broadcast against incomes
+
+        Returns:
+            Tax liability in rupees, shaped like incomes and deductions broadcast
+        """
+        gross, deductions = np.broadcast_arrays(
+            np.asarray(incomes, dtype=float), np.asarray(deductions, dtype=float)
+        )
+        taxable = np.maximum(gross - deductions, 0)
+        tax = self.slab_tax(financial_year, tax_regime, taxable)
+
+        rebate_limit, max_rebate = self.rebate_limit(financial_year, tax_regime)
+        eligible = taxable <= float(rebate_limit)
+        tax = np.where(eligible, tax - np.minimum(tax, float(max_rebate)), tax)
+
+        surcharge = _round(tax * self._surcharge_rates(financial_year, gross))
+        with_surcharge = tax + surcharge
+        return with_surcharge + _round(with_surcharge * float(self.cess_rate(financial_year)))
+
+    def _surcharge_rates(self, financial_year: str, incomes: np.ndarray) -> np.ndarray:
+        brackets = self._surcharge.get((financial_year, 'NORMAL'), ())
+        if not brackets:
+            return np.zeros(incomes.shape)
+        lower = np.array([float(b[0]) for b in brackets])
+        upper = np.array([float(b[1]) if b[1] is not None else np.inf for b in brackets])
+        rate = np.array([float(b[2]) for b in brackets])
+        index = np.searchsorted(lower, incomes, side='right') - 1
+        clipped = np.maximum(index, 0)
+        return np.where((index >= 0) & (incomes < upper[clipped]), rate[clipped], 0.0)
+
+
+def _round(values: np.ndarray) -> np.ndarray:
+    """Round half-up to the rupee (amounts are non-negative)."""
+    return np.floor(values + 0.5)
+
+
+class _ConnectionRules:
+    """Snapshot of one connection plus the generation it was loaded at."""
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.tables: Optional[TaxRuleTables] = None
+        self.generation = DataGeneration()
+        self.loads = 0
+
+
+_registry: "ConnectionCache[_ConnectionRules]" = ConnectionCache(_ConnectionRules)
+_lock = threading.RLock()
+
+
+def _read_rules(conn) -> Dict[str, tuple]:
+    placeholders = ",".join("?" * len(RULE_TABLES))
+    existing = {
+        row[0] for row in conn.execute(
+            f"SELECT name FROM sqlite_master WHERE type = 'table' AND name IN ({placeholders})",
+            RULE_TABLES
+        ).fetchall()
+    }
+    return {
+        table: tuple(tuple(row) for row in conn.execute(_RULE_QUERIES[table]).fetchall())
+        if table in existing else ()
+        for table in RULE_TABLES
+    }
+
+
+def get_tax_rule_tables(conn) -> TaxRuleTables:
+    """
+    Shared tax-rule snapshot of a connection.
+
+    Loads every rule table on first use. Later calls cost an attribute
+    read and, outside transactions, one PRAGMA; the tables are re-read
+    only after the database changed, and the snapshot object is replaced
+    only if the rule rows did.
+
+    Args:
+        conn: Database connection
+
+    Returns:
+        TaxRuleTables (immutable; shared by all callers)
+    """
+    with _lock:
+        entry = _registry.get(conn)
+        if entry.tables is None or entry.generation.is_stale(conn):
+            entry.generation.mark(conn)
+            rows = _read_rules(conn)
+            if entry.tables is None or rows != dict(entry.tables.rows):
+                entry.tables = TaxRuleTables(rows)
+                entry.loads += 1
+        return entry.tables
+
+
+def clear_tax_rule_tables(conn=None) -> None:
+    """Drop cached snapshots (of one connection, or all) so they reload on next use."""
+    _registry.discard(conn)
+
+
 class TaxRulesService:
     """
     Service to fetch tax rules from database.
     Eliminates hardcoded tax rates in application code.
+
+    Lookups are served from the connection's shared TaxRuleTables, so
+    creating a service per computation costs no queries.
     """
 
     def __init__(self, db_connection):
@@ -43,7 +398,11 @@ class TaxRulesService:
             db_connection: SQLite connection object
         """
         self.conn = db_connection
-        self._cache = {}  # Simple in-memory cache
+
+    @property
+    def rules(self) -> TaxRuleTables:
+        """Current snapshot of the tax-rule tables."""
+        return get_tax_rule_tables(self.conn)
 
     def get_tax_slabs(
         self,
@@ -60,29 +419,7 @@ class TaxRulesService:
         Returns:
             List of TaxSlab ordered by slab_order
         """
-        cache_key = f"slabs_{financial_year}_{tax_regime}"
-        if cache_key in self._cache:
-            return self._cache[cache_key]
-
-        cursor = self.conn.execute("""
-            SELECT lower_limit, upper_limit, tax_rate
-            FROM income_tax_slabs
-            WHERE financial_year = ?
-              AND tax_regime = ?
-              AND (effective_to IS NULL OR effective_to >= date('now'))
-            ORDER BY slab_order
-        """, (financial_year, tax_regime))
-
-        slabs = []
-        for row in cursor.fetchall():
-            slabs.append(TaxSlab(
-                lower_limit=Decimal(str(row[0])),
-                upper_limit=Decimal(str(row[1])) if row[1] else None,
-                tax_rate=Decimal(str(row[2]))
-            ))
-
-        self._cache[cache_key] = slabs
-        return slabs
+        return list(self.rules.tax_slabs(financial_year, tax_regime))
 
     def get_capital_gains_rate(
         self,
@@ -101,36 +438,7 @@ class TaxRulesService:
         Returns:
             CapitalGainsRate or None if not found
         """
-        cache_key = f"cg_{financial_year}_{asset_type}_{gain_type}"
-        if cache_key in self._cache:
-            return self._cache[cache_key]
-
-        cursor = self.conn.execute("""
-            SELECT asset_type, gain_type, holding_period_months,
-                   tax_rate, rate_type, exemption_limit, stt_required
-            FROM capital_gains_rates
-            WHERE financial_year = ?
-              AND asset_type = ?
-              AND gain_type = ?
-              AND (effective_to IS NULL OR effective_to >= date('now'))
-        """, (financial_year, asset_type, gain_type))
-
-        row = cursor.fetchone()
-        if not row:
-            return None
-
-        rate = CapitalGainsRate(
-            asset_type=row[0],
-            gain_type=row[1],
-            holding_period_months=row[2],
-            tax_rate=Decimal(str(row[3])),
-            rate_type=row[4],
-            exemption_limit=Decimal(str(row[5] or 0)),
-            stt_required=bool(row[6])
-        )
-
-        self._cache[cache_key] = rate
-        return rate
+        return self.rules.capital_gains_rate(financial_year, asset_type, gain_type)
 
     def get_standard_deduction(
         self,
@@ -149,41 +457,14 @@ class TaxRulesService:
         Returns:
             Deduction amount (0 if not found)
         """
-        cache_key = f"std_{financial_year}_{tax_regime}_{deduction_type}"
-        if cache_key in self._cache:
-            return self._cache[cache_key]
-
-        cursor = self.conn.execute("""
-            SELECT deduction_amount, deduction_percent
-            FROM standard_deductions
-            WHERE financial_year = ?
-              AND (tax_regime = ? OR tax_regime = 'BOTH')
-              AND deduction_type = ?
-        """, (financial_year, tax_regime, deduction_type))
-
-        row = cursor.fetchone()
-        if row:
-            amount = Decimal(str(row[0])) if row[0] else Decimal('0')
-        else:
-            amount = Decimal('0')
-
-        self._cache[cache_key] = amount
-        return amount
+        return self.rules.standard_deduction(financial_year, tax_regime, deduction_type)
 
     def get_house_property_deduction_percent(
         self,
         financial_year: str
     ) -> Decimal:
         """Get house property standard deduction percentage (30%)."""
-        cursor = self.conn.execute("""
-            SELECT deduction_percent
-            FROM standard_deductions
-            WHERE financial_year = ?
-              AND deduction_type = 'HOUSE_PROPERTY'
-        """, (financial_year,))
-
-        row = cursor.fetchone()
-        return Decimal(str(row[0])) if row else Decimal('0.30')
+        return self.rules.house_property_deduction_percent(financial_year)
 
     def get_surcharge_rate(
         self,
@@ -202,19 +483,7 @@ class TaxRulesService:
         Returns:
             Surcharge rate as decimal (e.g., 0.10 for 10%)
         """
-        cursor = self.conn.execute("""
-            SELECT surcharge_rate
-            FROM surcharge_rates
-            WHERE financial_year = ?
-              AND income_type = ?
-              AND lower_limit <= ?
-              AND (upper_limit IS NULL OR upper_limit > ?)
-            ORDER BY lower_limit DESC
-            LIMIT 1
-        """, (financial_year, income_type, float(total_income), float(total_income)))
-
-        row = cursor.fetchone()
-        return Decimal(str(row[0])) if row else Decimal('0')
+        return self.rules.surcharge_rate(financial_year, total_income, income_type)
 
     def get_cess_rate(self, financial_year: str) -> Decimal:
         """
@@ -223,15 +492,7 @@ class TaxRulesService:
         Returns:
             Cess rate (default 0.04 = 4%)
         """
-        cursor = self.conn.execute("""
-            SELECT rate
-            FROM cess_rates
-            WHERE financial_year = ?
-              AND cess_type = 'HEALTH_EDUCATION'
-        """, (financial_year,))
-
-        row = cursor.fetchone()
-        return Decimal(str(row[0])) if row else Decimal('0.04')
+        return self.rules.cess_rate(financial_year)
 
     def get_rebate_limit(
         self,
@@ -244,17 +505,7 @@ class TaxRulesService:
         Returns:
             Tuple of (income_limit, max_rebate)
         """
-        cursor = self.conn.execute("""
-            SELECT income_limit, max_rebate
-            FROM rebate_limits
-            WHERE financial_year = ?
-              AND tax_regime = ?
-        """, (financial_year, tax_regime))
-
-        row = cursor.fetchone()
-        if row:
-            return (Decimal(str(row[0])), Decimal(str(row[1])))
-        return (Decimal('0'), Decimal('0'))
+        return self.rules.rebate_limit(financial_year, tax_regime)
 
     def get_chapter_via_limit(
         self,
@@ -271,17 +522,12 @@ class TaxRulesService:
         Returns:
             Maximum allowed deduction
         """
-        cursor = self.conn.execute("""
-            SELECT max_limit
-            FROM chapter_via_limits
-            WHERE financial_year = ?
-              AND tax_regime = ?
-              AND section = ?
-        """, (financial_year, tax_regime, section))
+        return self.rules.chapter_via_limit(financial_year, tax_regime, section)
 
-        row = cursor.fetchone()
-        return Decimal(str(row[0])) if row else Decimal('0')
+    def slab_tax(self, financial_year: str, tax_regime: str, incomes, deductions=0) -> np.ndarray:
+        """Vectorized slab tax (see TaxRuleTables.slab_tax())."""
+        return self.rules.slab_tax(financial_year, tax_regime, incomes, deductions)
 
     def clear_cache(self):
-        """Clear the in-memory cache."""
-        self._cache.clear()
+        """Force the shared rule snapshot to reload on next use."""
+        clear_tax_rule_tables(self.conn)
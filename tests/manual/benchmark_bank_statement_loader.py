@@ -0,0 +1,138 @@
+"""
+Throughput benchmark for bank statement ingestion.
+
+Writes a synthetic 10-year savings-account statement (CSV) and ingests it
+twice into fresh databases:
+
+- row-by-row: iterrows() with per-cell _parse_date/_parse_amount, then one
+  INSERT + COMMIT per transaction (the former BankIntelligenceAnalyzer path)
+- columnar:   BankIntelligenceAnalyzer.ingest_statement()
+
+A second columnar run over the same file measures the all-duplicates case.
+
+Run:
+    python tests/manual/benchmark_bank_statement_loader.py
+    python tests/manual/benchmark_bank_statement_loader.py --years 20 --per-day 12
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from pfas.services.bank_intelligence.intelligent_analyzer import BankIntelligenceAnalyzer
+from pfas.services.bank_intelligence.models import BankTransactionIntel, TransactionType
+
+NARRATIONS = [
+    "UPI/{ref}/PAYEE{payee}@OKAXIS/Payment",
+    "NEFT-N{ref}-ACME CORP SALARY",
+    "ATM WDL {ref} MG ROAD",
+    "POS {ref} GROCERY MART",
+    "INT PD 01-01-2024 TO 31-03-2024",
+    "ACH D- ICICI PRUDENTIAL MF SIP {ref}",
+    "IMPS/{ref}/RENT FROM TENANT",
+]
+
+
+def write_statement(path: Path, years: int, per_day: int, seed: int = 5) -> int:
+    """Write the synthetic statement; returns the transaction count."""
+    rng = random.Random(seed)
+    balance = 100000.0
+    lines = ["Statement of Account,,,,", "Txn Date,Remarks,Withdrawal,Deposit,Balance"]
+    day = date(2015, 4, 1)
+    end = date(2015 + years, 4, 1)
+    while day < end:
+        for _ in range(rng.randint(0, 2 * per_day)):
+            narration = rng.choice(NARRATIONS).format(
+                ref=rng.randint(10**9, 10**10), payee=rng.randint(0, 200)
+            )
+            amount = round(rng.uniform(10, 50000), 2)
+            if rng.random() < 0.7:
+                balance -= amount
+                debit, credit = f'"{amount:,.2f}"', ""
+            else:
+                balance += amount
+                debit, credit = "", f'"{amount:,.2f}"'
+            lines.append(f"{day:%d/%m/%Y},{narration},{debit},{credit},{balance:.2f}")
+        day += timedelta(days=1)
+    path.write_text("\n".join(lines) + "\n")
+    return len(lines) - 2
+
+
+def ingest_rowwise(analyzer: BankIntelligenceAnalyzer, file_path: str) -> int:
+    """Former path: per-row parse, one INSERT and COMMIT per transaction."""
+    df = analyzer._read_statement_file(file_path)
+    df = analyzer._set_header_and_filter(df, analyzer._find_header_row(df))
+    column_map = analyzer._map_columns(df)
+
+    inserted = 0
+    for _, row in df.iterrows():
+        txn_date = analyzer._parse_date(row.get(column_map["date"]))
+        description = str(row.get(column_map["description"], ""))
+        if txn_date is None or description.lower() in ("nan", "none", ""):
+            continue
+        debit = analyzer._parse_amount(row.get(column_map["debit"]))
+        credit = analyzer._parse_amount(row.get(column_map["credit"]))
+        if debit == 0 and credit == 0:
+            continue
+        balance = analyzer._parse_amount(row.get(column_map["balance"]))
+        category, sub_category, _ = analyzer.classifier.classify(description)
+        txn = BankTransactionIntel(
+            user_name="bench", bank_name="BANK", txn_date=txn_date,
+            base_string=description,
+            amount=debit if debit > 0 else credit,
+            txn_type=TransactionType.DEBIT if debit > 0 else TransactionType.CREDIT,
+            balance=balance or None, category=category, sub_category=sub_category,
+            source_file=file_path,
+        )
+        if analyzer._insert_transaction(txn):
+            inserted += 1
+    return inserted
+
+
+def timed(func):
+    start = time.perf_counter()
+    value = func()
+    return value, time.perf_counter() - start
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Benchmark bank statement ingestion")
+    arg_parser.add_argument("--years", type=int, default=10, help="Years of statement history")
+    arg_parser.add_argument("--per-day", type=int, default=8, help="Average transactions per day")
+    args = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_path = Path(tmp)
+        statement = tmp_path / "statement.csv"
+        count = write_statement(statement, args.years, args.per_day)
+        print(f"Statement: {args.years} years, {count:,} transactions")
+
+        with BankIntelligenceAnalyzer(str(tmp_path / "rowwise.db"), tmp) as analyzer:
+            inserted, elapsed = timed(lambda: ingest_rowwise(analyzer, str(statement)))
+        print(f"  {'row-by-row':<22} {elapsed:8.2f} s  {inserted / elapsed:12,.0f} txns/sec")
+
+        with BankIntelligenceAnalyzer(str(tmp_path / "columnar.db"), tmp) as analyzer:
+            for label in ("columnar", "columnar (duplicates)"):
+                result, elapsed = timed(
+                    lambda: analyzer.ingest_statement(str(statement), "bench", "BANK")
+                )
+                print(
+                    f"  {label:<22} {elapsed:8.2f} s  "
+                    f"{result.transactions_processed / elapsed:12,.0f} txns/sec  "
+                    f"({result.transactions_inserted:,} inserted)"
+                )
+        if result.transactions_inserted or not result.success:
+            print("ERROR: second columnar run should only find duplicates")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
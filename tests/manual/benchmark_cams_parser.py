@@ -0,0 +1,177 @@
+"""
+Throughput benchmark for CAMS capital-gains statement parsing.
+
+Builds a synthetic TRXN_DETAILS sheet (20,000 rows by default) and turns it
+into MFTransactions twice:
+
+- row-by-row: iterrows() with per-cell _get_column_value/_parse_date/
+  _to_decimal (the former CAMSParser._parse_excel loop)
+- columnar:   CAMSParser._parse_frame()
+
+Both paths must produce the same transactions. Reading the workbook is not
+timed; it is the same for both paths.
+
+Run:
+    python tests/manual/benchmark_cams_parser.py
+    python tests/manual/benchmark_cams_parser.py --rows 100000
+"""
+
+import argparse
+import random
+import sqlite3
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+import pandas as pd
+
+from pfas.parsers.mf.cams import CAMSParser
+from pfas.parsers.mf.classifier import classify_scheme
+from pfas.parsers.mf.models import MFScheme, MFTransaction, ParseResult
+
+SCHEMES = [
+    ("HDFC Mutual Fund", "EQUITY", "HDFC Flexi Cap Fund - Direct Plan - Growth"),
+    ("SBI Mutual Fund", "EQUITY", "SBI Bluechip Fund Direct Growth"),
+    ("ICICI Prudential Mutual Fund", "HYBRID", "ICICI Prudential Balanced Advantage Fund"),
+    ("Axis Mutual Fund", "DEBT", "Axis Corporate Bond Fund - Direct Growth"),
+    ("Nippon India Mutual Fund", "CASH", "Nippon India Liquid Fund - Direct Growth"),
+    ("Mirae Asset Mutual Fund", "", "Mirae Asset Large Cap Fund - Direct Plan"),
+]
+
+DESCRIPTIONS = [
+    "Purchase", "Systematic Investment", "Redemption", "Switch Out",
+    "Switch In", "Dividend Reinvestment", "Purchase - Systematic",
+]
+
+
+def build_statement(rows: int, seed: int = 7) -> pd.DataFrame:
+    """Synthetic CAMS TRXN_DETAILS sheet as read by pandas."""
+    rng = random.Random(seed)
+    folios = [f"{rng.randint(10**7, 10**8)}/{rng.randint(10, 99)}" for _ in range(40)]
+    isins = [f"INF{rng.randint(100, 999)}K01{rng.randint(100, 999)}{rng.randint(0, 9)}" for _ in SCHEMES]
+    start = date(2015, 4, 1)
+
+    records = []
+    for i in range(rows):
+        amc, asset_class, name = SCHEMES[i % len(SCHEMES)]
+        txn_date = start + timedelta(days=rng.randint(0, 3600))
+        purchase_date = txn_date - timedelta(days=rng.randint(30, 2000))
+        units = round(rng.uniform(1, 5000), 3)
+        nav = round(rng.uniform(10, 900), 4)
+        redemption = rng.random() < 0.4
+        records.append({
+            "AMC Name": amc,
+            "Folio No": rng.choice(folios),
+            "ASSET CLASS": asset_class or float("nan"),
+            "Scheme Name": f"{name} ISIN : {isins[i % len(SCHEMES)]}" if rng.random() < 0.8 else name,
+            "Desc": rng.choice(DESCRIPTIONS),
+            "Date": f"{txn_date:%d-%b-%Y}",
+            "Units": units,
+            "Amount": round(units * nav, 2),
+            "Price": nav,
+            "STT": round(units * nav * 0.00001, 2) if redemption else float("nan"),
+            "Date.1": f"{purchase_date:%d-%b-%Y}" if redemption else float("nan"),
+            "PurhUnit": units if redemption else float("nan"),
+            "Unit Cost": round(nav * 0.8, 4) if redemption else float("nan"),
+            "Units As On 31/01/2018 (Grandfathered Units)": float("nan"),
+            "NAV As On 31/01/2018 (Grandfathered NAV)": rng.choice([float("nan"), 25.1234, 61.5]),
+            "Market Value As On 31/01/2018 (Grandfathered Value)": float("nan"),
+            "Short Term": round(rng.uniform(-500, 5000), 2) if redemption else float("nan"),
+            "Long Term Without Index": round(rng.uniform(0, 9000), 2) if redemption else float("nan"),
+        })
+        if rng.random() < 0.01:
+            records.append({"Scheme Name": float("nan"), "Amount": float("nan")})
+    return pd.DataFrame.from_records(records)
+
+
+def parse_rowwise(parser: CAMSParser, df: pd.DataFrame) -> list:
+    """Former path: one iterrows() step and ~25 cell lookups per transaction."""
+    get = parser._get_column_value
+    transactions = []
+    for _, row in df.iterrows():
+        scheme_name = get(row, ['Scheme Name', 'scheme_name', 'SCHEME NAME'])
+        if not scheme_name:
+            continue
+        asset_class_str = get(row, ['ASSET CLASS', 'Asset Class', 'asset_class'])
+        asset_class_str = str(asset_class_str).upper().strip() if asset_class_str else ''
+        if asset_class_str in parser.ASSET_CLASS_MAPPING:
+            asset_class = parser.ASSET_CLASS_MAPPING[asset_class_str]
+        else:
+            asset_class = classify_scheme(scheme_name)
+        nav_31jan = parser._to_decimal(get(row, [
+            'NAV As On 31/01/2018 (Grandfathered NAV)', 'NAV As On 31/01/2018', 'Grandfathered NAV'
+        ]))
+        scheme = MFScheme(
+            name=scheme_name,
+            amc_name=get(row, ['AMC Name', 'amc_name', 'AMC NAME', ' Fund Name']) or '',
+            isin=parser._extract_isin(scheme_name),
+            asset_class=asset_class,
+            nav_31jan2018=nav_31jan if nav_31jan > 0 else None,
+        )
+        txn_date = parser._parse_date(get(row, ['Date', 'date', 'Date.1']))
+        if not txn_date:
+            continue
+        transactions.append(MFTransaction(
+            folio_number=get(row, ['Folio No', 'Folio Number', 'folio_number']) or '',
+            scheme=scheme,
+            transaction_type=parser._determine_transaction_type(
+                get(row, ['Desc', 'desc', 'Trxn.Type', 'Transaction Type']) or ''
+            ),
+            date=txn_date,
+            units=parser._to_decimal(get(row, ['Units', 'units', 'Current Units'])),
+            nav=parser._to_decimal(get(row, ['Price', 'NAV', 'nav'])),
+            amount=parser._to_decimal(get(row, ['Amount', 'amount'])),
+            stt=parser._to_decimal(get(row, ['STT', 'stt'])),
+            purchase_date=parser._parse_date(get(row, ['Date_1', 'Date.1', 'Purchase Date'])),
+            purchase_units=parser._to_decimal(get(row, ['PurhUnit', 'Purchase Units', 'Source Scheme units'])),
+            purchase_nav=parser._to_decimal(get(row, ['Unit Cost', 'Original Purchase Cost', 'Purchase NAV'])),
+            grandfathered_units=parser._to_decimal(get(row, [
+                'Units As On 31/01/2018 (Grandfathered Units)', 'Grandfathered Units'
+            ])),
+            grandfathered_nav=parser._to_decimal(get(row, [
+                'NAV As On 31/01/2018 (Grandfathered NAV)', ' Grandfathered\n NAV as on 31/01/2018'
+            ])),
+            grandfathered_value=parser._to_decimal(get(row, [
+                'Market Value As On 31/01/2018 (Grandfathered Value)', 'GrandFathered Cost Value'
+            ])),
+            short_term_gain=parser._to_decimal(get(row, ['Short Term', 'short_term'])),
+            long_term_gain=parser._to_decimal(get(row, ['Long Term Without Index', 'Long Term'])),
+        ))
+    return transactions
+
+
+def timed(func):
+    start = time.perf_counter()
+    value = func()
+    return value, time.perf_counter() - start
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Benchmark CAMS statement parsing")
+    arg_parser.add_argument("--rows", type=int, default=20000, help="Transactions in the sheet")
+    args = arg_parser.parse_args()
+
+    df = build_statement(args.rows)
+    parser = CAMSParser(sqlite3.connect(":memory:"))
+    print(f"Statement: {len(df):,} rows")
+
+    expected, rowwise = timed(lambda: parse_rowwise(parser, df))
+    print(f"  {'row-by-row':<12} {rowwise:8.3f} s  {len(expected) / rowwise:12,.0f} txns/sec")
+
+    result = ParseResult(success=True)
+    actual, columnar = timed(lambda: parser._parse_frame(df, result))
+    print(f"  {'columnar':<12} {columnar:8.3f} s  {len(actual) / columnar:12,.0f} txns/sec")
+    print(f"  speedup      {rowwise / columnar:8.1f}x")
+
+    if actual != expected:
+        print("ERROR: columnar transactions differ from the row-by-row path")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
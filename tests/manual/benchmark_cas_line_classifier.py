@@ -0,0 +1,69 @@
+"""
+Micro-benchmark for detailed CAS line classification.
+
+Compares the sequential pattern cascade (the reference parser in
+tests/unit/test_parsers/test_mf/cas_sequential_reference.py) against the
+single-pass classifier (_parse_detailed_cas) on the sample CAS fixture
+repeated to a realistic statement size.
+
+Run:
+    python tests/manual/benchmark_cas_line_classifier.py
+    python tests/manual/benchmark_cas_line_classifier.py --copies 500 --repeat 5
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add src and the project root (for the test reference parser) to path
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from pfas.parsers.mf.cas_pdf_parser import CASPDFParser
+from tests.unit.test_parsers.test_mf.cas_sequential_reference import parse_detailed_cas_sequential
+
+FIXTURE = Path(__file__).parent.parent / "fixtures" / "mf" / "sample_cas_detailed.txt"
+
+
+def best_of(func, text: str, repeat: int) -> float:
+    """Best wall-clock time of func(text) over repeat runs."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Benchmark CAS line classification")
+    arg_parser.add_argument("--copies", type=int, default=200, help="Times to repeat the fixture")
+    arg_parser.add_argument("--repeat", type=int, default=3, help="Runs per implementation")
+    args = arg_parser.parse_args()
+
+    text = "\n".join([FIXTURE.read_text()] * args.copies)
+    line_count = text.count("\n") + 1
+    parser = CASPDFParser()
+
+    if parser._parse_detailed_cas(text) != parse_detailed_cas_sequential(parser, text):
+        print("ERROR: classifier output differs from sequential parser")
+        return 1
+
+    print(f"Lines: {line_count:,}")
+    results = {}
+    for label, func in [
+        ("sequential", lambda t: parse_detailed_cas_sequential(parser, t)),
+        ("classifier", parser._parse_detailed_cas),
+    ]:
+        elapsed = best_of(func, text, args.repeat)
+        results[label] = elapsed
+        print(f"  {label:<12} {elapsed * 1000:8.1f} ms  {line_count / elapsed:12,.0f} lines/sec")
+
+    print(f"Speedup: {results['sequential'] / results['classifier']:.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,90 @@
+"""
+Micro-benchmark for bank transaction categorization.
+
+Compares the rule-by-rule keyword scan that CategoryClassifier used to do
+against the compiled KeywordMatcher (classify / classify_many) on
+synthetic UPI/NEFT narrations, a share of which repeat the same payee.
+
+Run:
+    python tests/manual/benchmark_transaction_categorizer.py
+    python tests/manual/benchmark_transaction_categorizer.py --count 500000 --repeat 5
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from pfas.services.bank_intelligence.category_rules import CategoryClassifier
+
+
+def sequential_classify(classifier: CategoryClassifier, description: str):
+    """The former per-keyword scan."""
+    description_upper = description.upper()
+    for rule in classifier.rules:
+        for keyword in rule.keywords:
+            if keyword.upper() in description_upper:
+                return (rule.category, rule.sub_category, rule.is_income)
+    return ("OTHER", None, False)
+
+
+def make_narrations(count: int, seed: int = 11):
+    rng = random.Random(seed)
+    payees = [f"PAYEE{i}@OKAXIS" for i in range(300)]
+    tails = ["SALARY JAN", "RENT FROM TENANT", "INT PD", "ATM WDL", "GROCERY", "", "SIP ICICI MF"]
+    narrations = []
+    for i in range(count):
+        if rng.random() < 0.5:
+            narrations.append(f"UPI/{rng.choice(payees)}/{rng.choice(tails)}")
+        else:
+            narrations.append(f"NEFT/N{rng.randint(10**9, 10**10)}/{rng.choice(payees)}/{rng.choice(tails)}")
+    return narrations
+
+
+def best_of(func, repeat: int) -> float:
+    """Best wall-clock time of func() over repeat runs."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Benchmark transaction categorization")
+    arg_parser.add_argument("--count", type=int, default=100_000, help="Narrations to classify")
+    arg_parser.add_argument("--repeat", type=int, default=3, help="Runs per implementation")
+    args = arg_parser.parse_args()
+
+    narrations = make_narrations(args.count)
+    classifier = CategoryClassifier()
+
+    expected = [sequential_classify(classifier, d) for d in narrations]
+    if classifier.classify_many(narrations) != expected:
+        print("ERROR: compiled matcher output differs from sequential scan")
+        return 1
+
+    def compiled_cold():
+        CategoryClassifier().classify_many(narrations)
+
+    print(f"Narrations: {len(narrations):,} ({len(set(narrations)):,} distinct)")
+    results = {}
+    for label, func in [
+        ("sequential", lambda: [sequential_classify(classifier, d) for d in narrations]),
+        ("compiled", compiled_cold),
+    ]:
+        elapsed = best_of(func, args.repeat)
+        results[label] = elapsed
+        print(f"  {label:<12} {elapsed * 1000:8.1f} ms  {len(narrations) / elapsed:12,.0f} txns/sec")
+
+    print(f"Speedup: {results['sequential'] / results['compiled']:.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
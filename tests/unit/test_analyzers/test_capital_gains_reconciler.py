@@ -0,0 +1,178 @@
+"""
+Unit tests for CapitalGainsReconciler FY lot checkpoints.
+
+Tests:
+1. Single-FY results with checkpoints match a full replay
+2. Later FYs replay only their own transactions
+3. Back-dated transactions invalidate later checkpoints
+4. clear_lot_checkpoints
+"""
+
+import random
+import sqlite3
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+
+from pfas.analyzers.capital_gains_reconciler import CapitalGainsReconciler
+from pfas.core.database import SCHEMA_SQL
+from pfas.parsers.mf.fifo_tracker import PortfolioFIFOTracker
+from pfas.parsers.mf.models import (
+    CASData,
+    CASFolio,
+    CASScheme,
+    CASTransaction,
+    InvestorInfo,
+    StatementPeriod,
+)
+
+FYS = ["2020-21", "2021-22", "2022-23", "2023-24", "2024-25"]
+
+
+@pytest.fixture
+def conn():
+    connection = sqlite3.connect(":memory:")
+    connection.executescript(SCHEMA_SQL)
+    yield connection
+    connection.close()
+
+
+def make_cas(seed: int = 7) -> CASData:
+    """Two folios with SIPs and partial redemptions spread over five FYs."""
+    rng = random.Random(seed)
+    folios = []
+    for folio_no, names in (
+        ("F1", ["Axis Bluechip Fund", "HDFC Corporate Bond Fund"]),
+        ("F2", ["ICICI Prudential Balanced Advantage Fund"]),
+    ):
+        schemes = []
+        for name in names:
+            txns = []
+            balance = Decimal("0")
+            nav = Decimal("20")
+            day = date(2020, 5, 1)
+            while day < date(2025, 3, 1):
+                nav = (nav * Decimal(str(rng.uniform(0.97, 1.05)))).quantize(Decimal("0.0001"))
+                if balance > 50 and rng.random() < 0.25:
+                    units = (balance * Decimal("0.3")).quantize(Decimal("0.001"))
+                    txns.append(CASTransaction(
+                        date=day, description="Redemption",
+                        units=-units, nav=nav, amount=-(units * nav).quantize(Decimal("0.01")),
+                    ))
+                    balance -= units
+                else:
+                    units = (Decimal("5000") / nav).quantize(Decimal("0.001"))
+                    txns.append(CASTransaction(
+                        date=day, description="Purchase - SIP",
+                        units=units, nav=nav, amount=Decimal("5000"),
+                    ))
+                    balance += units
+                day += timedelta(days=45)
+            schemes.append(CASScheme(scheme=name, transactions=txns))
+        folios.append(CASFolio(folio=folio_no, amc="AMC", schemes=schemes))
+
+    return CASData(
+        statement_period=StatementPeriod(date(2020, 4, 1), date(2025, 3, 31)),
+        investor_info=InvestorInfo(name="Test"),
+        folios=folios,
+    )
+
+
+def totals(fy_gains):
+    return {
+        fy: (
+            g.fifo_equity_ltcg, g.fifo_equity_stcg,
+            g.fifo_debt_ltcg, g.fifo_debt_stcg,
+            g.fifo_hybrid_ltcg, g.fifo_hybrid_stcg,
+            [(s.folio, s.scheme_name, s.fifo_ltcg, s.fifo_stcg, s.redemption_count)
+             for s in g.scheme_gains],
+        )
+        for fy, g in fy_gains.items()
+    }
+
+
+def count_replayed(monkeypatch):
+    calls = []
+    original = PortfolioFIFOTracker.process_transaction
+
+    def counting(self, *args, **kwargs):
+        calls.append((kwargs["scheme_name"], kwargs["txn_date"]))
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(PortfolioFIFOTracker, "process_transaction", counting)
+    return calls
+
+
+class TestLotCheckpoints:
+    """Tests for FY-boundary lot checkpoints."""
+
+    def test_single_fy_matches_full_replay(self, conn):
+        cas = make_cas()
+        full = totals(CapitalGainsReconciler(conn).calculate_from_cas(cas, 1, use_checkpoints=False))
+
+        reconciler = CapitalGainsReconciler(conn)
+        for fy in FYS:
+            result = totals(reconciler.calculate_from_cas(cas, 1, fy))
+            assert result == {fy: full[fy]}
+
+        # Second pass resumes from stored checkpoints
+        for fy in reversed(FYS):
+            assert totals(reconciler.calculate_from_cas(cas, 1, fy)) == {fy: full[fy]}
+
+    def test_full_replay_saves_every_boundary(self, conn):
+        CapitalGainsReconciler(conn).calculate_from_cas(make_cas(), 1)
+
+        boundaries = [row[0] for row in conn.execute("""
+            SELECT DISTINCT boundary_date FROM mf_fifo_lot_checkpoints ORDER BY boundary_date
+        """)]
+        assert boundaries == [f"{year}-04-01" for year in range(2021, 2026)]
+
+    def test_later_fy_replays_only_its_transactions(self, conn, monkeypatch):
+        cas = make_cas()
+        reconciler = CapitalGainsReconciler(conn)
+        reconciler.calculate_from_cas(cas, 1, "2023-24")
+
+        calls = count_replayed(monkeypatch)
+        reconciler.calculate_from_cas(cas, 1, "2024-25")
+
+        dates = [d for _, d in calls]
+        assert dates
+        assert min(dates) >= date(2024, 4, 1)
+        assert max(dates) <= date(2025, 3, 31)
+
+    def test_backdated_transaction_invalidates_checkpoints(self, conn, monkeypatch):
+        cas = make_cas()
+        reconciler = CapitalGainsReconciler(conn)
+        reconciler.calculate_from_cas(cas, 1, "2024-25")
+
+        # A newer statement shows an extra FY 2021-22 purchase in one scheme
+        scheme = cas.folios[0].schemes[0]
+        scheme.transactions.append(CASTransaction(
+            date=date(2021, 9, 15), description="Purchase",
+            units=Decimal("100"), nav=Decimal("25"), amount=Decimal("2500"),
+        ))
+        expected = totals(CapitalGainsReconciler(conn).calculate_from_cas(cas, 1, use_checkpoints=False))
+
+        calls = count_replayed(monkeypatch)
+        result = totals(reconciler.calculate_from_cas(cas, 1, "2024-25"))
+
+        assert result == {"2024-25": expected["2024-25"]}
+        # Only the changed scheme went back to its 2021-04-01 checkpoint
+        changed = [d for name, d in calls if name == scheme.scheme]
+        others = [d for name, d in calls if name != scheme.scheme]
+        assert date(2021, 4, 1) <= min(changed) < date(2022, 4, 1)
+        assert min(others) >= date(2024, 4, 1)
+
+        calls.clear()
+        reconciler.calculate_from_cas(cas, 1, "2024-25")
+        assert min(d for _, d in calls) >= date(2024, 4, 1)
+
+    def test_clear_lot_checkpoints(self, conn):
+        reconciler = CapitalGainsReconciler(conn)
+        reconciler.calculate_from_cas(make_cas(), 1)
+
+        deleted = reconciler.clear_lot_checkpoints(1, from_date=date(2024, 4, 1))
+        assert deleted == 6  # 3 schemes x 2 boundaries
+        assert reconciler.clear_lot_checkpoints(1) == 9
+        assert reconciler.clear_lot_checkpoints(1) == 0
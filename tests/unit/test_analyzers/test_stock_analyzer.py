@@ -481,6 +481,41 @@ class TestXIRRCalculator:
         assert xirr is not None
         assert abs(xirr) < 0.01  # ~0% return
 
+    def test_analyzer_xirr_matches_per_stock_calculation(self, sample_config):
+        """Batched portfolio/per-stock XIRR should match the scalar calculator."""
+        import sqlite3
+
+        conn = sqlite3.connect(":memory:")
+        conn.execute("""CREATE TABLE stock_capital_gains_detail (
+            user_id INTEGER, symbol TEXT, buy_date TEXT, sell_date TEXT,
+            buy_value REAL, sell_value REAL)""")
+        conn.execute("""CREATE TABLE stock_holdings (
+            user_id INTEGER, symbol TEXT, market_value REAL, as_of_date TEXT)""")
+        conn.executemany(
+            "INSERT INTO stock_capital_gains_detail VALUES (1, ?, ?, ?, ?, ?)",
+            [
+                ("INFY", "2023-01-10", "2023-11-20", 10000, 11500),
+                ("INFY", "2023-03-01", "2024-02-01", 5000, 4800),
+                ("TCS", "2022-06-15", "2024-01-05", 20000, 26000),
+            ]
+        )
+        conn.execute("INSERT INTO stock_holdings VALUES (1, 'INFY', 7000, '2024-03-31')")
+
+        analyzer = StockAnalyzer(conn, config=sample_config)
+        analyzer.user_id = 1
+        analyzer._calculate_xirr()
+
+        infy = XIRRCalculator.calculate([
+            (date(2023, 1, 10), Decimal("-10000")), (date(2023, 11, 20), Decimal("11500")),
+            (date(2023, 3, 1), Decimal("-5000")), (date(2024, 2, 1), Decimal("4800")),
+            (date(2024, 3, 31), Decimal("7000")),
+        ])
+        tcs = XIRRCalculator.calculate([(date(2022, 6, 15), Decimal("-20000")), (date(2024, 1, 5), Decimal("26000"))])
+
+        assert analyzer.result.xirr_by_stock["INFY"] == pytest.approx(infy)
+        assert analyzer.result.xirr_by_stock["TCS"] == pytest.approx(tcs)
+        assert analyzer.result.xirr_overall is not None
+
 
 # =============================================================================
 # Scanner Tests
@@ -813,3 +848,131 @@ class TestEdgeCases:
         assert h.isin == ""  # NaN converted to empty string
         assert h.average_buy_price == Decimal("0")  # NaN converted to 0
         assert h.unrealized_pnl == Decimal("0")
+
+
+# =============================================================================
+# DB Ingester Tests
+# =============================================================================
+
+@pytest.fixture
+def cg_conn():
+    """In-memory DB with stock_brokers and a capital gains table without UNIQUE."""
+    import sqlite3
+
+    conn = sqlite3.connect(":memory:")
+    conn.execute("""CREATE TABLE stock_brokers (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT UNIQUE NOT NULL, broker_code TEXT)""")
+    conn.execute("""CREATE TABLE stock_capital_gains_detail (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, user_id INTEGER NOT NULL, broker_id INTEGER,
+        financial_year TEXT, quarter TEXT, symbol TEXT NOT NULL, isin TEXT, company_name TEXT,
+        quantity INTEGER NOT NULL, buy_date DATE, sell_date DATE, holding_period_days INTEGER,
+        buy_price REAL, sell_price REAL, buy_value REAL, sell_value REAL,
+        buy_expenses REAL, sell_expenses REAL, fmv_31jan2018 REAL, grandfathered_price REAL,
+        is_grandfathered BOOLEAN, gross_profit_loss REAL, cost_of_acquisition REAL,
+        taxable_profit REAL, is_long_term BOOLEAN, gain_type TEXT, stt_paid REAL,
+        turnover REAL, source_file TEXT)""")
+    yield conn
+    conn.close()
+
+
+def make_trades(count, offset=0, source="trades.xlsx"):
+    trades = []
+    for i in range(offset, offset + count):
+        trades.append(NormalizedTransaction(
+            symbol=["INFY", "TCS", "WIPRO"][i % 3],
+            isin="INE000000000",
+            quantity=10 + i % 4,
+            buy_date=date(2023, 1, 1 + i % 28),
+            sell_date=date(2024, 1 + i % 12, 1 + i % 28),
+            buy_value=Decimal("1000"),
+            sell_value=Decimal("1100"),
+            broker=BrokerType.ZERODHA if i % 2 else BrokerType.ICICIDIRECT,
+            source_file=source,
+        ))
+    return trades
+
+
+def stored_rows(conn):
+    return conn.execute("""SELECT user_id, broker_id, symbol, quantity, buy_date, sell_date, source_file
+        FROM stock_capital_gains_detail ORDER BY id""").fetchall()
+
+
+class TestStockDBIngester:
+    """Tests for duplicate handling in StockDBIngester.ingest_transactions."""
+
+    def test_bulk_matches_row_by_row(self, sample_config, cg_conn):
+        import sqlite3
+
+        other = sqlite3.connect(":memory:")
+        for (sql,) in cg_conn.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'"):
+            other.execute(sql)
+
+        # Second batch repeats 20 stored trades and one trade within itself
+        batches = [make_trades(40), make_trades(30, offset=20, source="next.xlsx")]
+        batches[1].append(make_trades(1, offset=45)[0])
+
+        results = {}
+        for conn, bulk in ((other, False), (cg_conn, True)):
+            ingester = StockDBIngester(conn, sample_config)
+            results[bulk] = []
+            for batch in batches:
+                counts = ingester.ingest_transactions(batch, user_id=1, bulk=bulk)
+                results[bulk].append((counts, list(ingester.skipped_transactions)))
+
+        assert results[True] == results[False]
+        assert results[True][1][0] == (10, 21)
+        assert results[True][1][1][-1] is batches[1][-1]
+        assert stored_rows(cg_conn) == stored_rows(other)
+
+    def test_one_lookup_per_batch(self, sample_config, cg_conn):
+        ingester = StockDBIngester(cg_conn, sample_config)
+        ingester.ingest_transactions(make_trades(40), user_id=1)
+
+        statements = []
+        cg_conn.set_trace_callback(statements.append)
+        ingester.ingest_transactions(make_trades(40, offset=10), user_id=1)
+        cg_conn.set_trace_callback(None)
+
+        lookups = [s for s in statements if s.lstrip().startswith("SELECT symbol, buy_date")]
+        assert len(lookups) == 1
+        assert "sell_date BETWEEN" in lookups[0]
+
+    def test_migration_dedups_and_indexes(self, sample_config, cg_conn):
+        from pfas.core.database import bootstrap_schema
+
+        trades = make_trades(5)
+        for trade in (trades[0], *trades, trades[3]):
+            cg_conn.execute(
+                StockDBIngester.INSERT_TRANSACTION_SQL,
+                StockDBIngester._transaction_row(trade, 1, 1),
+            )
+        cg_conn.commit()
+        cg_conn.execute("PRAGMA user_version = 4")
+
+        assert bootstrap_schema(cg_conn) == [5]
+
+        indexes = [row[1] for row in cg_conn.execute("PRAGMA index_list(stock_capital_gains_detail)")]
+        assert "idx_stock_cg_detail_dedup" in indexes
+        assert [row[0] for row in cg_conn.execute(
+            "SELECT id FROM stock_capital_gains_detail ORDER BY id"
+        )] == [1, 3, 4, 5, 6]
+
+        cg_conn.executemany(
+            StockDBIngester.INSERT_OR_IGNORE_TRANSACTION_SQL,
+            [StockDBIngester._transaction_row(t, 1, 1) for t in trades],
+        )
+        assert len(stored_rows(cg_conn)) == 5
+
+    def test_legacy_duplicates_keep_in_memory_check(self, sample_config, cg_conn):
+        trades = make_trades(3)
+        for _ in range(2):
+            cg_conn.execute(
+                StockDBIngester.INSERT_TRANSACTION_SQL,
+                StockDBIngester._transaction_row(trades[0], 1, 1),
+            )
+
+        ingester = StockDBIngester(cg_conn, sample_config)
+        inserted, skipped = ingester.ingest_transactions(trades, user_id=1)
+
+        assert (inserted, skipped) == (2, 1)
+        assert ingester.skipped_transactions == [trades[0]]
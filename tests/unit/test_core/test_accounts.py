@@ -14,6 +14,8 @@ from pfas.core.accounts import (
     get_account_hierarchy,
     CHART_OF_ACCOUNTS,
     Account,
+    AccountDirectory,
+    get_account_directory,
 )
 from pfas.core.exceptions import AccountNotFoundError
 
@@ -168,6 +170,79 @@ class TestAccountHierarchy:
             get_account_hierarchy(db_with_accounts, "9999")
 
 
+class TestAccountDirectory:
+    """Tests for the in-process chart-of-accounts cache."""
+
+    def test_lookups_served_from_memory(self, db_with_accounts):
+        """Test repeated lookups load accounts once."""
+        directory = AccountDirectory(db_with_accounts)
+
+        bank = directory.get_by_code("1101")
+        assert directory.get_id("1101") == bank.id
+        assert directory.get_by_id(bank.id).code == "1101"
+
+        stats = directory.stats()
+        assert stats["loads"] == 1
+        assert stats["lookups_avoided"] == 3
+        assert stats["db_lookups"] == 0
+
+    def test_children_by_parent(self, db_with_accounts):
+        """Test children are indexed by parent ID."""
+        directory = AccountDirectory(db_with_accounts)
+        investments = directory.get_by_code("1200")
+
+        codes = {a.code for a in directory.get_children(investments.id)}
+
+        assert {"1201", "1202", "1203"} <= codes
+
+    def test_same_connection_write_invalidates(self, db_with_accounts):
+        """Test inserts and updates on the same connection are picked up."""
+        directory = AccountDirectory(db_with_accounts)
+        directory.get_by_code("1101")
+
+        db_with_accounts.execute(
+            "INSERT INTO accounts (code, name, account_type) VALUES ('9901', 'Test', 'ASSET')"
+        )
+        db_with_accounts.execute("UPDATE accounts SET name = 'Renamed' WHERE code = '1101'")
+        db_with_accounts.commit()
+
+        assert directory.get_by_code("9901") is not None
+        assert directory.get_by_code("1101").name == "Renamed"
+        assert directory.stats()["db_lookups"] == 0
+
+    def test_other_connection_write_invalidates(self, tmp_path):
+        """Test commits from another connection are detected via data_version."""
+        import sqlite3
+
+        db_path = tmp_path / "accounts.db"
+        writer = sqlite3.connect(db_path)
+        writer.execute(
+            "CREATE TABLE accounts (id INTEGER PRIMARY KEY, code TEXT UNIQUE, name TEXT, "
+            "account_type TEXT, parent_id INTEGER, currency TEXT, description TEXT, "
+            "is_active INTEGER DEFAULT 1)"
+        )
+        writer.execute("INSERT INTO accounts (code, name, account_type) VALUES ('1101', 'Bank', 'ASSET')")
+        writer.commit()
+
+        reader = sqlite3.connect(db_path)
+        directory = AccountDirectory(reader)
+        assert directory.get_by_code("1101").name == "Bank"
+
+        writer.execute("UPDATE accounts SET name = 'Bank - Savings' WHERE code = '1101'")
+        writer.commit()
+
+        assert directory.get_by_code("1101").name == "Bank - Savings"
+        reader.close()
+        writer.close()
+
+    def test_directory_shared_per_connection(self, db_with_accounts):
+        """Test the registry returns one directory per connection."""
+        from unittest.mock import MagicMock
+
+        assert get_account_directory(db_with_accounts) is get_account_directory(db_with_accounts)
+        assert get_account_directory(MagicMock()) is None
+
+
 class TestAccountDataclass:
     """Tests for Account dataclass."""
 
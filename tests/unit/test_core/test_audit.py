@@ -5,9 +5,17 @@ Tests audit logging for compliance and data tracking.
 """
 
 import pytest
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from decimal import Decimal
 
-from pfas.core.audit import AuditLogger, AuditLogEntry
+from pfas.core.accounts import get_account_by_code
+from pfas.core.audit import AuditLogger, AuditLogEntry, AuditMode, audit_session
+from pfas.core.journal import JournalEntry
+from pfas.core.transaction_service import (
+    TransactionService,
+    TransactionSource,
+    TransactionRequest,
+)
 
 
 @pytest.fixture
@@ -255,3 +263,143 @@ class TestAuditLogEntryDataclass:
         assert entry.record_id == 1
         assert entry.action == "INSERT"
         assert isinstance(entry.timestamp, datetime)
+
+
+class TestAuditModes:
+    """Tests for full/summary/deferred audit modes in TransactionService."""
+
+    @pytest.fixture
+    def service(self, db_with_accounts):
+        return TransactionService(db_with_accounts)
+
+    @staticmethod
+    def _requests(conn, count):
+        bank = get_account_by_code(conn, "1101")
+        salary = get_account_by_code(conn, "4101")
+        return [
+            TransactionRequest(
+                description=f"Salary {i}",
+                idempotency_key=f"audit-mode:{i}",
+                entries=[
+                    JournalEntry(account_id=bank.id, debit=Decimal("100")),
+                    JournalEntry(account_id=salary.id, credit=Decimal("100")),
+                ],
+                txn_date=date(2024, 4, 1),
+            )
+            for i in range(count)
+        ]
+
+    @staticmethod
+    def _audit_counts(conn):
+        # Chart of accounts setup is audited too; ignore it
+        rows = conn.execute(
+            "SELECT table_name, COUNT(*) FROM audit_log "
+            "WHERE table_name != 'accounts' GROUP BY table_name"
+        ).fetchall()
+        return {row[0]: row[1] for row in rows}
+
+    def test_full_mode_audits_journal_once(self, service, db_with_accounts, sample_user):
+        """The trigger row is kept; the service does not add a second journals row."""
+        request = self._requests(db_with_accounts, 1)[0]
+        result = service.record(
+            user_id=sample_user["id"],
+            entries=request.entries,
+            description=request.description,
+            source=TransactionSource.MANUAL,
+            idempotency_key=request.idempotency_key,
+        )
+
+        journal_rows = db_with_accounts.execute(
+            "SELECT COUNT(*) FROM audit_log WHERE table_name = 'journals' AND record_id = ?",
+            (result.journal_id,),
+        ).fetchone()[0]
+        assert journal_rows == 1
+        assert self._audit_counts(db_with_accounts)["journal_entries"] == 2
+
+    def test_summary_mode_one_row_per_transaction(self, service, db_with_accounts, sample_user):
+        with audit_session(db_with_accounts, AuditMode.SUMMARY):
+            service.record_many(
+                user_id=sample_user["id"],
+                requests=self._requests(db_with_accounts, 3),
+                source=TransactionSource.MANUAL,
+            )
+
+        assert self._audit_counts(db_with_accounts) == {"journals": 3}
+        assert db_with_accounts.execute(
+            "SELECT suppress_row_audit FROM audit_control"
+        ).fetchone()[0] == 0
+
+    def test_deferred_mode_writes_one_batch(self, service, db_with_accounts, sample_user):
+        with audit_session(db_with_accounts, "deferred", label="salary.xlsx",
+                           user_id=sample_user["id"]) as batch:
+            results = service.record_many(
+                user_id=sample_user["id"],
+                requests=self._requests(db_with_accounts, 5),
+                source=TransactionSource.MANUAL,
+                chunk_size=2,
+            )
+
+        assert self._audit_counts(db_with_accounts) == {"audit_batches": 1}
+        assert batch.id is not None
+        assert batch.row_count == 5
+
+        audit_logger = AuditLogger(db_with_accounts)
+        stored = audit_logger.get_batch(batch.id)
+        assert stored.label == "salary.xlsx"
+        assert stored.row_ids["journals"] == [r.journal_id for r in results]
+
+        detail = audit_logger.get_batch_detail(batch.id)
+        assert [d["values"]["description"] for d in detail] == [f"Salary {i}" for i in range(5)]
+
+    def test_deferred_mode_writes_nothing_on_error(self, service, db_with_accounts, sample_user):
+        with pytest.raises(RuntimeError):
+            with audit_session(db_with_accounts, AuditMode.DEFERRED):
+                service.record_many(
+                    user_id=sample_user["id"],
+                    requests=self._requests(db_with_accounts, 2),
+                    source=TransactionSource.MANUAL,
+                )
+                raise RuntimeError("parse failed")
+
+        assert "audit_batches" not in self._audit_counts(db_with_accounts)
+
+    def test_deferred_mode_skips_rows_rolled_back_by_caller(self, service, db_with_accounts, sample_user):
+        """Rows written inside a caller's transaction and then rolled back are not audited."""
+        requests = self._requests(db_with_accounts, 3)
+        with audit_session(db_with_accounts, AuditMode.DEFERRED, label="file") as batch:
+            db_with_accounts.execute("BEGIN IMMEDIATE")
+            db_with_accounts.execute("SAVEPOINT caller")
+            service.record_many(
+                user_id=sample_user["id"], requests=requests[:2], source=TransactionSource.MANUAL
+            )
+            db_with_accounts.execute("ROLLBACK TO SAVEPOINT caller")
+            db_with_accounts.execute("RELEASE SAVEPOINT caller")
+            kept = service.record_many(
+                user_id=sample_user["id"], requests=requests[2:], source=TransactionSource.MANUAL
+            )
+        db_with_accounts.commit()
+
+        assert batch.row_ids == {"journals": [kept[0].journal_id]}
+        assert AuditLogger(db_with_accounts).get_batch(batch.id).row_count == 1
+
+    def test_mode_restored_after_session(self, service, db_with_accounts, sample_user):
+        with audit_session(db_with_accounts, AuditMode.SUMMARY):
+            pass
+
+        request = self._requests(db_with_accounts, 1)[0]
+        service.record(
+            user_id=sample_user["id"],
+            entries=request.entries,
+            description=request.description,
+            source=TransactionSource.MANUAL,
+            idempotency_key=request.idempotency_key,
+        )
+        assert self._audit_counts(db_with_accounts)["journal_entries"] == 2
+
+    def test_log_change_keeps_caller_transaction_open(self, db_connection, audit_logger):
+        db_connection.execute("BEGIN IMMEDIATE")
+        audit_logger.log_insert("users", 1, {"name": "Test"})
+
+        assert db_connection.in_transaction
+        db_connection.rollback()
+        assert db_connection.execute("SELECT COUNT(*) FROM audit_log").fetchone()[0] == 0
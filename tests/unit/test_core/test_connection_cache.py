@@ -0,0 +1,158 @@
+"""
+Unit tests for the shared per-connection caches.
+
+Tests:
+1. DataGeneration staleness: own writes, other connections, rollbacks
+2. One value per connection, bounded, closed connections pruned
+3. discard_connection_caches() and the DatabaseManager close hook
+"""
+
+import sqlite3
+
+import pytest
+
+from pfas.core.accounts import get_account_directory
+from pfas.core.audit import get_audit_context
+from pfas.core.connection_cache import (
+    ConnectionCache,
+    DataGeneration,
+    discard_connection_caches,
+)
+from pfas.core.database import DatabaseManager
+from pfas.core.rate_calendar import _registry as rate_calendars, rate_calendar
+
+
+@pytest.fixture
+def shared_db(tmp_path):
+    path = tmp_path / "shared.db"
+    first = sqlite3.connect(path)
+    first.execute("CREATE TABLE t (x INTEGER)")
+    first.commit()
+    second = sqlite3.connect(path)
+    yield first, second
+    second.close()
+    first.close()
+
+
+class TestDataGeneration:
+    """Tests for DataGeneration.is_stale()."""
+
+    def test_unmarked_is_stale(self, shared_db):
+        conn, _ = shared_db
+        assert DataGeneration().is_stale(conn)
+        assert DataGeneration().is_stale(conn, own_writes=False)
+
+    def test_own_writes(self, shared_db):
+        conn, _ = shared_db
+        generation = DataGeneration()
+        generation.mark(conn)
+        assert not generation.is_stale(conn)
+
+        conn.execute("INSERT INTO t VALUES (1)")
+        conn.commit()
+
+        assert generation.is_stale(conn)
+        assert not generation.is_stale(conn, own_writes=False)
+
+    def test_other_connection_commit(self, shared_db):
+        conn, other = shared_db
+        generation = DataGeneration()
+        generation.mark(conn)
+
+        other.execute("INSERT INTO t VALUES (1)")
+        other.commit()
+
+        assert generation.is_stale(conn)
+        assert generation.is_stale(conn, own_writes=False)
+
+    def test_marked_in_transaction_then_rolled_back(self, shared_db):
+        conn, _ = shared_db
+        generation = DataGeneration()
+        conn.execute("INSERT INTO t VALUES (1)")
+        generation.mark(conn)
+        assert not generation.is_stale(conn)
+
+        conn.rollback()
+
+        assert generation.is_stale(conn, own_writes=False)
+
+    def test_advance_accepts_own_writes(self, shared_db):
+        conn, _ = shared_db
+        generation = DataGeneration()
+        generation.mark(conn)
+        conn.execute("INSERT INTO t VALUES (1)")
+        conn.commit()
+
+        generation.advance(conn)
+
+        assert not generation.is_stale(conn)
+
+
+class TestConnectionCache:
+    """Tests for ConnectionCache."""
+
+    def test_one_value_per_connection(self, shared_db):
+        first, second = shared_db
+        cache = ConnectionCache(lambda conn: object())
+
+        assert cache.get(first) is cache.get(first)
+        assert cache.get(first) is not cache.get(second)
+        assert cache.peek(first) is cache.get(first)
+
+    def test_least_recently_used_dropped(self):
+        connections = [sqlite3.connect(":memory:") for _ in range(3)]
+        cache = ConnectionCache(lambda conn: object(), max_connections=2)
+        try:
+            first = cache.get(connections[0])
+            cache.get(connections[1])
+            cache.get(connections[0])
+            cache.get(connections[2])
+
+            assert cache.peek(connections[0]) is first
+            assert cache.peek(connections[1]) is None
+        finally:
+            for conn in connections:
+                conn.close()
+
+    def test_closed_connections_pruned(self):
+        cache = ConnectionCache(lambda conn: object())
+        closed = sqlite3.connect(":memory:")
+        cache.get(closed)
+        closed.close()
+
+        live = sqlite3.connect(":memory:")
+        try:
+            cache.get(live)
+            assert len(cache) == 1
+        finally:
+            live.close()
+
+    def test_discard_drops_from_every_cache(self, shared_db):
+        conn, other = shared_db
+        conn.execute(
+            "CREATE TABLE exchange_rates (id INTEGER PRIMARY KEY, date TEXT, "
+            "from_currency TEXT, to_currency TEXT, rate REAL, source TEXT)"
+        )
+        directory = get_account_directory(conn)
+        context = get_audit_context(conn)
+        rate_calendar(conn, "USD")
+        rate_calendar(other, "USD")
+
+        discard_connection_caches(conn)
+
+        assert get_account_directory(conn) is not directory
+        assert get_audit_context(conn) is not context
+        assert rate_calendars.peek(conn) is None
+        assert rate_calendars.peek(other) is not None
+
+    def test_database_manager_close_discards(self):
+        DatabaseManager.reset_instance()
+        db = DatabaseManager()
+        conn = db.init(":memory:", "test_password")
+        get_account_directory(conn)
+        rate_calendar(conn, "USD")
+
+        db.close()
+        DatabaseManager.reset_instance()
+
+        assert rate_calendars.peek(conn) is None
@@ -4,8 +4,18 @@ Unit tests for database module.
 Tests SQLCipher encrypted database creation and schema initialization.
 """
 
+import sqlite3
+import threading
+
 import pytest
-from pfas.core.database import DatabaseManager, get_connection, SCHEMA_SQL
+from pfas.core.database import (
+    DatabaseManager,
+    get_connection,
+    SCHEMA_SQL,
+    SCHEMA_VERSION,
+    bootstrap_schema,
+    get_schema_version,
+)
 from pfas.core.exceptions import DatabaseError
 
 
@@ -140,3 +150,192 @@ class TestGetConnection:
             get_connection()
 
         DatabaseManager.reset_instance()
+
+
+@pytest.fixture
+def file_db(db_manager, tmp_path):
+    """File database (WAL) with a two-reader pool."""
+    db_manager.init(str(tmp_path / "pool.db"), "test_password_123", pool_size=2)
+    return db_manager
+
+
+class TestConnectionPool:
+    """Tests for DatabaseManager.reader()/writer() and the connection pool."""
+
+    def insert_account(self, conn, code):
+        conn.execute(
+            "INSERT INTO accounts (code, name, account_type) VALUES (?, ?, ?)",
+            (code, f"Account {code}", "ASSET"),
+        )
+
+    def test_reader_is_read_only(self, file_db):
+        with file_db.reader() as conn:
+            assert conn is not file_db.connection
+            assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+            with pytest.raises(Exception, match="readonly"):
+                self.insert_account(conn, "9001")
+
+    def test_reader_sees_committed_rows_while_writer_is_busy(self, file_db):
+        with file_db.writer() as writer:
+            self.insert_account(writer, "9002")
+            writer.commit()
+
+            writer.execute("BEGIN IMMEDIATE")
+            self.insert_account(writer, "9003")
+            # WAL: the reader is not blocked by the open write transaction
+            with file_db.reader() as conn:
+                codes = {row["code"] for row in conn.execute("SELECT code FROM accounts")}
+            writer.commit()
+
+        assert "9002" in codes
+        assert "9003" not in codes
+
+    def test_per_thread_checkout(self, file_db):
+        seen = {}
+        barrier = threading.Barrier(2)
+
+        def worker(name):
+            with file_db.reader() as conn:
+                with file_db.reader() as nested:
+                    assert nested is conn
+                seen[name] = id(conn)
+                barrier.wait(timeout=5)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in ("a", "b")]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert seen["a"] != seen["b"]
+        stats = file_db.pool_stats()
+        assert stats.readers_open == 2
+        assert stats.readers_in_use == 0
+        assert stats.reader_checkouts == 2
+
+        # Idle readers are reused
+        with file_db.reader():
+            pass
+        assert file_db.pool_stats().readers_open == 2
+
+    def test_checkout_timeout(self, file_db):
+        file_db.pool.timeout = 0.05
+        release = threading.Event()
+        holding = threading.Barrier(3)
+
+        def hold():
+            with file_db.reader():
+                holding.wait(timeout=5)
+                release.wait(timeout=5)
+
+        threads = [threading.Thread(target=hold) for _ in range(2)]
+        for t in threads:
+            t.start()
+        holding.wait(timeout=5)
+
+        with pytest.raises(DatabaseError, match="No read connection free"):
+            with file_db.reader():
+                pass
+
+        release.set()
+        for t in threads:
+            t.join()
+        assert file_db.pool_stats().reader_waits == 1
+
+    def test_health_check_replaces_broken_reader(self, file_db):
+        with file_db.reader() as conn:
+            pass
+        conn.close()
+
+        assert file_db.pool.check_health()
+        assert file_db.pool_stats().readers_replaced == 1
+        with file_db.reader() as fresh:
+            assert fresh is not conn
+            assert fresh.execute("SELECT 1").fetchone()[0] == 1
+
+    def test_in_memory_readers_share_writer(self, db_connection, db_manager):
+        with db_manager.reader() as conn:
+            assert conn is db_connection
+        assert db_manager.pool_stats().shared
+
+    def test_closed_pool(self, file_db):
+        pool = file_db.pool
+        file_db.close()
+
+        with pytest.raises(DatabaseError):
+            with pool.reader():
+                pass
+        with pytest.raises(DatabaseError):
+            file_db.pool_stats()
+
+
+class TestSchemaBootstrap:
+    """Tests for the PRAGMA user_version schema bootstrap."""
+
+    @staticmethod
+    def ddl_statements(conn, func):
+        statements = []
+        conn.set_trace_callback(statements.append)
+        try:
+            func()
+        finally:
+            conn.set_trace_callback(None)
+        return [s for s in statements if s.lstrip().upper().startswith(("CREATE", "DROP"))]
+
+    def test_new_database_is_stamped(self, file_db):
+        conn = file_db.connection
+        assert get_schema_version(conn) == SCHEMA_VERSION
+        tables = file_db.get_tables()
+        assert "processed_files" in tables
+        assert "mf_nav_history" in tables
+
+    def test_current_database_skips_ddl(self, file_db, tmp_path):
+        file_db.close()
+        conn = file_db.init(str(tmp_path / "pool.db"), "test_password_123")
+
+        assert self.ddl_statements(conn, lambda: bootstrap_schema(conn)) == []
+
+    def test_services_skip_ddl_on_current_schema(self, db_connection):
+        from pfas.services.batch_ingester import BatchIngester
+        from pfas.services.nav_service import NAVService
+
+        ddl = self.ddl_statements(db_connection, lambda: (
+            BatchIngester(db_connection, user_id=1), NAVService(db_connection)
+        ))
+        assert ddl == []
+
+    def test_legacy_database_is_migrated(self, tmp_path):
+        conn = sqlite3.connect(tmp_path / "legacy.db")
+        conn.executescript(SCHEMA_SQL)
+        # Pre-005 unguarded insert trigger
+        conn.executescript("""
+            DROP TRIGGER audit_accounts_insert;
+            CREATE TRIGGER audit_accounts_insert AFTER INSERT ON accounts
+            BEGIN
+                INSERT INTO audit_log (table_name, record_id, action)
+                VALUES ('accounts', NEW.id, 'INSERT');
+            END;
+            INSERT INTO journals (id, date, description) VALUES (1, '2024-04-01', 'Opening');
+            INSERT INTO journal_entries (journal_id, account_id, debit, credit)
+            VALUES (1, 7, 250, 0), (1, 8, 0, 250);
+        """)
+        assert get_schema_version(conn) == 0
+
+        assert bootstrap_schema(conn) == [1, 2, 3, 4, 5]
+        assert get_schema_version(conn) == SCHEMA_VERSION
+        balances = conn.execute(
+            "SELECT account_id, running_balance FROM account_daily_balances ORDER BY account_id"
+        ).fetchall()
+        assert balances == [(7, 250), (8, -250)]
+        trigger_sql = conn.execute(
+            "SELECT sql FROM sqlite_master WHERE name = 'audit_accounts_insert'"
+        ).fetchone()[0]
+        assert "audit_control" in trigger_sql
+        assert bootstrap_schema(conn) == []
+
+    def test_newer_database_is_left_alone(self, tmp_path):
+        conn = sqlite3.connect(tmp_path / "future.db")
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION + 1}")
+
+        assert bootstrap_schema(conn) == []
+        assert conn.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()[0] == 0
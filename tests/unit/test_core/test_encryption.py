@@ -8,7 +8,15 @@ import pytest
 from pfas.core.encryption import (
     encrypt_field,
     decrypt_field,
+    decrypt_fields,
     derive_key,
+    FieldCipher,
+    KeyCache,
+    get_key_cache,
+    clear_key_cache,
+    get_user_cipher,
+    is_envelope,
+    reencrypt_to_envelope,
     generate_master_key,
     mask_sensitive,
     SALT_LENGTH,
@@ -189,6 +197,124 @@ class TestKeyDerivation:
         assert salt1 == salt2 == fixed_salt
 
 
+class TestKeyCache:
+    """Tests for the derived-key LRU cache."""
+
+    def test_cache_hit_returns_same_key(self):
+        """Test repeated derivation for the same salt is served from cache."""
+        cache = KeyCache(maxsize=4)
+        salt = b"s" * SALT_LENGTH
+
+        key1 = cache.get_or_derive(b"password", salt)
+        key2 = cache.get_or_derive(b"password", salt)
+
+        assert key1 == key2 == derive_key(b"password", salt)
+        assert cache.stats()["misses"] == 1
+        assert cache.stats()["hits"] == 1
+
+    def test_cache_is_bounded(self):
+        """Test least recently used keys are evicted."""
+        cache = KeyCache(maxsize=2)
+        for i in range(3):
+            cache.get_or_derive(b"password", bytes([i]) * SALT_LENGTH)
+
+        assert len(cache) == 2
+
+    def test_cache_clear_wipes_keys(self):
+        """Test clear() drops derived keys."""
+        cache = KeyCache(maxsize=2)
+        cache.get_or_derive(b"password", b"s" * SALT_LENGTH)
+
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.stats()["hits"] == 0
+
+
+class TestEnvelopeEncryption:
+    """Tests for per-user envelope encryption."""
+
+    def test_envelope_roundtrip(self, master_key):
+        """Test FieldCipher encrypts into envelopes that decrypt_field reads."""
+        cipher = FieldCipher(master_key, b"u" * SALT_LENGTH)
+
+        ciphertext, salt = cipher.encrypt("AAPPS0793R")
+
+        assert is_envelope(ciphertext)
+        assert salt == b"u" * SALT_LENGTH
+        assert decrypt_field(ciphertext, salt, master_key) == "AAPPS0793R"
+
+    def test_envelope_unique_nonce(self, master_key):
+        """Test the same value encrypts differently under one data key."""
+        cipher = FieldCipher(master_key, b"u" * SALT_LENGTH)
+
+        assert cipher.encrypt("SAME")[0] != cipher.encrypt("SAME")[0]
+
+    def test_bulk_decrypt_costs_one_kdf(self, master_key):
+        """Test decrypting many fields of one user derives the key once."""
+        salt = b"b" * SALT_LENGTH
+        cipher = FieldCipher(master_key, salt)
+        values = [f"ACCOUNT{i:04d}" for i in range(20)]
+        encrypted = [cipher.encrypt(v) for v in values]
+
+        clear_key_cache()
+        assert decrypt_fields(encrypted, master_key) == values
+        assert get_key_cache().stats()["misses"] == 1
+
+    def test_legacy_encrypt_skips_key_cache(self, master_key):
+        """Test one-off per-field keys do not evict reusable cached keys."""
+        clear_key_cache()
+        for i in range(5):
+            encrypt_field(f"VALUE{i}", master_key)
+
+        assert len(get_key_cache()) == 0
+        assert get_key_cache().stats()["misses"] == 0
+
+    def test_legacy_values_still_decrypt(self, master_key):
+        """Test FieldCipher reads legacy per-field-salt values."""
+        ciphertext, salt = encrypt_field("LEGACY", master_key)
+        cipher = FieldCipher(master_key, b"u" * SALT_LENGTH)
+
+        assert cipher.decrypt(ciphertext, salt) == "LEGACY"
+
+    def test_reencrypt_to_envelope(self, db_connection, sample_user, master_key):
+        """Test legacy user fields are migrated to the user's envelope."""
+        counts = reencrypt_to_envelope(db_connection, master_key)
+
+        row = db_connection.execute(
+            "SELECT pan_encrypted, pan_salt FROM users WHERE id = ?", (sample_user["id"],)
+        ).fetchone()
+        cipher = get_user_cipher(db_connection, sample_user["id"], master_key)
+
+        assert counts["users.pan"] == 1
+        assert is_envelope(row["pan_encrypted"])
+        assert bytes(row["pan_salt"]) == cipher.user_salt
+        assert cipher.decrypt(row["pan_encrypted"], row["pan_salt"]) == sample_user["pan"]
+
+        # Second run is a no-op
+        assert reencrypt_to_envelope(db_connection, master_key)["users.pan"] == 0
+
+    def test_user_cipher_joins_open_transaction(self, db_connection, sample_user, master_key):
+        """Test a new user salt is left to the caller's transaction."""
+        db_connection.execute("BEGIN")
+        get_user_cipher(db_connection, 4242, master_key)
+        assert db_connection.in_transaction
+
+        db_connection.rollback()
+
+        assert db_connection.execute(
+            "SELECT COUNT(*) FROM user_encryption_keys WHERE user_id = 4242"
+        ).fetchone()[0] == 0
+
+    def test_reencrypt_dry_run_writes_nothing(self, db_connection, sample_user, master_key):
+        """Test a dry run keeps neither re-encrypted values nor new user salts."""
+        counts = reencrypt_to_envelope(db_connection, master_key, dry_run=True)
+
+        assert counts["users.pan"] == 1
+        assert not db_connection.in_transaction
+        assert db_connection.execute("SELECT COUNT(*) FROM user_encryption_keys").fetchone()[0] == 0
+
+
 class TestMaskSensitive:
     """Tests for mask_sensitive function."""
 
@@ -0,0 +1,145 @@
+"""
+Unit tests for the shared file fingerprint cache.
+
+Tests:
+1. Digests match hashlib and each file is read once per change
+2. Persistence across cache instances
+3. Parallel hash_many() and the call sites sharing the process-wide cache
+"""
+
+import hashlib
+import os
+
+import pytest
+
+from pfas.core.fingerprint import (
+    FileFingerprintCache,
+    configure_fingerprint_cache,
+    file_fingerprint,
+    get_fingerprint_cache,
+)
+
+
+@pytest.fixture
+def statements(tmp_path):
+    paths = []
+    for i in range(6):
+        path = tmp_path / f"statement_{i}.csv"
+        path.write_bytes(os.urandom(1000 + i) * 50)
+        paths.append(path)
+    return paths
+
+
+@pytest.fixture
+def shared_cache():
+    """Fresh in-memory process-wide cache, restored afterwards."""
+    cache = configure_fingerprint_cache()
+    yield cache
+    configure_fingerprint_cache()
+
+
+def count_reads(cache, monkeypatch):
+    reads = []
+    compute = cache._compute
+
+    def counting(path):
+        reads.append(path)
+        return compute(path)
+
+    monkeypatch.setattr(cache, "_compute", counting)
+    return reads
+
+
+class TestFileFingerprintCache:
+    """Tests for FileFingerprintCache."""
+
+    def test_digests_match_hashlib(self, statements):
+        cache = FileFingerprintCache()
+        data = statements[0].read_bytes()
+
+        assert cache.hash(statements[0]) == hashlib.sha256(data).hexdigest()
+        assert cache.hash(statements[0], "md5") == hashlib.md5(data).hexdigest()
+        with pytest.raises(ValueError):
+            cache.hash(statements[0], "sha1")
+
+    def test_reads_once_until_changed(self, statements, monkeypatch):
+        cache = FileFingerprintCache()
+        reads = count_reads(cache, monkeypatch)
+        path = statements[0]
+
+        first = cache.hash(path)
+        cache.hash(path, "md5")
+        cache.hash(path)
+        assert len(reads) == 1
+        # One lookup per file version and stats window
+        assert cache.stats.hits == 0 and cache.stats.misses == 1
+
+        path.write_bytes(b"amended statement")
+        st = os.stat(path)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        assert cache.hash(path) != first
+        assert len(reads) == 2
+
+    def test_persists_across_instances(self, statements, tmp_path, monkeypatch):
+        cache_path = tmp_path / "cache" / "file_hashes.db"
+        first = FileFingerprintCache(cache_path)
+        expected = first.hash_many(statements)
+        first.close()
+
+        second = FileFingerprintCache(cache_path)
+        reads = count_reads(second, monkeypatch)
+
+        assert second.hash_many(statements) == expected
+        assert reads == []
+        assert second.stats.hit_rate == 1.0
+
+    def test_hash_many(self, statements, tmp_path):
+        cache = FileFingerprintCache(workers=4)
+        missing = tmp_path / "missing.csv"
+
+        result = cache.hash_many(statements + [missing], "md5")
+
+        assert missing not in result
+        assert result == {p: hashlib.md5(p.read_bytes()).hexdigest() for p in statements}
+        assert cache.stats.misses == len(statements)
+        with pytest.raises(OSError):
+            cache.hash(missing)
+
+    def test_cold_run_counts_each_file_once(self, statements):
+        """A cold scan followed by per-file hashing reports 0% hits; a new window 100%."""
+        cache = FileFingerprintCache()
+
+        cache.hash_many(statements, "md5")
+        for path in statements:
+            cache.hash(path)
+            cache.hash(path, "md5")
+        assert (cache.stats.hits, cache.stats.misses) == (0, len(statements))
+
+        cache.reset_stats()
+        for path in statements:
+            cache.hash(path)
+        assert cache.stats.hit_rate == 1.0
+
+
+class TestSharedCallSites:
+    """Scanners, ingesters and the archiver hash through one cache."""
+
+    def test_call_sites_share_one_read(self, statements, shared_cache, monkeypatch):
+        from pfas.analyzers.stock_analyzer import BrokerType, ScannedFile, StatementType
+        from pfas.core.manifest import calculate_file_hash
+        from pfas.services.statement_tracker import StatementTracker
+
+        reads = count_reads(shared_cache, monkeypatch)
+        path = statements[0]
+        data = path.read_bytes()
+
+        scanned = ScannedFile(path, BrokerType.ZERODHA, StatementType.TRANSACTIONS, "test")
+        tracked = StatementTracker.__new__(StatementTracker)._calculate_hash(path)
+        archived = calculate_file_hash(path)
+
+        assert scanned.file_hash == hashlib.md5(data).hexdigest()
+        assert tracked == file_fingerprint(path) == hashlib.sha256(data).hexdigest()
+        assert archived == f"sha256:{tracked}"
+        assert len(reads) == 1
+        assert get_fingerprint_cache() is shared_cache
@@ -33,11 +33,13 @@ from pfas.core.security import (
 )
 from pfas.core.audit import AuditLogger, AuditLogEntry
 from pfas.core.exceptions import IdempotencyError, BatchIngestionError
-from pfas.services.nav_service import NAVService, NAVRecord
+from pfas.services.nav_service import NAVService, NAVRecord, get_navs
 from pfas.core.transaction_service import (
     TransactionService,
     TransactionResult,
     TransactionSource,
+    TransactionRequest,
+    AssetRecord,
     IdempotencyKeyGenerator,
 )
 from pfas.core.journal import JournalEntry
@@ -47,6 +49,7 @@ from pfas.parsers.idempotency import (
     stock_idempotency_key,
     bank_idempotency_key,
 )
+from pfas.parsers.base import BaseParser, ParsedRecord
 from pfas.services.batch_ingester import (
     BatchIngester,
     BatchResult,
@@ -103,6 +106,15 @@ def db_connection():
             FOREIGN KEY (account_id) REFERENCES accounts(id)
         );
 
+        CREATE TABLE account_daily_balances (
+            account_id INTEGER NOT NULL,
+            date DATE NOT NULL,
+            debit DECIMAL(15,2) NOT NULL DEFAULT 0,
+            credit DECIMAL(15,2) NOT NULL DEFAULT 0,
+            running_balance DECIMAL(15,2) NOT NULL DEFAULT 0,
+            PRIMARY KEY (account_id, date)
+        ) WITHOUT ROWID;
+
         CREATE TABLE mf_schemes (
             id INTEGER PRIMARY KEY,
             name TEXT NOT NULL,
@@ -142,6 +154,16 @@ def db_connection():
             timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         );
 
+        CREATE TABLE audit_batches (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            label TEXT,
+            source TEXT,
+            user_id INTEGER,
+            row_count INTEGER NOT NULL DEFAULT 0,
+            row_ids TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        );
+
         -- Insert test data
         INSERT INTO users (id, name) VALUES (1, 'Test User');
         INSERT INTO accounts (id, code, name, account_type) VALUES
@@ -402,6 +424,47 @@ class TestNAVService:
         assert nav1 == Decimal("50.5")
         assert nav2 == Decimal("51.0")
 
+    def test_get_navs_matches_get_nav_at(self, db_connection):
+        """Test batched lookup agrees with per-date lookup for every rule."""
+        service = NAVService(db_connection)
+        service.store_nav(1, date(2024, 3, 1), Decimal("100.0000"))
+        service.store_nav(1, date(2024, 3, 11), Decimal("110.0000"))
+        service.store_nav(1, date(2024, 6, 1), Decimal("120.0000"))
+        service.store_nav(2, date(2024, 3, 5), Decimal("20.5000"))
+
+        dates = [date(2024, 2, 1) + timedelta(days=i) for i in range(150)]
+        for allow_interpolation in (True, False):
+            navs = service.get_navs([1, 2, 3], dates, allow_interpolation)
+            for scheme_id in (1, 2, 3):
+                for as_of in dates:
+                    expected = service.get_nav_at(scheme_id, as_of, allow_interpolation)
+                    assert navs.get((scheme_id, as_of)) == expected
+
+    def test_get_navs_single_query(self, db_connection):
+        """Test many schemes and dates are answered from one slice read."""
+        service = NAVService(db_connection)
+        for scheme_id in range(1, 51):
+            service.store_nav(scheme_id, date(2024, 1, 31), Decimal(scheme_id))
+
+        month_ends = [date(2024, m, 28) for m in range(1, 13)]
+        statements = []
+        db_connection.set_trace_callback(statements.append)
+        try:
+            navs = service.get_navs(range(1, 51), month_ends)
+        finally:
+            db_connection.set_trace_callback(None)
+
+        assert len([s for s in statements if "FROM mf_nav_history" in s]) == 1
+        assert (1, date(2024, 1, 28)) not in navs
+        assert navs[(50, date(2024, 12, 28))] == Decimal("50")
+
+    def test_get_navs_without_history_table(self):
+        """Test batched lookup returns nothing when NAV history is absent."""
+        conn = sqlite3.connect(":memory:")
+        assert get_navs(conn, [1], [date(2024, 3, 1)]) == {}
+        assert get_navs(conn, [], []) == {}
+        conn.close()
+
 
 # ============================================================
 # TRANSACTION SERVICE TESTS
@@ -500,6 +563,172 @@ class TestTransactionService:
         assert txn["user_id"] == 1
 
 
+class TestTransactionServiceBulk:
+    """Tests for TransactionService bulk-ingest API."""
+
+    @staticmethod
+    def _request(key, amount="1000", **kwargs):
+        return TransactionRequest(
+            description=f"Bulk {key}",
+            idempotency_key=key,
+            entries=[
+                JournalEntry(account_id=1, debit=Decimal(amount)),
+                JournalEntry(account_id=2, credit=Decimal(amount)),
+            ],
+            txn_date=date(2024, 4, 1),
+            **kwargs,
+        )
+
+    def test_record_many_success(self, db_connection):
+        """Test recording many transactions links entries to the right journals."""
+        service = TransactionService(db_connection)
+        requests = [self._request(f"bulk:{i}", amount=str(100 + i)) for i in range(5)]
+
+        results = service.record_many(
+            user_id=1, requests=requests, source=TransactionSource.MANUAL, chunk_size=2
+        )
+
+        assert [r.result for r in results] == [TransactionResult.SUCCESS] * 5
+        for i, result in enumerate(results):
+            journal = service.journal_engine.get_journal(result.journal_id)
+            assert journal.description == f"Bulk bulk:{i}"
+            assert journal.entries[0].debit == Decimal(str(100 + i))
+            assert service.get_transaction_by_key(f"bulk:{i}")["journal_id"] == result.journal_id
+
+    def test_record_many_maintains_balances(self, db_connection):
+        """Test bulk writes keep materialized account balances in sync."""
+        service = TransactionService(db_connection)
+        requests = [self._request(f"bulk:bal:{i}", amount="100") for i in range(4)]
+
+        service.record_many(user_id=1, requests=requests, source=TransactionSource.MANUAL)
+
+        assert service.journal_engine.get_account_balance(1, date(2024, 4, 1)) == Decimal("400")
+        assert service.journal_engine.check_daily_balances() == []
+
+    def test_record_many_duplicates(self, db_connection):
+        """Test duplicates against the DB and within the batch are detected."""
+        service = TransactionService(db_connection)
+        service.record(
+            user_id=1,
+            entries=self._request("bulk:dup").entries,
+            description="Existing",
+            source=TransactionSource.MANUAL,
+            idempotency_key="bulk:dup",
+        )
+
+        results = service.record_many(
+            user_id=1,
+            requests=[self._request("bulk:dup"), self._request("bulk:new"), self._request("bulk:new")],
+            source=TransactionSource.MANUAL,
+        )
+
+        assert [r.result for r in results] == [
+            TransactionResult.DUPLICATE,
+            TransactionResult.SUCCESS,
+            TransactionResult.DUPLICATE,
+        ]
+
+    def test_repeat_recorded_when_first_copy_fails(self, db_connection):
+        """Test a repeated key is recorded when its first copy in the batch fails."""
+        service = TransactionService(db_connection)
+        failing = self._request("bulk:retry", asset_records=[AssetRecord("no_such_table", {"x": 1})])
+
+        results = service.record_many(
+            user_id=1,
+            requests=[failing, self._request("bulk:retry")],
+            source=TransactionSource.MANUAL,
+        )
+
+        assert [r.result for r in results] == [
+            TransactionResult.JOURNAL_ERROR,
+            TransactionResult.SUCCESS,
+        ]
+        assert service.get_transaction_by_key("bulk:retry")["journal_id"] == results[1].journal_id
+
+    def test_record_many_validation_errors(self, db_connection):
+        """Test unbalanced entries and unknown accounts fail per record."""
+        service = TransactionService(db_connection)
+        unbalanced = self._request("bulk:unbalanced")
+        unbalanced.entries[1] = JournalEntry(account_id=2, credit=Decimal("1"))
+        unknown = self._request("bulk:unknown")
+        unknown.entries[0] = JournalEntry(account_id=999, debit=Decimal("1000"))
+
+        results = service.record_many(
+            user_id=1,
+            requests=[unbalanced, self._request("bulk:ok"), unknown],
+            source=TransactionSource.MANUAL,
+        )
+
+        assert results[0].result == TransactionResult.VALIDATION_ERROR
+        assert results[1].result == TransactionResult.SUCCESS
+        assert results[2].result == TransactionResult.JOURNAL_ERROR
+        assert "999" in results[2].error_message
+        assert service.get_transaction_by_key("bulk:unknown") is None
+
+    def test_record_many_asset_record_ids(self, db_connection):
+        """Test asset record IDs are returned per record."""
+        service = TransactionService(db_connection)
+        requests = [
+            self._request(
+                f"bulk:asset:{i}",
+                asset_records=[AssetRecord("mf_transactions", {
+                    "folio_id": 1, "date": "2024-04-01", "units": i, "amount": 1000,
+                })],
+            )
+            for i in range(3)
+        ]
+
+        results = service.record_many(user_id=1, requests=requests, source=TransactionSource.MANUAL)
+
+        for i, result in enumerate(results):
+            row_id = result.asset_record_ids["mf_transactions"]
+            row = db_connection.execute(
+                "SELECT units FROM mf_transactions WHERE id = ?", (row_id,)
+            ).fetchone()
+            assert row["units"] == i
+
+    def test_failed_record_rolls_back_alone(self, db_connection):
+        """Test a failing record in a chunk does not leave partial writes or block others."""
+        service = TransactionService(db_connection)
+        bad = self._request(
+            "bulk:bad",
+            asset_records=[AssetRecord("no_such_table", {"x": 1})],
+        )
+
+        results = service.record_many(
+            user_id=1,
+            requests=[self._request("bulk:a"), bad, self._request("bulk:b")],
+            source=TransactionSource.MANUAL,
+        )
+
+        assert [r.result for r in results] == [
+            TransactionResult.SUCCESS,
+            TransactionResult.JOURNAL_ERROR,
+            TransactionResult.SUCCESS,
+        ]
+        assert service.get_transaction_by_key("bulk:bad") is None
+        journals = db_connection.execute(
+            "SELECT COUNT(*) FROM journals WHERE description = 'Bulk bulk:bad'"
+        ).fetchone()[0]
+        assert journals == 0
+
+    def test_bulk_session_flushes_on_exit(self, db_connection):
+        """Test the bulk context manager flushes buffered records."""
+        service = TransactionService(db_connection)
+
+        with service.bulk(user_id=1, source=TransactionSource.MANUAL, chunk_size=10) as session:
+            for i in range(3):
+                session.add(
+                    description=f"Session {i}",
+                    idempotency_key=f"session:{i}",
+                    entries=self._request("x").entries,
+                )
+            assert session.pending_count == 3
+
+        assert len(session.results) == 3
+        assert all(r.result == TransactionResult.SUCCESS for r in session.results)
+
+
 # ============================================================
 # IDEMPOTENCY KEY GENERATOR TESTS
 # ============================================================
@@ -585,6 +814,70 @@ class TestIdempotencyMixin:
 # BATCH INGESTER TESTS
 # ============================================================
 
+class LineParser(BaseParser):
+    """Minimal parser: one raw record per line of a .txt file."""
+
+    normalized: list = []
+
+    def get_source_type(self):
+        return "LINES"
+
+    def get_supported_formats(self):
+        return [".txt"]
+
+    def parse_raw(self, file_path):
+        return [
+            ParsedRecord(
+                source_type="LINES",
+                source_file=str(file_path),
+                raw_data={"line": line, "pid": os.getpid()},
+                row_index=i,
+            )
+            for i, line in enumerate(file_path.read_text().splitlines())
+        ]
+
+    def normalize_record(self, record):
+        LineParser.normalized.append(
+            (Path(record.source_file).name, record.raw_data["line"], record.raw_data["pid"])
+        )
+        return None
+
+
+class LedgerParser(LineParser):
+    """Parser that records each line through TransactionService; a "fail" line aborts the file."""
+
+    def parse(self, file_path):
+        result = super().parse(file_path)
+        lines = file_path.read_text().splitlines()
+        requests = [
+            TransactionRequest(
+                description=line,
+                idempotency_key=f"ledger:{line}",
+                entries=[
+                    JournalEntry(account_id=1, debit=Decimal("100")),
+                    JournalEntry(account_id=2, credit=Decimal("100")),
+                ],
+                txn_date=date(2024, 4, 1),
+            )
+            for line in lines if line != "fail"
+        ]
+        first = requests[0]
+        self.transaction_service.record(
+            user_id=1,
+            entries=first.entries,
+            description=first.description,
+            source=TransactionSource.MANUAL,
+            idempotency_key=first.idempotency_key,
+            txn_date=first.txn_date,
+        )
+        self.transaction_service.record_many(
+            user_id=1, requests=requests[1:], source=TransactionSource.MANUAL
+        )
+        if "fail" in lines:
+            raise ValueError("unreadable line")
+        return result
+
+
 class TestBatchIngester:
     """Tests for BatchIngester class."""
 
@@ -657,6 +950,142 @@ class TestBatchIngester:
         assert result.files_skipped == 1
         assert result.total_records == 10
 
+    def _write_files(self, directory, count):
+        paths = []
+        for i in range(count):
+            path = Path(directory) / f"file{i}.txt"
+            path.write_text(f"{i}-a\n{i}-b\n")
+            paths.append(path)
+        return paths
+
+    def test_parallel_matches_sequential(self, db_connection):
+        """Test workers > 1 gives the same per-file results in input order."""
+        with tempfile.TemporaryDirectory() as tmp:
+            files = self._write_files(tmp, 6)
+            files.append(Path(tmp) / "missing.txt")
+            files.append(files[0])  # in-batch duplicate
+
+            outcomes = []
+            for workers in (1, 3):
+                ingester = BatchIngester(db_connection, user_id=1)
+                ingester.register_parser(".txt", LineParser)
+                db_connection.execute("DELETE FROM processed_files")
+                db_connection.commit()
+                LineParser.normalized = []
+
+                result = ingester.ingest_batch(
+                    files, user_id=1, stop_on_error=False, workers=workers
+                )
+
+                outcomes.append((
+                    [(r.file_path.name, r.status, r.file_hash) for r in result.file_results],
+                    [(name, line) for name, line, _ in LineParser.normalized],
+                ))
+                pids = {pid for _, _, pid in LineParser.normalized}
+
+            assert outcomes[0] == outcomes[1]
+            statuses = [status for _, status, _ in outcomes[1][0]]
+            assert statuses == [FileStatus.SUCCESS] * 6 + [FileStatus.FAILED, FileStatus.SKIPPED]
+            # Rows reached the writer in file order, extracted in other processes
+            assert outcomes[1][1][:4] == [
+                ("file0.txt", "0-a"), ("file0.txt", "0-b"),
+                ("file1.txt", "1-a"), ("file1.txt", "1-b"),
+            ]
+            assert os.getpid() not in pids
+
+    def test_parallel_skips_extraction_of_processed_files(self, db_connection):
+        """Test already-processed files are not re-extracted in workers."""
+        with tempfile.TemporaryDirectory() as tmp:
+            files = self._write_files(tmp, 2)
+            ingester = BatchIngester(db_connection, user_id=1)
+            ingester.register_parser(".txt", LineParser)
+            ingester.ingest_batch(files[:1], user_id=1)
+
+            LineParser.normalized = []
+            result = ingester.ingest_batch(files, user_id=1, workers=2)
+
+            assert result.success
+            assert [r.status for r in result.file_results] == [
+                FileStatus.SKIPPED, FileStatus.SUCCESS
+            ]
+            assert {name for name, _, _ in LineParser.normalized} == {"file1.txt"}
+
+    def test_deferred_audit_one_batch_per_file(self, db_connection):
+        """Test deferred audit mode writes one compact batch record per file."""
+        with tempfile.TemporaryDirectory() as tmp:
+            files = self._write_files(tmp, 2)
+            ingester = BatchIngester(db_connection, user_id=1, audit_mode="deferred")
+            ingester.register_parser(".txt", LineParser)
+
+            result = ingester.ingest_batch(files, user_id=1)
+
+            assert result.success
+            rows = db_connection.execute(
+                "SELECT table_name, record_id FROM audit_log ORDER BY id"
+            ).fetchall()
+            assert [row[0] for row in rows] == ["audit_batches", "audit_batches"]
+
+            audit_logger = AuditLogger(db_connection)
+            labels = [audit_logger.get_batch(row[1]).label for row in rows]
+            assert labels == ["file0.txt", "file1.txt"]
+            detail = audit_logger.get_batch_detail(rows[0][1])
+            assert detail[0]["table_name"] == "processed_files"
+            assert detail[0]["values"]["file_name"] == "file0.txt"
+
+    @staticmethod
+    def _ledger_journals(conn):
+        return [row[0] for row in conn.execute(
+            "SELECT description FROM journals ORDER BY id"
+        ).fetchall()]
+
+    def test_parser_rows_commit_with_file(self, db_connection):
+        """Test rows a parser records inside the batch are all committed."""
+        with tempfile.TemporaryDirectory() as tmp:
+            files = self._write_files(tmp, 2)
+            ingester = BatchIngester(db_connection, user_id=1, audit_mode="deferred")
+            ingester.register_parser(".txt", LedgerParser)
+
+            result = ingester.ingest_batch(files, user_id=1)
+
+            assert result.success
+            assert not db_connection.in_transaction
+            assert self._ledger_journals(db_connection) == ["0-a", "0-b", "1-a", "1-b"]
+            batches = db_connection.execute(
+                "SELECT label, row_count FROM audit_batches ORDER BY id"
+            ).fetchall()
+            # journal + processed_files per file
+            assert [tuple(row) for row in batches] == [("file0.txt", 3), ("file1.txt", 3)]
+
+    @pytest.mark.parametrize("stop_on_error", [True, False])
+    def test_failed_file_keeps_none_of_its_rows(self, db_connection, stop_on_error):
+        """Test a file failing after recording rows leaves none of them (or their audit)."""
+        with tempfile.TemporaryDirectory() as tmp:
+            good, bad = self._write_files(tmp, 2)
+            bad.write_text("1-a\n1-b\nfail\n")
+            TransactionService(db_connection)  # ledger tables outlive a rolled-back batch
+            ingester = BatchIngester(db_connection, user_id=1, audit_mode="deferred")
+            ingester.register_parser(".txt", LedgerParser)
+
+            result = ingester.ingest_batch([good, bad], user_id=1, stop_on_error=stop_on_error)
+
+            assert [r.status for r in result.file_results] == [FileStatus.SUCCESS, FileStatus.FAILED]
+            kept = [] if stop_on_error else ["0-a", "0-b"]
+            assert self._ledger_journals(db_connection) == kept
+            keys = db_connection.execute(
+                "SELECT COUNT(*) FROM processed_transactions WHERE idempotency_key LIKE 'ledger:1-%'"
+            ).fetchone()[0]
+            assert keys == 0
+            batches = db_connection.execute(
+                "SELECT COUNT(*) FROM audit_log WHERE table_name = 'audit_batches'"
+            ).fetchone()[0]
+            assert batches == (0 if stop_on_error else 1)
+
+    def test_invalid_workers(self, db_connection):
+        """Test workers must be positive."""
+        ingester = BatchIngester(db_connection, user_id=1)
+        with pytest.raises(ValueError, match="workers"):
+            ingester.ingest_batch([Path("x.txt")], user_id=1, workers=0)
+
 
 # ============================================================
 # STANDALONE KEY FUNCTION TESTS
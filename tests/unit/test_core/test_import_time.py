@@ -0,0 +1,93 @@
+"""
+Import-time regression tests for the CLI entry points.
+
+Tests:
+1. Each entry point stays within its `python -X importtime` budget
+2. Heavy dependencies are not imported until a code path needs them
+3. Lazy package exports resolve to the submodule objects
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC = Path(__file__).resolve().parents[3] / "src"
+
+# Cumulative import time budget per entry point, in milliseconds. Generous
+# enough for a slow CI box; set PFAS_IMPORT_BUDGET_MS to tighten locally.
+IMPORT_BUDGET_MS = float(os.environ.get("PFAS_IMPORT_BUDGET_MS", 250))
+
+ENTRY_POINTS = [
+    "pfas.cli.reports_cli",
+    "pfas.cli.advance_tax_cli",
+    "pfas.cli.mf_analyzer_cli",
+]
+
+HEAVY_MODULES = {"pandas", "numpy", "openpyxl", "pdfplumber", "fitz", "reportlab"}
+
+
+def run_python(*args):
+    env = dict(os.environ, PYTHONPATH=str(SRC))
+    return subprocess.run(
+        [sys.executable, *args], capture_output=True, text=True, env=env, check=True
+    )
+
+
+def import_times(module: str) -> dict:
+    """Module name -> cumulative import time (microseconds) for `import module`."""
+    stderr = run_python("-X", "importtime", "-c", f"import {module}").stderr
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+@pytest.mark.parametrize("module", ENTRY_POINTS)
+class TestEntryPointImports:
+    """Startup cost of the console scripts."""
+
+    def test_within_budget(self, module):
+        times = import_times(module)
+        assert times[module] / 1000 < IMPORT_BUDGET_MS
+
+    def test_heavy_dependencies_deferred(self, module):
+        imported = {name.split(".")[0] for name in import_times(module)}
+        assert not imported & HEAVY_MODULES
+
+
+class TestLazyExports:
+    """Package re-exports load on first access."""
+
+    def test_package_import_loads_no_submodules(self):
+        code = (
+            "import sys, pfas.core, pfas.services, pfas.parsers, pfas.analyzers;"
+            "print(sorted(m for m in sys.modules if m.startswith('pfas.')))"
+        )
+        loaded = run_python("-c", code).stdout.strip()
+        assert loaded == "['pfas._lazy', 'pfas.analyzers', 'pfas.core', 'pfas.parsers', 'pfas.services']"
+
+    def test_names_resolve_to_submodule_objects(self):
+        import pfas.analyzers
+        import pfas.services
+        from pfas.analyzers import MFAnalysisResult
+        from pfas.analyzers.mf_analyzer import AnalysisResult
+        from pfas.services.nav_service import NAVService
+
+        assert MFAnalysisResult is AnalysisResult
+        assert pfas.services.NAVService is NAVService
+        assert "NAVService" in dir(pfas.services)
+        assert "StockAnalysisResult" in dir(pfas.analyzers)
+
+    def test_unknown_name(self):
+        import pfas.services
+
+        with pytest.raises(AttributeError):
+            pfas.services.NoSuchService
+        with pytest.raises(ImportError):
+            from pfas.services import NoSuchService  # noqa: F401
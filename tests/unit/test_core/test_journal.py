@@ -275,6 +275,73 @@ class TestAccountBalance:
         assert balance == Decimal("0")
 
 
+class TestMaterializedBalances:
+    """Tests for the account_daily_balances rollup."""
+
+    def _post(self, engine, debit_account, credit_account, amount, txn_date):
+        return engine.create_journal(
+            txn_date=txn_date,
+            description="Test",
+            entries=[
+                JournalEntry(account_id=debit_account.id, debit=Decimal(amount)),
+                JournalEntry(account_id=credit_account.id, credit=Decimal(amount)),
+            ],
+        )
+
+    def test_as_of_balance(self, journal_engine, bank_account, salary_account):
+        """Test as-of balances across several days."""
+        self._post(journal_engine, bank_account, salary_account, "1000", date(2024, 4, 1))
+        self._post(journal_engine, bank_account, salary_account, "500", date(2024, 5, 1))
+
+        assert journal_engine.get_account_balance(bank_account.id, date(2024, 3, 31)) == Decimal("0")
+        assert journal_engine.get_account_balance(bank_account.id, date(2024, 4, 15)) == Decimal("1000")
+        assert journal_engine.get_account_balance(bank_account.id, date(2024, 5, 1)) == Decimal("1500")
+        assert journal_engine.get_account_balance(salary_account.id, date(2024, 5, 1)) == Decimal("1500")
+
+    def test_backdated_entry_updates_later_days(self, journal_engine, bank_account, salary_account):
+        """Test a back-dated journal shifts running balances of later days."""
+        self._post(journal_engine, bank_account, salary_account, "1000", date(2024, 6, 1))
+        self._post(journal_engine, bank_account, salary_account, "250", date(2024, 5, 1))
+
+        assert journal_engine.get_account_balance(bank_account.id, date(2024, 5, 31)) == Decimal("250")
+        assert journal_engine.get_account_balance(bank_account.id, date(2024, 6, 1)) == Decimal("1250")
+        assert journal_engine.check_daily_balances() == []
+
+    def test_get_account_balances(self, journal_engine, bank_account, salary_account):
+        """Test batch balances match single-account balances."""
+        self._post(journal_engine, bank_account, salary_account, "700", date(2024, 4, 1))
+
+        balances = journal_engine.get_account_balances(
+            [bank_account.id, salary_account.id], date(2024, 4, 30)
+        )
+
+        assert balances == {bank_account.id: Decimal("700"), salary_account.id: Decimal("700")}
+
+    def test_engine_construction_runs_no_sql(self, db_with_accounts):
+        """Test constructing an engine touches nothing (safe on read-only connections)."""
+        statements = []
+        db_with_accounts.set_trace_callback(statements.append)
+        try:
+            JournalEngine(db_with_accounts)
+        finally:
+            db_with_accounts.set_trace_callback(None)
+
+        assert statements == []
+
+    def test_check_and_rebuild(self, db_with_accounts, journal_engine, bank_account, salary_account):
+        """Test the checker detects drift and rebuild repairs it."""
+        self._post(journal_engine, bank_account, salary_account, "100", date(2024, 4, 1))
+        db_with_accounts.execute("UPDATE account_daily_balances SET running_balance = 999")
+        db_with_accounts.commit()
+
+        assert len(journal_engine.check_daily_balances()) == 2
+
+        journal_engine.rebuild_daily_balances()
+
+        assert journal_engine.check_daily_balances() == []
+        assert journal_engine.get_account_balance(bank_account.id, date(2024, 4, 1)) == Decimal("100")
+
+
 class TestAccountLedger:
     """Tests for account ledger."""
 
@@ -0,0 +1,150 @@
+"""
+Unit tests for the compiled keyword matcher and the categorizers built on it.
+
+Tests:
+1. Priority resolution matches a rule-by-rule scan
+2. Batch matching and the narration memo
+3. CategoryClassifier and cash flow classification are unchanged
+"""
+
+import random
+import sqlite3
+
+import pytest
+
+from pfas.core.keyword_matcher import KeywordMatcher
+from pfas.services.bank_intelligence.category_rules import CategoryClassifier
+from pfas.services.cash_flow_service import CashFlowStatementService
+from pfas.core.models import CashFlowCategory, FlowDirection
+
+
+def scan(rules, text):
+    """Reference first-match scan."""
+    text = text.upper()
+    for value, keywords in rules:
+        if any(kw.upper() in text for kw in keywords):
+            return value
+    return None
+
+
+def narrations(keywords, count=2000, seed=3):
+    rng = random.Random(seed)
+    fillers = ["UPI", "NEFT", "IMPS", "/", "-", " ", "PAYEE", "OKAXIS", "REF 123", "X"]
+    result = []
+    for _ in range(count):
+        parts = [rng.choice(fillers) for _ in range(rng.randint(0, 4))]
+        parts += [rng.choice(keywords) for _ in range(rng.randint(0, 3))]
+        rng.shuffle(parts)
+        text = " ".join(parts)
+        result.append(text.lower() if rng.random() < 0.2 else text)
+    return result
+
+
+class TestKeywordMatcher:
+    """Tests for KeywordMatcher."""
+
+    RULES = [
+        ("RENT", ["RENT FROM", "RENTAL INCOME"]),
+        ("SALARY", ["SALARY", "SAL CR"]),
+        ("ATM", ["ATM WDL", "ATM"]),
+        ("TRANSFER", ["NEFT", "RENT", "SAL"]),
+        ("DUPLICATE", ["SALARY"]),
+    ]
+
+    def test_best_rule_wins_regardless_of_position(self):
+        matcher = KeywordMatcher(self.RULES)
+        # NEFT matches first in the text, SALARY ranks higher
+        assert matcher.match("NEFT/ACME SALARY JAN") == "SALARY"
+        assert matcher.match("RENTAL INCOME") == "RENT"
+        # RENT is a prefix of RENTAL but only the TRANSFER rule lists it alone
+        assert matcher.match("RENTAL DEPOSIT") == "TRANSFER"
+        assert matcher.match("ATM WDL 42") == "ATM"
+        assert matcher.match("cash at atm") == "ATM"
+        assert matcher.match("POS PURCHASE") is None
+
+    def test_matches_reference_scan(self):
+        matcher = KeywordMatcher(self.RULES)
+        keywords = [kw for _, kws in self.RULES for kw in kws] + ["SA", "RENTA", "AT"]
+        for text in narrations(keywords):
+            assert matcher.match(text) == scan(self.RULES, text), text
+
+    def test_empty_rules_and_keywords(self):
+        assert KeywordMatcher([]).match("ANYTHING") is None
+        assert KeywordMatcher([("A", [])]).match("ANYTHING") is None
+        # An empty keyword is contained in every narration, as with `in`
+        assert KeywordMatcher([("A", ["ZZZ"]), ("B", [""])]).match("") == "B"
+
+    def test_match_many(self):
+        matcher = KeywordMatcher(self.RULES, cache_size=0)
+        texts = ["SAL CR", "NEFT", "SAL CR", "NOTHING", "ATM"]
+        assert matcher.match_many(texts) == ["SALARY", "TRANSFER", "SALARY", None, "ATM"]
+        assert matcher.match_many([]) == []
+
+    def test_cache_is_bounded_lru(self):
+        matcher = KeywordMatcher(self.RULES, cache_size=2)
+        matcher.match("SAL CR 1")
+        matcher.match("SAL CR 2")
+        matcher.match("SAL CR 1")
+        matcher.match("SAL CR 3")
+
+        assert list(matcher._cache) == ["SAL CR 1", "SAL CR 3"]
+        matcher.clear_cache()
+        assert not matcher._cache
+
+
+class TestCategoryClassifier:
+    """CategoryClassifier results are unchanged by the compiled matcher."""
+
+    @staticmethod
+    def reference(classifier, description):
+        description_upper = description.upper()
+        for keyword, category in classifier.custom_overrides.items():
+            if keyword.upper() in description_upper:
+                for rule in classifier.rules:
+                    if rule.category == category:
+                        return (category, rule.sub_category, rule.is_income)
+                return (category, None, False)
+        for rule in classifier.rules:
+            for keyword in rule.keywords:
+                if keyword.upper() in description_upper:
+                    return (rule.category, rule.sub_category, rule.is_income)
+        return ("OTHER", None, False)
+
+    @pytest.mark.parametrize("overrides", [None, {"acme": "SALARY", "NEFT": "CUSTOM", "SALARY": "RENT_INCOME"}])
+    def test_matches_reference(self, overrides):
+        classifier = CategoryClassifier(overrides)
+        keywords = [kw for rule in classifier.rules for kw in rule.keywords]
+        keywords += list(overrides or {})
+
+        descriptions = narrations(keywords)
+        expected = [self.reference(classifier, d) for d in descriptions]
+
+        assert [classifier.classify(d) for d in descriptions] == expected
+        assert classifier.classify_many(descriptions) == expected
+
+
+class TestCashFlowClassification:
+    """Cash flow rules only match in their own direction."""
+
+    @staticmethod
+    def reference(description, is_credit):
+        desc_upper = description.upper()
+        for rule in CashFlowStatementService.CLASSIFICATION_RULES:
+            if any(kw in desc_upper for kw in rule.keywords):
+                if is_credit == (rule.flow_direction == FlowDirection.INFLOW):
+                    return rule.category.value
+        return None
+
+    def test_matches_reference(self):
+        service = CashFlowStatementService(sqlite3.connect(":memory:"))
+        keywords = [kw for rule in service.CLASSIFICATION_RULES for kw in rule.keywords]
+        defaults = {
+            True: CashFlowCategory.OTHER_OPERATING_INFLOW.value,
+            False: CashFlowCategory.OTHER_OPERATING_OUTFLOW.value,
+        }
+
+        for description in narrations(keywords):
+            for is_credit in (True, False):
+                result = service._classify_transaction(description, is_credit)
+                expected = self.reference(description, is_credit) or defaults[is_credit]
+                assert result["category"] == expected, description
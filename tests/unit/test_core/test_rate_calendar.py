@@ -0,0 +1,188 @@
+"""
+Unit tests for the shared exchange-rate calendar.
+
+Tests:
+1. Forward-fill and lookback rules of rate_on()/rates_on()
+2. One calendar per connection and pair, shared by every consumer
+3. Staying in sync with add_rate()/bulk_add_rates() and other writes
+4. Noticing commits from other connections and rolled-back writes
+"""
+
+import sqlite3
+from datetime import date, timedelta
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from pfas.core.currency import CurrencyConverter
+from pfas.core.database import SCHEMA_SQL
+from pfas.core.rate_calendar import (
+    RateCalendar,
+    RateObservation,
+    rate_calendar,
+    refresh_rate_calendars,
+)
+from pfas.services.currency import ExchangeRate, SBITTRateProvider
+
+
+@pytest.fixture(autouse=True)
+def fresh_calendars():
+    refresh_rate_calendars()
+    yield
+    refresh_rate_calendars()
+
+
+@pytest.fixture
+def calendar():
+    # Friday and the following Tuesday; nothing over the weekend and Monday
+    return RateCalendar("USD", "INR", [
+        RateObservation(2, date(2024, 6, 18), Decimal("83.40"), "SBI"),
+        RateObservation(1, date(2024, 6, 14), Decimal("83.25"), "SBI"),
+    ])
+
+
+def queries(conn, func):
+    statements = []
+    conn.set_trace_callback(statements.append)
+    try:
+        func()
+    finally:
+        conn.set_trace_callback(None)
+    return [s for s in statements if "exchange_rates" in s]
+
+
+class TestRateCalendar:
+    """Tests for RateCalendar lookups."""
+
+    def test_forward_fill(self, calendar):
+        assert calendar.first_date == date(2024, 6, 14)
+        assert calendar.last_date == date(2024, 6, 18)
+        assert calendar.rate_on(date(2024, 6, 14)) == Decimal("83.25")
+        assert calendar.rate_on(date(2024, 6, 17)) == Decimal("83.25")
+        assert calendar.rate_on(date(2024, 6, 18)) == Decimal("83.40")
+        assert calendar.observation_on(date(2024, 6, 16)).rate_date == date(2024, 6, 14)
+
+    def test_lookback(self, calendar):
+        assert calendar.rate_on(date(2024, 6, 13)) is None
+        assert calendar.rate_on(date(2024, 6, 25)) == Decimal("83.40")
+        assert calendar.rate_on(date(2024, 6, 26)) is None
+        assert calendar.rate_on(date(2025, 6, 26), max_days_back=None) == Decimal("83.40")
+        assert calendar.rate_on(date(2024, 6, 17), max_days_back=0) is None
+
+    def test_rates_on_matches_rate_on(self, calendar):
+        days = [date(2024, 6, 1) + timedelta(days=i) for i in range(40)]
+        days.reverse()
+
+        for lookback in (-1, 0, 2, None):
+            expected = [calendar.rate_on(d, lookback) for d in days]
+            rates = calendar.rates_on(days, lookback)
+
+            assert [None if np.isnan(r) else Decimal(str(r)) for r in rates] == expected
+
+    def test_empty(self):
+        calendar = RateCalendar("EUR")
+
+        assert calendar.rate_on(date(2024, 1, 1)) is None
+        assert np.isnan(calendar.rates_on([date(2024, 1, 1)])).all()
+
+    def test_update_replaces_same_date(self, calendar):
+        calendar.update([RateObservation(3, date(2024, 6, 14), Decimal("83.30"), "MANUAL")])
+
+        assert len(calendar) == 2
+        assert calendar.rate_on(date(2024, 6, 16)) == Decimal("83.30")
+
+
+class TestSharedCalendar:
+    """Tests for rate_calendar() and the consumers using it."""
+
+    def test_history_loaded_once(self, db_connection):
+        provider = SBITTRateProvider(db_connection)
+        provider.add_rate(date(2024, 6, 14), "USD", "INR", Decimal("83.25"), "SBI")
+
+        def lookups():
+            for day in range(14, 22):
+                provider.get_rate(date(2024, 6, day))
+            CurrencyConverter(db_connection).convert(Decimal("10"), "USD", date(2024, 6, 16))
+            SBITTRateProvider(db_connection).get_rate_record(date(2024, 6, 20))
+
+        first = queries(db_connection, lookups)
+        assert len(first) == 2  # history + fingerprint
+        assert queries(db_connection, lookups) == []
+        assert rate_calendar(db_connection, "USD") is provider.calendar()
+
+    def test_add_rate_updates_calendar(self, db_connection):
+        provider = SBITTRateProvider(db_connection)
+        provider.add_rate(date(2024, 6, 14), "USD", "INR", Decimal("83.25"), "SBI")
+        assert provider.get_rate(date(2024, 6, 18)) == Decimal("83.25")
+
+        CurrencyConverter(db_connection).add_rate(date(2024, 6, 17), "USD", Decimal("83.50"))
+        provider.bulk_add_rates([
+            ExchangeRate(date(2024, 6, 18), "USD", "INR", Decimal("83.75"), "SBI"),
+        ])
+
+        lookups = queries(db_connection, lambda: [
+            provider.get_rate(date(2024, 6, 17)), provider.get_rate(date(2024, 6, 19))
+        ])
+        assert lookups == []
+        assert provider.get_rate(date(2024, 6, 17)) == Decimal("83.50")
+        assert provider.get_rate(date(2024, 6, 19)) == Decimal("83.75")
+
+    def test_direct_writes_detected(self, db_connection):
+        provider = SBITTRateProvider(db_connection)
+        provider.add_rate(date(2024, 6, 14), "USD", "INR", Decimal("83.25"), "SBI")
+        assert provider.get_rate(date(2024, 6, 17)) == Decimal("83.25")
+
+        db_connection.execute(
+            "INSERT INTO exchange_rates (date, from_currency, to_currency, rate) "
+            "VALUES ('2024-06-17', 'USD', 'INR', 84.0)"
+        )
+        assert provider.get_rate(date(2024, 6, 17)) == Decimal("84.0")
+
+        db_connection.execute("DELETE FROM exchange_rates WHERE date = '2024-06-14'")
+        with pytest.raises(ValueError):
+            provider.get_rate(date(2024, 6, 15))
+
+    def test_provider_rates_on(self, db_connection):
+        provider = SBITTRateProvider(db_connection)
+        provider.add_rate(date(2024, 6, 14), "USD", "INR", Decimal("83.25"), "SBI")
+
+        rates = provider.rates_on([date(2024, 6, 13), date(2024, 6, 21), date(2024, 6, 22)])
+
+        assert np.isnan(rates[0]) and rates[1] == 83.25 and np.isnan(rates[2])
+
+    def test_other_connection_writes_detected(self, tmp_path):
+        path = tmp_path / "rates.db"
+        writer = sqlite3.connect(path)
+        writer.executescript(SCHEMA_SQL)
+        reader = sqlite3.connect(path)
+        try:
+            insert = (
+                "INSERT INTO exchange_rates (date, from_currency, to_currency, rate) "
+                "VALUES (?, 'USD', 'INR', ?)"
+            )
+            writer.execute(insert, ("2024-06-14", 83.25))
+            writer.commit()
+            assert rate_calendar(reader, "USD").rate_on(date(2024, 6, 17)) == Decimal("83.25")
+            assert queries(reader, lambda: rate_calendar(reader, "USD")) == []
+
+            writer.execute(insert, ("2024-06-17", 84.0))
+            writer.commit()
+
+            assert rate_calendar(reader, "USD").rate_on(date(2024, 6, 17)) == Decimal("84.0")
+        finally:
+            reader.close()
+            writer.close()
+
+    def test_rolled_back_write_dropped(self, db_connection):
+        provider = SBITTRateProvider(db_connection)
+        provider.add_rate(date(2024, 6, 14), "USD", "INR", Decimal("83.25"), "SBI")
+
+        db_connection.execute(
+            "INSERT INTO exchange_rates (date, from_currency, to_currency, rate) "
+            "VALUES ('2024-06-17', 'USD', 'INR', 84.0)"
+        )
+        assert provider.get_rate(date(2024, 6, 17)) == Decimal("84.0")
+        db_connection.rollback()
+
+        assert provider.get_rate(date(2024, 6, 17)) == Decimal("83.25")
@@ -0,0 +1,149 @@
+"""Tests for the batch XIRR engine."""
+
+import random
+from datetime import date, timedelta
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from pfas.core.xirr import (
+    CashflowBatch,
+    XIRRStatus,
+    xirr,
+    xirr_batch,
+)
+
+
+def two_flow_rate(invested: float, returned: float, days: int) -> float:
+    """Closed-form XIRR of a single investment and a single return."""
+    return (returned / invested) ** (365.0 / days) - 1
+
+
+def npv(cashflows, rate):
+    first = min(d for d, _ in cashflows)
+    return sum(float(a) / (1 + rate) ** ((d - first).days / 365.0) for d, a in cashflows)
+
+
+class TestXIRR:
+    """Tests for single-series xirr()."""
+
+    def test_simple_return(self):
+        rate = xirr([(date(2023, 1, 1), -10000), (date(2024, 1, 1), 11000)])
+        assert rate == pytest.approx(two_flow_rate(10000, 11000, 365))
+
+    def test_accepts_decimal_and_unsorted_flows(self):
+        rate = xirr([
+            (date(2024, 1, 1), Decimal("17000")),
+            (date(2023, 7, 1), Decimal("-5000")),
+            (date(2023, 1, 1), Decimal("-10000")),
+        ])
+        assert rate is not None
+        assert npv([(date(2023, 1, 1), -10000), (date(2023, 7, 1), -5000), (date(2024, 1, 1), 17000)], rate) \
+            == pytest.approx(0, abs=1e-3)
+
+    @pytest.mark.parametrize("cashflows", [
+        [(date(2023, 1, 1), -10000)],
+        [(date(2023, 1, 1), 10000), (date(2024, 1, 1), 11000)],
+        [(date(2023, 1, 1), -10000), (date(2024, 1, 1), -5000)],
+        [(date(2023, 1, 1), 0), (date(2024, 1, 1), 10000)],
+        [],
+    ])
+    def test_invalid_series(self, cashflows):
+        assert xirr(cashflows) is None
+
+
+class TestXIRRBatch:
+    """Tests for xirr_batch()."""
+
+    def test_batch_matches_single_series(self):
+        rng = random.Random(42)
+        series = []
+        for _ in range(200):
+            start = date(2018, 1, 1) + timedelta(days=rng.randint(0, 1000))
+            flows = [(start + timedelta(days=30 * i), -rng.uniform(1000, 5000)) for i in range(rng.randint(1, 24))]
+            invested = -sum(a for _, a in flows)
+            flows.append((start + timedelta(days=rng.randint(400, 2500)), invested * rng.uniform(0.6, 2.5)))
+            series.append(flows)
+
+        offsets = np.cumsum([0] + [len(s) for s in series])
+        amounts = [a for s in series for _, a in s]
+        days = [d.toordinal() for s in series for d, _ in s]
+
+        result = xirr_batch(amounts, days, offsets)
+
+        assert len(result) == 200
+        assert result.converged.all()
+        for i, flows in enumerate(series):
+            assert result.rates[i] == pytest.approx(xirr(flows), abs=1e-9)
+            assert npv(flows, result.rates[i]) == pytest.approx(0, abs=1e-2)
+
+    def test_bisection_fallback_beyond_newton_bound(self):
+        """Rates above the Newton clamp are found by bisection."""
+        flows = [(date(2024, 1, 1), -100), (date(2024, 3, 14), 200)]
+
+        result = xirr_batch([-100, 200], [d.toordinal() for d, _ in flows], [0, 2])
+        solution = result.solution(0)
+
+        assert solution.status == XIRRStatus.BRACKETED
+        assert solution.rate == pytest.approx(two_flow_rate(100, 200, 73), rel=1e-5)
+        assert solution.iterations > 0
+
+    def test_no_root_in_range(self):
+        # Near-total loss within a day: rate below RATE_FLOOR
+        result = xirr_batch([-10000, 1], [0, 1], [0, 2])
+        assert result.solution(0).status == XIRRStatus.NO_ROOT
+        assert result.solution(0).rate is None
+
+    def test_statuses_and_iterations(self):
+        result = xirr_batch(
+            [-100, 110, 50, -100, 200],
+            [0, 365, 0, 0, 73],
+            [0, 2, 3, 5],
+        )
+        assert [XIRRStatus(s) for s in result.status] == [
+            XIRRStatus.CONVERGED, XIRRStatus.INVALID, XIRRStatus.BRACKETED,
+        ]
+        assert result.iterations[0] > 0
+        assert result.iterations[1] == 0
+        assert np.isnan(result.rates[1])
+
+    def test_empty_batch(self):
+        result = xirr_batch([], [], [0])
+        assert len(result) == 0
+
+
+class TestCashflowBatch:
+    """Tests for CashflowBatch."""
+
+    def test_flow_added_to_several_series(self):
+        batch = CashflowBatch()
+        batch.add(date(2023, 1, 1), -100, "A", "portfolio")
+        batch.add(date(2024, 1, 1), 120, "A", "portfolio")
+        batch.add(date(2023, 1, 1), -100, "B", "portfolio")
+        batch.add(date(2024, 1, 1), 100, "B", "portfolio")
+        batch.add(date(2024, 1, 1), 5, "C")
+
+        solutions = batch.solve()
+
+        assert batch.keys == ["A", "portfolio", "B", "C"]
+        assert solutions["A"].rate == pytest.approx(0.20)
+        assert solutions["B"].rate == pytest.approx(0.0, abs=1e-9)
+        assert solutions["portfolio"].rate == pytest.approx(0.10)
+        assert solutions["C"].status == XIRRStatus.INVALID
+        assert not solutions["C"].converged
+
+    def test_interleaved_keys_match_separate_solves(self):
+        flows = {
+            "X": [(date(2022, 1, 1), -1000), (date(2022, 6, 1), -500), (date(2023, 3, 1), 1800)],
+            "Y": [(date(2022, 2, 1), -2000), (date(2023, 2, 1), 1900)],
+        }
+        batch = CashflowBatch()
+        for i in range(3):
+            for key, series in flows.items():
+                if i < len(series):
+                    batch.add(series[i][0], series[i][1], key)
+
+        solutions = batch.solve()
+        for key, series in flows.items():
+            assert solutions[key].rate == pytest.approx(xirr(series), abs=1e-12)
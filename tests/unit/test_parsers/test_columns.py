@@ -0,0 +1,129 @@
+"""
+Unit tests for column-at-a-time statement normalization.
+
+Tests:
+1. Cell cleaning, header coalescing and regex extraction
+2. Converters run once per distinct value; date formats parsed column-wise
+3. ColumnMappingConfig value_mapping with the shipped parser configs
+"""
+
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+
+import pandas as pd
+
+from pfas.parsers.base import ColumnMappingConfig
+from pfas.parsers.columns import (
+    cell_text,
+    coalesce,
+    date_column,
+    extract,
+    map_distinct,
+    parse_dates,
+)
+
+CONFIG_DIR = Path(__file__).resolve().parents[3] / "config" / "parser_configs"
+
+
+class TestCellHelpers:
+    """Tests for cell_text, coalesce and extract."""
+
+    def test_cell_text(self):
+        values = pd.Series([" SIP ", None, float("nan"), "", "nan", 12.5])
+
+        assert cell_text(values).tolist() == ["SIP", None, None, None, None, "12.5"]
+        assert cell_text(values, keep_blank=True).tolist() == ["SIP", None, None, "", "nan", "12.5"]
+
+    def test_coalesce_prefers_first_non_blank_candidate(self):
+        df = pd.DataFrame({
+            "Folio No": ["123", None, "  "],
+            "Folio Number": ["999", "456", None],
+        })
+
+        folios = coalesce(df, ["Folio No", "Folio Number", "Missing Column"])
+
+        assert folios.tolist() == ["123", "456", None]
+
+    def test_extract(self):
+        names = pd.Series(["Fund A ISIN : INF179K01BB8", "Fund B ( INF769K01010)", None])
+
+        assert extract(names, r"ISIN\s*:\s*([A-Z0-9]{12})").tolist() == ["INF179K01BB8", None, None]
+        assert extract(names, r"INF[A-Z0-9]{9}").tolist() == [
+            "INF179K01BB8", "INF769K01010", None
+        ]
+
+
+class TestConverters:
+    """Tests for map_distinct, parse_dates and date_column."""
+
+    def test_map_distinct_converts_each_value_once(self):
+        calls = []
+
+        def convert(value):
+            calls.append(value)
+            return Decimal(str(value))
+
+        values = pd.Series(["10.5", "10.5", "7", "10.5", "7"])
+        memo = {}
+
+        assert map_distinct(values, convert, memo) == [Decimal("10.5")] * 2 + [Decimal("7"), Decimal("10.5"), Decimal("7")]
+        assert map_distinct(["7"], convert, memo) == [Decimal("7")]
+        assert calls == ["10.5", "7"]
+
+    def test_parse_dates_matches_scalar_parser(self):
+        calls = []
+
+        def parse(value):
+            calls.append(value)
+            return None if value is None or pd.isna(value) else pd.to_datetime(value).date()
+
+        values = pd.Series(["15-Apr-2024", "01-Jan-2020", "15-Apr-2024", "04/05/2024", None])
+
+        parsed = parse_dates(values, parse, ["%d-%b-%Y"])
+
+        assert parsed == [parse(v) for v in values]
+        # Only the value outside the given formats (and the blank) hit the scalar parser
+        assert sorted(map(str, calls[:2])) == ["04/05/2024", "nan"]
+
+    def test_date_column(self):
+        values = pd.Series(["15/04/2024", "2024-04-16", pd.Timestamp("2024-04-17"), "bad", None])
+
+        assert date_column(values, ["%d/%m/%Y", "%Y-%m-%d"]) == [
+            date(2024, 4, 15), date(2024, 4, 16), date(2024, 4, 17), None, None
+        ]
+
+    def test_date_column_fallback(self):
+        values = pd.Series(["15/04/2024", "April 16, 2024", "nan", " ", None])
+        calls = []
+
+        def fallback(text):
+            calls.append(text)
+            return pd.to_datetime(text).date()
+
+        assert date_column(values, ["%d/%m/%Y"], fallback) == [
+            date(2024, 4, 15), date(2024, 4, 16), None, None, None
+        ]
+        assert calls == ["April 16, 2024"]
+
+
+class TestValueMapping:
+    """Tests for value_mapping in ColumnMappingConfig.apply_mapping."""
+
+    def test_shipped_cams_mapping(self):
+        config = ColumnMappingConfig(CONFIG_DIR)
+        row = {
+            "AMC Name": "HDFC Mutual Fund",
+            "Folio No": "123/45",
+            "ASSET CLASS": "equity",
+            "Scheme Name": "HDFC Flexi Cap ISIN : INF179K01BB8",
+            "Desc": "Purchase",
+            "Date": "15/04/2024",
+            "Units": "10.5",
+            "Amount": "5000.00",
+        }
+
+        record = config.apply_mapping(row, "CAMS")
+
+        assert record["asset_class"] == "MF_EQUITY"
+        assert record["transaction_type"] == "BUY"
@@ -0,0 +1,238 @@
+"""
+Reference implementation of the detailed CAS parser.
+
+CASPDFParser._parse_detailed_cas classifies each line once and dispatches
+on the result. This is the original cascade it replaced, which tries
+every pattern on every line in turn. It is kept only for the equivalence
+tests and tests/manual/benchmark_cas_line_classifier.py.
+"""
+
+import re
+from datetime import date
+from decimal import Decimal
+from typing import List
+
+from pfas.parsers.mf.cas_pdf_parser import (
+    AMC_PATTERN,
+    FOLIO_PATTERN,
+    PAN_PATTERN,
+    STAMP_DUTY_PATTERN,
+    STAMP_DUTY_TXN_PATTERN,
+    STT_PATTERN,
+    STT_TXN_PATTERN,
+    VALUATION_PATTERN,
+    CASPDFParser,
+)
+from pfas.parsers.mf.models import (
+    CASFolio,
+    CASScheme,
+    CASTransaction,
+    SchemeValuation,
+    TransactionType,
+)
+
+
+def parse_detailed_cas_sequential(parser: CASPDFParser, text: str) -> List[CASFolio]:
+    """Parse DETAILED CAS text with parser's helpers, one pattern after another."""
+    folios = []
+    current_folio = None
+    current_scheme = None
+    current_amc = ""
+
+    lines = text.split('\n')
+    i = 0
+
+    while i < len(lines):
+        line = lines[i].strip()
+
+        if not line:
+            i += 1
+            continue
+
+        # Check for AMC header
+        amc_match = AMC_PATTERN.match(line)
+        if amc_match:
+            current_amc = amc_match.group(1).strip()
+            i += 1
+            continue
+
+        # Check for folio line
+        folio_match = FOLIO_PATTERN.search(line)
+        if folio_match:
+            folio_number = folio_match.group(1)
+
+            # Extract PAN/KYC if on same line
+            pan = ""
+            pan_match = PAN_PATTERN.search(line)
+            if pan_match:
+                pan = pan_match.group(1)
+
+            # Save previous folio
+            if current_folio:
+                if current_scheme:
+                    parser._finalize_scheme(current_scheme)
+                    current_folio.schemes.append(current_scheme)
+                folios.append(current_folio)
+
+            current_folio = CASFolio(
+                folio=folio_number,
+                amc=current_amc,
+                pan=pan
+            )
+            current_scheme = None
+            i += 1
+            continue
+
+        # Check for scheme header (contains Fund, Growth, etc.)
+        if parser._is_scheme_line(line):
+            # Finalize previous scheme
+            if current_scheme and current_folio:
+                parser._finalize_scheme(current_scheme)
+                current_folio.schemes.append(current_scheme)
+
+            # Parse scheme info
+            scheme_info = parser._parse_scheme_line(line, lines, i)
+            current_scheme = CASScheme(
+                scheme=scheme_info.get('name', 'Unknown'),
+                isin=scheme_info.get('isin'),
+                rta=scheme_info.get('rta', ''),
+                rta_code=scheme_info.get('rta_code', ''),
+                advisor=scheme_info.get('advisor'),
+            )
+
+            # Look for opening balance
+            i += 1
+            while i < len(lines):
+                next_line = lines[i].strip()
+                open_match = re.search(
+                    r'Opening\s+(?:Unit\s+)?Balance\s*:?\s*([\d,]+\.?\d*)',
+                    next_line, re.IGNORECASE
+                )
+                if open_match:
+                    current_scheme.open = parser._parse_decimal(open_match.group(1))
+                    i += 1
+                    break
+                elif parser._is_transaction_line(next_line):
+                    # No opening balance line, start processing transactions
+                    break
+                i += 1
+            continue
+
+        # Check for stamp duty transaction line (date + *** Stamp Duty *** + amount)
+        stamp_txn_match = STAMP_DUTY_TXN_PATTERN.match(line)
+        if current_scheme and stamp_txn_match:
+            txn_date = parser._parse_date(stamp_txn_match.group(1))
+            amount = parser._parse_decimal(stamp_txn_match.group(2)) if stamp_txn_match.group(2) else Decimal("0")
+            stamp_txn = CASTransaction(
+                date=txn_date or date.today(),
+                description="*** Stamp Duty ***",
+                amount=amount,
+                units=Decimal("0"),
+                nav=Decimal("0"),
+                balance=None,
+                transaction_type=TransactionType.STAMP_DUTY_TAX
+            )
+            current_scheme.transactions.append(stamp_txn)
+            i += 1
+            continue
+
+        # Check for stamp duty line without date (*** Stamp Duty ***)
+        if current_scheme and STAMP_DUTY_PATTERN.match(line):
+            # Create a stamp duty transaction linked to previous transaction's date
+            prev_date = None
+            if current_scheme.transactions:
+                prev_date = current_scheme.transactions[-1].date
+            stamp_txn = CASTransaction(
+                date=prev_date or date.today(),
+                description="*** Stamp Duty ***",
+                amount=Decimal("0"),
+                units=Decimal("0"),
+                nav=Decimal("0"),
+                balance=None,
+                transaction_type=TransactionType.STAMP_DUTY_TAX
+            )
+            current_scheme.transactions.append(stamp_txn)
+            i += 1
+            continue
+
+        # Check for STT transaction line (date + *** STT *** + amount)
+        stt_txn_match = STT_TXN_PATTERN.match(line)
+        if current_scheme and stt_txn_match:
+            txn_date = parser._parse_date(stt_txn_match.group(1))
+            amount = parser._parse_decimal(stt_txn_match.group(2)) if stt_txn_match.group(2) else Decimal("0")
+            stt_txn = CASTransaction(
+                date=txn_date or date.today(),
+                description="*** STT Paid ***",
+                amount=amount,
+                units=Decimal("0"),
+                nav=Decimal("0"),
+                balance=None,
+                transaction_type=TransactionType.STT_TAX
+            )
+            current_scheme.transactions.append(stt_txn)
+            i += 1
+            continue
+
+        # Check for STT line without date (*** STT Paid ***)
+        if current_scheme and STT_PATTERN.match(line):
+            prev_date = None
+            if current_scheme.transactions:
+                prev_date = current_scheme.transactions[-1].date
+            stt_txn = CASTransaction(
+                date=prev_date or date.today(),
+                description="*** STT Paid ***",
+                amount=Decimal("0"),
+                units=Decimal("0"),
+                nav=Decimal("0"),
+                balance=None,
+                transaction_type=TransactionType.STT_TAX
+            )
+            current_scheme.transactions.append(stt_txn)
+            i += 1
+            continue
+
+        # Check for transaction line
+        if current_scheme and parser._is_transaction_line(line):
+            txn = parser._parse_transaction_line(line)
+            if txn:
+                current_scheme.transactions.append(txn)
+            i += 1
+            continue
+
+        # Check for closing balance
+        close_match = re.search(
+            r'Closing\s+(?:Unit\s+)?Balance\s*:?\s*([\d,]+\.?\d*)',
+            line, re.IGNORECASE
+        )
+        if close_match and current_scheme:
+            current_scheme.close = parser._parse_decimal(close_match.group(1))
+            i += 1
+            continue
+
+        # Check for valuation line
+        val_match = VALUATION_PATTERN.search(line)
+        if val_match and current_scheme:
+            val_date = parser._parse_date(val_match.group(1))
+            val_nav = parser._parse_decimal(val_match.group(2))
+            val_value = parser._parse_decimal(val_match.group(3))
+
+            if val_date:
+                current_scheme.valuation = SchemeValuation(
+                    date=val_date,
+                    nav=val_nav,
+                    value=val_value
+                )
+            i += 1
+            continue
+
+        i += 1
+
+    # Don't forget last folio/scheme
+    if current_scheme and current_folio:
+        parser._finalize_scheme(current_scheme)
+        current_folio.schemes.append(current_scheme)
+
+    if current_folio:
+        folios.append(current_folio)
+
+    return folios
@@ -98,6 +98,51 @@ class TestCAMSParser:
         assert parser._to_decimal(None) == Decimal("0")
         assert parser._to_decimal("") == Decimal("0")
 
+    def test_parse_frame(self, db_connection):
+        """Test column-wise conversion of a TRXN_DETAILS sheet."""
+        import pandas as pd
+        from pfas.parsers.mf.models import ParseResult
+
+        parser = CAMSParser(db_connection)
+        df = pd.DataFrame({
+            "AMC Name": ["SBI Mutual Fund", None, "HDFC Mutual Fund"],
+            "Folio No": ["123/45", None, "678"],
+            "ASSET CLASS": ["EQUITY", None, None],
+            "Scheme Name": [
+                "SBI Bluechip Fund Direct Growth, ISIN : INF200K01123", None,
+                "HDFC Liquid Fund - Direct Growth",
+            ],
+            "Desc": ["Redemption", None, "Purchase"],
+            "Date": ["15-Apr-2024", None, "2024-04-16"],
+            "Units": [10.5, None, "1000"],
+            "Amount": ["1050.25", None, 250000],
+            "Date.1": ["01-Jan-2020", None, None],
+            "Short Term": [None, None, None],
+            "Long Term Without Index": [120.5, None, None],
+        })
+        result = ParseResult(success=True)
+
+        redemption, purchase = parser._parse_frame(df, result)
+
+        assert redemption.folio_number == "123/45"
+        assert redemption.scheme.isin == "INF200K01123"
+        assert redemption.scheme.asset_class == AssetClass.EQUITY
+        assert redemption.transaction_type == TransactionType.REDEMPTION
+        assert redemption.date == date(2024, 4, 15)
+        assert redemption.purchase_date == date(2020, 1, 1)
+        assert redemption.units == Decimal("10.5")
+        assert redemption.amount == Decimal("1050.25")
+        assert redemption.long_term_gain == Decimal("120.5")
+        assert redemption.short_term_gain == Decimal("0")
+
+        assert purchase.scheme.amc_name == "HDFC Mutual Fund"
+        assert purchase.scheme.isin is None
+        assert purchase.transaction_type == TransactionType.PURCHASE
+        assert purchase.date == date(2024, 4, 16)
+        assert purchase.purchase_date is None
+        assert purchase.units == Decimal("1000")
+        assert result.warnings == []
+
     def test_parse_nonexistent_file(self, db_connection):
         """Test parsing nonexistent file returns error."""
         parser = CAMSParser(db_connection)
@@ -0,0 +1,83 @@
+"""Tests for the single-pass line classifier in the detailed CAS parser."""
+
+import pytest
+from pathlib import Path
+
+from pfas.parsers.mf.cas_pdf_parser import CASPDFParser, LineKind
+from pfas.parsers.mf.models import TransactionType
+from tests.unit.test_parsers.test_mf.cas_sequential_reference import parse_detailed_cas_sequential
+
+
+FIXTURE = Path(__file__).parents[3] / "fixtures" / "mf" / "sample_cas_detailed.txt"
+
+
+@pytest.fixture
+def parser():
+    return CASPDFParser()
+
+
+@pytest.fixture
+def cas_text():
+    return FIXTURE.read_text()
+
+
+class TestClassifyLine:
+    """Tests for CASPDFParser._classify_line."""
+
+    @pytest.mark.parametrize("line, kind", [
+        ("HDFC Mutual Fund", LineKind.AMC),
+        ("Aditya Birla Sun Life Asset Management", LineKind.AMC),
+        ("Folio No: 1234567/89 PAN: ABCDE1234F", LineKind.FOLIO),
+        ("B92Z-Aditya Birla Sun Life Liquid Fund - Growth-Direct Plan", LineKind.SCHEME),
+        ("ISIN: INF209K01YY7(Advisor: DIRECT)", LineKind.SCHEME),
+        ("15-May-2024 *** Stamp Duty *** 0.50", LineKind.STAMP_DUTY_TXN),
+        ("*** Stamp Duty ***", LineKind.STAMP_DUTY),
+        ("04-Aug-2024 *** STT Paid *** 1.00", LineKind.STT_TXN),
+        ("*** STT ***", LineKind.STT),
+        ("02-Apr-2024 Purchase 10,000.00 98.215 101.8175 223.715", LineKind.TRANSACTION),
+        ("Closing Unit Balance: 295.289", LineKind.CLOSING_BALANCE),
+        ("Valuation on 31-Mar-2025: NAV: 125.4321 Value: Rs. 37,038.96", LineKind.VALUATION),
+        ("Page 1 of 4", LineKind.OTHER),
+        ("Total 10,000.00", LineKind.OTHER),
+    ])
+    def test_kinds(self, parser, line, kind):
+        assert parser._classify_line(line)[0] is kind
+
+    def test_blank_lines_skipped(self, parser):
+        tagged = list(parser._classify_lines("\n  \nHDFC Mutual Fund\n\n"))
+        assert [kind for kind, _, _ in tagged] == [LineKind.AMC]
+
+
+class TestDetailedCASEquivalence:
+    """The classifier-based parser must match the sequential reference."""
+
+    def test_fixture_matches_sequential(self, parser, cas_text):
+        folios = parser._parse_detailed_cas(cas_text)
+
+        assert folios == parse_detailed_cas_sequential(parser, cas_text)
+        assert [f.folio for f in folios] == ["1234567/89", "1034567890", "99887766"]
+        assert folios[0].pan == "ABCDE1234F"
+
+        small_cap = folios[0].schemes[0]
+        assert small_cap.open == parser._parse_decimal("125.500")
+        assert small_cap.close == parser._parse_decimal("295.289")
+        types = [t.transaction_type for t in small_cap.transactions]
+        assert types.count(TransactionType.STAMP_DUTY_TAX) == 2
+        assert types.count(TransactionType.STT_TAX) == 1
+
+    def test_scaled_text_matches_sequential(self, parser, cas_text):
+        text = "\n".join([cas_text] * 50)
+        assert parser._parse_detailed_cas(text) == parse_detailed_cas_sequential(parser, text)
+
+    def test_lines_after_scheme_header_skipped_until_opening(self, parser):
+        text = "\n".join([
+            "Folio No: 111",
+            "HSTOGT-HDFC Small Cap Fund - Direct Plan - Growth",
+            "Closing Unit Balance: 999.000",
+            "Opening Unit Balance: 10.000",
+            "Closing Unit Balance: 20.000",
+        ])
+        folios = parser._parse_detailed_cas(text)
+
+        assert folios == parse_detailed_cas_sequential(parser, text)
+        assert folios[0].schemes[0].close == parser._parse_decimal("20.000")
@@ -292,6 +292,28 @@ class TestFIFOUnitTracker:
         assert gains[0].gain_type == "STCG"
 
 
+    def test_state_round_trip(self):
+        from pfas.parsers.mf.fifo_tracker import FIFOUnitTracker
+        from pfas.parsers.mf.models import AssetClass
+
+        tracker = FIFOUnitTracker("Test Fund", "12345", AssetClass.EQUITY)
+        tracker.add_purchase(date(2020, 1, 1), Decimal("100"), Decimal("50"), Decimal("5000"))
+        tracker.add_purchase(date(2021, 1, 1), Decimal("60"), Decimal("55"), Decimal("3300"))
+        tracker.process_redemption(date(2022, 6, 1), Decimal("120"), Decimal("70"), Decimal("8400"))
+
+        restored = FIFOUnitTracker("Test Fund", "12345", AssetClass.EQUITY)
+        restored.restore_state(tracker.to_state())
+
+        assert restored.available_units == tracker.available_units == Decimal("40")
+        assert restored.total_redeemed == Decimal("120")
+
+        # Both redeem the remaining lot identically
+        expected = tracker.process_redemption(date(2023, 1, 1), Decimal("40"), Decimal("80"), Decimal("3200"))
+        gains = restored.process_redemption(date(2023, 1, 1), Decimal("40"), Decimal("80"), Decimal("3200"))
+        assert gains == expected
+        assert restored.available_units == Decimal("0")
+
+
 class TestPortfolioFIFOTracker:
     """Test portfolio-wide FIFO tracking."""
 
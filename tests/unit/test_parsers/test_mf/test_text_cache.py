@@ -0,0 +1,150 @@
+"""Tests for the encrypted CAS text cache and page sharding."""
+
+import pytest
+from pathlib import Path
+from unittest.mock import patch
+
+from pfas.core.encryption import KeyCache
+from pfas.parsers.mf import text_cache as text_cache_module
+from pfas.parsers.mf.text_cache import CASTextCache
+
+
+MASTER_KEY = b"test_master_key_32_bytes_long!!!"
+CAS_TEXT = "Consolidated Account Statement\nPAN: ABCDE1234F\n" * 10
+
+
+def write_text_pdf(path: Path, pages: int) -> Path:
+    """Write a minimal PDF with one line of text per page."""
+    font_id = 3 + 2 * pages
+    kids = " ".join(f"{3 + 2 * i} 0 R" for i in range(pages))
+    objects = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        f"<< /Type /Pages /Kids [{kids}] /Count {pages} >>",
+    ]
+    for i in range(pages):
+        stream = f"BT /F1 12 Tf 72 720 Td (Page {i + 1} text) Tj ET"
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents {4 + 2 * i} 0 R "
+            f"/Resources << /Font << /F1 {font_id} 0 R >> >> >>"
+        )
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+    objects.append("<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    data = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(data))
+        data += f"{number} 0 obj\n{body}\nendobj\n".encode()
+    xref = len(data)
+    data += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    data += b"".join(f"{offset:010d} 00000 n \n".encode() for offset in offsets)
+    data += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    path.write_bytes(data)
+    return path
+
+
+@pytest.fixture
+def pdf_file(tmp_path):
+    path = tmp_path / "cas.pdf"
+    path.write_bytes(b"%PDF-1.4 fake statement bytes")
+    return path
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return CASTextCache(tmp_path / "cache", MASTER_KEY, KeyCache())
+
+
+class TestCASTextCache:
+    """Tests for CASTextCache."""
+
+    def test_round_trip(self, cache, pdf_file):
+        key = cache.key_for(pdf_file, "pdfplumber", "secret")
+        assert cache.get(key) is None
+
+        cache.put(key, CAS_TEXT)
+        assert cache.get(key) == CAS_TEXT
+        assert cache.stats() == {"hits": 1, "misses": 1, "entries": 1}
+
+    def test_entries_are_encrypted(self, cache, pdf_file):
+        key = cache.key_for(pdf_file, "pdfplumber")
+        cache.put(key, CAS_TEXT)
+
+        raw = (cache.cache_dir / f"{key}.enc").read_bytes()
+        assert b"ABCDE1234F" not in raw
+
+    def test_key_depends_on_content_extractor_password_and_version(self, cache, pdf_file):
+        base = cache.key_for(pdf_file, "pdfplumber", "secret")
+
+        assert cache.key_for(pdf_file, "pymupdf", "secret") != base
+        assert cache.key_for(pdf_file, "pdfplumber", "wrong") != base
+        with patch.object(text_cache_module, "EXTRACTOR_VERSION", 99):
+            assert cache.key_for(pdf_file, "pdfplumber", "secret") != base
+
+        pdf_file.write_bytes(b"%PDF-1.4 different bytes")
+        assert cache.key_for(pdf_file, "pdfplumber", "secret") != base
+
+    def test_other_master_key_misses(self, tmp_path, pdf_file):
+        cache = CASTextCache(tmp_path / "cache", MASTER_KEY, KeyCache())
+        key = cache.key_for(pdf_file, "pdfplumber")
+        cache.put(key, CAS_TEXT)
+
+        other = CASTextCache(tmp_path / "cache", b"another_master_key_32_bytes_long", KeyCache())
+        assert other.get(key) is None
+
+    def test_salt_is_stable(self, tmp_path):
+        first = CASTextCache(tmp_path / "cache", MASTER_KEY)
+        second = CASTextCache(tmp_path / "cache", MASTER_KEY)
+        assert first._cipher.user_salt == second._cipher.user_salt
+
+    def test_clear(self, cache, pdf_file):
+        cache.put(cache.key_for(pdf_file, "pdfplumber"), CAS_TEXT)
+        assert cache.clear() == 1
+        assert cache.stats()["entries"] == 0
+
+
+class TestCASPDFParserExtraction:
+    """Tests for cached and sharded text extraction in CASPDFParser."""
+
+    def test_second_parse_skips_pdf_decoding(self, cache, pdf_file):
+        from pfas.parsers.mf import cas_pdf_parser
+
+        parser = cas_pdf_parser.CASPDFParser(text_cache=cache)
+        method = "_extract_with_pymupdf" if cas_pdf_parser.HAS_PYMUPDF else "_extract_with_pdfplumber"
+
+        with patch.object(parser, method, return_value=CAS_TEXT) as extract:
+            assert parser._extract_text(pdf_file, "secret") == CAS_TEXT
+            assert parser._extract_text(pdf_file, "secret") == CAS_TEXT
+            assert extract.call_count == 1
+
+            # Different password is a different entry
+            parser._extract_text(pdf_file, "other")
+            assert extract.call_count == 2
+
+    def test_page_shards(self):
+        from pfas.parsers.mf.cas_pdf_parser import CASPDFParser, PARALLEL_MIN_PAGES
+
+        assert CASPDFParser()._page_shards(500) == [(0, 500)]
+
+        parser = CASPDFParser(extraction_workers=4)
+        assert parser._page_shards(PARALLEL_MIN_PAGES - 1) == [(0, PARALLEL_MIN_PAGES - 1)]
+
+        shards = parser._page_shards(102)
+        assert shards == [(0, 26), (26, 52), (52, 77), (77, 102)]
+
+    def test_sharded_extraction_matches_sequential(self, tmp_path):
+        from pfas.parsers.mf import cas_pdf_parser
+
+        if cas_pdf_parser.HAS_PYMUPDF:
+            method = "_extract_with_pymupdf"
+        else:
+            pytest.importorskip("pdfplumber")
+            method = "_extract_with_pdfplumber"
+
+        pdf_path = write_text_pdf(tmp_path / "large.pdf", 120)
+        sequential = getattr(cas_pdf_parser.CASPDFParser(), method)(pdf_path)
+        sharded = getattr(cas_pdf_parser.CASPDFParser(extraction_workers=3), method)(pdf_path)
+
+        assert sharded == sequential
+        assert sequential.startswith("Page 1 text")
+        assert "Page 120 text" in sequential
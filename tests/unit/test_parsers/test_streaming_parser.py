@@ -0,0 +1,260 @@
+"""
+Unit tests for the opt-in streaming parse pipeline in BaseParser.
+
+Tests:
+1. Streaming staging matches the row-by-row pipeline
+2. Records in flight never exceed the chunk size
+3. Two commits per chunk instead of two per row
+4. Re-parsing is idempotent; mid-file errors keep staged chunks
+5. The normalized CAMS/Karvy Excel parsers stage in chunks
+"""
+
+import pandas as pd
+import pytest
+
+from pfas.core.database import DatabaseManager
+from pfas.parsers.base import BaseParser, ParsedRecord
+from pfas.parsers.mf.normalized_mf_parser import NormalizedCAMSParser, NormalizedKarvyParser
+
+
+class CSVLineParser(BaseParser):
+    """One staged row per "date,amount,name" line; blank amounts are skipped."""
+
+    def __init__(self, db_connection, fail_at=None):
+        super().__init__(db_connection)
+        self.fail_at = fail_at
+        self.max_in_flight = 0
+        self._yielded = 0
+
+    def get_source_type(self):
+        return "CSVLINES"
+
+    def get_supported_formats(self):
+        return [".csv"]
+
+    def parse_raw(self, file_path):
+        return list(self.iter_raw(file_path))
+
+    def iter_raw(self, file_path):
+        with open(file_path) as f:
+            for i, line in enumerate(f):
+                if i == self.fail_at:
+                    raise ValueError("truncated file")
+                txn_date, amount, name = line.rstrip("\n").split(",")
+                staged = self.conn.execute("SELECT COUNT(*) FROM staging_raw").fetchone()[0]
+                self.max_in_flight = max(self.max_in_flight, self._yielded - staged)
+                self._yielded += 1
+                yield ParsedRecord(
+                    source_type="CSVLINES",
+                    source_file=str(file_path),
+                    raw_data={"date": txn_date, "amount": amount, "name": name},
+                    row_index=i,
+                )
+
+    def normalize_record(self, record):
+        if not record.raw_data["amount"]:
+            return None
+        return {
+            "date": record.raw_data["date"],
+            "amount": record.raw_data["amount"],
+            "transaction_type": "CREDIT",
+            "asset_category": "BANK",
+            "asset_name": record.raw_data["name"],
+        }
+
+
+class StreamingCSVLineParser(CSVLineParser):
+    streaming = True
+    staging_chunk_size = 25
+
+
+@pytest.fixture
+def db_connection():
+    DatabaseManager.reset_instance()
+    db = DatabaseManager()
+    conn = db.init(":memory:", "test_password")
+    conn.execute("""
+        INSERT INTO users (id, pan_encrypted, pan_salt, name, email)
+        VALUES (1, X'00', X'00', 'Test User', 'test@example.com')
+    """)
+    conn.commit()
+    yield conn
+    db.close()
+    DatabaseManager.reset_instance()
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    path = tmp_path / "export.csv"
+    lines = []
+    for i in range(120):
+        amount = "" if i % 17 == 0 else f"{100 + i}.50"
+        lines.append(f"2024-{1 + i % 12:02d}-{1 + i % 28:02d},{amount},Payee {i}")
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+
+def staged_rows(conn):
+    return conn.execute("""
+        SELECT r.row_index, r.checksum, n.transaction_date, n.amount, n.asset_name
+        FROM staging_normalized n JOIN staging_raw r ON r.id = n.staging_raw_id
+        ORDER BY r.row_index
+    """).fetchall()
+
+
+def count_commits(conn):
+    statements = []
+    conn.set_trace_callback(statements.append)
+    return statements
+
+
+class TestStreamingParse:
+    """Tests for BaseParser.parse_stream()."""
+
+    def test_matches_row_by_row_pipeline(self, db_connection, csv_file):
+        expected = CSVLineParser(db_connection).parse(csv_file)
+        expected_rows = [tuple(r) for r in staged_rows(db_connection)]
+        db_connection.execute("DELETE FROM staging_normalized")
+        db_connection.execute("DELETE FROM staging_raw")
+        db_connection.execute("DELETE FROM processed_transactions")
+        db_connection.commit()
+
+        result = StreamingCSVLineParser(db_connection).parse(csv_file)
+
+        assert result.success
+        assert result.normalized_count == expected.normalized_count == 112
+        assert len(result.warnings) == len(expected.warnings) == 8
+        assert [tuple(r) for r in staged_rows(db_connection)] == expected_rows
+
+    def test_chunked_memory_and_commits(self, db_connection, csv_file):
+        parser = StreamingCSVLineParser(db_connection)
+        statements = count_commits(db_connection)
+
+        result = parser.parse(csv_file)
+        db_connection.set_trace_callback(None)
+
+        assert result.normalized_count == 112
+        # Raw records wait in at most one chunk (plus skipped rows) before staging
+        assert parser.max_in_flight <= parser.staging_chunk_size + 8
+        # 5 chunks, each one raw write and one normalized write
+        assert sum(1 for s in statements if s.strip().upper() == "COMMIT") == 10
+
+    def test_reparse_counts_duplicates(self, db_connection, csv_file):
+        StreamingCSVLineParser(db_connection).parse(csv_file)
+        result = StreamingCSVLineParser(db_connection).parse(csv_file)
+
+        assert result.success
+        assert result.normalized_count == 0
+        assert result.duplicate_count == 112
+        assert len(staged_rows(db_connection)) == 112
+
+    def test_parse_error_keeps_staged_rows(self, db_connection, csv_file):
+        result = StreamingCSVLineParser(db_connection, fail_at=60).parse(csv_file)
+
+        assert not result.success
+        assert "Parse error: truncated file" in result.errors
+        # Rows 0-59 were read before the failure, 4 of them not normalizable
+        assert len(staged_rows(db_connection)) == 56
+
+    def test_normalize_records_uses_chunks_when_streaming(self, db_connection, csv_file):
+        parser = StreamingCSVLineParser(db_connection)
+        result = parser.normalize_records(parser.iter_raw(csv_file))
+
+        assert result.normalized_count == 112
+        assert parser.max_in_flight <= parser.staging_chunk_size + 8
+
+    def test_invalid_file(self, db_connection, tmp_path):
+        result = StreamingCSVLineParser(db_connection).parse(tmp_path / "missing.csv")
+        assert not result.success
+
+
+@pytest.fixture
+def cams_frame():
+    rows = []
+    for i in range(60):
+        rows.append({
+            "Scheme Name": "" if i % 20 == 0 else f"Fund {i % 4} INF123A0100{i % 10}",
+            "Folio No": f"F{i % 3}",
+            "ASSET CLASS": "EQUITY",
+            "Desc": "Purchase" if i % 2 else "Redemption",
+            "Date": f"{1 + i % 28:02d}/06/2024",
+            "Units": f"{10 + i}.125",
+            "Amount": f"{1000 + i}.50",
+            "Price": "52.10",
+        })
+    return pd.DataFrame(rows)
+
+
+@pytest.fixture
+def cams_xlsx(tmp_path, cams_frame):
+    path = tmp_path / "cams_cg.xlsx"
+    # CAMS statements carry three title rows above the header
+    cams_frame.to_excel(path, sheet_name="TRXN_DETAILS", startrow=3, index=False)
+    return path
+
+
+class CountingCAMSParser(NormalizedCAMSParser):
+    """Tracks how many sheet rows were read ahead of staging."""
+
+    staging_chunk_size = 25
+
+    def __init__(self, db_connection):
+        super().__init__(db_connection)
+        self.max_in_flight = 0
+        self._read = 0
+
+    def _keep_row(self, first_value):
+        staged = self.conn.execute("SELECT COUNT(*) FROM staging_raw").fetchone()[0]
+        self.max_in_flight = max(self.max_in_flight, self._read - staged)
+        self._read += 1
+        return super()._keep_row(first_value)
+
+
+class TestNormalizedMFStreaming:
+    """Tests for chunked staging through the normalized CAMS/Karvy parsers."""
+
+    def test_cams_rows_staged_in_chunks(self, db_connection, cams_xlsx):
+        parser = CountingCAMSParser(db_connection)
+        statements = count_commits(db_connection)
+
+        result = parser.parse(cams_xlsx)
+        db_connection.set_trace_callback(None)
+
+        assert parser.streaming
+        assert result.success
+        assert result.normalized_count == 57
+        assert len(staged_rows(db_connection)) == 57
+        # Sheet rows are read at most one chunk (plus skipped blank rows) ahead
+        assert parser.max_in_flight <= parser.staging_chunk_size + 3
+        # 3 chunks, each one raw write and one normalized write
+        assert sum(1 for s in statements if s.strip().upper() == "COMMIT") == 6
+
+    def test_cams_raw_records(self, db_connection, cams_xlsx):
+        records = NormalizedCAMSParser(db_connection).parse_raw(cams_xlsx)
+
+        assert len(records) == 57
+        assert records[0].row_index == 1
+        assert records[0].raw_data["Folio No"] == "F1"
+        assert records[0].raw_data["Scheme Name"] == "Fund 1 INF123A01001"
+
+    def test_karvy_sections_skipped(self, db_connection, tmp_path, cams_frame):
+        path = tmp_path / "karvy_cg.xlsx"
+        frame = cams_frame.copy()
+        frame.loc[10, "Scheme Name"] = "Section"
+        frame.loc[30, "Scheme Name"] = "Fund"
+        frame.to_excel(path, sheet_name="Trasaction_Details", startrow=4, index=False)
+
+        result = NormalizedKarvyParser(db_connection).parse(path)
+
+        assert result.success
+        assert result.normalized_count == 55
+
+    def test_matches_dataframe_reader(self, db_connection, cams_xlsx):
+        pytest.importorskip("python_calamine")
+        parser = NormalizedCAMSParser(db_connection)
+
+        frame_records = list(parser._iter_frame_records(cams_xlsx))
+
+        assert [(r.row_index, r.raw_data) for r in frame_records] == [
+            (r.row_index, r.raw_data) for r in parser.parse_raw(cams_xlsx)
+        ]
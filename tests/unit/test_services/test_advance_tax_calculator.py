@@ -0,0 +1,45 @@
+"""
+Unit tests for AdvanceTaxCalculator.
+
+Tests:
+1. Computing on a read-only reader, history stored through the writer
+"""
+
+import pytest
+
+from pfas.core.tax_schema import init_tax_schema
+from pfas.services.advance_tax_calculator import AdvanceTaxCalculator
+from pfas.services.tax_rules_service import clear_tax_rule_tables
+
+
+@pytest.fixture
+def file_db(db_manager, tmp_path):
+    clear_tax_rule_tables()
+    conn = db_manager.init(str(tmp_path / "tax.db"), "test_password")
+    init_tax_schema(conn)
+    conn.execute(
+        "INSERT INTO users (id, name, pan_encrypted, pan_salt) VALUES (?, ?, ?, ?)",
+        (1, "TestUser", b"encrypted", b"salt")
+    )
+    conn.commit()
+    yield db_manager, conn
+    clear_tax_rule_tables()
+
+
+class TestComputationHistory:
+    """Tests for where computations are stored."""
+
+    def test_history_stored_through_writer(self, file_db):
+        db, writer = file_db
+
+        with db.reader() as reader:
+            result = AdvanceTaxCalculator(
+                reader, history_connection=writer
+            ).calculate(1, "2024-25", "NEW")
+
+        rows = writer.execute(
+            "SELECT tax_regime, is_latest FROM advance_tax_computation "
+            "WHERE user_id = 1 AND financial_year = '2024-25'"
+        ).fetchall()
+        assert result.user_id == 1
+        assert [tuple(r) for r in rows] == [("NEW", 1)]
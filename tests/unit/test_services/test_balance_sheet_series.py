@@ -0,0 +1,324 @@
+"""
+Unit tests for incremental balance sheet series.
+
+Every snapshot produced by BalanceSheetService.get_balance_sheets() must
+match get_balance_sheet() for the same date, whether it is built from
+scratch or resumed from a checkpoint.
+"""
+
+import json
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from pfas.core.database import DatabaseManager
+from pfas.services import BalanceSheetService, NAVService
+from pfas.services.balance_sheet_service import BalanceSheetState, month_ends
+
+
+@pytest.fixture
+def db_connection():
+    """Create test database with a year of mixed holdings."""
+    DatabaseManager.reset_instance()
+    db = DatabaseManager()
+    conn = db.init(":memory:", "test_password")
+
+    conn.execute("""
+        INSERT INTO users (id, pan_encrypted, pan_salt, name, email)
+        VALUES (1, X'00', X'00', 'Test User', 'test@example.com')
+    """)
+
+    # Bank: two accounts, balance after each transaction
+    conn.execute("""
+        INSERT INTO bank_accounts (id, account_number_encrypted, account_number_salt,
+                                   account_number_last4, bank_name, account_type, user_id)
+        VALUES (1, X'00', X'00', '1234', 'ICICI', 'SAVINGS', 1),
+               (2, X'00', X'00', '5678', 'HDFC', 'FD', 1)
+    """)
+    for i, (day, balance) in enumerate([
+        ("2024-01-05", 50000), ("2024-01-20", 42000), ("2024-03-02", 61000),
+        ("2024-05-15", 58000), ("2024-05-15", 70500), ("2024-08-30", 66000),
+    ]):
+        conn.execute("""
+            INSERT INTO bank_transactions (bank_account_id, date, description, credit, balance, user_id)
+            VALUES (1, ?, ?, 0, ?, 1)
+        """, (day, f"TXN {i}", balance))
+    conn.execute("""
+        INSERT INTO bank_transactions (bank_account_id, date, description, credit, balance, user_id)
+        VALUES (2, '2024-02-10', 'FD OPEN', 200000, 200000, 1)
+    """)
+
+    # Mutual funds: one equity scheme with NAV history, one debt scheme without
+    conn.execute("INSERT INTO mf_amcs (id, name) VALUES (1, 'Test AMC')")
+    conn.execute("""
+        INSERT INTO mf_schemes (id, amc_id, name, isin, asset_class, user_id)
+        VALUES (1, 1, 'Equity Fund', 'INF000000001', 'EQUITY', 1),
+               (2, 1, 'Debt Fund', NULL, 'DEBT', 1)
+    """)
+    conn.execute("""
+        INSERT INTO mf_folios (id, user_id, scheme_id, folio_number)
+        VALUES (1, 1, 1, 'F1'), (2, 1, 2, 'F2')
+    """)
+    for folio, txn_type, day, units, nav in [
+        (1, "PURCHASE", "2024-01-10", 100.5, 50.25),
+        (1, "PURCHASE", "2024-03-12", 40.125, 55.1),
+        (1, "REDEMPTION", "2024-06-18", 30.0, 60.3),
+        (2, "PURCHASE", "2024-02-01", 1000.0, 10.5),
+        (2, "REDEMPTION", "2024-09-05", 1000.0, 11.2),
+    ]:
+        conn.execute("""
+            INSERT INTO mf_transactions (folio_id, transaction_type, date, units, nav, amount, user_id)
+            VALUES (?, ?, ?, ?, ?, ?, 1)
+        """, (folio, txn_type, day, units, nav, units * nav))
+    nav_service = NAVService(conn)
+    for day, nav in [(date(2024, 1, 31), "51.0"), (date(2024, 4, 30), "57.75"), (date(2024, 10, 31), "64.2")]:
+        nav_service.store_nav(1, day, Decimal(nav))
+
+    # Stocks: delivery trades count, intraday ignored
+    for day, symbol, trade_type, qty, net_amount, category in [
+        ("2024-01-15", "INFY", "BUY", 10, 15000, "DELIVERY"),
+        ("2024-04-02", "INFY", "BUY", 5, 7800, "DELIVERY"),
+        ("2024-07-22", "INFY", "SELL", 8, 13000, "DELIVERY"),
+        ("2024-02-20", "TCS", "BUY", 3, 10500, "DELIVERY"),
+        ("2024-02-20", "TCS", "BUY", 50, 175000, "INTRADAY"),
+    ]:
+        conn.execute("""
+            INSERT INTO stock_trades (user_id, symbol, isin, trade_date, trade_type, quantity,
+                                      price, amount, net_amount, trade_category)
+            VALUES (1, ?, ?, ?, ?, ?, 0, ?, ?, ?)
+        """, (symbol, f"INE{symbol}", day, trade_type, qty, net_amount, net_amount, category))
+
+    # Foreign holdings valued in USD
+    conn.execute("""
+        INSERT INTO foreign_holdings (user_id, valuation_date, symbol, shares_held, total_value_usd)
+        VALUES (1, '2024-03-31', 'QCOM', 12.5, 2100.0), (1, '2024-09-30', 'QCOM', 4.0, 700.0)
+    """)
+    conn.execute("""
+        INSERT INTO exchange_rates (date, from_currency, to_currency, rate)
+        VALUES ('2024-03-28', 'USD', 'INR', 83.4), ('2024-08-30', 'USD', 'INR', 83.9)
+    """)
+
+    # Retirement funds
+    conn.execute("""
+        INSERT INTO epf_accounts (id, user_id, uan, establishment_id, member_id)
+        VALUES (1, 1, '100000000001', 'EST1', 'MEM1')
+    """)
+    for month, day, employee, employer in [
+        ("012024", "2024-01-31", 100000, 40000),
+        ("022024", "2024-02-29", 105000, 42000),
+        ("062024", "2024-06-30", 125000, 50000),
+    ]:
+        conn.execute("""
+            INSERT INTO epf_transactions (epf_account_id, wage_month, transaction_date,
+                                          transaction_type, employee_balance, employer_balance, user_id)
+            VALUES (1, ?, ?, 'CR', ?, ?, 1)
+        """, (month, day, employee, employer))
+
+    conn.execute("""
+        INSERT INTO ppf_accounts (id, user_id, account_number, bank_name, opening_date)
+        VALUES (1, 1, 'PPF1', 'SBI', '2015-04-01')
+    """)
+    conn.execute("""
+        INSERT INTO ppf_transactions (ppf_account_id, transaction_date, transaction_type, amount, balance, user_id)
+        VALUES (1, '2024-04-05', 'DEPOSIT', 150000, 950000, 1)
+    """)
+
+    conn.execute("INSERT INTO nps_accounts (id, user_id, pran) VALUES (1, 1, 'PRAN1')")
+    for day, tier, amount in [
+        ("2024-01-31", "I", 5000), ("2024-02-29", "I", 5000),
+        ("2024-02-29", "II", 2000), ("2024-07-31", "I", 5000),
+    ]:
+        conn.execute("""
+            INSERT INTO nps_transactions (nps_account_id, transaction_date, transaction_type, tier, amount, user_id)
+            VALUES (1, ?, 'CONTRIBUTION', ?, ?, 1)
+        """, (day, tier, amount))
+
+    # Liabilities: home loan with EMIs, car loan starting mid-year
+    conn.execute("""
+        INSERT INTO liabilities (id, user_id, liability_type, lender_name, principal_amount,
+                                 outstanding_amount, interest_rate, emi_amount, start_date)
+        VALUES (1, 1, 'HOME_LOAN', 'HDFC', 5000000, 4800000, 8.5, 45000, '2023-06-01'),
+               (2, 1, 'CAR_LOAN', 'ICICI', 800000, NULL, 9.0, NULL, '2024-05-10')
+    """)
+    for day, outstanding in [("2024-02-05", 4780000), ("2024-03-05", 4760000), ("2024-09-05", 4650000)]:
+        conn.execute("""
+            INSERT INTO liability_transactions (liability_id, transaction_date, transaction_type,
+                                                amount, outstanding_after, user_id)
+            VALUES (1, ?, 'EMI', 45000, ?, 1)
+        """, (day, outstanding))
+
+    conn.commit()
+
+    yield conn
+
+    db.close()
+    DatabaseManager.reset_instance()
+
+
+SERIES_START = date(2023, 12, 1)
+SERIES_END = date(2024, 12, 31)
+
+
+def assert_same_snapshot(actual, expected):
+    """Compare two snapshots up to floating point rounding."""
+    assert actual.snapshot_date == expected.snapshot_date
+
+    actual_fields = actual.to_breakdown_dict()
+    expected_fields = expected.to_breakdown_dict()
+    for section in ("assets", "liabilities"):
+        for key, value in expected_fields[section].items():
+            assert actual_fields[section][key] == pytest.approx(value, abs=1e-6), key
+
+    assert len(actual.asset_holdings) == len(expected.asset_holdings)
+    for got, want in zip(actual.asset_holdings, expected.asset_holdings):
+        assert got.asset_type == want.asset_type
+        assert got.asset_identifier == want.asset_identifier
+        assert float(got.quantity) == pytest.approx(float(want.quantity))
+        assert float(got.total_value) == pytest.approx(float(want.total_value))
+        assert float(got.cost_basis) == pytest.approx(float(want.cost_basis))
+
+    assert [(l.id, l.outstanding_amount) for l in actual.liability_details] == \
+        [(l.id, l.outstanding_amount) for l in expected.liability_details]
+
+
+class TestMonthEnds:
+    """Tests for month_ends()."""
+
+    def test_month_ends_inclusive(self):
+        assert month_ends(date(2024, 1, 31), date(2024, 4, 30)) == [
+            date(2024, 1, 31), date(2024, 2, 29), date(2024, 3, 31), date(2024, 4, 30),
+        ]
+
+    def test_partial_months_excluded(self):
+        assert month_ends(date(2024, 11, 15), date(2025, 1, 30)) == [
+            date(2024, 11, 30), date(2024, 12, 31),
+        ]
+
+
+class TestBalanceSheetSeries:
+    """Tests for incremental balance sheet series."""
+
+    def test_series_matches_full_recomputation(self, db_connection):
+        """Each monthly snapshot should equal get_balance_sheet() for that date."""
+        service = BalanceSheetService(db_connection)
+        series = service.get_monthly_balance_sheets(1, SERIES_START, SERIES_END)
+
+        assert [s.snapshot_date for s in series] == month_ends(SERIES_START, SERIES_END)
+        for snapshot in series:
+            assert_same_snapshot(snapshot, service.get_balance_sheet(1, snapshot.snapshot_date))
+
+        # Sanity check that the fixture exercises every section
+        june = series[6]
+        assert june.bank_savings > 0 and june.bank_fd > 0
+        assert june.mutual_funds_equity > 0 and june.mutual_funds_debt > 0
+        assert june.stocks_indian > 0 and june.stocks_foreign > 0
+        assert june.epf_balance and june.ppf_balance and june.nps_tier1 and june.nps_tier2
+        assert june.home_loans > 0 and june.car_loans > 0
+
+    def test_arbitrary_dates_sorted_and_deduplicated(self, db_connection):
+        service = BalanceSheetService(db_connection)
+        dates = [date(2024, 6, 18), date(2024, 1, 10), date(2024, 6, 18), date(2024, 5, 15)]
+
+        series = service.get_balance_sheets(1, dates)
+
+        assert [s.snapshot_date for s in series] == sorted(set(dates))
+        for snapshot in series:
+            assert_same_snapshot(snapshot, service.get_balance_sheet(1, snapshot.snapshot_date))
+
+    def test_empty_dates(self, db_connection):
+        assert BalanceSheetService(db_connection).get_balance_sheets(1, []) == []
+
+    def test_save_writes_snapshots_and_checkpoints(self, db_connection):
+        service = BalanceSheetService(db_connection)
+        service.get_monthly_balance_sheets(1, date(2024, 1, 1), date(2024, 6, 30), save=True)
+
+        history = service.get_net_worth_history(1)
+        assert [h["date"] for h in history] == [d.isoformat() for d in month_ends(date(2024, 1, 1), date(2024, 6, 30))]
+
+        count = db_connection.execute(
+            "SELECT COUNT(*) FROM balance_sheet_checkpoints WHERE user_id = 1"
+        ).fetchone()[0]
+        assert count == 6
+
+    def test_resume_from_checkpoint(self, db_connection):
+        """A later series should start from the saved checkpoint and still match."""
+        service = BalanceSheetService(db_connection)
+        service.get_monthly_balance_sheets(1, date(2024, 1, 1), date(2024, 6, 30), save=True)
+
+        executed = []
+        db_connection.set_trace_callback(executed.append)
+        series = service.get_monthly_balance_sheets(1, date(2024, 7, 1), SERIES_END)
+        db_connection.set_trace_callback(None)
+
+        # Rows are only read from the checkpoint date onwards
+        mf_queries = [q for q in executed if "FROM mf_transactions mt" in q and "mt.date >" in q]
+        assert mf_queries and "'2024-06-30'" in mf_queries[0]
+
+        for snapshot in series:
+            assert_same_snapshot(snapshot, service.get_balance_sheet(1, snapshot.snapshot_date))
+
+    def test_backdated_insert_invalidates_checkpoints(self, db_connection):
+        service = BalanceSheetService(db_connection)
+        service.get_monthly_balance_sheets(1, date(2024, 1, 1), date(2024, 6, 30), save=True)
+
+        db_connection.execute("""
+            INSERT INTO stock_trades (user_id, symbol, isin, trade_date, trade_type, quantity,
+                                      price, amount, net_amount, trade_category)
+            VALUES (1, 'WIPRO', 'INEWIPRO', '2024-03-15', 'BUY', 20, 0, 9000, 9000, 'DELIVERY')
+        """)
+        db_connection.commit()
+
+        def checkpoint_dates():
+            return [row[0] for row in db_connection.execute(
+                "SELECT checkpoint_date FROM balance_sheet_checkpoints ORDER BY checkpoint_date"
+            )]
+
+        series = service.get_monthly_balance_sheets(1, date(2024, 7, 1), date(2024, 8, 31))
+        for snapshot in series:
+            assert_same_snapshot(snapshot, service.get_balance_sheet(1, snapshot.snapshot_date))
+        assert any(h.asset_identifier == "INEWIPRO" for h in series[0].asset_holdings)
+        # Reading skips stale checkpoints without deleting them
+        assert len(checkpoint_dates()) == 6
+
+        service.get_monthly_balance_sheets(1, date(2024, 7, 1), date(2024, 8, 31), save=True)
+
+        # Saving removed the checkpoints from March onwards
+        assert checkpoint_dates() == ["2024-01-31", "2024-02-29", "2024-07-31", "2024-08-31"]
+
+    def test_clear_checkpoints(self, db_connection):
+        service = BalanceSheetService(db_connection)
+        service.get_monthly_balance_sheets(1, date(2024, 1, 1), date(2024, 4, 30), save=True)
+
+        assert service.clear_checkpoints(1, date(2024, 3, 1)) == 2
+        assert service.clear_checkpoints(1) == 2
+
+
+class TestBalanceSheetState:
+    """Tests for BalanceSheetState serialization."""
+
+    def test_json_round_trip(self):
+        state = BalanceSheetState(as_of=date(2024, 3, 31))
+        state.apply_bank(("2024-03-01", 7, 1, 1234.5))
+        state.apply_mf(("2024-03-02", 3, 11, 10.125, 50.5))
+        state.apply_stock(("2024-03-03", 4, "INFY", "INE009A01021", "BUY", 10, 15000.0))
+        state.apply_foreign(("2024-03-04", 5, "QCOM", 2.5, 400.0))
+        state.apply_epf(("2024-03-05", 6, 150000.0))
+        state.apply_nps(("2024-03-06", 8, "I", 5000))
+        state.apply_liability(("2024-03-07", 9, 2, 750000.0))
+
+        restored = BalanceSheetState.from_json(state.to_json())
+
+        assert restored == state
+        assert restored.mf[11] == [Decimal("10.125"), Decimal("50.5"), 1]
+        assert json.loads(state.to_json())["as_of"] == "2024-03-31"
+
+    def test_latest_row_wins(self):
+        state = BalanceSheetState()
+        state.apply_bank(("2024-01-05", 10, 1, 500.0))
+        state.apply_bank(("2024-01-03", 4, 1, 100.0))
+        state.apply_ppf(("2024-02-01", 3, 900.0))
+        state.apply_ppf(("2024-01-01", 9, 800.0))
+
+        assert state.bank[1] == [10, 500.0]
+        assert state.ppf == ["2024-02-01", 3, 900.0]
@@ -0,0 +1,161 @@
+"""
+Unit tests for the columnar statement loader in BankIntelligenceAnalyzer.
+
+Tests:
+1. Column-at-a-time parsing matches per-cell _parse_date/_parse_amount
+2. Bulk insert with set-based duplicate filtering, one commit per file
+"""
+
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+import pandas as pd
+import pytest
+
+from pfas.services.bank_intelligence.intelligent_analyzer import BankIntelligenceAnalyzer
+from pfas.services.bank_intelligence.models import BankTransactionIntel, TransactionType, UserBankConfig
+
+COLUMN_MAP = {
+    "date": "Txn Date",
+    "description": "Remarks",
+    "debit": "Withdrawal",
+    "credit": "Deposit",
+    "balance": "Balance",
+}
+
+
+@pytest.fixture
+def analyzer(tmp_path):
+    with BankIntelligenceAnalyzer(str(tmp_path / "money.db"), str(tmp_path)) as analyzer:
+        yield analyzer
+
+
+def parse_rowwise(analyzer, df, config=None):
+    """Reference: per-row parsing with the scalar helpers."""
+    transactions = []
+    for _, row in df.iterrows():
+        txn_date = analyzer._parse_date(row["Txn Date"], config)
+        description = str(row["Remarks"])
+        if txn_date is None or description.lower() in ("nan", "none", ""):
+            continue
+        debit = analyzer._parse_amount(row["Withdrawal"])
+        credit = analyzer._parse_amount(row["Deposit"])
+        if debit == 0 and credit == 0:
+            continue
+        balance = analyzer._parse_amount(row["Balance"])
+        category, sub_category, _ = analyzer.classifier.classify(description)
+        transactions.append(BankTransactionIntel(
+            user_name="U", bank_name="B", txn_date=txn_date, base_string=description,
+            amount=debit if debit > 0 else credit,
+            txn_type=TransactionType.DEBIT if debit > 0 else TransactionType.CREDIT,
+            balance=balance or None, category=category, sub_category=sub_category,
+            source_file="f.csv",
+        ))
+    return transactions
+
+
+def messy_frame():
+    return pd.DataFrame({
+        "Txn Date": [
+            "04/04/2024", " 05-04-2024 ", "2024-04-06", "07 Apr 2024", "08-APR-2024",
+            "09/04/24", "2024/04/10", "04/30/2024", datetime(2024, 5, 1, 10, 30),
+            date(2024, 5, 2), "April 3, 2024", "not a date", None, float("nan"),
+            "01/01/1500", "12/05/2024", "13/05/2024",
+        ],
+        "Remarks": [
+            "NEFT SALARY ACME", "UPI/PAYEE@OKAXIS", "ATM WDL", "INT PD", "nan",
+            "RENT FROM TENANT", "IMPS", "SGB INT", "CHQ DEP", "UPI/PAYEE@OKAXIS",
+            "POS", "UPI", "UPI", "UPI", "OLD", None, "NEFT",
+        ],
+        "Withdrawal": [
+            "", "1,250.50", "₹500", None, "10", "", "(20.00)", "", 99.5, "1,250.50",
+            "-", "5", "5", "5", "5", "5", "abc",
+        ],
+        "Deposit": [
+            "1,00,000.00", "", "", "12.34", "", "25000", "", "$7.5", None, "",
+            "3", "", "", "", "", "", "",
+        ],
+        "Balance": [
+            "1,00,000.00", "0", "", "0.00", "1", "2", "3", None, 4.25, "5",
+            "6", "7", "8", "9", "10", "11", "12",
+        ],
+    })
+
+
+class TestColumnarParse:
+    """Tests for _parse_transactions()."""
+
+    @pytest.mark.parametrize("date_format", ["%d/%m/%Y", "%m/%d/%Y", ""])
+    def test_matches_rowwise_parse(self, analyzer, date_format):
+        config = UserBankConfig(user_name="U", bank_name="B", date_format=date_format)
+        df = messy_frame()
+
+        expected = parse_rowwise(analyzer, df, config)
+        result = analyzer._parse_transactions(df, COLUMN_MAP, "U", "B", "f.csv", config)
+
+        assert result == expected
+        assert len(result) > 10
+
+    def test_datetime_column(self, analyzer):
+        df = messy_frame().iloc[:4].copy()
+        df["Txn Date"] = pd.to_datetime(["2024-04-01", None, "2024-04-03", "2024-04-04"])
+
+        result = analyzer._parse_transactions(df, COLUMN_MAP, "U", "B", "f.csv")
+
+        assert [t.txn_date for t in result] == [date(2024, 4, 1), date(2024, 4, 3), date(2024, 4, 4)]
+
+    def test_without_optional_columns(self, analyzer):
+        df = messy_frame()
+        column_map = {"date": "Txn Date", "description": "Remarks", "credit": "Deposit"}
+
+        result = analyzer._parse_transactions(df, column_map, "U", "B", "f.csv")
+
+        assert all(t.txn_type == TransactionType.CREDIT and t.balance is None for t in result)
+        assert result[0].amount == Decimal("100000.00")
+
+
+def write_statement(path, days=60):
+    lines = ["Bank Statement,,,,", "Txn Date,Remarks,Withdrawal,Deposit,Balance"]
+    start = date(2023, 1, 1)
+    for i in range(days):
+        day = (start + timedelta(days=i)).strftime("%d/%m/%Y")
+        lines.append(f'{day},UPI/PAYEE{i % 7}@OKAXIS,"{100 + i:,}.00",,{50000 - i}')
+        lines.append(f"{day},NEFT SALARY ACME {i},,{1000 + i},{51000 + i}")
+    # Same transaction twice in the file
+    lines.append(lines[-1])
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+
+class TestBulkInsert:
+    """Tests for ingest_statement() with _insert_transactions()."""
+
+    def test_inserts_once_and_skips_duplicates(self, analyzer, tmp_path):
+        statement = write_statement(tmp_path / "stmt.csv")
+        statements = []
+        analyzer.conn.set_trace_callback(statements.append)
+
+        first = analyzer.ingest_statement(str(statement), "U", "B")
+        analyzer.conn.set_trace_callback(None)
+
+        assert first.success, first.errors
+        assert first.transactions_processed == 121
+        assert first.transactions_inserted == 120
+        assert first.transactions_skipped == 1
+        # One commit for the transactions, one for the ingestion log
+        assert sum(1 for s in statements if s.strip().upper() == "COMMIT") == 2
+
+        second = analyzer.ingest_statement(str(statement), "U", "B")
+        assert second.transactions_inserted == 0
+        assert second.transactions_skipped == 121
+
+        count = analyzer.conn.execute("SELECT COUNT(*) FROM bank_transactions_intel").fetchone()[0]
+        assert count == 120
+
+    def test_partial_overlap(self, analyzer, tmp_path):
+        analyzer.ingest_statement(str(write_statement(tmp_path / "a.csv", days=30)), "U", "B")
+        result = analyzer.ingest_statement(str(write_statement(tmp_path / "b.csv", days=45)), "U", "B")
+
+        # Source file is not part of the UID, so the first 30 days are duplicates
+        assert result.transactions_inserted == 30
+        assert result.transactions_skipped == 61
@@ -0,0 +1,167 @@
+"""
+Unit tests for CostBasisTracker bulk lot loading and depletion.
+
+Tests:
+- preload_lots loads every symbol in one query
+- deplete_many matches sale-by-sale calculate_cost_basis + deplete_lots
+- Cache stays consistent with cost_basis_lots after writes
+"""
+
+import sqlite3
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+
+from pfas.core.exceptions import InsufficientSharesError
+from pfas.services.cost_basis_tracker import (
+    CostBasisTracker,
+    CostMethod,
+    LotSale,
+    setup_cost_basis_table,
+)
+
+SYMBOLS = ["INFY", "TCS", "RELIANCE", "HDFCBANK"]
+
+
+@pytest.fixture
+def conn():
+    connection = sqlite3.connect(":memory:")
+    connection.row_factory = sqlite3.Row
+    setup_cost_basis_table(connection)
+    yield connection
+    connection.close()
+
+
+def seed_lots(tracker: CostBasisTracker):
+    for i, symbol in enumerate(SYMBOLS):
+        for j in range(3):
+            tracker.record_purchase(
+                user_id=1,
+                asset_type="STOCK",
+                symbol=symbol,
+                purchase_date=date(2023, 1, 1) + timedelta(days=100 * j),
+                units=Decimal(10 + i),
+                total_cost=Decimal(1000 * (i + 1) + 100 * j),
+            )
+    tracker.conn.commit()
+
+
+def sell_ledger():
+    return [
+        LotSale("INFY", Decimal("15"), date(2024, 6, 1), Decimal("2000")),
+        LotSale("TCS", Decimal("5.5"), date(2024, 6, 2)),
+        LotSale("INFY", Decimal("12"), date(2024, 7, 1), Decimal("1800")),
+        LotSale("RELIANCE", Decimal("36"), date(2024, 8, 1), Decimal("9000")),
+    ]
+
+
+def remaining_units(conn):
+    return {
+        row["id"]: Decimal(str(row["units_remaining"]))
+        for row in conn.execute("SELECT id, units_remaining FROM cost_basis_lots")
+    }
+
+
+def count_queries(conn):
+    statements = []
+    conn.set_trace_callback(statements.append)
+    return statements
+
+
+class TestPreloadLots:
+    """Tests for preload_lots()."""
+
+    def test_single_query_for_all_symbols(self, conn):
+        seed_lots(CostBasisTracker(conn))
+        tracker = CostBasisTracker(conn)
+
+        by_symbol = tracker.preload_lots(1, "STOCK")
+        statements = count_queries(conn)
+
+        assert sorted(by_symbol) == sorted(SYMBOLS)
+        for symbol in SYMBOLS + ["UNKNOWN"]:
+            tracker.get_holding_summary(1, "STOCK", symbol)
+        assert statements == []
+        assert tracker.get_holding_summary(1, "STOCK", "TCS").total_units == Decimal("33")
+
+    def test_record_purchase_updates_preloaded_cache(self, conn):
+        tracker = CostBasisTracker(conn)
+        seed_lots(tracker)
+        tracker.preload_lots(1, "STOCK")
+
+        tracker.record_purchase(1, "STOCK", "INFY", date(2022, 6, 1), Decimal("4"), Decimal("400"))
+        tracker.record_purchase(1, "STOCK", "WIPRO", date(2024, 1, 1), Decimal("7"), Decimal("700"))
+
+        fresh = CostBasisTracker(conn)
+        for symbol in ("INFY", "WIPRO"):
+            cached = tracker.get_holding_summary(1, "STOCK", symbol).lots
+            assert cached == fresh.get_holding_summary(1, "STOCK", symbol).lots
+        assert tracker.get_holding_summary(1, "STOCK", "INFY").lots[0].acquisition_date == date(2022, 6, 1)
+
+    def test_deplete_lots_invalidates_preloaded_symbol(self, conn):
+        tracker = CostBasisTracker(conn)
+        seed_lots(tracker)
+        tracker.preload_lots(1, "STOCK")
+
+        result = tracker.calculate_cost_basis(1, "STOCK", "TCS", Decimal("11"), date(2024, 1, 1))
+        tracker.deplete_lots(1, "STOCK", "TCS", result)
+
+        summary = tracker.get_holding_summary(1, "STOCK", "TCS")
+        assert summary.total_units == Decimal("22")
+        assert len(summary.lots) == 2
+
+
+class TestDepleteMany:
+    """Tests for deplete_many()."""
+
+    @pytest.mark.parametrize("method", [CostMethod.FIFO, CostMethod.AVERAGE])
+    def test_matches_sale_by_sale(self, conn, method):
+        seed_lots(CostBasisTracker(conn))
+        sequential = CostBasisTracker(conn, cost_method=method)
+        expected = []
+        for sale in sell_ledger():
+            result = sequential.calculate_cost_basis(
+                1, "STOCK", sale.symbol, sale.units, sale.sell_date, sale.sale_proceeds
+            )
+            sequential.deplete_lots(1, "STOCK", sale.symbol, result)
+            expected.append(result)
+        expected_units = remaining_units(conn)
+        conn.rollback()
+
+        tracker = CostBasisTracker(conn, cost_method=method)
+        statements = count_queries(conn)
+        results = tracker.deplete_many(1, "STOCK", sell_ledger())
+        conn.set_trace_callback(None)
+
+        # All lots come from a single preload query
+        assert sum(1 for s in statements if s.lstrip().startswith("SELECT")) == 1
+
+        assert [r.total_cost_basis for r in results] == [r.total_cost_basis for r in expected]
+        assert [r.realized_gain for r in results] == [r.realized_gain for r in expected]
+        assert [r.is_long_term for r in results] == [r.is_long_term for r in expected]
+        units = remaining_units(conn)
+        assert units.keys() == expected_units.keys()
+        for lot_id, value in units.items():
+            assert value == pytest.approx(expected_units[lot_id], abs=Decimal("1e-9"))
+
+        # Cache reflects the writes
+        fresh = CostBasisTracker(conn, cost_method=method)
+        for symbol in SYMBOLS:
+            assert tracker.get_holding_summary(1, "STOCK", symbol).total_units == \
+                fresh.get_holding_summary(1, "STOCK", symbol).total_units
+
+    def test_insufficient_units_writes_nothing(self, conn):
+        seed_lots(CostBasisTracker(conn))
+        tracker = CostBasisTracker(conn)
+        before = remaining_units(conn)
+
+        ledger = sell_ledger() + [LotSale("TCS", Decimal("30"), date(2024, 9, 1))]
+        with pytest.raises(InsufficientSharesError):
+            tracker.deplete_many(1, "STOCK", ledger)
+
+        assert remaining_units(conn) == before
+        assert tracker.get_holding_summary(1, "STOCK", "INFY").total_units == Decimal("30")
+
+    def test_empty_ledger(self, conn):
+        assert CostBasisTracker(conn).deplete_many(1, "STOCK", []) == []
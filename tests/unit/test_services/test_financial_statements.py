@@ -251,6 +251,45 @@ class TestPortfolioValuationService:
         assert result.xirr_percent is None
         assert "No transactions" in result.error
 
+    def test_xirr_breakdown(self, db_connection):
+        """Per-scheme, per-AMC, per-stock and portfolio XIRR from one batch."""
+        db_connection.execute("INSERT INTO mf_amcs (id, name) VALUES (1, 'Test AMC')")
+        db_connection.execute("""
+            INSERT INTO mf_schemes (id, amc_id, name, asset_class, user_id)
+            VALUES (1, 1, 'Equity Fund', 'EQUITY', 1)
+        """)
+        db_connection.execute("INSERT INTO mf_folios (id, user_id, scheme_id, folio_number) VALUES (1, 1, 1, 'F1')")
+        db_connection.execute("""
+            INSERT INTO mf_transactions (folio_id, transaction_type, date, units, nav, amount, user_id)
+            VALUES (1, 'PURCHASE', '2023-01-01', 100, 100, 10000, 1),
+                   (1, 'PURCHASE', '2024-01-01', 100, 110, 11000, 1)
+        """)
+        db_connection.execute("""
+            INSERT INTO stock_trades (user_id, symbol, trade_date, trade_type, quantity,
+                                      price, amount, net_amount, trade_category)
+            VALUES (1, 'INFY', '2023-01-01', 'BUY', 10, 1000, 10000, 10000, 'DELIVERY')
+        """)
+        db_connection.commit()
+
+        service = PortfolioValuationService(db_connection)
+        breakdown = service.calculate_xirr_breakdown(user_id=1, as_of=date(2024, 1, 1))
+
+        # Scheme: 10000 + 11000 in, 200 units at NAV 110 = 22000 out
+        scheme = breakdown["scheme"]["Equity Fund"]
+        assert scheme.xirr_percent == Decimal("10.00")
+        assert scheme.total_invested == Decimal("21000")
+        assert scheme.total_current_value == Decimal("22000")
+        assert scheme.investment_period_days == 365
+        assert breakdown["amc"]["Test AMC"].xirr_percent == Decimal("10.00")
+
+        # Stock valued at last trade price: no gain
+        assert breakdown["symbol"]["INFY"].xirr_percent == Decimal("0.00")
+
+        portfolio = breakdown["portfolio"]["ALL"]
+        assert portfolio.total_invested == Decimal("31000")
+        assert portfolio.total_current_value == Decimal("32000")
+        assert Decimal("0") < portfolio.xirr_percent < Decimal("10")
+
 
 class TestLiabilitiesService:
     """Tests for LiabilitiesService."""
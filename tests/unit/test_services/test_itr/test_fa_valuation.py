@@ -0,0 +1,193 @@
+"""Tests for the Schedule FA daily valuation engine."""
+
+import pytest
+from datetime import date, timedelta
+from decimal import Decimal
+
+from pfas.services.currency import ExchangeRate, SBITTRateProvider
+from pfas.services.itr.fa_valuation import ESPP_KEY, ForeignEquityValuationEngine
+from pfas.services.itr.schedule_fa import ScheduleFAGenerator
+
+
+def add_daily_rates(conn, start, end, rate=Decimal("83.00")):
+    provider = SBITTRateProvider(conn)
+    days = (end - start).days + 1
+    provider.bulk_add_rates([
+        ExchangeRate(start + timedelta(days=i), "USD", "INR", rate, "SBI")
+        for i in range(days)
+    ])
+
+
+@pytest.fixture
+def rsu_user(db_connection, sample_user):
+    """MSFT RSUs: 10 shares vested 2023, 5 in 2024, 8 sold in May 2024."""
+    user_id = sample_user["id"]
+    conn = db_connection
+    conn.execute(
+        """INSERT INTO stock_plans (user_id, grant_number, grant_type, grant_date, symbol, company_name)
+        VALUES (?, 'G-1', 'RSU', '2022-06-15', 'MSFT', 'Microsoft Corporation')""",
+        (user_id,)
+    )
+    conn.executemany(
+        """INSERT INTO rsu_vests (user_id, grant_number, vest_date, shares_vested, fmv_usd, net_shares, tt_rate)
+        VALUES (?, 'G-1', ?, ?, ?, ?, ?)""",
+        [
+            (user_id, '2023-06-15', 14, 300, 10, 82),
+            (user_id, '2024-03-15', 7, 400, 5, None),
+        ]
+    )
+    conn.execute(
+        """INSERT INTO rsu_sales (user_id, sale_date, shares_sold, sell_price_usd, sell_value_usd, cost_basis_usd)
+        VALUES (?, '2024-05-10', 8, 440, 3520, 2400)""",
+        (user_id,)
+    )
+    conn.execute(
+        """INSERT INTO foreign_dividends (user_id, dividend_date, symbol, gross_dividend_usd, tt_rate)
+        VALUES (?, '2024-06-13', 'MSFT', 5.25, 83.5)""",
+        (user_id,)
+    )
+    conn.commit()
+    add_daily_rates(conn, date(2023, 12, 20), date(2024, 12, 31))
+
+    engine = ForeignEquityValuationEngine(conn)
+    engine.add_prices("MSFT", [
+        (date(2024, 1, 2), Decimal("370")),
+        (date(2024, 4, 1), Decimal("420")),
+        (date(2024, 7, 10), Decimal("460")),
+        (date(2024, 12, 31), Decimal("420")),
+    ])
+    return user_id
+
+
+class TestForeignEquityValuationEngine:
+    """Tests for ForeignEquityValuationEngine."""
+
+    def test_no_holdings(self, db_connection, sample_user):
+        """Test a user without foreign equity needs no rates."""
+        engine = ForeignEquityValuationEngine(db_connection)
+
+        assert engine.value_holdings(sample_user["id"], 2024) == []
+
+    def test_peak_is_highest_daily_value(self, db_connection, rsu_user):
+        """Test peak uses the daily position, not the closing position."""
+        engine = ForeignEquityValuationEngine(db_connection)
+
+        [msft] = engine.value_holdings(rsu_user, 2024)
+
+        # 15 shares at the 1 April close, before 8 were sold on 10 May
+        assert msft.peak_date == date(2024, 4, 1)
+        assert msft.peak_shares == Decimal("15")
+        assert msft.peak_value_usd == Decimal("6300")
+        assert msft.peak_value_inr == Decimal("6300") * Decimal("83.00")
+
+    def test_closing_initial_and_income(self, db_connection, rsu_user):
+        """Test closing, initial value and dividend income."""
+        engine = ForeignEquityValuationEngine(db_connection)
+
+        [msft] = engine.value_holdings(rsu_user, 2024)
+
+        assert msft.company_name == "Microsoft Corporation"
+        assert msft.closing_shares == Decimal("7")
+        assert msft.closing_price_usd == Decimal("420")
+        assert msft.closing_value_usd == Decimal("2940")
+        assert msft.closing_value_inr == Decimal("2940") * Decimal("83.00")
+
+        # 10 shares at vest FMV and TT rate, 5 at the 2024 rate
+        assert msft.date_of_acquisition == date(2023, 6, 15)
+        assert msft.initial_value_usd == Decimal("5000")
+        assert msft.initial_value_inr == Decimal("246000") + Decimal("2000") * Decimal("83.00")
+
+        assert msft.income_usd == Decimal("5.25")
+        assert msft.income_inr == Decimal("5.25") * Decimal("83.5")
+
+    def test_prices_from_transactions_fill_gaps(self, db_connection, rsu_user):
+        """Test vest FMV and sale price stand in for missing closes."""
+        engine = ForeignEquityValuationEngine(db_connection)
+        db_connection.execute("DELETE FROM foreign_stock_prices")
+
+        [msft] = engine.value_holdings(rsu_user, 2024)
+
+        # 15 x 400 from the 2024 vest FMV, then 7 x 440 after the sale
+        assert msft.peak_date == date(2024, 3, 15)
+        assert msft.peak_value_usd == Decimal("6000")
+        assert msft.closing_value_usd == Decimal("3080")
+
+    def test_results_cached_per_user_and_year(self, db_connection, rsu_user):
+        """Test valuations are cached until clear_cache()."""
+        engine = ForeignEquityValuationEngine(db_connection)
+
+        first = engine.value_holdings(rsu_user, 2024)
+        db_connection.execute("DELETE FROM rsu_sales")
+
+        assert engine.value_holdings(rsu_user, 2024) is first
+
+        engine.clear_cache(rsu_user)
+        [msft] = engine.value_holdings(rsu_user, 2024)
+        assert msft.closing_shares == Decimal("15")
+
+    def test_sold_out_before_year_is_excluded(self, db_connection, rsu_user):
+        """Test a year after every share was sold has no holdings."""
+        db_connection.execute(
+            """INSERT INTO rsu_sales (user_id, sale_date, shares_sold, sell_price_usd, sell_value_usd, cost_basis_usd)
+            VALUES (?, '2024-11-01', 7, 430, 3010, 2800)""",
+            (rsu_user,)
+        )
+        engine = ForeignEquityValuationEngine(db_connection)
+
+        [msft] = engine.value_holdings(rsu_user, 2024)
+        assert msft.closing_shares == Decimal("0")
+        assert msft.closing_value_inr == Decimal("0")
+        assert engine.value_holdings(rsu_user, 2025) == []
+
+    def test_missing_rate_raises(self, db_connection, rsu_user):
+        """Test a held day without a TT rate in the lookback window."""
+        db_connection.execute(
+            "DELETE FROM exchange_rates WHERE date BETWEEN '2024-08-01' AND '2024-08-20'"
+        )
+        engine = ForeignEquityValuationEngine(db_connection)
+
+        with pytest.raises(ValueError, match="2024-08-08"):
+            engine.value_holdings(rsu_user, 2024)
+
+    def test_espp_without_plan_symbol(self, db_connection, sample_user):
+        """Test ESPP lots are valued under the ESPP key at market price."""
+        user_id = sample_user["id"]
+        db_connection.execute(
+            """INSERT INTO espp_purchases (user_id, purchase_date, shares_purchased, purchase_price_usd, market_price_usd, tt_rate)
+            VALUES (?, '2024-06-28', 20, 85, 100, 83.4)""",
+            (user_id,)
+        )
+        db_connection.commit()
+        add_daily_rates(db_connection, date(2024, 6, 1), date(2024, 12, 31))
+        engine = ForeignEquityValuationEngine(db_connection)
+
+        [espp] = engine.value_holdings(user_id, 2024)
+
+        assert espp.symbol == ESPP_KEY
+        assert espp.company_name == "ESPP Holdings"
+        assert espp.initial_value_usd == Decimal("1700")
+        assert espp.initial_value_inr == Decimal("1700") * Decimal("83.4")
+        assert espp.peak_value_usd == Decimal("2000")
+        assert espp.closing_value_usd == Decimal("2000")
+
+
+class TestScheduleFAEquityHoldings:
+    """Tests for A3 entries built from the valuation engine."""
+
+    def test_generate_uses_daily_peak(self, db_connection, rsu_user):
+        """Test A3 peak differs from the closing value."""
+        SBITTRateProvider(db_connection).add_rate(
+            date(2025, 3, 31), "USD", "INR", Decimal("85.50"), "SBI"
+        )
+        generator = ScheduleFAGenerator(db_connection)
+
+        schedule_fa = generator.generate(rsu_user, "2024-25")
+
+        [holding] = schedule_fa.equity_holdings
+        assert holding.symbol == "MSFT"
+        assert holding.entity_name == "Microsoft Corporation"
+        assert holding.peak_value_foreign == Decimal("6300")
+        assert holding.closing_value_foreign == Decimal("2940")
+        assert holding.shares_held == Decimal("7")
+        assert holding.nature_of_income == "Dividend"
+        assert schedule_fa.total_peak_value_inr == holding.peak_value_inr
@@ -0,0 +1,179 @@
+"""Tests for the shared tax-rule tables and TaxRulesService."""
+
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from pfas.core.tax_schema import init_tax_schema
+from pfas.services.advance_tax_calculator import AdvanceTaxCalculator, AdvanceTaxResult
+from pfas.services.itr.itr2_exporter import ITR2Exporter
+from pfas.services.tax_rules_service import (
+    TaxRulesService,
+    clear_tax_rule_tables,
+    get_tax_rule_tables,
+)
+
+
+@pytest.fixture
+def tax_db(db_connection):
+    clear_tax_rule_tables()
+    init_tax_schema(db_connection)
+    yield db_connection
+    clear_tax_rule_tables()
+
+
+def rule_queries(conn, func):
+    statements = []
+    conn.set_trace_callback(statements.append)
+    try:
+        func()
+    finally:
+        conn.set_trace_callback(None)
+    return [s for s in statements if "sqlite_master" in s or "_rates" in s or "_slabs" in s]
+
+
+class TestTaxRulesService:
+    """Tests for lookups served from the snapshot."""
+
+    def test_lookups(self, tax_db):
+        """Test values match the seeded rule tables."""
+        service = TaxRulesService(tax_db)
+
+        slabs = service.get_tax_slabs("2025-26", "NEW")
+        assert len(slabs) == 7
+        assert slabs[1].lower_limit == Decimal("400000")
+        assert slabs[-1].upper_limit is None
+
+        ltcg = service.get_capital_gains_rate("2025-26", "EQUITY_LISTED", "LTCG")
+        assert ltcg.tax_rate == Decimal("0.125")
+        assert ltcg.exemption_limit == Decimal("125000")
+        assert ltcg.stt_required is True
+        assert service.get_capital_gains_rate("2025-26", "UNLISTED", "LTCG") is None
+
+        assert service.get_standard_deduction("2025-26", "NEW") == Decimal("75000")
+        assert service.get_standard_deduction("2025-26", "OLD", "PENSION") == Decimal("0")
+        assert service.get_house_property_deduction_percent("2024-25") == Decimal("0.3")
+        assert service.get_cess_rate("2024-25") == Decimal("0.04")
+        assert service.get_rebate_limit("2025-26", "NEW") == (Decimal("800000"), Decimal("25000"))
+        assert service.get_chapter_via_limit("2024-25", "OLD", "80C") == Decimal("150000")
+
+    def test_surcharge_brackets(self, tax_db):
+        """Test surcharge bracket bounds and the equity CG cap."""
+        service = TaxRulesService(tax_db)
+
+        assert service.get_surcharge_rate("2024-25", Decimal("4999999")) == Decimal("0")
+        assert service.get_surcharge_rate("2024-25", Decimal("5000000")) == Decimal("0.1")
+        assert service.get_surcharge_rate("2024-25", Decimal("60000000")) == Decimal("0.37")
+        assert service.get_surcharge_rate("2024-25", Decimal("60000000"), "EQUITY_CG") == Decimal("0.15")
+
+    def test_missing_tables(self, db_connection):
+        """Test a database without rule tables gives the defaults."""
+        clear_tax_rule_tables()
+        service = TaxRulesService(db_connection)
+
+        assert service.get_tax_slabs("2024-25") == []
+        assert service.get_cess_rate("2024-25") == Decimal("0.04")
+        with pytest.raises(ValueError, match="No tax slabs"):
+            service.slab_tax("2024-25", "NEW", [1_000_000])
+
+
+class TestSharedSnapshot:
+    """Tests for get_tax_rule_tables() sharing and invalidation."""
+
+    def test_shared_across_services(self, tax_db):
+        """Test services reuse one snapshot without querying rule tables."""
+        rules = get_tax_rule_tables(tax_db)
+
+        def compute():
+            AdvanceTaxCalculator(tax_db).tax_rules.get_tax_slabs("2024-25", "NEW")
+            TaxRulesService(tax_db).get_surcharge_rate("2024-25", Decimal("6000000"))
+            ITR2Exporter(tax_db)._regime_slabs("2024-25", True)
+
+        assert rule_queries(tax_db, compute) == []
+        assert TaxRulesService(tax_db).rules is rules
+
+    def test_rule_change_reloads(self, tax_db):
+        """Test writes to rule tables replace the snapshot, other writes keep it."""
+        rules = get_tax_rule_tables(tax_db)
+
+        tax_db.execute("INSERT INTO users (pan_encrypted, pan_salt, name) VALUES (x'00', x'00', 'X')")
+        assert get_tax_rule_tables(tax_db) is rules
+
+        tax_db.execute("UPDATE cess_rates SET rate = 0.05 WHERE financial_year = '2025-26'")
+        assert get_tax_rule_tables(tax_db) is not rules
+        assert TaxRulesService(tax_db).get_cess_rate("2025-26") == Decimal("0.05")
+
+    def test_rolled_back_change(self, tax_db):
+        """Test a snapshot taken inside a rolled-back transaction is dropped."""
+        tax_db.execute("UPDATE rebate_limits SET max_rebate = 60000 WHERE tax_regime = 'NEW'")
+        service = TaxRulesService(tax_db)
+        assert service.get_rebate_limit("2025-26", "NEW")[1] == Decimal("60000")
+
+        tax_db.rollback()
+
+        assert service.get_rebate_limit("2025-26", "NEW")[1] == Decimal("25000")
+
+
+class TestVectorizedTax:
+    """Tests for slab_tax() and tax_liability()."""
+
+    def test_slab_tax_matches_calculator(self, tax_db):
+        """Test vectorized slab tax equals the Decimal slab loop."""
+        calculator = AdvanceTaxCalculator(tax_db)
+        rules = get_tax_rule_tables(tax_db)
+        incomes = np.arange(0, 6_000_000, 37_501)
+
+        for fy in ("2024-25", "2025-26"):
+            for regime in ("OLD", "NEW"):
+                slabs = rules.tax_slabs(fy, regime)
+                expected = [
+                    float(calculator._calculate_slab_tax(Decimal(int(i)), slabs)) for i in incomes
+                ]
+                assert rules.slab_tax(fy, regime, incomes).tolist() == expected
+
+    def test_tax_liability_matches_calculator(self, tax_db):
+        """Test rebate, surcharge and cess follow AdvanceTaxCalculator."""
+        calculator = AdvanceTaxCalculator(tax_db)
+        rules = get_tax_rule_tables(tax_db)
+        incomes = np.array([650_000, 850_000, 1_275_000, 5_400_000, 12_000_000])
+        deductions = np.array([[0], [75_000], [250_000]])
+
+        liability = rules.tax_liability("2025-26", "OLD", incomes, deductions)
+
+        assert liability.shape == (3, 5)
+        for row, deduction in enumerate(deductions[:, 0]):
+            for col, income in enumerate(incomes):
+                result = AdvanceTaxResult(user_id=1, financial_year="2025-26", tax_regime="OLD")
+                result.total_other_income = Decimal(int(income))
+                result.gross_total_income = Decimal(int(income))
+                result.total_deductions = Decimal(int(deduction))
+                result.taxable_income = max(Decimal("0"), result.gross_total_income - result.total_deductions)
+                calculator._calculate_tax(result, "2025-26", "OLD")
+
+                assert liability[row, col] == float(result.total_tax_liability)
+
+    def test_regime_comparison(self, tax_db):
+        """Test the new regime's 87A rebate zeroes tax up to the limit."""
+        rules = get_tax_rule_tables(tax_db)
+
+        new = rules.tax_liability("2025-26", "NEW", [855_000, 1_300_000], 75_000)
+        old = rules.tax_liability("2025-26", "OLD", [855_000, 1_300_000], 200_000)
+
+        assert new[0] == 0
+        assert new[1] > 0
+        assert (old > new).all()
+
+
+class TestITR2ExporterSlabs:
+    """Tests for ITR-2 slabs from the rule tables."""
+
+    def test_uses_rule_tables(self, tax_db):
+        """Test FY slabs come from the database when present."""
+        exporter = ITR2Exporter(tax_db)
+
+        slabs = exporter._regime_slabs("2025-26", True)
+        assert slabs[0] == (Decimal("400000"), Decimal("0"))
+        assert len(slabs) == 7
+
+        assert exporter._regime_slabs("2019-20", False) == exporter.OLD_REGIME_SLABS